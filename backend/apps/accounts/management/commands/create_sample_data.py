@@ -5,6 +5,7 @@
   python manage.py create_sample_data           # 새 데이터 생성 (기존 데이터 유지)
   python manage.py create_sample_data --reset   # 기존 샘플 데이터 삭제 후 새로 생성
 """
+from django.core.management import call_command
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
 from django.utils import timezone
@@ -374,6 +375,9 @@ class Command(BaseCommand):
 
         self.stdout.write(self.style.SUCCESS(f'도움 요청 {help_requests_created}개 생성'))
 
+        # 9. 대시보드 사전 집계 재계산 (위에서 update()로 수정한 시각은 signal로 반영되지 않음)
+        call_command('rebuild_dashboard_rollups', lecture=lecture.id, stdout=self.stdout)
+
         # 완료 메시지
         self.stdout.write('')
         self.stdout.write(self.style.SUCCESS('=' * 50))
@@ -6,10 +6,15 @@ from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
 from django.contrib.auth import get_user_model
 
+from core.websocket import MessageCodecMixin
+
+from . import ticker
+from .services.dashboard_snapshot import get_dashboard_snapshot
+
 User = get_user_model()
 
 
-class DashboardConsumer(AsyncWebsocketConsumer):
+class DashboardConsumer(MessageCodecMixin, AsyncWebsocketConsumer):
     """
     WebSocket Consumer for instructor dashboard real-time updates
 
@@ -24,6 +29,9 @@ class DashboardConsumer(AsyncWebsocketConsumer):
     Messages from client:
     - request_statistics: Request current statistics
     - request_student_list: Request current student list
+
+    통계/수강생 목록은 강의별 스냅샷을 공유하며, 강의별 ticker가 원본이 바뀐
+    경우에만 주기적으로 다시 계산해 그룹에 statistics_update를 보낸다.
     """
 
     async def connect(self):
@@ -51,15 +59,23 @@ class DashboardConsumer(AsyncWebsocketConsumer):
 
         await self.accept()
 
-        # Send initial data
-        initial_data = await self.get_initial_dashboard_data()
+        # 강의별 통계 갱신 루프 참여 (첫 연결이면 시작)
+        ticker.acquire(self.lecture_id, self.channel_layer)
+        self.ticker_acquired = True
+
+        # Send initial data (마지막 스냅샷)
+        snapshot = await self.get_snapshot()
         await self.send(text_data=json.dumps({
             'type': 'initial_data',
-            'data': initial_data
+            'data': snapshot['initial_data'] if snapshot else None
         }))
 
     async def disconnect(self, close_code):
         """Handle WebSocket disconnection"""
+        if getattr(self, 'ticker_acquired', False):
+            ticker.release(self.lecture_id)
+            self.ticker_acquired = False
+
         # Leave lecture dashboard group
         await self.channel_layer.group_discard(
             self.lecture_group_name,
@@ -92,7 +108,8 @@ class DashboardConsumer(AsyncWebsocketConsumer):
 
     async def handle_request_statistics(self):
         """Send current lecture statistics"""
-        statistics = await self.get_lecture_statistics()
+        snapshot = await self.get_snapshot()
+        statistics = snapshot['statistics'] if snapshot else None
         await self.send(text_data=json.dumps({
             'type': 'statistics',
             'data': statistics
@@ -100,7 +117,8 @@ class DashboardConsumer(AsyncWebsocketConsumer):
 
     async def handle_request_student_list(self):
         """Send current student list with progress"""
-        students = await self.get_student_list()
+        snapshot = await self.get_snapshot()
+        students = snapshot['student_list'] if snapshot else []
         await self.send(text_data=json.dumps({
             'type': 'student_list',
             'data': students
@@ -142,10 +160,13 @@ class DashboardConsumer(AsyncWebsocketConsumer):
 
     async def statistics_update(self, event):
         """Send statistics update notification"""
-        await self.send(text_data=json.dumps({
+        message = {
             'type': 'statistics_update',
             'statistics': event['statistics']
-        }))
+        }
+        if 'students' in event:
+            message['students'] = event['students']
+        await self.send(text_data=json.dumps(message))
 
     # Database queries
     @database_sync_to_async
@@ -158,175 +179,6 @@ class DashboardConsumer(AsyncWebsocketConsumer):
             return None
 
     @database_sync_to_async
-    def get_initial_dashboard_data(self):
-        """Get initial dashboard data"""
-        from apps.lectures.models import Lecture, UserLectureEnrollment
-        from apps.progress.models import UserProgress
-        from apps.tasks.models import Task, Subtask
-        from apps.help.models import HelpRequest
-
-        try:
-            lecture = Lecture.objects.get(id=self.lecture_id)
-
-            # Get all enrolled students
-            enrollments = UserLectureEnrollment.objects.filter(
-                lecture=lecture
-            ).select_related('user')
-
-            # Get all subtasks for this lecture
-            total_subtasks = Subtask.objects.filter(
-                task__lecture=lecture
-            ).count()
-
-            students = []
-            for enrollment in enrollments:
-                user = enrollment.user
-
-                # Get completed subtasks count
-                completed_count = UserProgress.objects.filter(
-                    user=user,
-                    subtask__task__lecture=lecture,
-                    status='COMPLETED'
-                ).count()
-
-                # Get pending help requests
-                pending_help = HelpRequest.objects.filter(
-                    user=user,
-                    subtask__task__lecture=lecture,
-                    status__in=['PENDING', 'ANALYZING']
-                ).count()
-
-                progress_rate = (completed_count / total_subtasks * 100) if total_subtasks > 0 else 0
-
-                students.append({
-                    'user_id': user.id,
-                    'user_name': user.name,
-                    'email': user.email,
-                    'progress_rate': round(progress_rate, 2),
-                    'completed_subtasks': completed_count,
-                    'total_subtasks': total_subtasks,
-                    'pending_help': pending_help,
-                    'enrolled_at': enrollment.enrolled_at.isoformat()
-                })
-
-            # Get pending help requests count
-            pending_help_total = HelpRequest.objects.filter(
-                subtask__task__lecture=lecture,
-                status__in=['PENDING', 'ANALYZING']
-            ).count()
-
-            return {
-                'lecture': {
-                    'id': lecture.id,
-                    'title': lecture.title,
-                    'description': lecture.description
-                },
-                'students': students,
-                'total_students': len(students),
-                'total_subtasks': total_subtasks,
-                'pending_help_requests': pending_help_total
-            }
-
-        except Lecture.DoesNotExist:
-            return None
-
-    @database_sync_to_async
-    def get_lecture_statistics(self):
-        """Get lecture statistics"""
-        from apps.lectures.models import Lecture
-        from apps.progress.models import UserProgress
-        from apps.help.models import HelpRequest
-        from django.db.models import Count, Q
-
-        try:
-            lecture = Lecture.objects.get(id=self.lecture_id)
-
-            # Get subtasks with difficulty (high help request count)
-            difficult_subtasks = HelpRequest.objects.filter(
-                subtask__task__lecture=lecture
-            ).values(
-                'subtask__id',
-                'subtask__title'
-            ).annotate(
-                help_count=Count('id')
-            ).order_by('-help_count')[:5]
-
-            # Get average completion rate
-            from apps.lectures.models import UserLectureEnrollment
-            from apps.tasks.models import Subtask
-
-            total_subtasks = Subtask.objects.filter(task__lecture=lecture).count()
-            enrollments = UserLectureEnrollment.objects.filter(lecture=lecture).count()
-
-            if enrollments > 0 and total_subtasks > 0:
-                completed_progresses = UserProgress.objects.filter(
-                    subtask__task__lecture=lecture,
-                    status='COMPLETED'
-                ).count()
-                avg_completion_rate = (completed_progresses / (enrollments * total_subtasks) * 100)
-            else:
-                avg_completion_rate = 0
-
-            return {
-                'difficult_subtasks': list(difficult_subtasks),
-                'average_completion_rate': round(avg_completion_rate, 2),
-                'total_enrollments': enrollments,
-                'total_subtasks': total_subtasks
-            }
-
-        except Lecture.DoesNotExist:
-            return None
-
-    @database_sync_to_async
-    def get_student_list(self):
-        """Get current student list with progress"""
-        from apps.lectures.models import Lecture, UserLectureEnrollment
-        from apps.progress.models import UserProgress
-        from apps.tasks.models import Subtask
-
-        try:
-            lecture = Lecture.objects.get(id=self.lecture_id)
-            total_subtasks = Subtask.objects.filter(task__lecture=lecture).count()
-
-            enrollments = UserLectureEnrollment.objects.filter(
-                lecture=lecture
-            ).select_related('user')
-
-            students = []
-            for enrollment in enrollments:
-                user = enrollment.user
-                completed_count = UserProgress.objects.filter(
-                    user=user,
-                    subtask__task__lecture=lecture,
-                    status='COMPLETED'
-                ).count()
-
-                progress_rate = (completed_count / total_subtasks * 100) if total_subtasks > 0 else 0
-
-                # Get current subtask
-                current_progress = UserProgress.objects.filter(
-                    user=user,
-                    subtask__task__lecture=lecture,
-                    status='IN_PROGRESS'
-                ).select_related('subtask').first()
-
-                current_subtask = None
-                if current_progress:
-                    current_subtask = {
-                        'id': current_progress.subtask.id,
-                        'title': current_progress.subtask.title,
-                        'order': current_progress.subtask.order
-                    }
-
-                students.append({
-                    'user_id': user.id,
-                    'user_name': user.name,
-                    'progress_rate': round(progress_rate, 2),
-                    'completed_subtasks': completed_count,
-                    'current_subtask': current_subtask
-                })
-
-            return students
-
-        except Lecture.DoesNotExist:
-            return []
+    def get_snapshot(self):
+        """강의 대시보드 스냅샷 (초기 데이터, 통계, 수강생 목록)"""
+        return get_dashboard_snapshot(self.lecture_id)
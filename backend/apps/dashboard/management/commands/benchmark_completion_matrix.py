@@ -0,0 +1,108 @@
+"""
+완료 행렬 분석 벤치마크 커맨드
+
+합성 데이터(학생 × 단계)로 CompletionMatrix 생성/분석 시간을 측정하고,
+같은 결과를 단순 반복문으로 계산했을 때와 비교합니다. DB는 사용하지 않습니다.
+
+사용법:
+  python manage.py benchmark_completion_matrix                          # 1000명 × 200단계
+  python manage.py benchmark_completion_matrix --students 5000 --steps 300 --repeat 3
+"""
+import statistics
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from apps.dashboard.services.completion_matrix import (
+    STATE_COMPLETED,
+    STATE_STARTED,
+    CompletionMatrix,
+)
+
+
+def _synthetic_records(students, steps, seed):
+    """순서대로 진행하다 임의 지점에서 멈추는 학생 기록"""
+    rng = np.random.default_rng(seed)
+    stop_at = rng.integers(0, steps + 1, size=students)
+    records = []
+    for row in range(students):
+        stop = int(stop_at[row])
+        dwell = rng.lognormal(mean=4.0, sigma=0.6, size=stop)
+        for column in range(stop):
+            records.append((row, column, STATE_COMPLETED, float(dwell[column])))
+        if stop < steps:
+            records.append((row, stop, STATE_STARTED, None))
+    return records
+
+
+def _python_baseline(records, students, steps):
+    """행렬 없이 기록 목록을 반복하며 퍼널/이탈/중앙값 계산 (비교용)"""
+    completed = [set() for _ in range(students)]
+    dwell_by_step = [[] for _ in range(steps)]
+    for row, column, state, seconds in records:
+        if state == STATE_COMPLETED:
+            completed[row].add(column)
+            if seconds is not None:
+                dwell_by_step[column].append(seconds)
+
+    funnel = [sum(1 for done in completed if column in done) for column in range(steps)]
+    stopped_at = [0] * (steps + 1)
+    for done in completed:
+        step = 0
+        while step < steps and step in done:
+            step += 1
+        stopped_at[step] += 1
+    medians = [statistics.median(values) if values else None for values in dwell_by_step]
+    return funnel, stopped_at, medians
+
+
+class Command(BaseCommand):
+    help = '완료 행렬(NumPy) 분석 성능 측정'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=1000, help='학생 수 (기본 1000)')
+        parser.add_argument('--steps', type=int, default=200, help='단계 수 (기본 200)')
+        parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (기본 5, 중앙값 출력)')
+        parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+
+    def handle(self, *args, **options):
+        students = options['students']
+        steps = options['steps']
+        repeat = max(options['repeat'], 1)
+
+        self.stdout.write(f'합성 데이터 생성 중... ({students}명 × {steps}단계)')
+        records = _synthetic_records(students, steps, options['seed'])
+        self.stdout.write(f'기록 {len(records)}건')
+
+        row_ids = list(range(students))
+        column_ids = list(range(steps))
+        labels = ['A' if row % 3 else 'B' for row in row_ids]
+        matrix = CompletionMatrix.from_records(row_ids, column_ids, records)
+
+        cases = [
+            ('from_records', lambda: CompletionMatrix.from_records(row_ids, column_ids, records)),
+            ('funnel', matrix.funnel),
+            ('drop_off', matrix.drop_off),
+            ('dwell_percentiles', matrix.dwell_percentiles),
+            ('compare_cohorts', lambda: matrix.compare_cohorts(labels)),
+            ('to_compact', lambda: matrix.to_compact(include_dwell=True)),
+            ('python baseline (funnel/drop_off/median)', lambda: _python_baseline(records, students, steps)),
+        ]
+
+        for name, func in cases:
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                func()
+                timings.append((time.perf_counter() - started) * 1000)
+            self.stdout.write(f'  {name:<42} {statistics.median(timings):9.2f} ms')
+
+        # 결과 일치 확인
+        funnel, stopped_at, _ = _python_baseline(records, students, steps)
+        drop_off = matrix.drop_off()
+        if matrix.funnel()['completed'] != funnel or drop_off['stopped_at'] + [drop_off['finished']] != stopped_at:
+            self.stdout.write(self.style.ERROR('행렬 계산 결과가 기준 계산과 다릅니다.'))
+            return
+
+        self.stdout.write(self.style.SUCCESS('벤치마크 완료 (기준 계산과 결과 일치)'))
@@ -0,0 +1,44 @@
+"""
+대시보드 사전 집계 테이블/소요 시간 스케치 재계산 커맨드
+
+signals 도입 전 데이터의 백필이나, queryset.update()처럼 signal을 거치지 않은
+일괄 변경 후 집계를 원본 기준으로 맞출 때 사용합니다.
+
+사용법:
+  python manage.py rebuild_dashboard_rollups               # 전체 강의
+  python manage.py rebuild_dashboard_rollups --lecture 3   # 특정 강의만
+"""
+from django.core.management.base import BaseCommand
+
+from apps.dashboard.services import (
+    rebuild_duration_sketches,
+    rebuild_session_rollups,
+    rebuild_subtask_rollups,
+)
+
+
+class Command(BaseCommand):
+    help = '대시보드 단계/세션 사전 집계 테이블 및 소요 시간 스케치 재계산'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--lecture',
+            type=int,
+            default=None,
+            help='재계산할 강의 ID (생략 시 전체)',
+        )
+
+    def handle(self, *args, **options):
+        lecture_id = options.get('lecture')
+
+        self.stdout.write('단계별 집계 재계산 중...')
+        subtask_count = rebuild_subtask_rollups(lecture_id=lecture_id)
+        self.stdout.write(self.style.SUCCESS(f'단계 {subtask_count}개 집계 완료'))
+
+        self.stdout.write('세션별 집계 재계산 중...')
+        session_count = rebuild_session_rollups(lecture_id=lecture_id)
+        self.stdout.write(self.style.SUCCESS(f'세션 {session_count}개 집계 완료'))
+
+        self.stdout.write('단계 소요 시간 스케치 재계산 중...')
+        sketch_count = rebuild_duration_sketches(lecture_id=lecture_id)
+        self.stdout.write(self.style.SUCCESS(f'스케치 {sketch_count}개 저장 완료'))
@@ -0,0 +1,125 @@
+# Generated by Django 5.0.1 on 2026-10-19 01:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("lecture_sessions", "0008_recordingsession_live_analysis"),
+        ("tasks", "0004_add_source_task_field"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SessionStatsRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "participant_count",
+                    models.IntegerField(default=0, verbose_name="참가자 수"),
+                ),
+                (
+                    "completed_count",
+                    models.IntegerField(default=0, verbose_name="완료 참가자 수"),
+                ),
+                (
+                    "completion_time_total_seconds",
+                    models.FloatField(default=0, verbose_name="총 완료 소요 시간(초)"),
+                ),
+                (
+                    "completion_time_count",
+                    models.IntegerField(default=0, verbose_name="완료 시간 집계 수"),
+                ),
+                (
+                    "help_request_count",
+                    models.IntegerField(default=0, verbose_name="도움 요청 수"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="갱신 시각"),
+                ),
+                (
+                    "session",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stats_rollup",
+                        to="lecture_sessions.lecturesession",
+                        verbose_name="세션",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "세션 통계 집계",
+                "verbose_name_plural": "세션 통계 집계",
+                "db_table": "dashboard_session_stats_rollups",
+            },
+        ),
+        migrations.CreateModel(
+            name="SubtaskStatsRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "student_count",
+                    models.IntegerField(default=0, verbose_name="시작한 학생 수"),
+                ),
+                (
+                    "completed_count",
+                    models.IntegerField(
+                        default=0,
+                        help_text="시작/완료 시각이 모두 있는 완료 기록 수",
+                        verbose_name="완료 수",
+                    ),
+                ),
+                (
+                    "total_time_seconds",
+                    models.FloatField(default=0, verbose_name="총 소요 시간(초)"),
+                ),
+                (
+                    "duration_histogram",
+                    models.JSONField(
+                        default=dict,
+                        help_text="로그 구간 번호 → 완료 수 (지체율 계산용)",
+                        verbose_name="소요 시간 히스토그램",
+                    ),
+                ),
+                ("help_count", models.IntegerField(default=0, verbose_name="도움 요청 수")),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="갱신 시각"),
+                ),
+                (
+                    "subtask",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stats_rollup",
+                        to="tasks.subtask",
+                        verbose_name="세부 단계",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "단계 통계 집계",
+                "verbose_name_plural": "단계 통계 집계",
+                "db_table": "dashboard_subtask_stats_rollups",
+            },
+        ),
+    ]
@@ -0,0 +1,102 @@
+# Generated by Django 5.0.1 on 2026-10-19 01:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("dashboard", "0001_initial"),
+        ("lecture_sessions", "0009_sessionsummarysnapshot"),
+        ("tasks", "0004_add_source_task_field"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StepDurationSketch",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "cohort",
+                    models.CharField(
+                        help_text="디지털 수준 (UNKNOWN: 미입력, '*': 전체)",
+                        max_length=20,
+                        verbose_name="집단",
+                    ),
+                ),
+                ("count", models.IntegerField(default=0, verbose_name="완료 수")),
+                ("sketch", models.JSONField(default=dict, verbose_name="스케치")),
+                (
+                    "p50_seconds",
+                    models.FloatField(
+                        blank=True, null=True, verbose_name="p50 소요 시간(초)"
+                    ),
+                ),
+                (
+                    "p90_seconds",
+                    models.FloatField(
+                        blank=True, null=True, verbose_name="p90 소요 시간(초)"
+                    ),
+                ),
+                (
+                    "p99_seconds",
+                    models.FloatField(
+                        blank=True, null=True, verbose_name="p99 소요 시간(초)"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="갱신 시각"),
+                ),
+                (
+                    "session",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="비어 있으면 전체 기록 합계",
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="duration_sketches",
+                        to="lecture_sessions.lecturesession",
+                        verbose_name="세션",
+                    ),
+                ),
+                (
+                    "subtask",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="duration_sketches",
+                        to="tasks.subtask",
+                        verbose_name="세부 단계",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "단계 소요 시간 스케치",
+                "verbose_name_plural": "단계 소요 시간 스케치",
+                "db_table": "dashboard_step_duration_sketches",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="stepdurationsketch",
+            constraint=models.UniqueConstraint(
+                fields=("subtask", "session", "cohort"),
+                name="uniq_step_sketch_session_cohort",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="stepdurationsketch",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("session__isnull", True)),
+                fields=("subtask", "cohort"),
+                name="uniq_step_sketch_total_cohort",
+            ),
+        ),
+    ]
@@ -0,0 +1,136 @@
+"""
+Dashboard Rollup Models - 대시보드 통계용 사전 집계 테이블
+
+UserProgress/HelpRequest/SessionParticipant 원본을 요청마다 다시 집계하지 않도록
+단계별/세션별 집계 값을 signals에서 증분 갱신한다. (백필: rebuild_dashboard_rollups)
+"""
+from django.db import models
+
+from apps.sessions.models import LectureSession
+from apps.tasks.models import Subtask
+
+
+class SubtaskStatsRollup(models.Model):
+    """단계별 진행/도움 요청 집계"""
+
+    subtask = models.OneToOneField(
+        Subtask,
+        on_delete=models.CASCADE,
+        related_name='stats_rollup',
+        verbose_name='세부 단계'
+    )
+    student_count = models.IntegerField(default=0, verbose_name='시작한 학생 수')
+    completed_count = models.IntegerField(
+        default=0,
+        verbose_name='완료 수',
+        help_text='시작/완료 시각이 모두 있는 완료 기록 수'
+    )
+    total_time_seconds = models.FloatField(default=0, verbose_name='총 소요 시간(초)')
+    duration_histogram = models.JSONField(
+        default=dict,
+        verbose_name='소요 시간 히스토그램',
+        help_text='로그 구간 번호 → 완료 수 (지체율 계산용)'
+    )
+    help_count = models.IntegerField(default=0, verbose_name='도움 요청 수')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='갱신 시각')
+
+    class Meta:
+        db_table = 'dashboard_subtask_stats_rollups'
+        verbose_name = '단계 통계 집계'
+        verbose_name_plural = '단계 통계 집계'
+
+    def __str__(self):
+        return f"Stats for subtask {self.subtask_id}"
+
+    @property
+    def avg_time_seconds(self):
+        return self.total_time_seconds / self.completed_count if self.completed_count else 0
+
+
+class SessionStatsRollup(models.Model):
+    """세션별 참가/완료/도움 요청 집계"""
+
+    session = models.OneToOneField(
+        LectureSession,
+        on_delete=models.CASCADE,
+        related_name='stats_rollup',
+        verbose_name='세션'
+    )
+    participant_count = models.IntegerField(default=0, verbose_name='참가자 수')
+    completed_count = models.IntegerField(default=0, verbose_name='완료 참가자 수')
+    completion_time_total_seconds = models.FloatField(default=0, verbose_name='총 완료 소요 시간(초)')
+    completion_time_count = models.IntegerField(default=0, verbose_name='완료 시간 집계 수')
+    help_request_count = models.IntegerField(default=0, verbose_name='도움 요청 수')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='갱신 시각')
+
+    class Meta:
+        db_table = 'dashboard_session_stats_rollups'
+        verbose_name = '세션 통계 집계'
+        verbose_name_plural = '세션 통계 집계'
+
+    def __str__(self):
+        return f"Stats for session {self.session_id}"
+
+    @property
+    def avg_completion_time(self):
+        if not self.completion_time_count:
+            return 0
+        return self.completion_time_total_seconds / self.completion_time_count
+
+
+class StepDurationSketch(models.Model):
+    """
+    단계 소요 시간 분위수 스케치 (DDSketch, apps.dashboard.sketches)
+
+    (단계, 세션, 집단)별로 보관한다. session이 비어 있으면 모든 세션(전체 기록) 합계,
+    cohort가 ALL_COHORTS이면 모든 집단 합계. 저장 시 p50/p90/p99를 함께 계산해 두어
+    조회는 행 하나만 읽는다.
+    """
+
+    ALL_COHORTS = '*'
+
+    subtask = models.ForeignKey(
+        Subtask,
+        on_delete=models.CASCADE,
+        related_name='duration_sketches',
+        verbose_name='세부 단계'
+    )
+    session = models.ForeignKey(
+        LectureSession,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='duration_sketches',
+        verbose_name='세션',
+        help_text='비어 있으면 전체 기록 합계'
+    )
+    cohort = models.CharField(
+        max_length=20,
+        verbose_name='집단',
+        help_text="디지털 수준 (UNKNOWN: 미입력, '*': 전체)"
+    )
+    count = models.IntegerField(default=0, verbose_name='완료 수')
+    sketch = models.JSONField(default=dict, verbose_name='스케치')
+    p50_seconds = models.FloatField(null=True, blank=True, verbose_name='p50 소요 시간(초)')
+    p90_seconds = models.FloatField(null=True, blank=True, verbose_name='p90 소요 시간(초)')
+    p99_seconds = models.FloatField(null=True, blank=True, verbose_name='p99 소요 시간(초)')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='갱신 시각')
+
+    class Meta:
+        db_table = 'dashboard_step_duration_sketches'
+        verbose_name = '단계 소요 시간 스케치'
+        verbose_name_plural = '단계 소요 시간 스케치'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['subtask', 'session', 'cohort'],
+                name='uniq_step_sketch_session_cohort',
+            ),
+            models.UniqueConstraint(
+                fields=['subtask', 'cohort'],
+                condition=models.Q(session__isnull=True),
+                name='uniq_step_sketch_total_cohort',
+            ),
+        ]
+
+    def __str__(self):
+        return f"Duration sketch for subtask {self.subtask_id} (session={self.session_id}, cohort={self.cohort})"
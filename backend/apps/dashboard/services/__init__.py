@@ -0,0 +1,46 @@
+"""
+Dashboard Services
+"""
+from .lecture_stats import (
+    get_student_progress_summaries,
+    get_lecture_progress_overview,
+)
+from .dashboard_snapshot import (
+    build_dashboard_snapshot,
+    get_dashboard_snapshot,
+    mark_dashboard_dirty,
+    refresh_dashboard_snapshot_if_dirty,
+)
+from .rollups import (
+    estimate_delayed_count,
+    refresh_session_rollup,
+    rebuild_subtask_rollups,
+    rebuild_session_rollups,
+)
+from .duration_sketches import (
+    apply_duration_change,
+    get_step_percentiles,
+    rebuild_duration_sketches,
+)
+from .completion_matrix import (
+    CompletionMatrix,
+    build_completion_report,
+)
+
+__all__ = [
+    'get_student_progress_summaries',
+    'get_lecture_progress_overview',
+    'build_dashboard_snapshot',
+    'get_dashboard_snapshot',
+    'mark_dashboard_dirty',
+    'refresh_dashboard_snapshot_if_dirty',
+    'estimate_delayed_count',
+    'refresh_session_rollup',
+    'rebuild_subtask_rollups',
+    'rebuild_session_rollups',
+    'apply_duration_change',
+    'get_step_percentiles',
+    'rebuild_duration_sketches',
+    'CompletionMatrix',
+    'build_completion_report',
+]
@@ -0,0 +1,319 @@
+"""
+Completion Matrix - 학생 × 단계 완료/소요 시간 행렬 기반 강의 분석
+
+강의(또는 세션)의 진행 기록을 NumPy 배열로 한 번 적재하고,
+퍼널/이탈 지점/단계별 소요 시간 백분위수/집단 비교를 반복문 없이 계산한다.
+
+행렬 구성:
+  행(row)    수강생 (강의: 수강 등록 순, 세션: 참가 순)
+  열(column) 강의 단계 (과제 순서 → 단계 순서, get_lecture_plan 기준)
+  states     0 = 기록 없음, 1 = 시작함(미완료), 2 = 완료
+  dwell      완료한 단계의 소요 시간(초), 없으면 NaN
+"""
+import base64
+import warnings
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+STATE_NONE = 0
+STATE_STARTED = 1
+STATE_COMPLETED = 2
+
+# dwell 압축 전송 시 값이 없는 칸
+DWELL_MISSING = np.iinfo(np.uint32).max
+
+DEFAULT_PERCENTILES = (50, 90, 99)
+
+
+def _nan_to_none(values) -> List:
+    return [None if np.isnan(value) else round(float(value), 1) for value in values]
+
+
+class CompletionMatrix:
+    """학생 × 단계 완료 상태/소요 시간 행렬"""
+
+    def __init__(self, row_ids: Sequence, column_ids: Sequence, states: np.ndarray, dwell: np.ndarray):
+        self.row_ids = list(row_ids)
+        self.column_ids = list(column_ids)
+        self.states = states
+        self.dwell = dwell
+
+    # ==================== 생성 ====================
+
+    @classmethod
+    def from_records(
+        cls,
+        row_ids: Sequence,
+        column_ids: Sequence,
+        records: Iterable[Tuple],
+    ) -> 'CompletionMatrix':
+        """
+        진행 기록으로 행렬 생성
+
+        Args:
+            row_ids: 행 순서 (학생 ID 등)
+            column_ids: 열 순서 (단계 ID)
+            records: (row_id, column_id, state, dwell_seconds 또는 None) 목록.
+                행/열에 없는 기록은 무시하고, 같은 칸에 여러 기록이 있으면
+                가장 진행된 상태와 가장 짧은 소요 시간을 사용한다.
+        """
+        row_index = {row_id: index for index, row_id in enumerate(row_ids)}
+        column_index = {column_id: index for index, column_id in enumerate(column_ids)}
+
+        rows, columns, states, dwell = [], [], [], []
+        for row_id, column_id, state, seconds in records:
+            row = row_index.get(row_id)
+            column = column_index.get(column_id)
+            if row is None or column is None:
+                continue
+            rows.append(row)
+            columns.append(column)
+            states.append(state)
+            dwell.append(np.nan if seconds is None else seconds)
+
+        shape = (len(row_ids), len(column_ids))
+        state_matrix = np.zeros(shape, dtype=np.uint8)
+        dwell_matrix = np.full(shape, np.nan, dtype=np.float64)
+        if rows:
+            cells = (np.asarray(rows, dtype=np.intp), np.asarray(columns, dtype=np.intp))
+            np.maximum.at(state_matrix, cells, np.asarray(states, dtype=np.uint8))
+            np.fmin.at(dwell_matrix, cells, np.asarray(dwell, dtype=np.float64))
+
+        return cls(row_ids, column_ids, state_matrix, dwell_matrix)
+
+    @classmethod
+    def for_lecture(cls, lecture_id: int) -> Tuple['CompletionMatrix', List[Dict]]:
+        """
+        강의 수강생 × 단계 행렬 (쿼리 3개 + 강의 단계 구성 캐시)
+
+        Returns:
+            (행렬, 행 정보 [{'id', 'name', 'cohort'}]) - cohort는 디지털 수준
+        """
+        from apps.lectures.models import UserLectureEnrollment
+        from apps.lectures.services import get_lecture_plan
+        from apps.progress.models import UserProgress
+
+        column_ids = get_lecture_plan(lecture_id)['subtask_ids']
+        rows = [
+            {'id': user_id, 'name': name, 'cohort': digital_level or 'UNKNOWN'}
+            for user_id, name, digital_level in UserLectureEnrollment.objects.filter(
+                lecture_id=lecture_id
+            ).order_by('id').values_list('user_id', 'user__name', 'user__digital_level')
+        ]
+
+        progress = UserProgress.objects.filter(
+            user_id__in=[row['id'] for row in rows],
+            subtask_id__in=column_ids,
+        ).values_list('user_id', 'subtask_id', 'status', 'started_at', 'completed_at')
+
+        matrix = cls.from_records(
+            [row['id'] for row in rows], column_ids, _progress_records(progress.iterator())
+        )
+        return matrix, rows
+
+    @classmethod
+    def for_session(cls, session) -> Tuple['CompletionMatrix', List[Dict]]:
+        """
+        세션 참가자 × 강의 단계 행렬
+
+        완료 여부는 참가자의 completed_subtasks/current_subtask, 소요 시간은
+        해당 세션의 UserProgress(로그인 참가자만)에서 가져온다.
+
+        Returns:
+            (행렬, 행 정보 [{'id', 'name', 'cohort'}]) - id는 참가자 ID
+        """
+        from apps.lectures.services import get_lecture_plan
+        from apps.progress.models import UserProgress
+
+        column_ids = get_lecture_plan(session.lecture_id)['subtask_ids'] if session.lecture_id else []
+        participants = list(session.participants.select_related('user').order_by('id'))
+        rows = [
+            {
+                'id': p.id,
+                'name': p.participant_name,
+                'cohort': (p.user.digital_level if p.user else None) or 'UNKNOWN',
+            }
+            for p in participants
+        ]
+
+        records = []
+        participant_by_user = {}
+        for p in participants:
+            if p.user_id:
+                participant_by_user[p.user_id] = p.id
+            for subtask_id in p.completed_subtasks or []:
+                records.append((p.id, subtask_id, STATE_COMPLETED, None))
+            if p.current_subtask_id:
+                records.append((p.id, p.current_subtask_id, STATE_STARTED, None))
+
+        progress = UserProgress.objects.filter(
+            session=session,
+            user_id__in=list(participant_by_user),
+            subtask_id__in=column_ids,
+        ).values_list('user_id', 'subtask_id', 'status', 'started_at', 'completed_at')
+        records.extend(
+            (participant_by_user[user_id], subtask_id, state, seconds)
+            for user_id, subtask_id, state, seconds in _progress_records(progress.iterator())
+        )
+
+        matrix = cls.from_records([row['id'] for row in rows], column_ids, records)
+        return matrix, rows
+
+    # ==================== 분석 ====================
+
+    @property
+    def completed(self) -> np.ndarray:
+        return self.states == STATE_COMPLETED
+
+    def funnel(self) -> Dict[str, List[int]]:
+        """
+        단계별 퍼널
+
+        Returns:
+            Dict containing:
+                - completed: 단계별 완료 학생 수
+                - reached: 첫 단계부터 해당 단계까지 모두 완료한 학생 수
+                - started: 단계별 시작(완료 포함) 학생 수
+        """
+        completed = self.completed
+        return {
+            'completed': completed.sum(axis=0).tolist(),
+            'reached': np.logical_and.accumulate(completed, axis=1).sum(axis=0).tolist(),
+            'started': (self.states >= STATE_STARTED).sum(axis=0).tolist(),
+        }
+
+    def first_incomplete_steps(self) -> np.ndarray:
+        """학생별 처음으로 완료하지 못한 단계 인덱스 (모두 완료하면 단계 수)"""
+        completed = self.completed
+        if completed.shape[1] == 0:
+            return np.zeros(completed.shape[0], dtype=np.intp)
+        return np.where(completed.all(axis=1), completed.shape[1], np.argmin(completed, axis=1))
+
+    def drop_off(self) -> Dict:
+        """
+        이탈 지점 - 순서대로 진행하다 멈춘 단계별 학생 수
+
+        Returns:
+            Dict containing:
+                - stopped_at: 단계별로 그 단계에서 멈춘 학생 수
+                - finished: 모든 단계를 완료한 학생 수
+                - worst_step_index: 가장 많이 멈춘 단계 인덱스 (없으면 None)
+        """
+        column_count = len(self.column_ids)
+        counts = np.bincount(self.first_incomplete_steps(), minlength=column_count + 1)
+        stopped_at = counts[:column_count]
+        return {
+            'stopped_at': stopped_at.tolist(),
+            'finished': int(counts[column_count]),
+            'worst_step_index': int(np.argmax(stopped_at)) if stopped_at.any() else None,
+        }
+
+    def dwell_percentiles(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict:
+        """
+        단계별 소요 시간 백분위수(초)
+
+        Returns:
+            {'p50': [...], 'p90': [...], ..., 'count': [...]} - 기록이 없는 단계는 None
+        """
+        counts = (~np.isnan(self.dwell)).sum(axis=0)
+        result = {}
+        if self.dwell.size:
+            with warnings.catch_warnings():
+                # 기록이 없는 단계(All-NaN slice)는 NaN으로 둔다
+                warnings.simplefilter('ignore', category=RuntimeWarning)
+                values = np.nanpercentile(self.dwell, percentiles, axis=0)
+        else:
+            values = np.full((len(percentiles), len(self.column_ids)), np.nan)
+        for pct, row in zip(percentiles, values):
+            result[f'p{int(pct)}'] = _nan_to_none(row)
+        result['count'] = counts.tolist()
+        return result
+
+    def compare_cohorts(self, labels: Sequence[str]) -> Dict[str, Dict]:
+        """
+        집단별 비교 (예: 디지털 수준별)
+
+        Args:
+            labels: 행마다 집단 이름
+
+        Returns:
+            {집단: {'size', 'completion_rate' (단계별), 'median_dwell' (단계별), 'avg_progress'}}
+        """
+        labels = np.asarray(labels)
+        column_count = max(len(self.column_ids), 1)
+        completed = self.completed
+        result = {}
+        for label in np.unique(labels):
+            mask = labels == label
+            cohort_completed = completed[mask]
+            cohort_dwell = self.dwell[mask]
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', category=RuntimeWarning)
+                median_dwell = np.nanmedian(cohort_dwell, axis=0) if cohort_dwell.size else \
+                    np.full(len(self.column_ids), np.nan)
+            result[str(label)] = {
+                'size': int(mask.sum()),
+                'completion_rate': np.round(cohort_completed.mean(axis=0), 3).tolist(),
+                'median_dwell': _nan_to_none(median_dwell),
+                'avg_progress': round(float(cohort_completed.sum(axis=1).mean() / column_count * 100), 1),
+            }
+        return result
+
+    # ==================== 전송 ====================
+
+    def to_compact(self, include_dwell: bool = False) -> Dict:
+        """
+        히트맵 렌더링용 압축 형식
+
+        Returns:
+            Dict containing:
+                - states: 행마다 단계 수 길이의 문자열 ('0' 기록 없음, '1' 시작, '2' 완료)
+                - dwell: (include_dwell) 행 우선 uint32 little-endian 초 단위 배열의 base64,
+                  값이 없는 칸은 4294967295
+        """
+        cells = (self.states + ord('0')).astype(np.uint8)
+        compact = {
+            'shape': list(self.states.shape),
+            'states': [row.tobytes().decode('ascii') for row in cells],
+        }
+        if include_dwell:
+            dwell = np.where(
+                np.isnan(self.dwell), DWELL_MISSING,
+                np.round(np.clip(np.nan_to_num(self.dwell), 0, DWELL_MISSING - 1)),
+            )
+            compact['dwell'] = base64.b64encode(dwell.astype('<u4').tobytes()).decode('ascii')
+        return compact
+
+
+def _progress_records(rows: Iterable[Tuple]) -> Iterable[Tuple]:
+    """UserProgress (user_id, subtask_id, status, started_at, completed_at) → 행렬 기록"""
+    for user_id, subtask_id, status, started_at, completed_at in rows:
+        if status == 'COMPLETED':
+            seconds = (completed_at - started_at).total_seconds() if started_at and completed_at else None
+            yield user_id, subtask_id, STATE_COMPLETED, seconds
+        elif status != 'NOT_STARTED':
+            yield user_id, subtask_id, STATE_STARTED, None
+
+
+def build_completion_report(matrix: CompletionMatrix, rows: List[Dict], include_dwell: bool = False) -> Dict:
+    """
+    행렬 + 분석 결과 응답 (CompletionMatrixView 형식)
+
+    Args:
+        matrix: CompletionMatrix
+        rows: for_lecture / for_session이 반환한 행 정보
+        include_dwell: 칸별 소요 시간 포함 여부
+    """
+    from apps.tasks.models import Subtask
+
+    titles = dict(Subtask.objects.filter(id__in=matrix.column_ids).values_list('id', 'title'))
+    return {
+        'rows': rows,
+        'columns': [{'subtask_id': subtask_id, 'title': titles.get(subtask_id)} for subtask_id in matrix.column_ids],
+        'matrix': matrix.to_compact(include_dwell=include_dwell),
+        'funnel': matrix.funnel(),
+        'drop_off': matrix.drop_off(),
+        'dwell_percentiles': matrix.dwell_percentiles(),
+        'cohorts': matrix.compare_cohorts([row['cohort'] for row in rows]),
+    }
@@ -0,0 +1,203 @@
+"""
+Dashboard Snapshot - 강의 대시보드 WebSocket 데이터를 강의별로 한 번만 계산해 공유
+
+같은 강의를 여러 강사/조교가 보고 있어도 연결마다 통계를 다시 계산하지 않도록,
+강의별 스냅샷(초기 데이터, 통계, 수강생 목록)을 Redis에 캐시한다.
+원본이 바뀌면 signals에서 dirty 표시만 하고, 강의별 ticker가 주기마다 dirty일 때만
+다시 계산해 그룹에 statistics_update를 한 번 보낸다.
+
+Redis 구조 (dashboard_snapshot:{lecture_id}:*):
+  data   마지막 스냅샷 JSON (새로 연결한 클라이언트에 바로 전송)
+  dirty  마지막 계산 이후 원본이 바뀌었는지 표시
+  lock   주기당 한 프로세스만 계산하도록 하는 락 (주기 길이 TTL)
+
+Redis를 사용할 수 없으면 캐시 없이 매번 계산한다.
+"""
+import json
+import logging
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.db.models import Count
+
+from core.redis import get_redis
+from .lecture_stats import get_student_progress_summaries
+
+logger = logging.getLogger(__name__)
+
+
+def _keys(lecture_id: int) -> Dict[str, str]:
+    prefix = f'dashboard_snapshot:{lecture_id}'
+    return {
+        'data': f'{prefix}:data',
+        'dirty': f'{prefix}:dirty',
+        'lock': f'{prefix}:lock',
+    }
+
+
+def build_dashboard_snapshot(lecture_id: int) -> Optional[Dict]:
+    """
+    강의 대시보드 데이터 계산 (쿼리 수는 수강생 수와 무관하게 고정)
+
+    Returns:
+        Dict containing:
+            - initial_data: 연결 직후 전송하는 초기 데이터
+            - statistics: 강의 통계 (statistics / statistics_update)
+            - student_list: 수강생별 진행 상태 (student_list)
+        강의가 없으면 None
+    """
+    from apps.help.models import HelpRequest
+    from apps.lectures.models import Lecture
+    from apps.lectures.services import get_lecture_plan
+    from apps.progress.models import UserProgress
+    from apps.tasks.models import Subtask
+
+    lecture = Lecture.objects.filter(id=lecture_id).first()
+    if lecture is None:
+        return None
+
+    total_subtasks = get_lecture_plan(lecture.id)['total_subtasks']
+    enrollments = list(lecture.enrollments.select_related('user').order_by('id'))
+    user_ids = [enrollment.user_id for enrollment in enrollments]
+
+    summaries = get_student_progress_summaries(lecture.id, user_ids)
+
+    lecture_help = HelpRequest.objects.filter(subtask__task__lecture=lecture)
+    pending_by_user = dict(
+        lecture_help.filter(
+            user_id__in=user_ids, status__in=['PENDING', 'ANALYZING']
+        ).values('user_id').annotate(count=Count('id')).values_list('user_id', 'count')
+    )
+
+    current_subtask_ids = {
+        summary['current_progress']['subtask_id']
+        for summary in summaries.values() if summary['current_progress']
+    }
+    subtask_orders = dict(
+        Subtask.objects.filter(id__in=current_subtask_ids).values_list('id', 'order_index')
+    )
+
+    students = []
+    student_list = []
+    for enrollment in enrollments:
+        user = enrollment.user
+        summary = summaries[user.id]
+        completed_count = summary['completed_subtasks']
+        progress_rate = round((completed_count / total_subtasks * 100) if total_subtasks > 0 else 0, 2)
+
+        students.append({
+            'user_id': user.id,
+            'user_name': user.name,
+            'email': user.email,
+            'progress_rate': progress_rate,
+            'completed_subtasks': completed_count,
+            'total_subtasks': total_subtasks,
+            'pending_help': pending_by_user.get(user.id, 0),
+            'enrolled_at': enrollment.enrolled_at.isoformat(),
+        })
+
+        current = summary['current_progress']
+        student_list.append({
+            'user_id': user.id,
+            'user_name': user.name,
+            'progress_rate': progress_rate,
+            'completed_subtasks': completed_count,
+            'current_subtask': {
+                'id': current['subtask_id'],
+                'title': current['subtask_title'],
+                'order': subtask_orders.get(current['subtask_id']),
+            } if current else None,
+        })
+
+    # 도움 요청이 많은 단계 및 평균 완료율
+    difficult_subtasks = list(
+        lecture_help.values('subtask__id', 'subtask__title').annotate(
+            help_count=Count('id')
+        ).order_by('-help_count')[:5]
+    )
+    pending_help_total = lecture_help.filter(status__in=['PENDING', 'ANALYZING']).count()
+
+    if enrollments and total_subtasks > 0:
+        completed_progresses = UserProgress.objects.filter(
+            subtask__task__lecture=lecture,
+            status='COMPLETED'
+        ).count()
+        avg_completion_rate = completed_progresses / (len(enrollments) * total_subtasks) * 100
+    else:
+        avg_completion_rate = 0
+
+    return {
+        'initial_data': {
+            'lecture': {
+                'id': lecture.id,
+                'title': lecture.title,
+                'description': lecture.description,
+            },
+            'students': students,
+            'total_students': len(students),
+            'total_subtasks': total_subtasks,
+            'pending_help_requests': pending_help_total,
+        },
+        'statistics': {
+            'difficult_subtasks': difficult_subtasks,
+            'average_completion_rate': round(avg_completion_rate, 2),
+            'total_enrollments': len(enrollments),
+            'total_subtasks': total_subtasks,
+        },
+        'student_list': student_list,
+    }
+
+
+def _store(lecture_id: int, snapshot: Optional[Dict]):
+    if snapshot is None:
+        return
+    ttl = getattr(settings, 'DASHBOARD_SNAPSHOT_TTL', 300)
+    get_redis().set(_keys(lecture_id)['data'], json.dumps(snapshot, ensure_ascii=False, default=str), ex=ttl)
+
+
+def get_dashboard_snapshot(lecture_id: int) -> Optional[Dict]:
+    """마지막 스냅샷 조회 (없으면 계산 후 캐시)"""
+    try:
+        raw = get_redis().get(_keys(lecture_id)['data'])
+    except Exception as e:
+        logger.warning(f"Dashboard snapshot cache unavailable for lecture {lecture_id}: {e}")
+        return build_dashboard_snapshot(lecture_id)
+
+    if raw:
+        return json.loads(raw)
+
+    snapshot = build_dashboard_snapshot(lecture_id)
+    try:
+        _store(lecture_id, snapshot)
+    except Exception as e:
+        logger.warning(f"Failed to cache dashboard snapshot for lecture {lecture_id}: {e}")
+    return snapshot
+
+
+def mark_dashboard_dirty(lecture_id: Optional[int]):
+    """원본 변경 표시 - 다음 ticker 주기에 다시 계산"""
+    if not lecture_id:
+        return
+    try:
+        get_redis().set(_keys(lecture_id)['dirty'], 1, ex=getattr(settings, 'DASHBOARD_SNAPSHOT_TTL', 300))
+    except Exception as e:
+        logger.warning(f"Failed to mark dashboard dirty for lecture {lecture_id}: {e}")
+
+
+def refresh_dashboard_snapshot_if_dirty(lecture_id: int, interval: float) -> Optional[Dict]:
+    """
+    ticker 주기마다 호출 - 이번 주기의 락을 잡았고 dirty이면 다시 계산해 캐시
+
+    Returns:
+        새 스냅샷 (전송 필요) 또는 None (다른 프로세스가 처리했거나 변경 없음)
+    """
+    keys = _keys(lecture_id)
+    redis = get_redis()
+    if not redis.set(keys['lock'], 1, nx=True, px=max(int(interval * 1000), 1)):
+        return None
+    if not redis.delete(keys['dirty']):
+        return None
+
+    snapshot = build_dashboard_snapshot(lecture_id)
+    _store(lecture_id, snapshot)
+    return snapshot
@@ -0,0 +1,211 @@
+"""
+Duration Sketches - 단계 소요 시간 분위수 스케치 갱신/조회
+
+완료 기록이 들어올 때 signals에서 (단계, 세션, 집단) 스케치와 전체 합계 스케치를
+증분 갱신하고, 조회 시에는 저장해 둔 p50/p90/p99를 읽거나 여러 세션 스케치를 병합한다.
+전체 재계산(백필)은 rebuild_dashboard_rollups 관리 명령으로 실행한다.
+
+집단(cohort)은 학생의 디지털 수준 (미입력: UNKNOWN). 완료 후 학생의 디지털 수준이 바뀌면
+이전 기록은 원래 집단에 남으므로, 필요하면 재계산으로 맞춘다.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from apps.dashboard.models import StepDurationSketch
+from apps.dashboard.sketches import DDSketch
+
+ALL_COHORTS = StepDurationSketch.ALL_COHORTS
+UNKNOWN_COHORT = 'UNKNOWN'
+
+# (단계 ID, 세션 ID, 학생 ID, 소요 시간 초)
+DurationRecord = Tuple[int, Optional[int], Optional[int], float]
+
+
+def _relative_accuracy() -> float:
+    return getattr(settings, 'DASHBOARD_SKETCH_RELATIVE_ACCURACY', 0.02)
+
+
+def _percentile_fields(sketch: DDSketch) -> Dict:
+    return {
+        'count': sketch.count,
+        'sketch': sketch.to_dict(),
+        'p50_seconds': sketch.quantile(0.5),
+        'p90_seconds': sketch.quantile(0.9),
+        'p99_seconds': sketch.quantile(0.99),
+    }
+
+
+def _cohort_for_user(user_id: Optional[int]) -> str:
+    from django.contrib.auth import get_user_model
+
+    if not user_id:
+        return UNKNOWN_COHORT
+    level = get_user_model().objects.filter(id=user_id).values_list('digital_level', flat=True).first()
+    return level or UNKNOWN_COHORT
+
+
+def _targets(session_id: Optional[int], cohort: str) -> List[Tuple[Optional[int], str]]:
+    targets = [(None, cohort), (None, ALL_COHORTS)]
+    if session_id:
+        targets.insert(0, (session_id, cohort))
+    return targets
+
+
+def _locked_sketch(subtask_id: int, session_id: Optional[int], cohort: str, create: bool):
+    rows = StepDurationSketch.objects.select_for_update().filter(subtask_id=subtask_id, cohort=cohort)
+    rows = rows.filter(session__isnull=True) if session_id is None else rows.filter(session_id=session_id)
+    row = rows.first()
+    if row is None and create:
+        try:
+            with transaction.atomic():
+                StepDurationSketch.objects.create(subtask_id=subtask_id, session_id=session_id, cohort=cohort)
+        except IntegrityError:
+            # 동시에 생성되었거나 단계/세션이 삭제된 경우
+            pass
+        row = rows.first()
+    return row
+
+
+def _apply(record: DurationRecord, sign: int):
+    subtask_id, session_id, user_id, seconds = record
+    cohort = _cohort_for_user(user_id)
+
+    for target_session_id, target_cohort in _targets(session_id, cohort):
+        row = _locked_sketch(subtask_id, target_session_id, target_cohort, create=sign > 0)
+        if row is None:
+            continue
+        sketch = DDSketch.from_dict(row.sketch, _relative_accuracy())
+        if sign > 0:
+            sketch.add(seconds)
+        else:
+            sketch.remove(seconds)
+        for field, value in _percentile_fields(sketch).items():
+            setattr(row, field, value)
+        row.save()
+
+
+def apply_duration_change(old: Optional[DurationRecord], new: Optional[DurationRecord]):
+    """
+    완료 소요 시간 변경 반영
+
+    Args:
+        old: 변경 전 (단계 ID, 세션 ID, 학생 ID, 소요 시간) - 완료 기록이 아니었으면 None
+        new: 변경 후 값 - 완료 기록이 아니게 되었거나 삭제되었으면 None
+    """
+    if old == new:
+        return
+
+    with transaction.atomic():
+        if old is not None:
+            _apply(old, -1)
+        if new is not None:
+            _apply(new, 1)
+
+
+def get_step_percentiles(
+    subtask_ids: Iterable[int],
+    cohort: Optional[str] = None,
+    session_ids: Optional[Iterable[int]] = None,
+) -> Dict[int, Dict]:
+    """
+    단계별 소요 시간 분위수
+
+    Args:
+        subtask_ids: 단계 ID 목록
+        cohort: 지정 시 해당 집단만 (기본: 전체)
+        session_ids: 지정 시 해당 세션 스케치를 병합 (기본: 전체 기록 합계 - 저장된 값을 그대로 사용)
+
+    Returns:
+        {subtask_id: {'p50', 'p90', 'p99', 'count'}} (기록 없는 단계는 값이 None, count 0)
+    """
+    subtask_ids = list(subtask_ids)
+    result = {
+        subtask_id: {'p50': None, 'p90': None, 'p99': None, 'count': 0}
+        for subtask_id in subtask_ids
+    }
+
+    rows = StepDurationSketch.objects.filter(subtask_id__in=subtask_ids)
+    if session_ids is None:
+        for row in rows.filter(session__isnull=True, cohort=cohort or ALL_COHORTS):
+            result[row.subtask_id] = {
+                'p50': row.p50_seconds,
+                'p90': row.p90_seconds,
+                'p99': row.p99_seconds,
+                'count': row.count,
+            }
+        return result
+
+    rows = rows.filter(session_id__in=list(session_ids))
+    if cohort:
+        rows = rows.filter(cohort=cohort)
+
+    merged: Dict[int, DDSketch] = {}
+    for subtask_id, data in rows.values_list('subtask_id', 'sketch'):
+        sketch = DDSketch.from_dict(data, _relative_accuracy())
+        if subtask_id in merged:
+            merged[subtask_id].merge(sketch)
+        else:
+            merged[subtask_id] = sketch
+
+    for subtask_id, sketch in merged.items():
+        fields = _percentile_fields(sketch)
+        result[subtask_id] = {
+            'p50': fields['p50_seconds'],
+            'p90': fields['p90_seconds'],
+            'p99': fields['p99_seconds'],
+            'count': fields['count'],
+        }
+    return result
+
+
+def rebuild_duration_sketches(lecture_id: Optional[int] = None, subtask_ids: Optional[List[int]] = None) -> int:
+    """
+    소요 시간 스케치 재계산 (원본 완료 기록 기준)
+
+    Args:
+        lecture_id: 지정 시 해당 강의의 단계만
+        subtask_ids: 지정 시 해당 단계만
+
+    Returns:
+        저장한 스케치 수
+    """
+    from apps.progress.models import UserProgress
+    from apps.tasks.models import Subtask
+
+    subtasks = Subtask.objects.all()
+    if lecture_id:
+        subtasks = subtasks.filter(task__lecture_id=lecture_id)
+    if subtask_ids is not None:
+        subtasks = subtasks.filter(id__in=subtask_ids)
+    subtask_ids = list(subtasks.values_list('id', flat=True))
+
+    sketches: Dict[Tuple[int, Optional[int], str], DDSketch] = {}
+    timed = UserProgress.objects.filter(
+        subtask_id__in=subtask_ids,
+        status='COMPLETED',
+        started_at__isnull=False,
+        completed_at__isnull=False,
+    ).annotate(
+        time_spent=F('completed_at') - F('started_at')
+    ).values_list('subtask_id', 'session_id', 'user__digital_level', 'time_spent')
+    for subtask_id, session_id, level, time_spent in timed.iterator():
+        for target in _targets(session_id, level or UNKNOWN_COHORT):
+            key = (subtask_id, *target)
+            if key not in sketches:
+                sketches[key] = DDSketch(_relative_accuracy())
+            sketches[key].add(time_spent.total_seconds())
+
+    rows = [
+        StepDurationSketch(
+            subtask_id=subtask_id, session_id=session_id, cohort=cohort, **_percentile_fields(sketch)
+        )
+        for (subtask_id, session_id, cohort), sketch in sketches.items()
+    ]
+    with transaction.atomic():
+        StepDurationSketch.objects.filter(subtask_id__in=subtask_ids).delete()
+        StepDurationSketch.objects.bulk_create(rows, batch_size=500)
+
+    return len(rows)
@@ -0,0 +1,97 @@
+"""
+Lecture Stats - 강사 대시보드용 강의 통계 집계
+
+수강생/단계별 통계를 학생 수와 무관하게 고정된 개수의 그룹 집계 쿼리로 계산한다.
+(values(...).annotate(...) 한 번으로 전원 분을 가져와 Python에서 매핑)
+"""
+from typing import Dict, Iterable
+
+from django.db.models import Count, Max, Q
+
+from apps.help.models import HelpRequest
+from apps.progress.models import UserProgress
+
+
+def get_student_progress_summaries(lecture_id: int, user_ids: Iterable[int]) -> Dict[int, Dict]:
+    """
+    수강생별 진행 요약 (쿼리 3개)
+
+    Returns:
+        {user_id: {'completed_subtasks', 'last_activity', 'help_count', 'current_progress'}}
+        current_progress는 IN_PROGRESS 상태 중 가장 먼저 생성된 진행 기록
+        ({'subtask_id', 'subtask_title', 'status'}) 또는 None
+    """
+    user_ids = list(user_ids)
+    summaries = {
+        user_id: {
+            'completed_subtasks': 0,
+            'last_activity': None,
+            'help_count': 0,
+            'current_progress': None,
+        }
+        for user_id in user_ids
+    }
+    if not user_ids:
+        return summaries
+
+    progress = UserProgress.objects.filter(
+        user_id__in=user_ids,
+        subtask__task__lecture_id=lecture_id
+    )
+
+    for row in progress.values('user_id').annotate(
+        completed=Count('id', filter=Q(status='COMPLETED')),
+        last_activity=Max('updated_at'),
+    ):
+        summaries[row['user_id']]['completed_subtasks'] = row['completed']
+        summaries[row['user_id']]['last_activity'] = row['last_activity']
+
+    for row in progress.filter(status='IN_PROGRESS').order_by('user_id', 'id').values(
+        'user_id', 'subtask_id', 'subtask__title', 'status'
+    ):
+        summary = summaries[row['user_id']]
+        if summary['current_progress'] is None:
+            summary['current_progress'] = {
+                'subtask_id': row['subtask_id'],
+                'subtask_title': row['subtask__title'],
+                'status': row['status'],
+            }
+
+    for row in HelpRequest.objects.filter(
+        user_id__in=user_ids,
+        subtask__task__lecture_id=lecture_id
+    ).values('user_id').annotate(help_count=Count('id')):
+        summaries[row['user_id']]['help_count'] = row['help_count']
+
+    return summaries
+
+
+def get_lecture_progress_overview(lecture, total_subtasks: int) -> Dict:
+    """
+    수강생 전체의 평균 진행률(%)과 완료율(%) (쿼리 2개)
+
+    수강생별 완료 단계 수를 한 번에 집계하며, 진행 기록이 없는 수강생은 0%로 계산한다.
+    """
+    total_students = lecture.enrollments.count()
+    if total_students == 0 or total_subtasks == 0:
+        return {'total_students': total_students, 'average_progress': 0, 'completion_rate': 0}
+
+    completed_counts = UserProgress.objects.filter(
+        user_id__in=lecture.enrollments.values('user_id'),
+        subtask__task__lecture=lecture,
+        status='COMPLETED'
+    ).values('user_id').annotate(completed=Count('id')).values_list('completed', flat=True)
+
+    total_progress = 0
+    completed_students = 0
+    for completed in completed_counts:
+        total_progress += (completed / total_subtasks) * 100
+        if completed == total_subtasks:
+            completed_students += 1
+
+    return {
+        'total_students': total_students,
+        'average_progress': round(total_progress / total_students),
+        'completion_rate': round((completed_students / total_students) * 100),
+    }
+
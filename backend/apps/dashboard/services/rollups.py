@@ -0,0 +1,266 @@
+"""
+Dashboard Rollups - 단계/세션 통계 사전 집계 테이블 갱신
+
+signals에서 원본 레코드의 변경 전/후 기여분 차이만 반영(증분)하고,
+세션이 끝나면 해당 세션 집계를 원본 기준으로 다시 계산해 누락을 보정한다.
+전체 재계산(백필)은 rebuild_dashboard_rollups 관리 명령으로 실행한다.
+
+지체율(평균의 2배 이상 소요한 비율)은 평균이 계속 바뀌므로, 소요 시간을
+로그 구간(약 10% 폭) 히스토그램으로 보관하고 조회 시 추정한다.
+"""
+import logging
+import math
+from typing import Dict, List, Optional
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from apps.dashboard.models import SessionStatsRollup, SubtaskStatsRollup
+
+logger = logging.getLogger(__name__)
+
+# 히스토그램 구간 i = [BASE^i - 1, BASE^(i+1) - 1) 초
+HISTOGRAM_BASE = 1.1
+
+# 세션 집계를 원본 기준으로 다시 계산하는 세션 상태
+FINISHED_SESSION_STATUSES = ('ENDED', 'REVIEW_MODE')
+
+
+def duration_bucket(seconds: float) -> int:
+    return int(math.log1p(max(seconds, 0)) / math.log(HISTOGRAM_BASE))
+
+
+def estimate_delayed_count(histogram: Dict, threshold_seconds: float) -> float:
+    """소요 시간이 threshold 이상인 완료 수 추정 (경계 구간은 선형 보간)"""
+    delayed = 0.0
+    for bucket, count in histogram.items():
+        lower = HISTOGRAM_BASE ** int(bucket) - 1
+        upper = HISTOGRAM_BASE ** (int(bucket) + 1) - 1
+        if lower >= threshold_seconds:
+            delayed += count
+        elif upper > threshold_seconds:
+            delayed += count * (upper - threshold_seconds) / (upper - lower)
+    return delayed
+
+
+# ==================== 원본 레코드 기여분 ====================
+
+def progress_contribution(status, started_at, completed_at) -> Dict:
+    """UserProgress 1건이 단계 집계에 기여하는 값"""
+    timed = status == 'COMPLETED' and started_at is not None and completed_at is not None
+    return {
+        'student': 1,
+        'completed': 1 if timed else 0,
+        'duration': (completed_at - started_at).total_seconds() if timed else None,
+    }
+
+
+def participant_contribution(status, joined_at, completed_at) -> Dict:
+    """SessionParticipant 1건이 세션 집계에 기여하는 값"""
+    timed = completed_at is not None and joined_at is not None
+    return {
+        'participant': 1,
+        'completed': 1 if status == 'COMPLETED' else 0,
+        'duration': (completed_at - joined_at).total_seconds() if timed else None,
+    }
+
+
+# ==================== 증분 갱신 ====================
+
+def _locked_subtask_rollup(subtask_id: int, create: bool) -> Optional[SubtaskStatsRollup]:
+    from apps.tasks.models import Subtask
+
+    rollup = SubtaskStatsRollup.objects.select_for_update().filter(subtask_id=subtask_id).first()
+    if rollup is None and create and Subtask.objects.filter(id=subtask_id).exists():
+        SubtaskStatsRollup.objects.get_or_create(subtask_id=subtask_id)
+        rollup = SubtaskStatsRollup.objects.select_for_update().get(subtask_id=subtask_id)
+    return rollup
+
+
+def apply_progress_change(subtask_id: int, old: Optional[Dict], new: Optional[Dict]):
+    """
+    UserProgress 변경 반영
+
+    Args:
+        subtask_id: 단계 ID
+        old: 변경 전 기여분 (새로 생성된 경우 None)
+        new: 변경 후 기여분 (삭제된 경우 None)
+    """
+    if old == new:
+        return
+
+    with transaction.atomic():
+        rollup = _locked_subtask_rollup(subtask_id, create=new is not None)
+        if rollup is None:
+            return
+
+        histogram = dict(rollup.duration_histogram or {})
+        for contribution, sign in ((old, -1), (new, 1)):
+            if contribution is None:
+                continue
+            rollup.student_count += sign * contribution['student']
+            rollup.completed_count += sign * contribution['completed']
+            if contribution['duration'] is not None:
+                rollup.total_time_seconds += sign * contribution['duration']
+                bucket = str(duration_bucket(contribution['duration']))
+                histogram[bucket] = histogram.get(bucket, 0) + sign
+                # Celery에서 변경 순서가 바뀌어 잠시 음수가 될 수 있으므로 0일 때만 제거
+                if histogram[bucket] == 0:
+                    del histogram[bucket]
+        rollup.duration_histogram = histogram
+        rollup.save()
+
+
+def apply_help_change(subtask_id: Optional[int], delta: int, created_at=None):
+    """HelpRequest 생성(+1)/삭제(-1) 반영"""
+    if not subtask_id:
+        return
+
+    SubtaskStatsRollup.objects.filter(subtask_id=subtask_id).update(help_count=F('help_count') + delta)
+    if delta > 0 and not SubtaskStatsRollup.objects.filter(subtask_id=subtask_id).exists():
+        with transaction.atomic():
+            rollup = _locked_subtask_rollup(subtask_id, create=True)
+            if rollup is not None:
+                rollup.help_count += delta
+                rollup.save(update_fields=['help_count', 'updated_at'])
+
+    # 진행 중인 같은 강의 세션의 도움 요청 수 (세션 종료 시 원본 기준으로 다시 계산)
+    if delta > 0:
+        from apps.sessions.models import LectureSession
+
+        created_at = created_at or timezone.now()
+        session_ids = LectureSession.objects.filter(
+            lecture__tasks__subtasks__id=subtask_id,
+            started_at__lte=created_at,
+            ended_at__isnull=True,
+        ).values_list('id', flat=True)
+        SessionStatsRollup.objects.filter(session_id__in=list(session_ids)).update(
+            help_request_count=F('help_request_count') + delta
+        )
+
+
+def apply_participant_change(session_id: int, old: Optional[Dict], new: Optional[Dict]):
+    """SessionParticipant 변경 반영 (old/new는 participant_contribution 결과)"""
+    if old == new:
+        return
+
+    with transaction.atomic():
+        rollup = SessionStatsRollup.objects.select_for_update().filter(session_id=session_id).first()
+        if rollup is None:
+            if new is None:
+                return
+            SessionStatsRollup.objects.get_or_create(session_id=session_id)
+            rollup = SessionStatsRollup.objects.select_for_update().get(session_id=session_id)
+
+        for contribution, sign in ((old, -1), (new, 1)):
+            if contribution is None:
+                continue
+            rollup.participant_count += sign * contribution['participant']
+            rollup.completed_count += sign * contribution['completed']
+            if contribution['duration'] is not None:
+                rollup.completion_time_total_seconds += sign * contribution['duration']
+                rollup.completion_time_count += sign
+        rollup.save()
+
+
+# ==================== 원본 기준 재계산 ====================
+
+def refresh_session_rollup(session) -> SessionStatsRollup:
+    """세션 1개의 집계를 원본 기준으로 다시 계산 (세션 종료 시, 백필)"""
+    from apps.help.models import HelpRequest
+
+    values = {
+        'participant_count': 0,
+        'completed_count': 0,
+        'completion_time_total_seconds': 0,
+        'completion_time_count': 0,
+        'help_request_count': 0,
+    }
+    for row in session.participants.values('status', 'joined_at', 'completed_at'):
+        contribution = participant_contribution(row['status'], row['joined_at'], row['completed_at'])
+        values['participant_count'] += 1
+        values['completed_count'] += contribution['completed']
+        if contribution['duration'] is not None:
+            values['completion_time_total_seconds'] += contribution['duration']
+            values['completion_time_count'] += 1
+
+    if session.lecture_id:
+        now = timezone.now()
+        values['help_request_count'] = HelpRequest.objects.filter(
+            subtask__task__lecture_id=session.lecture_id,
+            created_at__gte=session.started_at or now,
+            created_at__lte=session.ended_at or now,
+        ).count()
+
+    rollup, _ = SessionStatsRollup.objects.update_or_create(session=session, defaults=values)
+    return rollup
+
+
+def rebuild_subtask_rollups(lecture_id: Optional[int] = None, subtask_ids: Optional[List[int]] = None) -> int:
+    """
+    단계 집계 재계산 (쿼리 수는 단계/기록 수와 무관하게 고정)
+
+    Args:
+        lecture_id: 지정 시 해당 강의의 단계만
+        subtask_ids: 지정 시 해당 단계만 (변경 전 값을 모르는 기록이 저장된 경우)
+    """
+    from apps.help.models import HelpRequest
+    from apps.progress.models import UserProgress
+    from apps.tasks.models import Subtask
+
+    subtasks = Subtask.objects.all()
+    if lecture_id:
+        subtasks = subtasks.filter(task__lecture_id=lecture_id)
+    if subtask_ids is not None:
+        subtasks = subtasks.filter(id__in=subtask_ids)
+    subtask_ids = list(subtasks.values_list('id', flat=True))
+
+    rollups = {subtask_id: SubtaskStatsRollup(subtask_id=subtask_id) for subtask_id in subtask_ids}
+
+    for row in UserProgress.objects.filter(subtask_id__in=subtask_ids).values('subtask_id').annotate(
+        student_count=Count('id')
+    ):
+        rollups[row['subtask_id']].student_count = row['student_count']
+
+    timed = UserProgress.objects.filter(
+        subtask_id__in=subtask_ids,
+        status='COMPLETED',
+        started_at__isnull=False,
+        completed_at__isnull=False,
+    ).annotate(
+        time_spent=F('completed_at') - F('started_at')
+    ).values_list('subtask_id', 'time_spent')
+    for subtask_id, time_spent in timed.iterator():
+        rollup = rollups[subtask_id]
+        seconds = time_spent.total_seconds()
+        rollup.completed_count += 1
+        rollup.total_time_seconds += seconds
+        bucket = str(duration_bucket(seconds))
+        rollup.duration_histogram[bucket] = rollup.duration_histogram.get(bucket, 0) + 1
+
+    for row in HelpRequest.objects.filter(subtask_id__in=subtask_ids).values('subtask_id').annotate(
+        help_count=Count('id')
+    ):
+        rollups[row['subtask_id']].help_count = row['help_count']
+
+    with transaction.atomic():
+        SubtaskStatsRollup.objects.filter(subtask_id__in=subtask_ids).delete()
+        SubtaskStatsRollup.objects.bulk_create(rollups.values(), batch_size=500)
+
+    return len(rollups)
+
+
+def rebuild_session_rollups(lecture_id: Optional[int] = None) -> int:
+    """세션 집계 전체 재계산"""
+    from apps.sessions.models import LectureSession
+
+    sessions = LectureSession.objects.all()
+    if lecture_id:
+        sessions = sessions.filter(lecture_id=lecture_id)
+
+    count = 0
+    for session in sessions.iterator():
+        refresh_session_rollup(session)
+        count += 1
+    return count
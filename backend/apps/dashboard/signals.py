@@ -0,0 +1,203 @@
+"""
+Dashboard Signals - 원본 기록이 바뀔 때 대시보드 사전 집계 테이블/소요 시간 스케치 증분 갱신
+
+post_init에서 로드 시점의 값을 기억해 두고, 저장/삭제 시 변경 전/후 기여분 차이만 반영한다.
+UserProgress는 완료 보고마다 저장되고 같은 단계 집계 행을 잠그므로, 차이만 계산해 두고
+커밋 후 Celery(apply_progress_change_task)에서 반영한다 (브로커 장애 시 바로 반영).
+queryset.update()는 signal을 보내지 않으므로, 세션 참가자 일괄 변경은 세션 종료 시
+refresh_session_rollup으로 보정한다.
+
+WebSocket 대시보드 스냅샷은 다시 계산하지 않고 dirty 표시만 한다 (강의별 ticker가 처리).
+"""
+import logging
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from apps.help.models import HelpRequest
+from apps.lectures.models import UserLectureEnrollment
+from apps.progress.models import UserProgress
+from apps.sessions.models import LectureSession, SessionParticipant
+from apps.tasks.models import Subtask, Task
+from .services.dashboard_snapshot import mark_dashboard_dirty
+from .services.rollups import (
+    FINISHED_SESSION_STATUSES,
+    apply_help_change,
+    apply_participant_change,
+    participant_contribution,
+    progress_contribution,
+    refresh_session_rollup,
+)
+from .tasks import apply_progress_change_task
+
+logger = logging.getLogger(__name__)
+
+_PROGRESS_FIELDS = ('subtask_id', 'session_id', 'user_id', 'status', 'started_at', 'completed_at')
+_PARTICIPANT_FIELDS = ('session_id', 'status', 'joined_at', 'completed_at')
+
+
+def _snapshot(instance, fields):
+    """로드된 필드 값 (지연 로딩 필드가 있으면 None - 조회 쿼리를 추가로 만들지 않음)"""
+    if instance.pk is None or any(field not in instance.__dict__ for field in fields):
+        return None
+    return {field: instance.__dict__[field] for field in fields}
+
+
+def _duration_record(snapshot, contribution):
+    """소요 시간 스케치에 넣을 완료 기록 (시작/완료 시각이 있는 완료 기록만)"""
+    if snapshot is None or contribution is None or contribution['duration'] is None:
+        return None
+    return snapshot['subtask_id'], snapshot['session_id'], snapshot['user_id'], contribution['duration']
+
+
+def _apply_progress_change_later(**payload):
+    """커밋 후 Celery로 집계 반영 등록 (등록에 실패하면 바로 반영)"""
+    def enqueue():
+        try:
+            apply_progress_change_task.delay(**payload)
+        except Exception as e:
+            logger.warning(f"Failed to queue dashboard rollup update, applying inline: {e}")
+            apply_progress_change_task(**payload)
+
+    transaction.on_commit(enqueue)
+
+
+# ==================== UserProgress → SubtaskStatsRollup ====================
+
+@receiver(post_init, sender=UserProgress)
+def remember_progress(sender, instance, **kwargs):
+    instance._rollup_snapshot = _snapshot(instance, _PROGRESS_FIELDS)
+
+
+@receiver(post_save, sender=UserProgress)
+def update_subtask_rollup_on_progress_save(sender, instance, created, **kwargs):
+    old = None if created else getattr(instance, '_rollup_snapshot', None)
+    new = _snapshot(instance, _PROGRESS_FIELDS)
+    instance._rollup_snapshot = new
+
+    if new is None or (old is None and not created):
+        # 변경 전 값을 모르면 해당 단계만 다시 계산
+        _apply_progress_change_later(changes=[], rebuild_subtask_ids=[instance.subtask_id])
+        return
+
+    old_contribution = progress_contribution(old['status'], old['started_at'], old['completed_at']) if old else None
+    new_contribution = progress_contribution(new['status'], new['started_at'], new['completed_at'])
+    if old is not None and old['subtask_id'] != new['subtask_id']:
+        changes = [[old['subtask_id'], old_contribution, None], [new['subtask_id'], None, new_contribution]]
+    else:
+        changes = [[new['subtask_id'], old_contribution, new_contribution]]
+    _apply_progress_change_later(
+        changes=changes,
+        old_duration=_duration_record(old, old_contribution),
+        new_duration=_duration_record(new, new_contribution),
+    )
+
+
+@receiver(post_delete, sender=UserProgress)
+def update_subtask_rollup_on_progress_delete(sender, instance, **kwargs):
+    old = getattr(instance, '_rollup_snapshot', None)
+    if old is None:
+        _apply_progress_change_later(changes=[], rebuild_subtask_ids=[instance.subtask_id])
+        return
+    old_contribution = progress_contribution(old['status'], old['started_at'], old['completed_at'])
+    _apply_progress_change_later(
+        changes=[[old['subtask_id'], old_contribution, None]],
+        old_duration=_duration_record(old, old_contribution),
+    )
+
+
+# ==================== HelpRequest → 도움 요청 수 ====================
+
+@receiver(post_init, sender=HelpRequest)
+def remember_help_request(sender, instance, **kwargs):
+    instance._rollup_subtask_id = instance.__dict__.get('subtask_id') if instance.pk else None
+
+
+@receiver(post_save, sender=HelpRequest)
+def update_rollups_on_help_request_save(sender, instance, created, **kwargs):
+    old_subtask_id = getattr(instance, '_rollup_subtask_id', None)
+    instance._rollup_subtask_id = instance.subtask_id
+
+    if created:
+        apply_help_change(instance.subtask_id, 1, created_at=instance.created_at)
+    elif old_subtask_id != instance.subtask_id:
+        apply_help_change(old_subtask_id, -1)
+        apply_help_change(instance.subtask_id, 1, created_at=instance.created_at)
+
+
+@receiver(post_delete, sender=HelpRequest)
+def update_rollups_on_help_request_delete(sender, instance, **kwargs):
+    apply_help_change(instance.subtask_id, -1)
+
+
+# ==================== SessionParticipant / LectureSession → SessionStatsRollup ====================
+
+@receiver(post_init, sender=SessionParticipant)
+def remember_participant(sender, instance, **kwargs):
+    instance._rollup_snapshot = _snapshot(instance, _PARTICIPANT_FIELDS)
+
+
+@receiver(post_save, sender=SessionParticipant)
+def update_session_rollup_on_participant_save(sender, instance, created, **kwargs):
+    old = None if created else getattr(instance, '_rollup_snapshot', None)
+    new = _snapshot(instance, _PARTICIPANT_FIELDS)
+    instance._rollup_snapshot = new
+
+    if new is None or (old is None and not created):
+        refresh_session_rollup(instance.session)
+        return
+
+    apply_participant_change(
+        new['session_id'],
+        participant_contribution(old['status'], old['joined_at'], old['completed_at']) if old else None,
+        participant_contribution(new['status'], new['joined_at'], new['completed_at']),
+    )
+
+
+@receiver(post_delete, sender=SessionParticipant)
+def update_session_rollup_on_participant_delete(sender, instance, **kwargs):
+    old = getattr(instance, '_rollup_snapshot', None)
+    if old is None:
+        return
+    apply_participant_change(
+        old['session_id'],
+        participant_contribution(old['status'], old['joined_at'], old['completed_at']),
+        None,
+    )
+
+
+@receiver(post_save, sender=LectureSession)
+def refresh_session_rollup_on_end(sender, instance, **kwargs):
+    """세션 종료 시 일괄 변경(queryset.update)까지 반영하도록 원본 기준으로 다시 계산"""
+    if instance.status in FINISHED_SESSION_STATUSES:
+        refresh_session_rollup(instance)
+
+
+# ==================== WebSocket 대시보드 스냅샷 dirty 표시 ====================
+# UserProgress는 apply_progress_change_task가 집계를 반영한 뒤 표시
+
+def _lecture_id_for_subtask(subtask_id):
+    if not subtask_id:
+        return None
+    return Subtask.objects.filter(id=subtask_id).values_list('task__lecture_id', flat=True).first()
+
+
+@receiver(post_save, sender=HelpRequest)
+@receiver(post_delete, sender=HelpRequest)
+def mark_dashboard_dirty_on_record_change(sender, instance, **kwargs):
+    mark_dashboard_dirty(_lecture_id_for_subtask(instance.subtask_id))
+
+
+@receiver(post_save, sender=UserLectureEnrollment)
+@receiver(post_delete, sender=UserLectureEnrollment)
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def mark_dashboard_dirty_on_lecture_change(sender, instance, **kwargs):
+    mark_dashboard_dirty(instance.lecture_id)
+
+
+@receiver(post_save, sender=Subtask)
+@receiver(post_delete, sender=Subtask)
+def mark_dashboard_dirty_on_subtask_change(sender, instance, **kwargs):
+    mark_dashboard_dirty(Task.objects.filter(id=instance.task_id).values_list('lecture_id', flat=True).first())
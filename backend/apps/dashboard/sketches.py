@@ -0,0 +1,116 @@
+"""
+DDSketch - 병합 가능한 분위수 스케치
+
+단계 소요 시간의 p50/p90/p99를 원본 UserProgress를 다시 읽지 않고 구하기 위해,
+값을 로그 구간(gamma^(k-1), gamma^k]별 개수로만 보관한다.
+어떤 분위수든 상대 오차 relative_accuracy 이내로 추정되며, 같은 정확도의 스케치는
+구간별 개수를 더하는 것만으로 병합된다 (세션별 스케치 → 강의 전체).
+
+저장 형식 (to_dict):
+  a  상대 정확도
+  z  0 이하 값 개수
+  o  첫 구간 번호
+  c  o부터 연속된 구간별 개수 목록
+"""
+import math
+from typing import Dict, Iterable, Optional
+
+DEFAULT_RELATIVE_ACCURACY = 0.02
+
+# 이보다 작은 값은 0 구간에 넣는다 (초 단위 소요 시간)
+MIN_INDEXABLE_VALUE = 1e-3
+
+
+class DDSketch:
+    """로그 구간 분위수 스케치"""
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError('relative_accuracy는 0과 1 사이여야 합니다.')
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.zero_count = 0
+        self.bins: Dict[int, int] = {}
+
+    # ==================== 갱신 ====================
+
+    def _key(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        # 구간 (gamma^(k-1), gamma^k]의 대표값 (양 끝 상대 오차가 같아지는 지점)
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    def add(self, value: float, count: int = 1):
+        if value < MIN_INDEXABLE_VALUE:
+            self.zero_count += count
+            return
+        key = self._key(value)
+        self.bins[key] = self.bins.get(key, 0) + count
+
+    def remove(self, value: float, count: int = 1):
+        """add로 넣은 값 제거 (기록 수정/삭제 반영) - 없는 값이면 무시"""
+        if value < MIN_INDEXABLE_VALUE:
+            self.zero_count = max(self.zero_count - count, 0)
+            return
+        key = self._key(value)
+        remaining = self.bins.get(key, 0) - count
+        if remaining > 0:
+            self.bins[key] = remaining
+        else:
+            self.bins.pop(key, None)
+
+    def merge(self, other: 'DDSketch'):
+        """다른 스케치의 값을 합침 (같은 정확도만 가능)"""
+        if not math.isclose(self.gamma, other.gamma):
+            raise ValueError('정확도가 다른 스케치는 병합할 수 없습니다.')
+        self.zero_count += other.zero_count
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+
+    # ==================== 조회 ====================
+
+    @property
+    def count(self) -> int:
+        return self.zero_count + sum(self.bins.values())
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q 분위수 (0 <= q <= 1), 값이 없으면 None"""
+        total = self.count
+        if total == 0:
+            return None
+        rank = q * (total - 1)
+
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if rank < seen:
+                return self._value(key)
+        return self._value(max(self.bins))
+
+    def quantiles(self, qs: Iterable[float]) -> Dict[float, Optional[float]]:
+        return {q: self.quantile(q) for q in qs}
+
+    # ==================== 저장 ====================
+
+    def to_dict(self) -> Dict:
+        if not self.bins:
+            return {'a': self.relative_accuracy, 'z': self.zero_count, 'o': 0, 'c': []}
+        offset = min(self.bins)
+        counts = [0] * (max(self.bins) - offset + 1)
+        for key, count in self.bins.items():
+            counts[key - offset] = count
+        return {'a': self.relative_accuracy, 'z': self.zero_count, 'o': offset, 'c': counts}
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict], relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY) -> 'DDSketch':
+        if not data:
+            return cls(relative_accuracy)
+        sketch = cls(data.get('a', relative_accuracy))
+        sketch.zero_count = data.get('z', 0)
+        offset = data.get('o', 0)
+        sketch.bins = {offset + index: count for index, count in enumerate(data.get('c', [])) if count}
+        return sketch
@@ -0,0 +1,48 @@
+"""
+Celery Tasks for Dashboard Rollups
+"""
+import logging
+from typing import List, Optional
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def apply_progress_change_task(
+    changes: List,
+    old_duration: Optional[List] = None,
+    new_duration: Optional[List] = None,
+    rebuild_subtask_ids: Optional[List[int]] = None,
+):
+    """
+    UserProgress 변경을 단계 집계/소요 시간 스케치에 반영 (signals가 커밋 후 등록)
+
+    같은 단계 집계 행을 잠그는 작업을 요청/consumer 경로 밖에서 처리한다.
+
+    Args:
+        changes: [단계 ID, 변경 전 기여분, 변경 후 기여분] 목록 (progress_contribution 결과)
+        old_duration: 변경 전 (단계 ID, 세션 ID, 학생 ID, 소요 시간) - 완료 기록이 아니었으면 None
+        new_duration: 변경 후 값
+        rebuild_subtask_ids: 변경 전 값을 몰라 원본 기준으로 다시 계산할 단계
+    """
+    from apps.tasks.models import Subtask
+    from .services.dashboard_snapshot import mark_dashboard_dirty
+    from .services.duration_sketches import apply_duration_change, rebuild_duration_sketches
+    from .services.rollups import apply_progress_change, rebuild_subtask_rollups
+
+    for subtask_id, old, new in changes:
+        apply_progress_change(subtask_id, old, new)
+    apply_duration_change(
+        tuple(old_duration) if old_duration else None,
+        tuple(new_duration) if new_duration else None,
+    )
+    if rebuild_subtask_ids:
+        rebuild_subtask_rollups(subtask_ids=rebuild_subtask_ids)
+        rebuild_duration_sketches(subtask_ids=rebuild_subtask_ids)
+
+    subtask_ids = {subtask_id for subtask_id, _, _ in changes} | set(rebuild_subtask_ids or [])
+    lecture_ids = Subtask.objects.filter(id__in=subtask_ids).values_list('task__lecture_id', flat=True)
+    for lecture_id in set(lecture_ids):
+        mark_dashboard_dirty(lecture_id)
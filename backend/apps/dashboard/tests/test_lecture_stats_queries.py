@@ -0,0 +1,62 @@
+"""
+강의 수강생 목록/통계 API - 수강생 수와 무관한 쿼리 수
+"""
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.accounts.models import User
+from apps.help.models import HelpRequest
+from apps.lectures.models import Lecture, UserLectureEnrollment
+from apps.progress.models import UserProgress
+from apps.tasks.models import Subtask, Task
+
+
+class LectureStatsQueryBudgetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.instructor = User.objects.create_user(
+            email='stats-instructor@example.com', password='x', name='강사', role='INSTRUCTOR'
+        )
+        self.lecture = Lecture.objects.create(instructor=self.instructor, title='강의')
+        task = Task.objects.create(lecture=self.lecture, title='과제', order_index=0)
+        self.subtasks = [
+            Subtask.objects.create(task=task, title=f'단계 {index}', order_index=index)
+            for index in range(3)
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(self.instructor)
+        self.student_count = 0
+
+    def _enroll(self, count):
+        now = timezone.now()
+        for _ in range(count):
+            self.student_count += 1
+            student = User.objects.create_user(
+                email=f'stats-student{self.student_count}@example.com', password='x',
+                name=f'학생{self.student_count}', role='STUDENT',
+            )
+            UserLectureEnrollment.objects.create(user=student, lecture=self.lecture)
+            UserProgress.objects.create(
+                user=student, subtask=self.subtasks[0], status='COMPLETED', started_at=now, completed_at=now
+            )
+            UserProgress.objects.create(user=student, subtask=self.subtasks[1], status='IN_PROGRESS', started_at=now)
+            HelpRequest.objects.create(user=student, subtask=self.subtasks[1], request_type='MANUAL')
+
+    def _assert_query_budget(self, url, budget):
+        self._enroll(2)
+        self.client.get(url)  # 강의 단계 구성 캐시 채움
+
+        for added in (0, 10):
+            self._enroll(added)
+            with self.assertNumQueries(budget):
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+
+    def test_lecture_students_query_budget(self):
+        # 강의, 강사 확인, 수강생 목록, 진행 요약 3개 (get_student_progress_summaries)
+        self._assert_query_budget(f'/api/dashboard/lectures/{self.lecture.id}/students/', 6)
+
+    def test_lecture_statistics_query_budget(self):
+        self._assert_query_budget(f'/api/dashboard/statistics/lecture/{self.lecture.id}/', 7)
@@ -0,0 +1,69 @@
+"""
+진도 저장 시 대시보드 집계 갱신 - 저장 경로에서는 쿼리를 늘리지 않고 커밋 후 Celery에서 반영
+"""
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.accounts.models import User
+from apps.dashboard.models import StepDurationSketch, SubtaskStatsRollup
+from apps.dashboard.tasks import apply_progress_change_task
+from apps.lectures.models import Lecture
+from apps.progress.models import UserProgress
+from apps.tasks.models import Subtask, Task
+
+
+class ProgressRollupTests(TestCase):
+    def setUp(self):
+        instructor = User.objects.create_user(
+            email='rollup-instructor@example.com', password='x', name='강사', role='INSTRUCTOR'
+        )
+        lecture = Lecture.objects.create(instructor=instructor, title='강의')
+        task = Task.objects.create(lecture=lecture, title='과제', order_index=0)
+        self.subtask = Subtask.objects.create(task=task, title='단계', order_index=0)
+        self.student = User.objects.create_user(
+            email='rollup-student@example.com', password='x', name='학생', role='STUDENT'
+        )
+        patcher = mock.patch.object(
+            apply_progress_change_task, 'delay',
+            side_effect=lambda **kwargs: apply_progress_change_task.apply(kwargs=kwargs).get(),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _save(self, progress):
+        # 저장 경로는 UserProgress 쿼리 1개 - 집계는 커밋 후 태스크가 반영
+        with self.captureOnCommitCallbacks() as callbacks:
+            with self.assertNumQueries(1):
+                progress.save()
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+
+    def test_completion_updates_rollup_after_commit(self):
+        started_at = timezone.now() - timedelta(seconds=90)
+        progress = UserProgress(user=self.student, subtask=self.subtask, status='IN_PROGRESS', started_at=started_at)
+        self._save(progress)
+
+        rollup = SubtaskStatsRollup.objects.get(subtask=self.subtask)
+        self.assertEqual((rollup.student_count, rollup.completed_count), (1, 0))
+
+        progress.status = 'COMPLETED'
+        progress.completed_at = started_at + timedelta(seconds=90)
+        self._save(progress)
+
+        rollup.refresh_from_db()
+        self.assertEqual((rollup.student_count, rollup.completed_count), (1, 1))
+        self.assertAlmostEqual(rollup.total_time_seconds, 90)
+        sketch = StepDurationSketch.objects.get(
+            subtask=self.subtask, session__isnull=True, cohort=StepDurationSketch.ALL_COHORTS
+        )
+        self.assertEqual(sketch.count, 1)
+
+    def test_failed_enqueue_applies_inline(self):
+        with mock.patch.object(apply_progress_change_task, 'delay', side_effect=ConnectionError('broker down')):
+            with self.captureOnCommitCallbacks(execute=True):
+                UserProgress.objects.create(user=self.student, subtask=self.subtask, status='IN_PROGRESS')
+
+        self.assertEqual(SubtaskStatsRollup.objects.get(subtask=self.subtask).student_count, 1)
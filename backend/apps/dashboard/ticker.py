@@ -0,0 +1,73 @@
+"""
+Dashboard Ticker - 강의 대시보드 그룹별 통계 갱신 루프
+
+프로세스마다 시청 중인 강의(dashboard_lecture_{id} 그룹)당 루프 하나만 돌린다.
+DashboardConsumer가 연결/해제 시 acquire/release로 참조 수를 관리하고,
+마지막 연결이 끊기면 루프를 멈춘다.
+
+루프는 주기마다 refresh_dashboard_snapshot_if_dirty를 호출하여, 여러 프로세스 중
+락을 잡은 한 곳에서 원본이 바뀐 경우에만 다시 계산하고 그룹에 statistics_update를 보낸다.
+"""
+import asyncio
+import logging
+import weakref
+
+from channels.db import database_sync_to_async
+from django.conf import settings
+
+from .services.dashboard_snapshot import refresh_dashboard_snapshot_if_dirty
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 루프 → {lecture_id: {'task': asyncio.Task, 'refs': 연결 수}}
+_tickers = weakref.WeakKeyDictionary()
+
+
+def _registry():
+    loop = asyncio.get_running_loop()
+    if loop not in _tickers:
+        _tickers[loop] = {}
+    return _tickers[loop]
+
+
+def acquire(lecture_id: int, channel_layer):
+    """대시보드 연결 시 호출 - 해당 강의 루프가 없으면 시작"""
+    registry = _registry()
+    entry = registry.get(lecture_id)
+    if entry is None or entry['task'].done():
+        task = asyncio.get_running_loop().create_task(_run(lecture_id, channel_layer))
+        entry = registry[lecture_id] = {'task': task, 'refs': 0}
+    entry['refs'] += 1
+
+
+def release(lecture_id: int):
+    """대시보드 연결 해제 시 호출 - 마지막 연결이면 루프 중지"""
+    registry = _registry()
+    entry = registry.get(lecture_id)
+    if entry is None:
+        return
+    entry['refs'] -= 1
+    if entry['refs'] <= 0:
+        entry['task'].cancel()
+        del registry[lecture_id]
+
+
+async def _run(lecture_id: int, channel_layer):
+    interval = getattr(settings, 'DASHBOARD_TICKER_INTERVAL_SECONDS', 5)
+    group_name = f'dashboard_lecture_{lecture_id}'
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            snapshot = await database_sync_to_async(refresh_dashboard_snapshot_if_dirty)(lecture_id, interval)
+            if snapshot is None:
+                continue
+            await channel_layer.group_send(group_name, {
+                'type': 'statistics_update',
+                'statistics': snapshot['statistics'],
+                'students': snapshot['student_list'],
+            })
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Dashboard ticker failed for lecture {lecture_id}: {e}")
@@ -6,6 +6,8 @@ from .views import (
     SessionProgressStatsView,
     StepAnalysisView,
     SessionTrendsView,
+    LectureCompletionMatrixView,
+    SessionCompletionMatrixView,
 )
 
 app_name = 'dashboard'
@@ -18,4 +20,6 @@ urlpatterns = [
     # 통계 분석 API
     path('statistics/lecture/<int:lecture_id>/step-analysis/', StepAnalysisView.as_view(), name='step-analysis'),
     path('statistics/lecture/<int:lecture_id>/session-trends/', SessionTrendsView.as_view(), name='session-trends'),
+    path('statistics/lecture/<int:lecture_id>/completion-matrix/', LectureCompletionMatrixView.as_view(), name='lecture-completion-matrix'),
+    path('sessions/<int:session_id>/completion-matrix/', SessionCompletionMatrixView.as_view(), name='session-completion-matrix'),
 ]
@@ -1,23 +1,41 @@
 """
 Dashboard Views (강사용 모니터링)
 """
+from types import SimpleNamespace
+
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
-from django.db.models import Count, Q, Avg, F, ExpressionWrapper, DurationField
+from django.db.models import Count, Q, Sum
 from django.utils import timezone
 
 from apps.lectures.models import Lecture
-from apps.progress.models import UserProgress
 from apps.help.models import HelpRequest
 from apps.sessions.models import SessionParticipant, LectureSession
 from apps.tasks.models import Task, Subtask
 from apps.progress.serializers import UserProgressSerializer
 from apps.help.serializers import HelpRequestSerializer
-
-
-class LectureStudentsView(APIView):
+from apps.lectures.services import get_lecture_plan, get_plan_subtask
+from apps.sessions.services import SessionSummaryService
+from apps.sessions.versions import ConditionalGet, session_scope
+from core.db import ReplicaReadMixin
+from .models import SubtaskStatsRollup
+from .services import (
+    get_student_progress_summaries,
+    get_lecture_progress_overview,
+    estimate_delayed_count,
+    get_step_percentiles,
+    CompletionMatrix,
+    build_completion_report,
+)
+
+
+def _round_seconds(value):
+    return round(value) if value is not None else None
+
+
+class LectureStudentsView(ReplicaReadMixin, APIView):
     """수강생 목록 및 진행률 (강사용)"""
     permission_classes = [IsAuthenticated]
 
@@ -31,33 +49,20 @@ class LectureStudentsView(APIView):
                 status=403
             )
         
-        # 수강생 목록 및 진행 상태
-        enrollments = lecture.enrollments.select_related('user').all()
+        # 수강생 목록 및 진행 상태 (수강생 수와 무관하게 그룹 집계 쿼리로 계산)
+        enrollments = list(lecture.enrollments.select_related('user').all())
+        total_subtasks = get_lecture_plan(lecture.id)['total_subtasks']
+        summaries = get_student_progress_summaries(
+            lecture.id, [enrollment.user_id for enrollment in enrollments]
+        )
+
         students = []
-        
         for enrollment in enrollments:
             user = enrollment.user
-            # 진행 상태 통계
-            progress = UserProgress.objects.filter(
-                user=user,
-                subtask__task__lecture=lecture
-            )
-            
-            total_subtasks = lecture.tasks.aggregate(
-                count=Count('subtasks')
-            )['count'] or 0
-            
-            completed_subtasks = progress.filter(status='COMPLETED').count()
-            
-            # 현재 진행 중인 subtask
-            current_progress = progress.filter(status='IN_PROGRESS').first()
-            
-            # 도움 요청 횟수
-            help_count = HelpRequest.objects.filter(
-                user=user,
-                subtask__task__lecture=lecture
-            ).count()
-            
+            summary = summaries[user.id]
+            completed_subtasks = summary['completed_subtasks']
+            current_progress = summary['current_progress']
+
             students.append({
                 'user_id': user.id,
                 'name': user.name,
@@ -66,15 +71,15 @@ class LectureStudentsView(APIView):
                 'completed_subtasks': completed_subtasks,
                 'total_subtasks': total_subtasks,
                 'current_subtask': {
-                    'id': current_progress.subtask.id if current_progress else None,
-                    'title': current_progress.subtask.title if current_progress else None,
-                    'status': current_progress.status if current_progress else None
+                    'id': current_progress['subtask_id'],
+                    'title': current_progress['subtask_title'],
+                    'status': current_progress['status']
                 } if current_progress else None,
-                'help_count': help_count,
-                'last_activity': progress.order_by('-updated_at').first().updated_at if progress.exists() else None,
+                'help_count': summary['help_count'],
+                'last_activity': summary['last_activity'],
                 'enrolled_at': enrollment.enrolled_at
             })
-        
+
         return Response({
             'lecture_id': lecture_id,
             'students': students
@@ -102,7 +107,7 @@ class PendingHelpRequestsView(APIView):
         })
 
 
-class LectureStatisticsView(APIView):
+class LectureStatisticsView(ReplicaReadMixin, APIView):
     """강의 통계 (차트용)"""
     permission_classes = [IsAuthenticated]
 
@@ -116,80 +121,40 @@ class LectureStatisticsView(APIView):
                 status=403
             )
 
-        # 전체 수강생 수
-        total_students = lecture.enrollments.count()
-
         # 전체 서브태스크 수
-        total_subtasks = lecture.tasks.aggregate(count=Count('subtasks'))['count'] or 0
-
-        # 도움 요청 통계
-        total_help_requests = HelpRequest.objects.filter(
-            subtask__task__lecture=lecture
-        ).count()
-
-        # 평균 진행률 및 완료율 계산
-        average_progress = 0
-        completion_rate = 0
+        total_subtasks = get_lecture_plan(lecture.id)['total_subtasks']
 
-        if total_students > 0 and total_subtasks > 0:
-            # 각 수강생의 완료된 서브태스크 수를 계산
-            enrollments = lecture.enrollments.all()
-            total_progress = 0
-            completed_students = 0
+        # 단계별 사전 집계 (도움 요청 수)
+        rollups = SubtaskStatsRollup.objects.filter(subtask__task__lecture=lecture)
 
-            for enrollment in enrollments:
-                user = enrollment.user
-                completed_subtasks = UserProgress.objects.filter(
-                    user=user,
-                    subtask__task__lecture=lecture,
-                    status='COMPLETED'
-                ).count()
+        # 도움 요청 통계
+        total_help_requests = rollups.aggregate(total=Sum('help_count'))['total'] or 0
 
-                user_progress = (completed_subtasks / total_subtasks) * 100
-                total_progress += user_progress
+        # 전체 수강생 수, 평균 진행률 및 완료율 (수강생별 완료 수를 한 번에 집계)
+        overview = get_lecture_progress_overview(lecture, total_subtasks)
+        total_students = overview['total_students']
+        average_progress = overview['average_progress']
+        completion_rate = overview['completion_rate']
 
-                if completed_subtasks == total_subtasks:
-                    completed_students += 1
+        # 어려운 단계 (도움 요청이 많은 순) - 상세 정보 포함
+        difficult_rollups = rollups.filter(help_count__gt=0).select_related(
+            'subtask'
+        ).order_by('-help_count', 'subtask_id')[:10]
 
-            average_progress = round(total_progress / total_students)
-            completion_rate = round((completed_students / total_students) * 100)
+        difficult_rollups = list(difficult_rollups)
+        percentiles = get_step_percentiles([rollup.subtask_id for rollup in difficult_rollups])
 
-        # 어려운 단계 (도움 요청이 많은 순) - 상세 정보 포함
-        difficult_steps_raw = HelpRequest.objects.filter(
-            subtask__task__lecture=lecture
-        ).values('subtask_id', 'subtask__title').annotate(
-            help_count=Count('id')
-        ).order_by('-help_count')[:10]
-
-        difficult_steps = []
-        for step in difficult_steps_raw:
-            subtask_id = step['subtask_id']
-
-            # 평균 소요 시간 계산
-            progress_data = UserProgress.objects.filter(
-                subtask_id=subtask_id,
-                status='COMPLETED',
-                started_at__isnull=False,
-                completed_at__isnull=False
-            ).annotate(
-                time_spent=ExpressionWrapper(
-                    F('completed_at') - F('started_at'),
-                    output_field=DurationField()
-                )
-            ).aggregate(avg_time=Avg('time_spent'))
-
-            avg_time = progress_data['avg_time']
-            avg_time_seconds = avg_time.total_seconds() if avg_time else 0
-
-            # 해당 단계를 시작한 학생 수
-            student_count = UserProgress.objects.filter(subtask_id=subtask_id).count()
-
-            difficult_steps.append({
-                'subtask_name': step['subtask__title'],
-                'help_request_count': step['help_count'],
-                'avg_time_spent': round(avg_time_seconds),
-                'student_count': student_count,
-            })
+        difficult_steps = [
+            {
+                'subtask_name': rollup.subtask.title,
+                'help_request_count': rollup.help_count,
+                'avg_time_spent': round(rollup.avg_time_seconds),
+                'p50_time_spent': _round_seconds(percentiles[rollup.subtask_id]['p50']),
+                'p90_time_spent': _round_seconds(percentiles[rollup.subtask_id]['p90']),
+                'student_count': rollup.student_count,
+            }
+            for rollup in difficult_rollups
+        ]
 
         return Response({
             'lecture_id': lecture_id,
@@ -207,83 +172,138 @@ class SessionProgressStatsView(APIView):
     """
     세션별 진도 통계 (실시간 모니터링용)
     GET /api/dashboard/sessions/{session_id}/progress-stats/
+
+    Query Parameters:
+    - summary: true이면 참가자별 progress_data 없이 그룹 통계만 반환 (Redis 실시간 카운터, O(1))
+    - wait: 변경이 없으면 최대 wait초 대기 후 응답 (If-None-Match와 함께 사용하는 long-poll)
+
+    ETag/If-None-Match를 지원하며, 권한 확인 후 세션 버전이 그대로이면 통계 조회 없이 304를 반환합니다.
+    하트비트는 버전을 올리지 않으므로 지연 판정/last_active_at은 ETAG_TIME_BUCKET_SECONDS 단위로 갱신됩니다.
+    수업 중에는 참가자 상태를 Redis 실시간 상태(apps.sessions.live_state)에서 읽습니다.
     """
     permission_classes = [IsAuthenticated]
 
+    # 지연 판단 기준: 마지막 활동이 5분 이상 전
+    DELAY_THRESHOLD_SECONDS = 300
+    ETAG_TIME_BUCKET_SECONDS = 15
+
     def get(self, request, session_id):
-        from apps.sessions.models import LectureSession
-        from apps.tasks.models import Task, Subtask
-        from django.utils import timezone
+        from apps.sessions import live_counters, live_state
         from datetime import timedelta
 
-        session = get_object_or_404(LectureSession, pk=session_id)
+        summary_only = request.query_params.get('summary', '').lower() == 'true'
 
-        # 강사 권한 확인
-        if session.instructor != request.user:
+        session = get_object_or_404(
+            LectureSession.objects.select_related('current_subtask'), pk=session_id
+        )
+
+        # 강사 권한 확인 (304보다 먼저)
+        if session.instructor_id != request.user.id:
             return Response(
                 {'error': '강사만 세션 진도 통계를 조회할 수 있습니다.'},
                 status=403
             )
 
-        # 세션의 모든 참가자 조회
-        participants = session.participants.select_related('current_subtask', 'user').all()
-        total_students = participants.count()
-
-        if total_students == 0:
-            return Response({
-                'session_id': session_id,
-                'total_students': 0,
-                'groups': [
-                    {'name': '완료', 'count': 0, 'percentage': 0},
-                    {'name': '진행중', 'count': 0, 'percentage': 0},
-                    {'name': '지연', 'count': 0, 'percentage': 0},
-                    {'name': '미시작', 'count': 0, 'percentage': 0},
-                ],
-                'progress_data': []
-            })
+        conditional = ConditionalGet(
+            request, session_scope(session_id), request.user.id, summary_only,
+            time_bucket=self.ETAG_TIME_BUCKET_SECONDS,
+        )
+        not_modified = conditional.not_modified()
+        if not_modified is not None:
+            return not_modified
 
-        # 강의의 전체 서브태스크 수 계산
-        total_subtasks = 0
-        if session.lecture:
-            total_subtasks = Subtask.objects.filter(
-                task__lecture=session.lecture
-            ).count()
+        # 강의의 전체 서브태스크 수 (캐시된 강의 단계 구성)
+        total_subtasks = get_lecture_plan(session.lecture_id)['total_subtasks'] if session.lecture_id else 0
 
         # 현재 세션의 현재 단계 order_index 가져오기
         current_session_step_index = 0
         if session.current_subtask:
             current_session_step_index = session.current_subtask.order_index
 
-        # 참가자별 진도 상태 분류
-        completed_count = 0
-        in_progress_count = 0
-        delayed_count = 0
-        not_started_count = 0
+        participants = session.participants.all()
+        live_participants = live_state.list_participants(session.id)
+        delay_threshold = timezone.now() - timedelta(seconds=self.DELAY_THRESHOLD_SECONDS)
+
+        counts = None
+        if summary_only:
+            counts = live_counters.get_counts(session.id, self.DELAY_THRESHOLD_SECONDS)
+            if counts is None and live_counters.rebuild(session.id):
+                counts = live_counters.get_counts(session.id, self.DELAY_THRESHOLD_SECONDS)
+
+        if counts is None and live_participants is not None:
+            counts = {'total': len(live_participants), 'completed': 0, 'not_started': 0, 'delayed': 0}
+            for participant in live_participants:
+                key = self._status_group(participant, delay_threshold)
+                if key != 'in_progress':
+                    counts[key] += 1
+            counts['in_progress'] = (
+                counts['total'] - counts['completed'] - counts['not_started'] - counts['delayed']
+            )
+
+        if counts is None:
+            # 상태 그룹을 조건부 집계 한 번으로 계산
+            counts = participants.aggregate(
+                total=Count('id'),
+                completed=Count('id', filter=Q(status='COMPLETED')),
+                not_started=Count('id', filter=Q(status='WAITING')),
+                delayed=Count('id', filter=(
+                    ~Q(status__in=['COMPLETED', 'WAITING']) & Q(last_active_at__lt=delay_threshold)
+                )),
+            )
+            counts['in_progress'] = (
+                counts['total'] - counts['completed'] - counts['not_started'] - counts['delayed']
+            )
+
+        total_students = counts['total']
 
-        # 지연 판단 기준: 마지막 활동이 5분 이상 전
-        delay_threshold = timezone.now() - timedelta(minutes=5)
+        # 그룹별 비율 계산
+        groups = [
+            {
+                'name': name,
+                'count': counts[key],
+                'percentage': int((counts[key] / total_students) * 100) if total_students > 0 else 0,
+            }
+            for name, key in [
+                ('완료', 'completed'),
+                ('진행중', 'in_progress'),
+                ('지연', 'delayed'),
+                ('미시작', 'not_started'),
+            ]
+        ]
+
+        response_data = {
+            'session_id': session_id,
+            'total_students': total_students,
+            'total_subtasks': total_subtasks,
+            'current_session_step': current_session_step_index,
+            'groups': groups,
+        }
+        if summary_only:
+            return conditional.apply(Response(response_data))
+
+        # 참가자별 진도 상태
+        if live_participants is not None:
+            plan = get_lecture_plan(session.lecture_id) if session.lecture_id else None
+            rows = [
+                (participant, participant.user_id, participant.display_name or participant.user_name or 'Anonymous',
+                 self._live_subtask(plan, participant))
+                for participant in live_participants
+            ]
+        else:
+            rows = [
+                (participant, participant.user.id if participant.user else None,
+                 participant.display_name or (participant.user.name if participant.user else 'Anonymous'),
+                 participant.current_subtask)
+                for participant in participants.select_related('current_subtask', 'user')
+            ]
 
         progress_data = []
-        for participant in participants:
+        for participant, user_id, username, current_subtask in rows:
             # 참가자의 현재 단계
-            participant_step_index = 0
-            if participant.current_subtask:
-                participant_step_index = participant.current_subtask.order_index
-
-            # 상태 판단
-            if participant.status == 'COMPLETED':
-                status = 'completed'
-                completed_count += 1
-            elif participant.status == 'WAITING':
-                status = 'not_started'
-                not_started_count += 1
-            elif participant.last_active_at and participant.last_active_at < delay_threshold:
-                # 마지막 활동이 5분 이상 전이면 지연
-                status = 'delayed'
-                delayed_count += 1
-            else:
-                status = 'in_progress'
-                in_progress_count += 1
+            participant_step_index = current_subtask.order_index if current_subtask else 0
+
+            # 상태 판단 (그룹 집계와 같은 기준)
+            status = self._status_group(participant, delay_threshold)
 
             # 진행률 계산
             progress_percentage = 0
@@ -291,59 +311,54 @@ class SessionProgressStatsView(APIView):
                 progress_percentage = int((participant_step_index / total_subtasks) * 100)
 
             progress_data.append({
-                'user_id': participant.user.id if participant.user else None,
+                'user_id': user_id,
                 'device_id': participant.device_id,
-                'username': participant.display_name or (participant.user.name if participant.user else 'Anonymous'),
+                'username': username,
                 'current_subtask': {
-                    'id': participant.current_subtask.id if participant.current_subtask else None,
-                    'title': participant.current_subtask.title if participant.current_subtask else None,
-                    'order_index': participant.current_subtask.order_index if participant.current_subtask else 0,
-                } if participant.current_subtask else None,
+                    'id': current_subtask.id,
+                    'title': current_subtask.title,
+                    'order_index': current_subtask.order_index,
+                } if current_subtask else None,
                 'progress_percentage': progress_percentage,
                 'status': status,
                 'last_active_at': participant.last_active_at.isoformat() if participant.last_active_at else None,
             })
 
-        # 그룹별 비율 계산
-        groups = [
-            {
-                'name': '완료',
-                'count': completed_count,
-                'percentage': int((completed_count / total_students) * 100) if total_students > 0 else 0,
-            },
-            {
-                'name': '진행중',
-                'count': in_progress_count,
-                'percentage': int((in_progress_count / total_students) * 100) if total_students > 0 else 0,
-            },
-            {
-                'name': '지연',
-                'count': delayed_count,
-                'percentage': int((delayed_count / total_students) * 100) if total_students > 0 else 0,
-            },
-            {
-                'name': '미시작',
-                'count': not_started_count,
-                'percentage': int((not_started_count / total_students) * 100) if total_students > 0 else 0,
-            },
-        ]
-
-        return Response({
-            'session_id': session_id,
-            'total_students': total_students,
-            'total_subtasks': total_subtasks,
-            'current_session_step': current_session_step_index,
-            'groups': groups,
-            'progress_data': progress_data,
-        })
-
-
-class StepAnalysisView(APIView):
+        response_data['progress_data'] = progress_data
+        return conditional.apply(Response(response_data))
+
+    @staticmethod
+    def _status_group(participant, delay_threshold):
+        """참가자 상태 그룹 (completed / not_started / delayed / in_progress)"""
+        if participant.status == 'COMPLETED':
+            return 'completed'
+        if participant.status == 'WAITING':
+            return 'not_started'
+        if participant.last_active_at and participant.last_active_at < delay_threshold:
+            return 'delayed'
+        return 'in_progress'
+
+    @staticmethod
+    def _live_subtask(plan, participant):
+        """실시간 상태 참가자의 현재 단계 (강의 단계 구성에 없으면 DB 조회)"""
+        if not participant.current_subtask_id:
+            return None
+        subtask = get_plan_subtask(plan, participant.current_subtask_id) if plan else None
+        if subtask is None:
+            return participant.current_subtask
+        return SimpleNamespace(id=subtask['id'], title=subtask['title'], order_index=subtask['order_index'])
+
+
+class StepAnalysisView(ReplicaReadMixin, APIView):
     """
     단계별 병목 분석
     GET /api/dashboard/statistics/lecture/{lecture_id}/step-analysis/
 
-    각 단계별로 지체율, 도움요청 횟수, 평균 소요시간, 병목 점수를 제공합니다.
+    각 단계별로 지체율, 도움요청 횟수, 평균/분위수(p50/p90/p99) 소요시간, 병목 점수를 제공합니다.
+
+    Query Parameters:
+    - cohort: 지정 시 해당 디지털 수준 학생의 소요 시간 분위수만 (UNKNOWN: 미입력)
+    - session_ids: 쉼표로 구분한 세션 ID - 지정 시 해당 세션들의 소요 시간 스케치를 병합
     """
     permission_classes = [IsAuthenticated]
 
@@ -362,6 +377,28 @@ class StepAnalysisView(APIView):
             task__lecture=lecture
         ).select_related('task').order_by('task__order_index', 'order_index')
 
+        # 단계별 사전 집계 (signals로 증분 갱신, 백필: rebuild_dashboard_rollups)
+        rollups = {
+            rollup.subtask_id: rollup
+            for rollup in SubtaskStatsRollup.objects.filter(subtask__task__lecture=lecture)
+        }
+
+        # 단계별 소요 시간 분위수 (DDSketch, 저장된 값 또는 세션 스케치 병합)
+        session_ids = None
+        if request.query_params.get('session_ids'):
+            try:
+                session_ids = [int(value) for value in request.query_params['session_ids'].split(',') if value]
+            except ValueError:
+                return Response({'error': 'session_ids는 쉼표로 구분한 숫자여야 합니다.'}, status=400)
+            session_ids = list(
+                LectureSession.objects.filter(lecture=lecture, id__in=session_ids).values_list('id', flat=True)
+            )
+        percentiles = get_step_percentiles(
+            [subtask.id for subtask in subtasks],
+            cohort=request.query_params.get('cohort') or None,
+            session_ids=session_ids,
+        )
+
         step_analysis = []
         max_help_count = 0
         most_delayed_step = None
@@ -369,50 +406,27 @@ class StepAnalysisView(APIView):
         total_delay_rate = 0
 
         for subtask in subtasks:
-            # 해당 단계의 진행 데이터 조회
-            progress_queryset = UserProgress.objects.filter(subtask=subtask)
-
-            # 완료된 진행 데이터 (시간 계산용)
-            completed_progress = progress_queryset.filter(
-                status='COMPLETED',
-                started_at__isnull=False,
-                completed_at__isnull=False
-            )
-
-            # 평균 소요 시간 계산
-            avg_time_data = completed_progress.annotate(
-                time_spent=ExpressionWrapper(
-                    F('completed_at') - F('started_at'),
-                    output_field=DurationField()
-                )
-            ).aggregate(avg_time=Avg('time_spent'))
+            rollup = rollups.get(subtask.id) or SubtaskStatsRollup(subtask=subtask)
 
-            avg_time = avg_time_data['avg_time']
-            avg_time_seconds = avg_time.total_seconds() if avg_time else 0
+            # 평균 소요 시간
+            avg_time_seconds = rollup.avg_time_seconds
 
-            # 지체율 계산 (평균의 2배 이상 소요한 학생 비율)
-            completed_count = completed_progress.count()
+            # 지체율 계산 (평균의 2배 이상 소요한 학생 비율, 소요 시간 히스토그램으로 추정)
+            completed_count = rollup.completed_count
             delay_rate = 0
 
-            if avg_time and completed_count > 0:
-                # 평균의 2배 이상 소요한 학생 수 계산
-                delayed_count = completed_progress.annotate(
-                    time_spent=ExpressionWrapper(
-                        F('completed_at') - F('started_at'),
-                        output_field=DurationField()
-                    )
-                ).filter(time_spent__gte=avg_time * 2).count()
-
-                delay_rate = delayed_count / completed_count if completed_count > 0 else 0
+            if avg_time_seconds and completed_count > 0:
+                delayed_count = estimate_delayed_count(rollup.duration_histogram, avg_time_seconds * 2)
+                delay_rate = delayed_count / completed_count
 
             # 도움 요청 횟수
-            help_count = HelpRequest.objects.filter(subtask=subtask).count()
+            help_count = rollup.help_count
             if help_count > max_help_count:
                 max_help_count = help_count
                 most_help_requested_step = subtask.title
 
             # 전체 학생 수 (해당 단계를 시작한 학생)
-            student_count = progress_queryset.count()
+            student_count = rollup.student_count
 
             # 완료율
             completion_rate = completed_count / student_count if student_count > 0 else 0
@@ -439,6 +453,9 @@ class StepAnalysisView(APIView):
                 'task_name': subtask.task.title,
                 'order_index': subtask.order_index,
                 'avg_time_spent': round(avg_time_seconds),
+                'p50_time_spent': _round_seconds(percentiles[subtask.id]['p50']),
+                'p90_time_spent': _round_seconds(percentiles[subtask.id]['p90']),
+                'p99_time_spent': _round_seconds(percentiles[subtask.id]['p99']),
                 'delay_rate': round(delay_rate, 2),
                 'help_request_count': help_count,
                 'student_count': student_count,
@@ -463,7 +480,7 @@ class StepAnalysisView(APIView):
         })
 
 
-class SessionTrendsView(APIView):
+class SessionTrendsView(ReplicaReadMixin, APIView):
     """
     세션 간 추이 비교
     GET /api/dashboard/statistics/lecture/{lecture_id}/session-trends/
@@ -483,46 +500,31 @@ class SessionTrendsView(APIView):
             )
 
         # 종료된 세션만 조회 (시간순)
+        # 종료 시점 요약 스냅샷을 우선 사용하고, 스냅샷 도입 전 세션은 사전 집계를 사용
         sessions = LectureSession.objects.filter(
             lecture=lecture,
             status='ENDED'
-        ).order_by('started_at')
+        ).select_related('summary_snapshot', 'stats_rollup').order_by('started_at')
 
+        summary_service = SessionSummaryService()
         session_data = []
         for session in sessions:
-            participants = session.participants.all()
-            participant_count = participants.count()
+            metrics = getattr(session, 'summary_snapshot', None) or \
+                getattr(session, 'stats_rollup', None) or \
+                summary_service.freeze(session)
+            participant_count = metrics.participant_count
 
             if participant_count == 0:
                 continue
 
-            # 완료율 계산
-            completed_count = participants.filter(status='COMPLETED').count()
-            completion_rate = completed_count / participant_count
-
-            # 평균 완료 시간 계산
-            completed_participants = participants.filter(
-                completed_at__isnull=False,
-                joined_at__isnull=False
-            )
+            # 완료율
+            completion_rate = metrics.completed_count / participant_count
 
-            avg_completion_time = 0
-            if completed_participants.exists():
-                total_time = 0
-                count = 0
-                for p in completed_participants:
-                    if p.completed_at and p.joined_at:
-                        time_diff = (p.completed_at - p.joined_at).total_seconds()
-                        total_time += time_diff
-                        count += 1
-                avg_completion_time = total_time / count if count > 0 else 0
+            # 평균 완료 시간
+            avg_completion_time = metrics.avg_completion_time
 
             # 도움 요청 수
-            help_requests = HelpRequest.objects.filter(
-                subtask__task__lecture=lecture,
-                created_at__gte=session.started_at if session.started_at else timezone.now(),
-                created_at__lte=session.ended_at if session.ended_at else timezone.now()
-            ).count()
+            help_requests = metrics.help_request_count
 
             session_data.append({
                 'session_id': session.id,
@@ -618,3 +620,66 @@ class SessionTrendsView(APIView):
             'help_request_trend': help_trend,
             'avg_completion_time_trend': time_trend,
         }
+
+
+class LectureCompletionMatrixView(ReplicaReadMixin, APIView):
+    """
+    수강생 × 단계 완료 행렬 (히트맵용)
+    GET /api/dashboard/statistics/lecture/{lecture_id}/completion-matrix/
+
+    Query Parameters:
+    - include_dwell: true이면 칸별 소요 시간(초, base64 '<u4')을 함께 반환
+
+    matrix.states는 행(수강생)별 문자열로, 각 문자는 단계 상태
+    (0: 시작 안 함, 1: 진행 중, 2: 완료)입니다.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, lecture_id):
+        lecture = get_object_or_404(Lecture, pk=lecture_id)
+
+        # 강사 권한 확인
+        if lecture.instructor != request.user:
+            return Response(
+                {'error': '강사만 통계를 조회할 수 있습니다.'},
+                status=403
+            )
+
+        matrix, rows = CompletionMatrix.for_lecture(lecture.id)
+        include_dwell = request.query_params.get('include_dwell', '').lower() == 'true'
+
+        return Response({
+            'lecture_id': lecture.id,
+            **build_completion_report(matrix, rows, include_dwell=include_dwell),
+            'last_updated': timezone.now().isoformat(),
+        })
+
+
+class SessionCompletionMatrixView(ReplicaReadMixin, APIView):
+    """
+    세션 참가자 × 단계 완료 행렬 (히트맵용)
+    GET /api/dashboard/sessions/{session_id}/completion-matrix/
+
+    Query Parameters:
+    - include_dwell: true이면 칸별 소요 시간(초, base64 '<u4')을 함께 반환
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, session_id):
+        session = get_object_or_404(LectureSession, pk=session_id)
+
+        # 강사 권한 확인
+        if session.instructor_id != request.user.id:
+            return Response(
+                {'error': '강사만 세션 진도 통계를 조회할 수 있습니다.'},
+                status=403
+            )
+
+        matrix, rows = CompletionMatrix.for_session(session)
+        include_dwell = request.query_params.get('include_dwell', '').lower() == 'true'
+
+        return Response({
+            'session_id': session.id,
+            **build_completion_report(matrix, rows, include_dwell=include_dwell),
+            'last_updated': timezone.now().isoformat(),
+        })
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import HelpRequest, MGptAnalysis, HelpResponse
+from .models import HelpRequest, MGptAnalysis, HelpResponse, HelpSuggestion
 
 
 @admin.register(HelpRequest)
@@ -19,3 +19,10 @@ class MGptAnalysisAdmin(admin.ModelAdmin):
 class HelpResponseAdmin(admin.ModelAdmin):
     list_display = ['help_request', 'help_type', 'feedback_rating', 'displayed_at']
     list_filter = ['help_type', 'feedback_rating']
+
+
+@admin.register(HelpSuggestion)
+class HelpSuggestionAdmin(admin.ModelAdmin):
+    list_display = ['subtask', 'digital_level', 'updated_at']
+    list_filter = ['digital_level']
+    search_fields = ['subtask__title']
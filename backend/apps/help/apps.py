@@ -5,3 +5,6 @@ class HelpConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.help'
     verbose_name = 'Help Requests'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,141 @@
+"""
+Kafka Producer for Help Requests / M-GPT Analysis
+"""
+import json
+import logging
+import time
+from typing import Dict, Optional
+from kafka import KafkaProducer
+from kafka.errors import KafkaError
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class HelpRequestProducer:
+    """
+    Kafka Producer for the asynchronous M-GPT help pipeline
+
+    - HELP_REQUEST topic: 분석이 필요한 도움 요청 (run_help_analysis_consumer가 처리)
+    - MGPT_ANALYSIS topic: 완료된 분석 결과 (후속 처리/모니터링용)
+
+    Uses singleton pattern to reuse producer instance.
+    Messages are keyed by session (or user) so requests of one class stay ordered
+    within a partition.
+    """
+    _instance = None
+    _producer = None
+    _last_init_attempt = 0.0
+
+    # 브로커 연결 실패 시 재시도 간격 (요청마다 연결을 기다리지 않도록)
+    RECONNECT_INTERVAL_SECONDS = 60
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if self._producer is None:
+            self._initialize_producer()
+
+    def _initialize_producer(self):
+        """Initialize Kafka Producer with configuration"""
+        now = time.monotonic()
+        if HelpRequestProducer._last_init_attempt and \
+                now - HelpRequestProducer._last_init_attempt < self.RECONNECT_INTERVAL_SECONDS:
+            return
+        HelpRequestProducer._last_init_attempt = now
+
+        try:
+            HelpRequestProducer._producer = KafkaProducer(
+                bootstrap_servers=settings.KAFKA_BOOTSTRAP_SERVERS.split(','),
+                value_serializer=lambda v: json.dumps(v).encode('utf-8'),
+                key_serializer=lambda k: k.encode('utf-8') if k else None,
+                acks='all',
+                retries=3,
+                linger_ms=5,
+            )
+            logger.info("Help request Kafka Producer initialized successfully")
+        except Exception as e:
+            logger.error(f"Failed to initialize help request Kafka Producer: {e}")
+            HelpRequestProducer._producer = None
+
+    @property
+    def is_available(self) -> bool:
+        return self._producer is not None
+
+    def _send(self, topic: str, value: Dict, key: Optional[str] = None, wait: bool = False) -> bool:
+        """
+        메시지 전송
+
+        wait=True이면 브로커 확인(acks=all)까지 기다린다 (HELP_KAFKA_ACK_TIMEOUT_SECONDS).
+        확인을 받지 못하면 False를 반환하여 호출 측이 대체 경로를 쓰도록 한다.
+        """
+        if self._producer is None:
+            logger.warning("Help request Kafka Producer not available, skipping send")
+            return False
+
+        try:
+            future = self._producer.send(topic, key=key, value=value)
+            if wait:
+                future.get(timeout=getattr(settings, 'HELP_KAFKA_ACK_TIMEOUT_SECONDS', 5))
+            else:
+                future.add_errback(lambda exc: logger.error(f"Failed to send message to {topic}: {exc}"))
+            return True
+        except KafkaError as e:
+            logger.error(f"Kafka error sending message to {topic}: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected error sending message to {topic}: {e}")
+            return False
+
+    def send_help_request(self, help_request) -> bool:
+        """
+        Queue a help request for M-GPT analysis
+
+        브로커가 기록을 확인할 때까지 기다린다 (실패하면 호출 측이 Celery로 대체).
+
+        Args:
+            help_request: HelpRequest instance
+
+        Returns:
+            bool: True if the broker acknowledged the message, False otherwise
+        """
+        partition_key = (
+            f"session-{help_request.session_id}" if help_request.session_id
+            else f"user-{help_request.user_id}"
+        )
+        return self._send(
+            settings.KAFKA_TOPICS['HELP_REQUEST'],
+            key=partition_key,
+            value={
+                'help_request_id': help_request.id,
+                'user_id': help_request.user_id,
+                'session_id': help_request.session_id,
+                'subtask_id': help_request.subtask_id,
+                'request_type': help_request.request_type,
+                'created_at': help_request.created_at.isoformat(),
+            },
+            wait=True,
+        )
+
+    def send_analysis_result(self, result: Dict) -> bool:
+        """
+        Publish a finished M-GPT analysis
+
+        Args:
+            result: Analysis payload (help_request_id, user_id, session_id, analysis...)
+
+        Returns:
+            bool: True if message was queued successfully, False otherwise
+        """
+        return self._send(
+            settings.KAFKA_TOPICS['MGPT_ANALYSIS'],
+            key=f"help-{result.get('help_request_id')}",
+            value=result,
+        )
+
+    def flush(self, timeout: int = 10):
+        if self._producer:
+            self._producer.flush(timeout=timeout)
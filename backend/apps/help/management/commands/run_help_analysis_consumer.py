@@ -0,0 +1,174 @@
+"""
+Help Analysis Kafka Consumer Management Command
+HELP_REQUEST 토픽의 도움 요청을 M-GPT로 분석 (동시 처리 수 제한)
+
+분석에 실패한 요청은 Celery(analyze_help_request_task, 재시도 포함)로 넘기고,
+넘기지도 못한 요청은 오프셋을 커밋하지 않고 그 위치로 되돌아가 다시 읽는다 (at-least-once).
+분석은 멱등(이미 분석된 요청은 건너뜀)이므로 중복 처리되어도 결과는 하나다.
+"""
+import json
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from kafka import KafkaConsumer, TopicPartition
+from kafka.errors import KafkaError
+from kafka.structs import OffsetAndMetadata
+
+from apps.help.services import HelpAnalysisService
+from apps.help.tasks import analyze_help_request_task
+
+
+class Command(BaseCommand):
+    help = 'Run Kafka consumer that analyzes help requests with M-GPT'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--topic',
+            type=str,
+            default=settings.KAFKA_TOPICS['HELP_REQUEST'],
+            help='Kafka topic to consume from'
+        )
+        parser.add_argument(
+            '--group',
+            type=str,
+            default='mobilegpt-help-analysis-group',
+            help='Consumer group ID'
+        )
+        parser.add_argument(
+            '--bootstrap-servers',
+            type=str,
+            default=settings.KAFKA_BOOTSTRAP_SERVERS,
+            help='Kafka bootstrap servers'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=settings.HELP_ANALYSIS_CONCURRENCY,
+            help='Maximum number of M-GPT calls in flight'
+        )
+
+    def handle(self, *args, **options):
+        topic = options['topic']
+        group_id = options['group']
+        bootstrap_servers = options['bootstrap_servers']
+        concurrency = max(1, options['concurrency'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Starting help analysis consumer...\n'
+            f'Topic: {topic}\n'
+            f'Group: {group_id}\n'
+            f'Bootstrap servers: {bootstrap_servers}\n'
+            f'Concurrency: {concurrency}'
+        ))
+
+        # 배치 단위로 처리 후 커밋하므로 자동 커밋은 끄고,
+        # 한 번에 가져오는 레코드 수로 동시 분석 수를 제한한다.
+        try:
+            consumer = KafkaConsumer(
+                topic,
+                bootstrap_servers=bootstrap_servers.split(','),
+                group_id=group_id,
+                value_deserializer=lambda m: json.loads(m.decode('utf-8')),
+                auto_offset_reset='earliest',
+                enable_auto_commit=False,
+                max_poll_records=concurrency,
+                # M-GPT 응답이 느려도 리밸런싱되지 않도록 여유를 둠
+                max_poll_interval_ms=600000,
+            )
+        except KafkaError as e:
+            self.stdout.write(self.style.ERROR(f'Failed to connect to Kafka: {e}'))
+            return
+
+        self.stdout.write(self.style.SUCCESS('✓ Connected to Kafka successfully'))
+
+        service = HelpAnalysisService()
+        processed_count = 0
+
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                while True:
+                    batches = consumer.poll(timeout_ms=1000)
+                    records = [record for partition in batches.values() for record in partition]
+                    if not records:
+                        continue
+
+                    futures = [
+                        executor.submit(self.process_message, service, record.value)
+                        for record in records
+                    ]
+                    wait(futures)
+
+                    # 파티션별로 다시 읽어야 하는 첫 오프셋 (실패를 Celery로 넘기지 못한 레코드)
+                    redeliver = {}
+                    for record, future in zip(records, futures):
+                        result = future.result()
+                        if result.get('success'):
+                            processed_count += 1
+                            continue
+
+                        self.stdout.write(self.style.ERROR(
+                            f'Help request {result.get("help_request_id")} failed: {result.get("error")}'
+                        ))
+                        if result.get('help_request_id') and not self.hand_off(result['help_request_id']):
+                            tp = (record.topic, record.partition)
+                            redeliver[tp] = min(redeliver.get(tp, record.offset), record.offset)
+
+                    self.commit_batch(consumer, records, redeliver)
+
+                    self.stdout.write(self.style.SUCCESS(
+                        f'Processed batch of {len(records)} (total {processed_count})'
+                    ))
+
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING('\nShutting down help analysis consumer...'))
+        finally:
+            consumer.close()
+            self.stdout.write(self.style.SUCCESS(
+                f'Consumer closed. Total help requests analyzed: {processed_count}'
+            ))
+
+    def hand_off(self, help_request_id):
+        """실패한 분석을 Celery 재시도 경로로 넘김 (넘기지 못하면 False)"""
+        try:
+            analyze_help_request_task.delay(help_request_id)
+            return True
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f'Failed to re-enqueue help request {help_request_id}: {e}'))
+            return False
+
+    def commit_batch(self, consumer, records, redeliver):
+        """
+        배치 오프셋 커밋
+
+        redeliver에 있는 파티션은 그 오프셋 직전까지만 커밋하고 그 위치로 되돌아가
+        다음 poll에서 다시 받는다.
+        """
+        offsets = {}
+        for record in records:
+            tp = (record.topic, record.partition)
+            offsets[tp] = max(offsets.get(tp, 0), record.offset + 1)
+        offsets.update(redeliver)
+
+        consumer.commit(offsets={
+            TopicPartition(topic, partition): OffsetAndMetadata(offset, None)
+            for (topic, partition), offset in offsets.items()
+        })
+        for (topic, partition), offset in redeliver.items():
+            consumer.seek(TopicPartition(topic, partition), offset)
+            self.stdout.write(self.style.WARNING(f'Redelivering {topic}[{partition}] from offset {offset}'))
+
+    def process_message(self, service, message):
+        """Analyze a single help request message (worker thread)"""
+        help_request_id = message.get('help_request_id')
+        if not help_request_id:
+            return {'success': False, 'error': 'help_request_id missing'}
+
+        close_old_connections()
+        try:
+            return service.process_help_request(help_request_id)
+        except Exception as e:
+            return {'success': False, 'help_request_id': help_request_id, 'error': str(e)}
+        finally:
+            close_old_connections()
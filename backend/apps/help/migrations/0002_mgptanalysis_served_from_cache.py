@@ -0,0 +1,21 @@
+# Generated by Django 5.0.1 on 2026-10-19 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("help", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="mgptanalysis",
+            name="served_from_cache",
+            field=models.BooleanField(
+                default=False,
+                help_text="유사 상황의 이전 M-GPT 답변을 재사용한 경우",
+                verbose_name="캐시 응답 여부",
+            ),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.0.1 on 2026-10-19 01:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("help", "0002_mgptanalysis_served_from_cache"),
+        ("tasks", "0004_add_source_task_field"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="HelpSuggestion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "digital_level",
+                    models.CharField(max_length=20, verbose_name="디지털 수준"),
+                ),
+                ("content", models.JSONField(verbose_name="도움말 내용")),
+                (
+                    "source_fingerprint",
+                    models.CharField(
+                        help_text="생성 당시 단계 제목/설명/목표 액션의 해시 (변경 시 무효화)",
+                        max_length=40,
+                        verbose_name="단계 내용 지문",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성 시각"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정 시각"),
+                ),
+                (
+                    "subtask",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="help_suggestions",
+                        to="tasks.subtask",
+                        verbose_name="세부 단계",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "사전 생성 도움말",
+                "verbose_name_plural": "사전 생성 도움말",
+                "db_table": "help_suggestions",
+                "unique_together": {("subtask", "digital_level")},
+            },
+        ),
+    ]
@@ -88,6 +88,11 @@ class MGptAnalysis(models.Model):
     problem_diagnosis = models.TextField(blank=True, verbose_name='문제 진단')
     suggested_help = models.TextField(blank=True, verbose_name='추천 도움말')
     confidence_score = models.FloatField(null=True, blank=True, verbose_name='신뢰도')
+    served_from_cache = models.BooleanField(
+        default=False,
+        verbose_name='캐시 응답 여부',
+        help_text='유사 상황의 이전 M-GPT 답변을 재사용한 경우'
+    )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='분석 시각')
 
     class Meta:
@@ -147,3 +152,32 @@ class HelpResponse(models.Model):
 
     def __str__(self):
         return f"Response for {self.help_request.id}"
+
+
+class HelpSuggestion(models.Model):
+    """세션 시작 전에 미리 생성해 둔 단계별 M-GPT 도움말"""
+
+    subtask = models.ForeignKey(
+        Subtask,
+        on_delete=models.CASCADE,
+        related_name='help_suggestions',
+        verbose_name='세부 단계'
+    )
+    digital_level = models.CharField(max_length=20, verbose_name='디지털 수준')
+    content = models.JSONField(verbose_name='도움말 내용')
+    source_fingerprint = models.CharField(
+        max_length=40,
+        verbose_name='단계 내용 지문',
+        help_text='생성 당시 단계 제목/설명/목표 액션의 해시 (변경 시 무효화)'
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성 시각')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정 시각')
+
+    class Meta:
+        db_table = 'help_suggestions'
+        verbose_name = '사전 생성 도움말'
+        verbose_name_plural = '사전 생성 도움말'
+        unique_together = [['subtask', 'digital_level']]
+
+    def __str__(self):
+        return f"Suggestion for subtask {self.subtask_id} ({self.digital_level})"
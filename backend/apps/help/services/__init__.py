@@ -2,5 +2,9 @@
 Help Services
 """
 from .mgpt_service import MGptService
+from .answer_cache import HelpAnswerCache
+from .help_suggestion_service import HelpSuggestionService
+from .help_analysis_service import HelpAnalysisService
+from .help_cluster_service import HelpClusterService
 
-__all__ = ['MGptService']
+__all__ = ['MGptService', 'HelpAnswerCache', 'HelpSuggestionService', 'HelpAnalysisService', 'HelpClusterService']
@@ -0,0 +1,164 @@
+"""
+Help Answer Cache - 비슷한 상황의 도움 요청에 M-GPT 답변을 재사용
+
+같은 단계(subtask)에서 같은 디지털 수준의 학생이 비슷한 행동 패턴으로 막히면
+M-GPT 답변도 거의 같으므로, 요청 상황을 시그니처로 요약해 답변을 캐시한다.
+
+시그니처 = subtask id + 단계 내용 해시 + 디지털 수준 + 최근 이벤트 요약(버킷화)
+  (단계가 없는 요청은 강의/세션이 달라도 시그니처가 겹치므로 캐시하지 않는다)
+  - 최근 N개 이벤트의 (event_type, view_id) 순서 (연속 중복 제거)
+  - 컨텍스트 이벤트 수 구간 (0 / 1-3 / 4-10 / 11+)
+  - 에러 메시지 유무 및 내용 해시
+
+Redis 구조:
+  help_answer:entry:{signature}  답변 JSON (TTL)
+  help_answer:lru                signature → 마지막 사용 시각 (크기 제한 시 오래된 것부터 제거)
+  help_answer:stats:{lecture_id} hits / misses (강의별 적중률, 사전 생성 도움말로 응답한 경우도 적중)
+"""
+import hashlib
+import json
+import logging
+import time
+from typing import Dict, List, Optional
+
+from django.conf import settings
+
+from core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'help_answer'
+LRU_KEY = f'{KEY_PREFIX}:lru'
+
+# 컨텍스트 이벤트 수 구간 경계 (상한 포함)
+EVENT_COUNT_BUCKETS = [0, 3, 10]
+
+
+def _bucket_event_count(count: int) -> int:
+    for index, upper in enumerate(EVENT_COUNT_BUCKETS):
+        if count <= upper:
+            return index
+    return len(EVENT_COUNT_BUCKETS)
+
+
+class HelpAnswerCache:
+    """M-GPT 도움 답변 캐시 (TTL + 크기 제한 LRU)"""
+
+    def __init__(self, redis_client=None):
+        self.redis = redis_client or get_redis()
+        self.ttl = getattr(settings, 'HELP_ANSWER_CACHE_TTL', 3600)
+        self.max_entries = getattr(settings, 'HELP_ANSWER_CACHE_MAX_ENTRIES', 5000)
+
+    @staticmethod
+    def build_signature(
+        subtask_id: Optional[int],
+        digital_level: str,
+        activity_logs: Optional[List[Dict]] = None,
+        error_message: Optional[str] = None,
+        subtask_fingerprint: str = ''
+    ) -> str:
+        """
+        도움 요청 상황 시그니처 생성
+
+        Args:
+            subtask_id: 막힌 단계 ID
+            digital_level: 학생 디지털 수준
+            activity_logs: 최근 활동 로그 (시간순)
+            error_message: 앱 에러 메시지 (선택)
+            subtask_fingerprint: 단계 내용 해시 (HelpSuggestionService.build_fingerprint)
+                - 단계가 수정되면 이전 답변이 더 이상 적중하지 않도록
+
+        Returns:
+            시그니처 문자열 (sha1 hex)
+        """
+        activity_logs = activity_logs or []
+        recent_count = getattr(settings, 'HELP_ANSWER_SIGNATURE_EVENTS', 5)
+
+        pattern = []
+        for log in activity_logs[-recent_count:]:
+            step = (log.get('event_type') or '', log.get('view_id_resource_name') or '')
+            if not pattern or pattern[-1] != step:
+                pattern.append(step)
+
+        error_digest = (
+            hashlib.sha1(error_message.encode('utf-8')).hexdigest()[:8] if error_message else ''
+        )
+
+        raw = json.dumps([
+            subtask_id,
+            subtask_fingerprint,
+            digital_level,
+            _bucket_event_count(len(activity_logs)),
+            pattern,
+            error_digest,
+        ], ensure_ascii=False)
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def _entry_key(self, signature: str) -> str:
+        return f'{KEY_PREFIX}:entry:{signature}'
+
+    def _stats_key(self, lecture_id) -> str:
+        return f'{KEY_PREFIX}:stats:{lecture_id}'
+
+    def get(self, signature: str) -> Optional[Dict]:
+        """
+        캐시된 답변 조회
+
+        Returns:
+            캐시된 M-GPT 답변 또는 None
+        """
+        try:
+            raw = self.redis.get(self._entry_key(signature))
+            if raw is None:
+                self.redis.zrem(LRU_KEY, signature)
+            else:
+                self.redis.zadd(LRU_KEY, {signature: time.time()})
+        except Exception as e:
+            logger.warning(f"Help answer cache unavailable: {e}")
+            return None
+
+        return json.loads(raw) if raw is not None else None
+
+    def record_lookup(self, lecture_id: Optional[int], hit: bool):
+        """요청 접수 시점의 적중/실패를 강의별로 집계 (M-GPT 호출 없이 응답했으면 적중)"""
+        if not lecture_id:
+            return
+        try:
+            self.redis.hincrby(self._stats_key(lecture_id), 'hits' if hit else 'misses', 1)
+        except Exception as e:
+            logger.warning(f"Failed to record help answer cache stats: {e}")
+
+    def set(self, signature: str, answer: Dict):
+        """답변 저장 후 최대 개수를 넘으면 가장 오래 사용되지 않은 답변부터 제거"""
+        try:
+            pipe = self.redis.pipeline()
+            pipe.set(self._entry_key(signature), json.dumps(answer, ensure_ascii=False), ex=self.ttl)
+            pipe.zadd(LRU_KEY, {signature: time.time()})
+            pipe.zcard(LRU_KEY)
+            size = pipe.execute()[-1]
+
+            overflow = size - self.max_entries
+            if overflow > 0:
+                evicted = [member for member, _ in self.redis.zpopmin(LRU_KEY, overflow)]
+                if evicted:
+                    self.redis.delete(*[self._entry_key(sig) for sig in evicted])
+        except Exception as e:
+            logger.warning(f"Failed to store help answer in cache: {e}")
+
+    def get_stats(self, lecture_id: int) -> Dict:
+        """강의별 캐시 적중률 조회"""
+        try:
+            stats = self.redis.hgetall(self._stats_key(lecture_id))
+        except Exception as e:
+            logger.warning(f"Help answer cache unavailable: {e}")
+            stats = {}
+
+        hits = int(stats.get('hits', 0))
+        misses = int(stats.get('misses', 0))
+        total = hits + misses
+        return {
+            'lecture_id': lecture_id,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / total * 100, 2) if total else 0.0,
+        }
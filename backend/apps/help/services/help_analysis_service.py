@@ -0,0 +1,275 @@
+"""
+Help Analysis Service - 도움 요청을 비동기로 M-GPT 분석하고 결과를 전달
+
+플로우:
+  HelpRequestCreateView → Kafka(HELP_REQUEST) → run_help_analysis_consumer
+      → HelpAnalysisService.process_help_request
+          → ActivityLog 컨텍스트 수집 (단일 쿼리)
+          → 답변 캐시 → 사전 생성 도움말(HelpSuggestion) → MGptService
+          → MGptAnalysis / HelpResponse 저장
+          → WebSocket 전달 (progress_user_{id}, session_{code}) + Kafka(MGPT_ANALYSIS)
+"""
+import logging
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .answer_cache import HelpAnswerCache
+from .help_suggestion_service import HelpSuggestionService
+from .mgpt_service import MGptService
+
+logger = logging.getLogger(__name__)
+
+# M-GPT 프롬프트 컨텍스트로 사용하는 ActivityLog 필드
+CONTEXT_LOG_FIELDS = [
+    'event_type', 'view_id_resource_name', 'content_description', 'timestamp',
+]
+
+
+class HelpAnalysisService:
+    """
+    도움 요청 1건을 분석하여 MGptAnalysis/HelpResponse를 생성하고 실시간으로 알리는 서비스
+
+    Kafka는 at-least-once로 전달하므로 이미 분석된 요청은 건너뛴다.
+    """
+
+    def __init__(
+        self,
+        mgpt_service: MGptService = None,
+        answer_cache: HelpAnswerCache = None,
+        suggestion_service: HelpSuggestionService = None
+    ):
+        self.mgpt_service = mgpt_service or MGptService()
+        self.answer_cache = answer_cache or HelpAnswerCache()
+        self.suggestion_service = suggestion_service or HelpSuggestionService(self.mgpt_service)
+
+    def process_help_request(self, help_request_id: int) -> Dict:
+        """
+        도움 요청 분석 및 결과 전달
+
+        Args:
+            help_request_id: HelpRequest ID
+
+        Returns:
+            Dict containing:
+                - success: bool
+                - help_request_id: HelpRequest ID
+                - help_response_id: 생성된 HelpResponse ID (if success)
+                - skipped: 이미 분석된 요청인 경우 True
+                - error: Error message (if failed)
+        """
+        from apps.help.models import HelpRequest, MGptAnalysis
+
+        try:
+            help_request = HelpRequest.objects.select_related(
+                'user', 'subtask__task', 'session'
+            ).get(id=help_request_id)
+        except HelpRequest.DoesNotExist:
+            error_msg = f"HelpRequest {help_request_id} not found"
+            logger.error(error_msg)
+            return {'success': False, 'help_request_id': help_request_id, 'error': error_msg}
+
+        if help_request.status == 'RESOLVED' or \
+                MGptAnalysis.objects.filter(help_request_id=help_request_id).exists():
+            return {'success': True, 'help_request_id': help_request_id, 'skipped': True}
+
+        HelpRequest.objects.filter(id=help_request_id, status='PENDING').update(status='ANALYZING')
+
+        try:
+            analysis_input = self._build_analysis_input(help_request)
+            signature = self._build_signature(help_request, analysis_input)
+
+            # 대기 중 같은 상황의 다른 요청이 먼저 답변되었을 수 있으므로 한 번 더 확인
+            # (적중률 통계는 요청 접수 시점(answer_from_cache)에서만 집계)
+            result = (signature and self.answer_cache.get(signature)) or \
+                self.suggestion_service.get_suggestion(help_request.subtask, analysis_input['user_digital_level'])
+            served_from_cache = result is not None
+            if not served_from_cache:
+                result = self.mgpt_service.analyze_help_request(**analysis_input)
+                if signature and not result.get('is_fallback'):
+                    self.answer_cache.set(signature, result)
+
+            analysis, help_response = self._save_result(
+                help_request, analysis_input, result, served_from_cache=served_from_cache
+            )
+        except Exception as e:
+            logger.error(f"Error processing help request {help_request_id}: {e}")
+            HelpRequest.objects.filter(id=help_request_id, status='ANALYZING').update(status='PENDING')
+            return {'success': False, 'help_request_id': help_request_id, 'error': str(e)}
+
+        payload = self._build_result_payload(help_request, analysis, help_response, result)
+        self._notify(help_request, payload)
+
+        from apps.help.kafka_producer import HelpRequestProducer
+        HelpRequestProducer().send_analysis_result(payload)
+
+        return {
+            'success': True,
+            'help_request_id': help_request_id,
+            'help_response_id': help_response.id,
+            'cached': served_from_cache,
+        }
+
+    def answer_from_cache(self, help_request) -> Optional[Dict]:
+        """
+        캐시된 답변(또는 사전 생성 도움말)이 있으면 M-GPT 호출 없이 즉시 응답
+
+        요청 접수 시점에 호출되며, 강의별 캐시 적중률을 함께 집계한다.
+        사전 생성 도움말로 응답한 경우 같은 상황의 다음 요청을 위해 답변 캐시에도 저장한다.
+
+        Args:
+            help_request: HelpRequest instance (user, subtask__task, session 로드 권장)
+
+        Returns:
+            결과 payload (적중 시) 또는 None (캐시 없음)
+        """
+        try:
+            analysis_input = self._build_analysis_input(help_request)
+            signature = self._build_signature(help_request, analysis_input)
+            result = self.answer_cache.get(signature) if signature else None
+            if result is None:
+                result = self.suggestion_service.get_suggestion(
+                    help_request.subtask, analysis_input['user_digital_level']
+                )
+                if result is not None and signature:
+                    self.answer_cache.set(signature, result)
+            self.answer_cache.record_lookup(self._get_lecture_id(help_request), hit=result is not None)
+            if result is None:
+                return None
+
+            analysis, help_response = self._save_result(
+                help_request, analysis_input, result, served_from_cache=True
+            )
+        except Exception as e:
+            logger.error(f"Failed to answer help request {help_request.id} from cache: {e}")
+            return None
+
+        payload = self._build_result_payload(help_request, analysis, help_response, result)
+        self._notify(help_request, payload)
+        return payload
+
+    def _build_signature(self, help_request, analysis_input: Dict) -> Optional[str]:
+        """답변 캐시 시그니처 (단계가 없는 요청은 다른 강의와 겹칠 수 있으므로 None - 캐시 사용 안 함)"""
+        if not help_request.subtask_id:
+            return None
+        return HelpAnswerCache.build_signature(
+            subtask_id=help_request.subtask_id,
+            digital_level=analysis_input['user_digital_level'],
+            activity_logs=analysis_input['activity_logs'],
+            error_message=analysis_input['error_message'],
+            subtask_fingerprint=HelpSuggestionService.build_fingerprint(help_request.subtask),
+        )
+
+    def _get_lecture_id(self, help_request) -> Optional[int]:
+        if help_request.subtask and help_request.subtask.task:
+            return help_request.subtask.task.lecture_id
+        if help_request.session:
+            return help_request.session.lecture_id
+        return None
+
+    def _collect_activity_context(self, help_request) -> List[Dict]:
+        """
+        도움 요청 직전의 사용자 활동 로그 조회
+
+        (user, -timestamp) 인덱스를 타는 단일 쿼리로 최근 이벤트만 가져온다.
+        """
+        from apps.logs.models import ActivityLog
+
+        window = getattr(settings, 'HELP_CONTEXT_WINDOW_SECONDS', 300)
+        limit = getattr(settings, 'HELP_CONTEXT_MAX_EVENTS', 20)
+
+        logs = ActivityLog.objects.filter(
+            user_id=help_request.user_id,
+            timestamp__gte=help_request.created_at - timedelta(seconds=window),
+            timestamp__lte=help_request.created_at,
+        ).order_by('-timestamp').values(*CONTEXT_LOG_FIELDS)[:limit]
+
+        # 프롬프트에는 시간순으로 전달
+        return [
+            {**log, 'timestamp': log['timestamp'].isoformat() if log['timestamp'] else None}
+            for log in reversed(list(logs))
+        ]
+
+    def _build_analysis_input(self, help_request) -> Dict:
+        subtask = help_request.subtask
+        context_data = help_request.context_data or {}
+
+        return {
+            'subtask_title': subtask.title if subtask else context_data.get('subtask_title', ''),
+            'subtask_description': subtask.description if subtask else '',
+            'target_action': subtask.target_action if subtask else '',
+            'user_digital_level': help_request.user.digital_level,
+            'activity_logs': self._collect_activity_context(help_request),
+            'error_message': context_data.get('error_message'),
+        }
+
+    def _save_result(self, help_request, analysis_input: Dict, result: Dict, served_from_cache: bool = False):
+        from apps.help.models import HelpRequest, MGptAnalysis, HelpResponse
+
+        help_content = '\n'.join(result.get('step_by_step_solution') or []) or \
+            result.get('problem_diagnosis', '')
+
+        with transaction.atomic():
+            analysis = MGptAnalysis.objects.create(
+                help_request=help_request,
+                analysis_input=analysis_input,
+                analysis_output=result,
+                problem_diagnosis=result.get('problem_diagnosis', ''),
+                suggested_help=help_content,
+                confidence_score=result.get('confidence_score'),
+                served_from_cache=served_from_cache,
+            )
+            help_response = HelpResponse.objects.create(
+                help_request=help_request,
+                mgpt_analysis=analysis,
+                help_type='TEXT',
+                help_content=help_content,
+            )
+            # 분석이 끝나도 강사의 해결 처리 전까지는 대기 목록에 남김
+            HelpRequest.objects.filter(
+                id=help_request.id, status='ANALYZING'
+            ).update(status='PENDING')
+
+        return analysis, help_response
+
+    def _build_result_payload(self, help_request, analysis, help_response, result: Dict) -> Dict:
+        return {
+            'help_request_id': help_request.id,
+            'help_response_id': help_response.id,
+            'user_id': help_request.user_id,
+            'user_name': help_request.user.name,
+            'session_id': help_request.session_id,
+            'subtask_id': help_request.subtask_id,
+            'problem_diagnosis': analysis.problem_diagnosis,
+            'help_content': help_response.help_content,
+            'step_by_step_solution': result.get('step_by_step_solution', []),
+            'alternative_approaches': result.get('alternative_approaches', []),
+            'confidence_score': analysis.confidence_score,
+            'cached': analysis.served_from_cache,
+            'analyzed_at': timezone.now().isoformat(),
+        }
+
+    def _notify(self, help_request, payload: Dict):
+        """학생 진행도 그룹과 세션 그룹에 분석 결과 전송"""
+        from apps.sessions import event_log
+
+        channel_layer = get_channel_layer()
+        if channel_layer is None:
+            return
+
+        try:
+            async_to_sync(channel_layer.group_send)(
+                f'progress_user_{help_request.user_id}',
+                {'type': 'help_response', **payload}
+            )
+            if help_request.session:
+                event = {'type': 'help_response', **payload}
+                event_log.record(help_request.session.session_code, event)
+                async_to_sync(channel_layer.group_send)(f'session_{help_request.session.session_code}', event)
+        except Exception as e:
+            logger.error(f"Failed to push help response for request {help_request.id}: {e}")
@@ -0,0 +1,286 @@
+"""
+Help Cluster Service - 같은 단계의 도움 요청을 묶어 강사 알림과 M-GPT 답변을 한 번으로 합침
+
+수업 중 여러 학생이 몇 초 사이에 같은 단계(subtask)에서 도움을 요청하면
+강사 대시보드에 학생별 help_requested가 쏟아진다. (session, subtask)별로 짧은 창을 열어
+요청을 모으고, 창이 끝나면 한 번에 알린다.
+
+플로우:
+  SessionConsumer.handle_help_request → add_request
+      - 창의 첫 요청: 기존처럼 help_requested 즉시 전송 + flush 태스크 예약 (countdown=창 길이)
+      - 창 안의 이후 요청: 묶음에만 추가
+  flush_help_cluster_task → flush
+      - 2명 이상이면 help_cluster(인원/참가자 목록) 전송
+      - 공유 M-GPT 답변 1회 생성 → help_cluster_answer (해당 학생 기기에 help_response로 전달)
+  flush가 창 길이 + HELP_CLUSTER_FLUSH_GRACE_SECONDS 안에 실행되지 않으면 (Celery 중단/적체)
+      - 이후 요청을 보낸 consumer가 withdraw_unflushed로 묶음에서 빠지고 help_requested를 직접 전송
+      - flush 예약 자체가 실패하면 abandon으로 묶음을 닫아 이후 요청은 새 묶음으로 시작
+
+Redis 구조:
+  help_cluster:open:{session_code}:{subtask_id}  현재 열린 묶음 ID (창 길이 TTL)
+  help_cluster:meta:{cluster_id}                 세션/단계/생성 시각/flush 시각/공유 답변
+  help_cluster:members:{cluster_id}              참가자 키 → 요청 상세 JSON (메시지, 스크린샷 URL 등)
+"""
+import json
+import logging
+import uuid
+from collections import Counter
+from typing import Dict, List, Optional
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.utils import timezone
+
+from core.redis import get_async_redis, get_redis
+from .answer_cache import HelpAnswerCache
+from .help_suggestion_service import HelpSuggestionService
+from .mgpt_service import MGptService
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'help_cluster'
+
+# flush가 아직 시작되지 않았을 때만 참가자를 묶음에서 뺌 (flush의 flushed_at 기록과 원자적으로 구분)
+# KEYS: meta, members / ARGV: 참가자 키
+_WITHDRAW_SCRIPT = """
+if redis.call('HEXISTS', KEYS[1], 'flushed_at') == 1 then
+  return 0
+end
+return redis.call('HDEL', KEYS[2], ARGV[1])
+"""
+
+
+def _open_key(session_code: str, subtask_id) -> str:
+    return f'{KEY_PREFIX}:open:{session_code}:{subtask_id}'
+
+
+def _meta_key(cluster_id: str) -> str:
+    return f'{KEY_PREFIX}:meta:{cluster_id}'
+
+
+def _members_key(cluster_id: str) -> str:
+    return f'{KEY_PREFIX}:members:{cluster_id}'
+
+
+def _member_key(member: Dict) -> str:
+    """같은 학생의 중복 요청은 하나로 센다"""
+    if member.get('device_id'):
+        return f"device:{member['device_id']}"
+    return f"user:{member.get('account_id') or member.get('user_id')}"
+
+
+class HelpClusterService:
+    """(session, subtask)별 도움 요청 묶음 관리"""
+
+    def __init__(self):
+        self.window = getattr(settings, 'HELP_CLUSTER_WINDOW_SECONDS', 5)
+        self.detail_ttl = getattr(settings, 'HELP_CLUSTER_DETAIL_TTL', 3600)
+        self.flush_grace = getattr(settings, 'HELP_CLUSTER_FLUSH_GRACE_SECONDS', 10)
+
+    async def add_request(self, session_code: str, subtask_id, member: Dict) -> Dict:
+        """
+        도움 요청을 현재 열린 묶음에 추가 (없으면 새 묶음 생성)
+
+        Args:
+            session_code: 세션 코드
+            subtask_id: 막힌 단계 ID
+            member: user_id, user_name, device_id, account_id, message, screenshot_url, screenshot_id
+
+        Returns:
+            Dict containing:
+                - cluster_id: 묶음 ID
+                - is_first: 이 요청으로 묶음이 새로 열렸으면 True (flush 예약 필요)
+        """
+        redis = get_async_redis()
+        open_key = _open_key(session_code, subtask_id)
+
+        candidate = uuid.uuid4().hex
+        is_first = bool(await redis.set(open_key, candidate, nx=True, ex=self.window))
+        cluster_id = candidate if is_first else await redis.get(open_key)
+        if cluster_id is None:
+            # 조회 직전에 창이 닫힌 경우 새 묶음으로 시작
+            is_first = bool(await redis.set(open_key, candidate, nx=True, ex=self.window))
+            cluster_id = candidate if is_first else await redis.get(open_key)
+
+        member = {**member, 'requested_at': timezone.now().isoformat()}
+
+        pipe = redis.pipeline()
+        if is_first:
+            pipe.hset(_meta_key(cluster_id), mapping={
+                'session_code': session_code,
+                'subtask_id': subtask_id,
+                'opened_at': member['requested_at'],
+            })
+            pipe.expire(_meta_key(cluster_id), self.detail_ttl)
+        pipe.hset(_members_key(cluster_id), _member_key(member), json.dumps(member, ensure_ascii=False))
+        pipe.expire(_members_key(cluster_id), self.detail_ttl)
+        await pipe.execute()
+
+        return {'cluster_id': cluster_id, 'is_first': is_first}
+
+    async def abandon(self, session_code: str, subtask_id, cluster_id: str):
+        """flush 예약에 실패한 묶음 닫기 (이후 요청이 처리되지 않을 묶음에 쌓이지 않도록)"""
+        redis = get_async_redis()
+        open_key = _open_key(session_code, subtask_id)
+        if await redis.get(open_key) == cluster_id:
+            await redis.delete(open_key)
+
+    async def withdraw_unflushed(self, cluster_id: str, member: Dict) -> bool:
+        """
+        flush가 아직 시작되지 않았으면 참가자를 묶음에서 뺌
+
+        Returns:
+            뺐으면 True (호출 측이 help_requested를 직접 전송), flush가 이미 처리했으면 False
+        """
+        removed = await get_async_redis().eval(
+            _WITHDRAW_SCRIPT, 2, _meta_key(cluster_id), _members_key(cluster_id), _member_key(member)
+        )
+        return bool(removed)
+
+    def flush(self, cluster_id: str) -> Dict:
+        """
+        창이 끝난 묶음 처리 (Celery 태스크에서 호출)
+
+        Returns:
+            Dict containing:
+                - cluster_id: 묶음 ID
+                - count: 묶인 요청 수
+                - clustered: 2명 이상이라 묶음 알림/공유 답변을 보냈으면 True
+        """
+        redis = get_redis()
+        meta = redis.hgetall(_meta_key(cluster_id))
+        if not meta:
+            return {'cluster_id': cluster_id, 'count': 0, 'clustered': False}
+
+        session_code = meta['session_code']
+        subtask_id = int(meta['subtask_id'])
+
+        # 이 시점 이후에는 withdraw_unflushed가 참가자를 빼지 못함 (중복 실행도 한 번만 처리)
+        if not redis.hsetnx(_meta_key(cluster_id), 'flushed_at', timezone.now().isoformat()):
+            return {'cluster_id': cluster_id, 'count': 0, 'clustered': False}
+
+        # 이후 요청은 새 묶음으로 시작하도록 아직 열려 있으면 닫음
+        open_key = _open_key(session_code, subtask_id)
+        if redis.get(open_key) == cluster_id:
+            redis.delete(open_key)
+
+        members = self._load_members(cluster_id)
+        if len(members) < 2:
+            return {'cluster_id': cluster_id, 'count': len(members), 'clustered': False}
+
+        self._send(session_code, {
+            'type': 'help_cluster',
+            'cluster_id': cluster_id,
+            'subtask_id': subtask_id,
+            'count': len(members),
+            'participants': [self._summarize_member(member) for member in members],
+            'opened_at': meta.get('opened_at'),
+            'role_filter': 'INSTRUCTOR',
+        })
+
+        answer = self._build_shared_answer(subtask_id, members)
+        if not answer:
+            return {'cluster_id': cluster_id, 'count': len(members), 'clustered': True}
+        redis.hset(_meta_key(cluster_id), 'answer', json.dumps(answer, ensure_ascii=False))
+
+        self._send(session_code, {
+            'type': 'help_cluster_answer',
+            'cluster_id': cluster_id,
+            'subtask_id': subtask_id,
+            'device_ids': [m['device_id'] for m in members if m.get('device_id')],
+            'account_ids': [m['account_id'] for m in members if m.get('account_id')],
+            'problem_diagnosis': answer.get('problem_diagnosis', ''),
+            'help_content': '\n'.join(answer.get('step_by_step_solution') or []),
+            'step_by_step_solution': answer.get('step_by_step_solution', []),
+            'confidence_score': answer.get('confidence_score'),
+        })
+
+        return {'cluster_id': cluster_id, 'count': len(members), 'clustered': True}
+
+    def get_detail(self, cluster_id: str) -> Optional[Dict]:
+        """
+        묶음의 학생별 상세 조회 (메시지, 스크린샷 URL 포함)
+
+        Returns:
+            상세 Dict 또는 None (만료/없음)
+        """
+        redis = get_redis()
+        meta = redis.hgetall(_meta_key(cluster_id))
+        if not meta:
+            return None
+
+        answer = meta.get('answer')
+        return {
+            'cluster_id': cluster_id,
+            'session_code': meta['session_code'],
+            'subtask_id': int(meta['subtask_id']),
+            'opened_at': meta.get('opened_at'),
+            'requests': self._load_members(cluster_id),
+            'answer': json.loads(answer) if answer else None,
+        }
+
+    def _load_members(self, cluster_id: str) -> List[Dict]:
+        members = [json.loads(raw) for raw in get_redis().hvals(_members_key(cluster_id))]
+        return sorted(members, key=lambda member: member['requested_at'])
+
+    def _summarize_member(self, member: Dict) -> Dict:
+        return {
+            'user_id': member.get('user_id'),
+            'username': member.get('user_name'),
+            'device_id': member.get('device_id'),
+            'requested_at': member.get('requested_at'),
+            # 스크린샷은 저장 전이면 screenshot_id만 있음 (저장되면 help_screenshot_ready)
+            'has_screenshot': bool(member.get('screenshot_url') or member.get('screenshot_id')),
+            'screenshot_id': member.get('screenshot_id'),
+        }
+
+    def _build_shared_answer(self, subtask_id: int, members: List[Dict]) -> Dict:
+        """답변 캐시 → 사전 생성 도움말 → M-GPT 순으로 묶음 공유 답변 1개 준비 (단계가 없으면 빈 Dict)"""
+        from apps.accounts.models import User
+        from apps.tasks.models import Subtask
+
+        subtask = Subtask.objects.filter(id=subtask_id).first()
+        if subtask is None:
+            return {}
+
+        # 묶음에서 가장 많은 디지털 수준 기준으로 답변
+        levels = Counter(
+            User.objects.filter(
+                id__in=[m['account_id'] for m in members if m.get('account_id')]
+            ).exclude(digital_level__isnull=True).values_list('digital_level', flat=True)
+        )
+        digital_level = levels.most_common(1)[0][0] if levels else 'BEGINNER'
+
+        answer_cache = HelpAnswerCache()
+        signature = HelpAnswerCache.build_signature(
+            subtask_id=subtask_id,
+            digital_level=digital_level,
+            subtask_fingerprint=HelpSuggestionService.build_fingerprint(subtask),
+        )
+        answer = answer_cache.get(signature) or \
+            HelpSuggestionService().get_suggestion(subtask, digital_level)
+        if answer is not None:
+            return answer
+
+        answer = MGptService().analyze_help_request(
+            subtask_title=subtask.title,
+            subtask_description=subtask.description,
+            target_action=subtask.target_action or '',
+            user_digital_level=digital_level,
+        )
+        if not answer.get('is_fallback'):
+            answer_cache.set(signature, answer)
+        return answer
+
+    def _send(self, session_code: str, event: Dict):
+        from apps.sessions import event_log
+
+        channel_layer = get_channel_layer()
+        if channel_layer is None:
+            return
+        event_log.record(session_code, event)
+        try:
+            async_to_sync(channel_layer.group_send)(f'session_{session_code}', event)
+        except Exception as e:
+            logger.error(f"Failed to send {event['type']} for session {session_code}: {e}")
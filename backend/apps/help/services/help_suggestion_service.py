@@ -0,0 +1,164 @@
+"""
+Help Suggestion Service - 예정된 세션의 단계별 M-GPT 도움말 사전 생성
+
+세션은 scheduled_at 전에 강의와 단계 목록이 정해져 있으므로, 수업 시작 전에
+모든 단계 × 디지털 수준 조합의 도움말을 미리 만들어 두고 수업 중 첫 도움 요청에
+바로 응답한다.
+
+플로우:
+  Celery beat → prewarm_help_suggestions_task
+      → HelpSuggestionService.find_pending_targets (예정 세션의 단계 중 도움말이 없거나 낡은 것)
+      → generate_help_suggestion_task (rate_limit으로 LLM 호출 속도 제한)
+          → MGptService → HelpSuggestion 저장
+
+단계 내용(제목/설명/목표 액션)의 지문을 함께 저장하여, 단계가 수정되면
+signals에서 삭제하고 조회 시에도 지문이 다르면 사용하지 않는다.
+"""
+import hashlib
+import json
+import logging
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.utils import timezone
+
+from .mgpt_service import MGptService
+
+logger = logging.getLogger(__name__)
+
+# 사전 생성 대상 디지털 수준
+DIGITAL_LEVELS = ['BEGINNER', 'INTERMEDIATE', 'ADVANCED']
+
+
+class HelpSuggestionService:
+    """예정 세션 단계별 도움말 사전 생성/조회 서비스"""
+
+    def __init__(self, mgpt_service: MGptService = None):
+        self._mgpt_service = mgpt_service
+
+    @property
+    def mgpt_service(self) -> MGptService:
+        # 조회만 하는 경우 OpenAI 클라이언트를 만들지 않음
+        if self._mgpt_service is None:
+            self._mgpt_service = MGptService()
+        return self._mgpt_service
+
+    @staticmethod
+    def build_fingerprint(subtask) -> str:
+        """도움말 내용에 영향을 주는 단계 필드의 해시"""
+        raw = json.dumps([
+            subtask.title,
+            subtask.description,
+            subtask.target_action or '',
+        ], ensure_ascii=False)
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def find_pending_targets(self, lead_minutes: Optional[int] = None) -> List[Tuple[int, str]]:
+        """
+        곧 시작할 예정 세션의 (subtask_id, digital_level) 중 생성이 필요한 목록
+
+        Args:
+            lead_minutes: 지금부터 몇 분 이내에 시작하는 세션을 대상으로 할지
+
+        Returns:
+            [(subtask_id, digital_level), ...]
+        """
+        from apps.help.models import HelpSuggestion
+        from apps.sessions.models import LectureSession
+        from apps.tasks.models import Subtask
+
+        if lead_minutes is None:
+            lead_minutes = getattr(settings, 'HELP_PREWARM_LEAD_MINUTES', 120)
+
+        now = timezone.now()
+        lecture_ids = LectureSession.objects.filter(
+            status='WAITING',
+            scheduled_at__gte=now,
+            scheduled_at__lte=now + timedelta(minutes=lead_minutes),
+        ).values_list('lecture_id', flat=True).distinct()
+
+        subtasks = list(
+            Subtask.objects.filter(task__lecture_id__in=lecture_ids)
+            .only('id', 'title', 'description', 'target_action')
+        )
+        if not subtasks:
+            return []
+
+        existing = {
+            (row['subtask_id'], row['digital_level']): row['source_fingerprint']
+            for row in HelpSuggestion.objects.filter(
+                subtask_id__in=[subtask.id for subtask in subtasks]
+            ).values('subtask_id', 'digital_level', 'source_fingerprint')
+        }
+
+        targets = []
+        for subtask in subtasks:
+            fingerprint = self.build_fingerprint(subtask)
+            for level in DIGITAL_LEVELS:
+                if existing.get((subtask.id, level)) != fingerprint:
+                    targets.append((subtask.id, level))
+        return targets
+
+    def generate(self, subtask_id: int, digital_level: str) -> Dict:
+        """
+        단계 × 디지털 수준 도움말 1건 생성
+
+        Returns:
+            Dict containing:
+                - success: bool
+                - skipped: 이미 최신 도움말이 있는 경우 True
+                - error: Error message (if failed)
+        """
+        from apps.help.models import HelpSuggestion
+        from apps.tasks.models import Subtask
+
+        try:
+            subtask = Subtask.objects.get(id=subtask_id)
+        except Subtask.DoesNotExist:
+            return {'success': False, 'error': f"Subtask {subtask_id} not found"}
+
+        fingerprint = self.build_fingerprint(subtask)
+        if HelpSuggestion.objects.filter(
+            subtask_id=subtask_id, digital_level=digital_level, source_fingerprint=fingerprint
+        ).exists():
+            return {'success': True, 'skipped': True}
+
+        result = self.mgpt_service.analyze_help_request(
+            subtask_title=subtask.title,
+            subtask_description=subtask.description,
+            target_action=subtask.target_action or '',
+            user_digital_level=digital_level,
+        )
+        if result.get('is_fallback'):
+            return {'success': False, 'error': 'M-GPT unavailable'}
+
+        HelpSuggestion.objects.update_or_create(
+            subtask_id=subtask_id,
+            digital_level=digital_level,
+            defaults={'content': result, 'source_fingerprint': fingerprint},
+        )
+        return {'success': True}
+
+    def get_suggestion(self, subtask, digital_level: Optional[str]) -> Optional[Dict]:
+        """
+        사전 생성된 도움말 조회 (단계 내용이 바뀌었으면 None)
+
+        Args:
+            subtask: Subtask instance
+            digital_level: 학생 디지털 수준
+
+        Returns:
+            M-GPT 답변 형식의 Dict 또는 None
+        """
+        from apps.help.models import HelpSuggestion
+
+        if subtask is None or not digital_level:
+            return None
+
+        suggestion = HelpSuggestion.objects.filter(
+            subtask_id=subtask.id,
+            digital_level=digital_level,
+            source_fingerprint=self.build_fingerprint(subtask),
+        ).values_list('content', flat=True).first()
+        return suggestion
@@ -1,8 +1,8 @@
 """
 M-GPT Service for AI-powered help analysis using OpenAI API
 """
-import openai
 from django.conf import settings
+from openai import OpenAI
 from typing import Dict, Optional, List
 import json
 import logging
@@ -20,11 +20,15 @@ class MGptService:
         """Initialize OpenAI API with settings"""
         self.api_key = settings.OPENAI_API_KEY
         self.model = settings.OPENAI_MODEL
+        self.client = None
 
         if not self.api_key:
             logger.warning("OpenAI API key is not configured")
         else:
-            openai.api_key = self.api_key
+            self.client = OpenAI(
+                api_key=self.api_key,
+                base_url=getattr(settings, 'OPENAI_BASE_URL', None),
+            )
 
     def analyze_help_request(
         self,
@@ -68,8 +72,8 @@ class MGptService:
                 error_message=error_message
             )
 
-            # Call OpenAI API
-            response = openai.ChatCompletion.create(
+            # Call OpenAI API (openai>=1.0 client)
+            response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
@@ -197,6 +201,8 @@ class MGptService:
             ],
             'confidence_score': 50,
             'estimated_difficulty': '알 수 없음',
+            # 답변 캐시에 저장하지 않도록 표시
+            'is_fallback': True,
         }
 
     def generate_encouragement(
@@ -229,7 +235,7 @@ class MGptService:
 (2-3문장, 친근하고 따뜻한 톤)
 """
 
-            response = openai.ChatCompletion.create(
+            response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
@@ -304,7 +310,7 @@ class MGptService:
 }}
 """
 
-            response = openai.ChatCompletion.create(
+            response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
@@ -0,0 +1,21 @@
+"""
+Help Signals - 단계가 수정되면 사전 생성 도움말 무효화
+"""
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.tasks.models import Subtask
+
+
+@receiver(post_save, sender=Subtask)
+def invalidate_help_suggestions(sender, instance, created, **kwargs):
+    """단계 내용이 바뀌어 지문이 달라진 사전 생성 도움말 삭제 (삭제 시에는 CASCADE)"""
+    if created:
+        return
+
+    from apps.help.models import HelpSuggestion
+    from apps.help.services import HelpSuggestionService
+
+    HelpSuggestion.objects.filter(subtask_id=instance.id).exclude(
+        source_fingerprint=HelpSuggestionService.build_fingerprint(instance)
+    ).delete()
@@ -0,0 +1,109 @@
+"""
+Celery Tasks for Help Request Analysis
+"""
+import logging
+from celery import shared_task
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+def _suggestion_inflight_key(subtask_id: int, digital_level: str) -> str:
+    return f'help_suggestion_inflight:{subtask_id}:{digital_level}'
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=10)
+def analyze_help_request_task(self, help_request_id: int):
+    """
+    도움 요청 M-GPT 분석 태스크 (Kafka를 사용할 수 없을 때의 대체 경로)
+
+    Args:
+        help_request_id: HelpRequest ID
+
+    Returns:
+        Dict with analysis result
+    """
+    from apps.help.services import HelpAnalysisService
+
+    result = HelpAnalysisService().process_help_request(help_request_id)
+
+    if not result.get('success'):
+        logger.error(f"Help analysis failed for request {help_request_id}: {result.get('error')}")
+        if self.request.retries < self.max_retries:
+            raise self.retry()
+
+    return result
+
+
+@shared_task
+def prewarm_help_suggestions_task(lead_minutes: int = None):
+    """
+    곧 시작할 예정 세션의 단계별 도움말 사전 생성 (Celery beat 주기 실행)
+
+    생성이 필요한 (단계, 디지털 수준)마다 generate_help_suggestion_task를 등록하며,
+    LLM 호출 속도는 해당 태스크의 rate_limit으로 제한된다.
+    이전 주기에 등록한 생성이 아직 끝나지 않은 대상은 다시 등록하지 않는다.
+
+    Returns:
+        Dict with number of queued suggestions
+    """
+    from apps.help.services import HelpSuggestionService
+
+    queued = 0
+    inflight_ttl = getattr(settings, 'HELP_PREWARM_INFLIGHT_TTL', 900)
+    for subtask_id, digital_level in HelpSuggestionService().find_pending_targets(lead_minutes):
+        if not cache.add(_suggestion_inflight_key(subtask_id, digital_level), 1, timeout=inflight_ttl):
+            continue
+        generate_help_suggestion_task.delay(subtask_id, digital_level)
+        queued += 1
+
+    if queued:
+        logger.info(f"Queued {queued} help suggestions for upcoming sessions")
+    return {'queued': queued}
+
+
+@shared_task(
+    bind=True,
+    max_retries=2,
+    default_retry_delay=60,
+    rate_limit=settings.HELP_PREWARM_RATE_LIMIT,
+)
+def generate_help_suggestion_task(self, subtask_id: int, digital_level: str):
+    """
+    단계 × 디지털 수준 도움말 1건 생성
+
+    재시도까지 끝나면 prewarm_help_suggestions_task의 진행 중 표시를 해제한다.
+
+    Args:
+        subtask_id: Subtask ID
+        digital_level: BEGINNER / INTERMEDIATE / ADVANCED
+    """
+    from apps.help.services import HelpSuggestionService
+
+    result = HelpSuggestionService().generate(subtask_id, digital_level)
+
+    if not result.get('success'):
+        logger.warning(
+            f"Help suggestion for subtask {subtask_id} ({digital_level}) failed: {result.get('error')}"
+        )
+        if self.request.retries < self.max_retries:
+            raise self.retry()
+
+    cache.delete(_suggestion_inflight_key(subtask_id, digital_level))
+    return result
+
+
+@shared_task
+def flush_help_cluster_task(cluster_id: str):
+    """
+    도움 요청 묶음 창 종료 처리 (첫 요청 시 창 길이만큼 지연 실행)
+
+    2명 이상 묶였으면 강사에게 help_cluster를 보내고 공유 M-GPT 답변을 전달한다.
+
+    Args:
+        cluster_id: 묶음 ID
+    """
+    from apps.help.services import HelpClusterService
+
+    return HelpClusterService().flush(cluster_id)
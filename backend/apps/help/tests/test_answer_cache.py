@@ -0,0 +1,81 @@
+"""
+도움 답변 캐시 - 단계 없는 요청의 캐시 제외, 강의별 적중률 집계
+"""
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from apps.help.services.answer_cache import HelpAnswerCache
+from apps.help.services.help_analysis_service import HelpAnalysisService
+from apps.help.services.help_suggestion_service import HelpSuggestionService
+
+SUGGESTION = {'problem_diagnosis': '미리 만든 도움말', 'step_by_step_solution': ['1단계']}
+
+
+class AnswerFromCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.answer_cache = mock.Mock()
+        self.answer_cache.get.return_value = None
+        self.suggestion_service = mock.Mock()
+        self.suggestion_service.get_suggestion.return_value = None
+        self.service = HelpAnalysisService(
+            mgpt_service=mock.Mock(),
+            answer_cache=self.answer_cache,
+            suggestion_service=self.suggestion_service,
+        )
+        for name, value in (
+            ('_collect_activity_context', []),
+            ('_save_result', (mock.Mock(), mock.Mock())),
+            ('_build_result_payload', {'help_request_id': 1}),
+            ('_notify', None),
+        ):
+            patcher = mock.patch.object(HelpAnalysisService, name, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _help_request(self, with_subtask=True):
+        subtask = SimpleNamespace(
+            title='파일 열기', description='', target_action='click',
+            task=SimpleNamespace(lecture_id=7),
+        ) if with_subtask else None
+        return SimpleNamespace(
+            id=1, user_id=2, subtask=subtask, subtask_id=3 if with_subtask else None,
+            session=SimpleNamespace(lecture_id=7),
+            user=SimpleNamespace(digital_level='BEGINNER'),
+            context_data={'subtask_title': '파일 열기'}, created_at=None,
+        )
+
+    def test_request_without_subtask_skips_answer_cache(self):
+        self.assertIsNone(self.service.answer_from_cache(self._help_request(with_subtask=False)))
+
+        self.answer_cache.get.assert_not_called()
+        self.answer_cache.set.assert_not_called()
+        self.answer_cache.record_lookup.assert_called_once_with(7, hit=False)
+
+    def test_suggestion_served_request_counts_as_hit(self):
+        self.suggestion_service.get_suggestion.return_value = SUGGESTION
+
+        self.assertIsNotNone(self.service.answer_from_cache(self._help_request()))
+
+        self.answer_cache.set.assert_called_once()
+        self.answer_cache.record_lookup.assert_called_once_with(7, hit=True)
+
+    def test_miss_counts_as_miss(self):
+        self.assertIsNone(self.service.answer_from_cache(self._help_request()))
+        self.answer_cache.record_lookup.assert_called_once_with(7, hit=False)
+
+
+class SignatureTests(SimpleTestCase):
+    def test_editing_subtask_changes_signature(self):
+        subtask = SimpleNamespace(title='파일 열기', description='', target_action='click')
+        before = HelpAnswerCache.build_signature(
+            subtask_id=3, digital_level='BEGINNER',
+            subtask_fingerprint=HelpSuggestionService.build_fingerprint(subtask),
+        )
+        subtask.description = '상단 메뉴에서 파일을 누르세요'
+        after = HelpAnswerCache.build_signature(
+            subtask_id=3, digital_level='BEGINNER',
+            subtask_fingerprint=HelpSuggestionService.build_fingerprint(subtask),
+        )
+        self.assertNotEqual(before, after)
@@ -0,0 +1,83 @@
+"""
+도움 요청 Kafka 경로 - 브로커 확인 대기, 실패한 분석의 재처리/재전달
+"""
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import SimpleTestCase
+from kafka import TopicPartition
+from kafka.errors import KafkaTimeoutError
+
+from apps.help.kafka_producer import HelpRequestProducer
+from apps.help.management.commands.run_help_analysis_consumer import Command
+
+
+class FakeFuture:
+    def __init__(self, error=None):
+        self.error = error
+
+    def get(self, timeout=None):
+        if self.error:
+            raise self.error
+
+    def add_errback(self, callback):
+        pass
+
+
+class HelpRequestProducerTests(SimpleTestCase):
+    def setUp(self):
+        self.producer = HelpRequestProducer.__new__(HelpRequestProducer)
+        self.kafka = mock.Mock()
+        patcher = mock.patch.object(HelpRequestProducer, '_producer', self.kafka)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _help_request(self):
+        return SimpleNamespace(
+            id=1, user_id=2, session_id=3, subtask_id=4, request_type='MANUAL',
+            created_at=mock.Mock(isoformat=lambda: '2026-01-01T00:00:00'),
+        )
+
+    def test_send_help_request_waits_for_broker_ack(self):
+        self.kafka.send.return_value = FakeFuture()
+        self.assertTrue(self.producer.send_help_request(self._help_request()))
+
+    def test_send_help_request_reports_failure_when_ack_times_out(self):
+        self.kafka.send.return_value = FakeFuture(KafkaTimeoutError())
+        self.assertFalse(self.producer.send_help_request(self._help_request()))
+
+
+class HelpAnalysisConsumerCommitTests(SimpleTestCase):
+    def _record(self, offset, partition=0):
+        return SimpleNamespace(topic='help-requests', partition=partition, offset=offset)
+
+    def test_commits_whole_batch_when_nothing_to_redeliver(self):
+        consumer = mock.Mock()
+        Command().commit_batch(consumer, [self._record(5), self._record(6), self._record(2, partition=1)], {})
+
+        offsets = consumer.commit.call_args.kwargs['offsets']
+        self.assertEqual(offsets[TopicPartition('help-requests', 0)].offset, 7)
+        self.assertEqual(offsets[TopicPartition('help-requests', 1)].offset, 3)
+        consumer.seek.assert_not_called()
+
+    def test_failed_hand_off_is_not_committed_and_is_redelivered(self):
+        consumer = mock.Mock()
+        records = [self._record(5), self._record(6), self._record(7)]
+        Command().commit_batch(consumer, records, {('help-requests', 0): 6})
+
+        offsets = consumer.commit.call_args.kwargs['offsets']
+        self.assertEqual(offsets[TopicPartition('help-requests', 0)].offset, 6)
+        consumer.seek.assert_called_once_with(TopicPartition('help-requests', 0), 6)
+
+    def test_failed_analysis_is_handed_to_celery(self):
+        with mock.patch(
+            'apps.help.management.commands.run_help_analysis_consumer.analyze_help_request_task.delay'
+        ) as delay:
+            self.assertTrue(Command().hand_off(42))
+        delay.assert_called_once_with(42)
+
+        with mock.patch(
+            'apps.help.management.commands.run_help_analysis_consumer.analyze_help_request_task.delay',
+            side_effect=ConnectionError('broker down'),
+        ):
+            self.assertFalse(Command().hand_off(42))
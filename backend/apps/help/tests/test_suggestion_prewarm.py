@@ -0,0 +1,39 @@
+"""
+도움말 사전 생성 - 진행 중인 대상은 다음 주기에 다시 등록하지 않음
+"""
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from apps.help import tasks
+
+
+class PrewarmHelpSuggestionsTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        patcher = mock.patch(
+            'apps.help.services.HelpSuggestionService.find_pending_targets',
+            return_value=[(3, 'BEGINNER'), (3, 'ADVANCED')],
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(cache.clear)
+
+    def test_inflight_targets_are_not_queued_again(self):
+        with mock.patch.object(tasks.generate_help_suggestion_task, 'delay') as delay:
+            self.assertEqual(tasks.prewarm_help_suggestions_task(), {'queued': 2})
+            self.assertEqual(tasks.prewarm_help_suggestions_task(), {'queued': 0})
+        self.assertEqual(delay.call_count, 2)
+
+    def test_finished_generation_releases_target(self):
+        with mock.patch.object(tasks.generate_help_suggestion_task, 'delay'):
+            tasks.prewarm_help_suggestions_task()
+        with mock.patch(
+            'apps.help.services.HelpSuggestionService.generate', return_value={'success': True}
+        ):
+            tasks.generate_help_suggestion_task(3, 'BEGINNER')
+
+        with mock.patch.object(tasks.generate_help_suggestion_task, 'delay') as delay:
+            self.assertEqual(tasks.prewarm_help_suggestions_task(), {'queued': 1})
+        delay.assert_called_once_with(3, 'BEGINNER')
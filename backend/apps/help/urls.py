@@ -3,7 +3,9 @@ from .views import (
     HelpRequestCreateView,
     HelpRequestDetailView,
     HelpRequestResolveView,
-    HelpFeedbackView
+    HelpFeedbackView,
+    HelpAnswerCacheStatsView,
+    HelpClusterDetailView
 )
 
 app_name = 'help'
@@ -13,4 +15,6 @@ urlpatterns = [
     path('request/<int:help_request_id>/', HelpRequestDetailView.as_view(), name='help-request-detail'),
     path('request/<int:help_request_id>/resolve/', HelpRequestResolveView.as_view(), name='help-request-resolve'),
     path('feedback/', HelpFeedbackView.as_view(), name='help-feedback'),
+    path('cache-stats/lecture/<int:lecture_id>/', HelpAnswerCacheStatsView.as_view(), name='help-cache-stats'),
+    path('clusters/<str:cluster_id>/', HelpClusterDetailView.as_view(), name='help-cluster-detail'),
 ]
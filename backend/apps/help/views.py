@@ -8,6 +8,9 @@ from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
 
 from .models import HelpRequest, MGptAnalysis, HelpResponse
+from .kafka_producer import HelpRequestProducer
+from .services import HelpAnalysisService, HelpAnswerCache, HelpClusterService
+from .tasks import analyze_help_request_task
 from .serializers import (
     HelpRequestSerializer,
     HelpRequestCreateSerializer,
@@ -24,9 +27,27 @@ class HelpRequestCreateView(generics.CreateAPIView):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         help_request = serializer.save(user=request.user, status='PENDING')
-        
-        # TODO: Kafka를 통해 M-GPT 분석 요청 (향후 구현)
-        
+
+        # 비슷한 상황의 답변이 캐시되어 있으면 M-GPT 호출 없이 즉시 응답
+        cached_payload = HelpAnalysisService().answer_from_cache(help_request)
+        if cached_payload:
+            return Response({
+                'help_request_id': help_request.id,
+                'status': help_request.status,
+                'cached': True,
+                'help_response': {
+                    'help_response_id': cached_payload['help_response_id'],
+                    'problem_diagnosis': cached_payload['problem_diagnosis'],
+                    'help_content': cached_payload['help_content'],
+                    'step_by_step_solution': cached_payload['step_by_step_solution'],
+                },
+                'message': '도움말을 찾았습니다.'
+            }, status=status.HTTP_201_CREATED)
+
+        # Kafka를 통해 M-GPT 분석 요청 (브로커를 사용할 수 없으면 Celery로 대체)
+        if not HelpRequestProducer().send_help_request(help_request):
+            analyze_help_request_task.delay(help_request.id)
+
         return Response({
             'help_request_id': help_request.id,
             'status': help_request.status,
@@ -58,7 +79,8 @@ class HelpRequestDetailView(APIView):
             analysis = help_request.mgpt_analysis
             response_data['analysis'] = {
                 'problem_diagnosis': analysis.problem_diagnosis,
-                'confidence_score': analysis.confidence_score
+                'confidence_score': analysis.confidence_score,
+                'cached': analysis.served_from_cache
             }
         
         # 도움 응답이 있으면 포함
@@ -131,3 +153,44 @@ class HelpFeedbackView(APIView):
             'message': '피드백이 저장되었습니다.',
             'help_response_id': help_response_id
         })
+
+
+class HelpAnswerCacheStatsView(APIView):
+    """강의별 M-GPT 답변 캐시 적중률 조회 (강사용)"""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, lecture_id):
+        from apps.lectures.models import Lecture
+
+        lecture = get_object_or_404(Lecture, pk=lecture_id)
+        if lecture.instructor != request.user:
+            return Response(
+                {'error': '해당 강의의 강사만 조회할 수 있습니다.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        return Response(HelpAnswerCache().get_stats(lecture.id))
+
+
+class HelpClusterDetailView(APIView):
+    """묶인 도움 요청의 학생별 상세 조회 (세션 강사용)"""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, cluster_id):
+        from apps.sessions.models import LectureSession
+
+        detail = HelpClusterService().get_detail(cluster_id)
+        if detail is None:
+            return Response(
+                {'error': '도움 요청 묶음을 찾을 수 없습니다.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        session = get_object_or_404(LectureSession, session_code=detail['session_code'])
+        if session.instructor != request.user:
+            return Response(
+                {'error': '해당 세션의 강사만 조회할 수 있습니다.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        return Response(detail)
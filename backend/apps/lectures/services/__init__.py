@@ -0,0 +1,20 @@
+"""
+Lecture Services
+"""
+from .lecture_plan import (
+    get_lecture_plan,
+    bump_lecture_plan_version,
+    describe_subtask,
+    get_plan_subtask,
+    get_next_subtask,
+    get_first_subtask,
+)
+
+__all__ = [
+    'get_lecture_plan',
+    'bump_lecture_plan_version',
+    'describe_subtask',
+    'get_plan_subtask',
+    'get_next_subtask',
+    'get_first_subtask',
+]
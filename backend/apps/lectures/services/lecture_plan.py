@@ -0,0 +1,148 @@
+"""
+Lecture Plan - 강의의 과제/단계 구성 캐시
+
+대시보드 폴링, 세션 진행 등에서 매번 Task/Subtask를 다시 조회하지 않도록 강의별 단계 구성을
+한 번 컴파일해 캐시한다. 단계 설명(descriptor)을 과제 순서 → 단계 순서의 평평한 배열로 두고,
+단계 ID → 위치 인덱스를 함께 보관해 다음 단계 조회를 O(1)로 처리한다.
+
+캐시 키에 강의별 버전을 포함하고, Task/Subtask가 바뀌면 signals에서 버전을
+올려 이전 캐시가 자연스럽게 버려지도록 한다.
+
+캐시 구조:
+  Django cache (Redis)
+    lecture_plan:version:{lecture_id}            현재 버전
+    lecture_plan:{lecture_id}:v{version}:f{형식}  컴파일된 단계 구성 Dict
+  프로세스 메모리
+    강의별 최근 구성 (버전이 같을 때만 사용, LECTURE_PLAN_LOCAL_CACHE_SIZE개까지)
+
+반환된 구성은 여러 요청이 공유하므로 수정하지 않는다.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+# 저장 형식이 바뀌면 올려서 이전 형식의 캐시를 읽지 않도록 한다
+PLAN_FORMAT = 2
+
+# 단계 설명에 포함하는 Subtask 필드 (학생 앱 진행/UI 매칭용)
+SUBTASK_FIELDS = (
+    'id', 'title', 'description', 'order_index', 'target_action', 'guide_text',
+    'voice_guide_text', 'view_id', 'text', 'content_description', 'target_package',
+)
+
+_local_plans = OrderedDict()
+_local_lock = threading.Lock()
+
+
+def _version_key(lecture_id: int) -> str:
+    return f'lecture_plan:version:{lecture_id}'
+
+
+def _get_version(lecture_id: int) -> int:
+    version = cache.get(_version_key(lecture_id))
+    if version is None:
+        cache.add(_version_key(lecture_id), 1, timeout=None)
+        version = cache.get(_version_key(lecture_id), 1)
+    return version
+
+
+def bump_lecture_plan_version(lecture_id: int):
+    """강의 단계 구성이 바뀌었을 때 호출 (이전 버전 캐시는 TTL로 만료)"""
+    if not lecture_id:
+        return
+    try:
+        cache.incr(_version_key(lecture_id))
+    except ValueError:
+        # 버전 키가 없으면 다음 조회 시 새로 만들어지므로 기존 캐시와 겹치지 않게 2부터 시작
+        cache.set(_version_key(lecture_id), 2, timeout=None)
+
+
+def describe_subtask(subtask, position: Optional[int] = None) -> Dict:
+    """Subtask 인스턴스 → 단계 설명 (강의 구성에 없는 단계를 같은 형식으로 다룰 때 사용)"""
+    descriptor = {field: getattr(subtask, field) for field in SUBTASK_FIELDS}
+    descriptor['task_id'] = subtask.task_id
+    descriptor['position'] = position
+    return descriptor
+
+
+def _compile(lecture_id: int, version: int) -> Dict:
+    from apps.tasks.models import Subtask
+
+    rows = (
+        Subtask.objects.filter(task__lecture_id=lecture_id)
+        .order_by('task__order_index', 'task_id', 'order_index', 'id')
+        .values(*SUBTASK_FIELDS, 'task_id', 'task__title')
+    )
+    subtasks = []
+    for position, row in enumerate(rows):
+        row['task_title'] = row.pop('task__title')
+        row['position'] = position
+        subtasks.append(row)
+
+    return {
+        'lecture_id': lecture_id,
+        'version': version,
+        'total_subtasks': len(subtasks),
+        'subtask_ids': [subtask['id'] for subtask in subtasks],
+        'subtasks': subtasks,
+        'positions': {subtask['id']: subtask['position'] for subtask in subtasks},
+    }
+
+
+def get_lecture_plan(lecture_id: int) -> Dict:
+    """
+    강의 단계 구성 조회 (프로세스 메모리 → Redis → DB 순)
+
+    Returns:
+        Dict containing:
+            - lecture_id: 강의 ID
+            - version: 구성 버전
+            - total_subtasks: 전체 단계 수
+            - subtask_ids: 과제 순서 → 단계 순서로 정렬된 단계 ID 목록
+            - subtasks: 같은 순서의 단계 설명 목록 (SUBTASK_FIELDS + task_id, task_title, position)
+            - positions: 단계 ID → subtasks 위치
+    """
+    version = _get_version(lecture_id)
+
+    with _local_lock:
+        plan = _local_plans.get(lecture_id)
+        if plan is not None and plan['version'] == version:
+            _local_plans.move_to_end(lecture_id)
+            return plan
+
+    key = f'lecture_plan:{lecture_id}:v{version}:f{PLAN_FORMAT}'
+    plan = cache.get(key)
+    if plan is None:
+        plan = _compile(lecture_id, version)
+        cache.set(key, plan, timeout=getattr(settings, 'LECTURE_PLAN_CACHE_TTL', 3600))
+
+    with _local_lock:
+        _local_plans[lecture_id] = plan
+        _local_plans.move_to_end(lecture_id)
+        while len(_local_plans) > getattr(settings, 'LECTURE_PLAN_LOCAL_CACHE_SIZE', 256):
+            _local_plans.popitem(last=False)
+    return plan
+
+
+def get_plan_subtask(plan: Dict, subtask_id) -> Optional[Dict]:
+    """구성에서 단계 설명 조회 (구성에 없는 단계면 None)"""
+    try:
+        position = plan['positions'].get(int(subtask_id))
+    except (TypeError, ValueError):
+        return None
+    return plan['subtasks'][position] if position is not None else None
+
+
+def get_next_subtask(plan: Dict, subtask_id) -> Optional[Dict]:
+    """구성 순서상 다음 단계 설명 (마지막 단계이거나 구성에 없는 단계면 None)"""
+    current = get_plan_subtask(plan, subtask_id)
+    if current is None or current['position'] + 1 >= plan['total_subtasks']:
+        return None
+    return plan['subtasks'][current['position'] + 1]
+
+
+def get_first_subtask(plan: Dict) -> Optional[Dict]:
+    return plan['subtasks'][0] if plan['subtasks'] else None
@@ -0,0 +1,21 @@
+"""
+Lecture Signals - 과제/단계가 바뀌면 강의 단계 구성 캐시 무효화
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.tasks.models import Subtask, Task
+from .services import bump_lecture_plan_version
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def invalidate_lecture_plan_on_task_change(sender, instance, **kwargs):
+    bump_lecture_plan_version(instance.lecture_id)
+
+
+@receiver(post_save, sender=Subtask)
+@receiver(post_delete, sender=Subtask)
+def invalidate_lecture_plan_on_subtask_change(sender, instance, **kwargs):
+    lecture_id = Task.objects.filter(id=instance.task_id).values_list('lecture_id', flat=True).first()
+    bump_lecture_plan_version(lecture_id)
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-19 10:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("logs", "0004_alter_activitylog_event_type"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="activitylog",
+            index=models.Index(
+                fields=["user", "-timestamp"], name="activity_lo_user_id_f065d0_idx"
+            ),
+        ),
+    ]
@@ -117,6 +117,8 @@ class ActivityLog(models.Model):
             models.Index(fields=['view_id_resource_name']),
             models.Index(fields=['event_type']),
             models.Index(fields=['is_sensitive_data']),
+            # 도움 요청 분석 시 사용자의 최근 활동을 한 번에 조회
+            models.Index(fields=['user', '-timestamp']),
         ]
         ordering = ['-timestamp']
 
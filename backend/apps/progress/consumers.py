@@ -6,10 +6,12 @@ from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
 from django.contrib.auth import get_user_model
 
+from core.websocket import MessageCodecMixin
+
 User = get_user_model()
 
 
-class ProgressConsumer(AsyncWebsocketConsumer):
+class ProgressConsumer(MessageCodecMixin, AsyncWebsocketConsumer):
     """
     WebSocket Consumer for student progress tracking
 
@@ -20,6 +22,7 @@ class ProgressConsumer(AsyncWebsocketConsumer):
     - next_subtask: Information about next subtask
     - achievement_unlocked: Achievement notification
     - encouragement: Encouragement message based on progress
+    - help_response: M-GPT answer to the student's help request
 
     Messages from client:
     - get_my_progress: Request current progress summary
@@ -159,6 +162,20 @@ class ProgressConsumer(AsyncWebsocketConsumer):
             'progress_rate': event.get('progress_rate')
         }))
 
+    async def help_response(self, event):
+        """Send M-GPT help response to client"""
+        await self.send(text_data=json.dumps({
+            'type': 'help_response',
+            'help_request_id': event['help_request_id'],
+            'help_response_id': event.get('help_response_id'),
+            'subtask_id': event.get('subtask_id'),
+            'problem_diagnosis': event.get('problem_diagnosis', ''),
+            'help_content': event.get('help_content', ''),
+            'step_by_step_solution': event.get('step_by_step_solution', []),
+            'alternative_approaches': event.get('alternative_approaches', []),
+            'confidence_score': event.get('confidence_score'),
+        }))
+
     # Helper methods
     async def notify_dashboard_progress_update(self, subtask_id, status):
         """Notify instructor dashboard about progress update"""
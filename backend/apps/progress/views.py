@@ -10,6 +10,7 @@ from django.utils import timezone
 
 from apps.tasks.models import Subtask, Task
 from apps.lectures.models import Lecture
+from core.db import ReplicaReadMixin
 from .models import UserProgress
 from .serializers import UserProgressSerializer, UserProgressUpdateSerializer
 
@@ -116,7 +117,7 @@ class ProgressUpdateView(APIView):
         })
 
 
-class UserProgressDetailView(APIView):
+class UserProgressDetailView(ReplicaReadMixin, APIView):
     """특정 학생의 강의 진행 상태 조회 (강사용)"""
     permission_classes = [IsAuthenticated]
 
@@ -0,0 +1,174 @@
+"""
+Session Admission - 수업 시작 시 몰리는 익명 참가(join) 처리 경로
+
+강사가 QR 코드를 띄우면 수십~수백 대의 기기가 몇 초 안에 AnonymousSessionJoinView를 호출한다.
+참가 1건마다 세션/강의/강사를 다시 조회하고 get_or_create(SELECT 후 INSERT/UPDATE)를 하지 않도록:
+  - 세션 참가 정보(descriptor)를 Django cache에 두고 세션 저장 시 무효화
+  - 참가자는 INSERT ... ON CONFLICT 한 문장으로 생성/갱신 (PostgreSQL)
+  - 수업 중 재참가는 Redis 실시간 상태(live_state)만 갱신 (DB 기록은 write-behind)
+    LiveParticipant.save()는 signal을 보내지 않으므로 참가자 디렉터리(directory)는 직접 갱신
+
+캐시 구조 (Django cache):
+  session_join:{session_code}  세션 참가 정보 Dict (SESSION_JOIN_CACHE_TTL)
+
+ON CONFLICT 경로는 Model.save()를 거치지 않으므로 post_save를 직접 보내
+조회 버전(ETag)과 대시보드 집계가 save() 경로와 같게 갱신되도록 한다.
+PostgreSQL이 아니면 get_or_create로 처리한다.
+"""
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models.signals import post_save
+from django.utils import timezone
+
+from . import directory, live_state
+from .models import LectureSession, SessionParticipant
+
+# 참가 가능한 세션 상태
+JOINABLE_STATUSES = ('WAITING', 'IN_PROGRESS', 'REVIEW_MODE')
+
+
+def _key(session_code: str) -> str:
+    return f'session_join:{session_code.upper()}'
+
+
+def get_join_descriptor(session_code: str) -> Optional[Dict]:
+    """
+    세션 참가 정보 조회 (캐시 → DB)
+
+    Returns:
+        Dict containing id, session_code, title, status, lecture_id, lecture_title,
+        instructor_id, instructor_name, current_subtask_id - 세션이 없으면 None (캐시하지 않음)
+    """
+    key = _key(session_code)
+    descriptor = cache.get(key)
+    if descriptor is not None:
+        return descriptor
+
+    session = LectureSession.objects.select_related('lecture', 'instructor').filter(
+        session_code=session_code.upper()
+    ).first()
+    if session is None:
+        return None
+
+    descriptor = {
+        'id': session.id,
+        'session_code': session.session_code,
+        'title': session.title,
+        'status': session.status,
+        'lecture_id': session.lecture_id,
+        'lecture_title': session.lecture.title if session.lecture else None,
+        'instructor_id': session.instructor_id,
+        'instructor_name': session.instructor.name if session.instructor else None,
+        'current_subtask_id': session.current_subtask_id,
+    }
+    cache.set(key, descriptor, timeout=getattr(settings, 'SESSION_JOIN_CACHE_TTL', 30))
+    return descriptor
+
+
+def invalidate_join_descriptor(session_code: str):
+    """세션 상태/현재 단계/제목이 바뀌었을 때 호출 (트랜잭션 안이면 커밋 후)"""
+    if session_code:
+        transaction.on_commit(lambda: cache.delete(_key(session_code)))
+
+
+_UPSERT_SQL = """
+INSERT INTO session_participants AS p (
+    session_id, device_id, display_name, status, current_subtask_id,
+    completed_subtasks, joined_at, last_active_at
+)
+VALUES (%(session_id)s, %(device_id)s, %(display_name)s, %(status)s, %(current_subtask_id)s,
+        '[]'::jsonb, %(now)s, %(now)s)
+ON CONFLICT (session_id, device_id) WHERE device_id IS NOT NULL
+DO UPDATE SET
+    display_name = EXCLUDED.display_name,
+    status = CASE WHEN %(activate)s AND p.status = 'WAITING' THEN 'ACTIVE' ELSE p.status END,
+    current_subtask_id = CASE WHEN %(activate)s AND p.status = 'WAITING'
+                              THEN EXCLUDED.current_subtask_id ELSE p.current_subtask_id END,
+    last_active_at = EXCLUDED.last_active_at
+RETURNING p.id, p.user_id, p.status, p.current_subtask_id, p.completed_subtasks,
+          p.last_completed_at, p.joined_at, p.completed_at, (p.xmax = 0) AS created
+"""
+
+
+def upsert_participant(descriptor: Dict, device_id: str, display_name: str) -> Tuple[SessionParticipant, bool]:
+    """
+    device_id 참가자 생성 또는 재참가 갱신 (AnonymousSessionJoinView의 get_or_create와 같은 결과)
+
+    - 새 참가자: 세션이 WAITING이면 WAITING, 아니면 ACTIVE (세션 현재 단계에서 시작)
+    - 기존 참가자: 표시 이름 갱신, 세션 진행 중이고 참가자가 WAITING이면 ACTIVE + 세션 현재 단계
+
+    Returns:
+        (참가자, 새로 생성 여부) - 수업 중 재참가면 참가자는 LiveParticipant
+    """
+    if descriptor['status'] in live_state.LIVE_STATUSES:
+        participant = live_state.get_participant(descriptor['id'], device_id=device_id)
+        if participant is not None:
+            participant.display_name = display_name
+            if descriptor['status'] == 'IN_PROGRESS' and participant.status == 'WAITING':
+                participant.status = 'ACTIVE'
+                participant.current_subtask_id = descriptor['current_subtask_id']
+            participant.save()
+            directory.register(descriptor['id'], participant)
+            return participant, False
+
+    if connection.vendor != 'postgresql':
+        return _get_or_create_participant(descriptor, device_id, display_name)
+
+    params = {
+        'session_id': descriptor['id'],
+        'device_id': device_id,
+        'display_name': display_name,
+        'status': 'WAITING' if descriptor['status'] == 'WAITING' else 'ACTIVE',
+        'current_subtask_id': descriptor['current_subtask_id'],
+        'activate': descriptor['status'] == 'IN_PROGRESS',
+        'now': timezone.now(),
+    }
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(_UPSERT_SQL, params)
+            (pk, user_id, status, current_subtask_id, completed_subtasks,
+             last_completed_at, joined_at, completed_at, created) = cursor.fetchone()
+
+        participant = SessionParticipant(
+            id=pk,
+            session_id=descriptor['id'],
+            user_id=user_id,
+            device_id=device_id,
+            display_name=display_name,
+            status=status,
+            current_subtask_id=current_subtask_id,
+            completed_subtasks=completed_subtasks,
+            last_completed_at=last_completed_at,
+            joined_at=joined_at,
+            last_active_at=params['now'],
+            completed_at=completed_at,
+        )
+        participant._state.adding = False
+        post_save.send(
+            sender=SessionParticipant, instance=participant, created=created,
+            update_fields=None, raw=False, using=connection.alias,
+        )
+    return participant, created
+
+
+def _get_or_create_participant(descriptor: Dict, device_id: str, display_name: str) -> Tuple[SessionParticipant, bool]:
+    participant, created = SessionParticipant.objects.get_or_create(
+        session_id=descriptor['id'],
+        device_id=device_id,
+        defaults={
+            'display_name': display_name,
+            'status': 'WAITING' if descriptor['status'] == 'WAITING' else 'ACTIVE',
+            'current_subtask_id': descriptor['current_subtask_id'],
+        }
+    )
+
+    if not created:
+        participant.display_name = display_name
+        if descriptor['status'] == 'IN_PROGRESS' and participant.status == 'WAITING':
+            participant.status = 'ACTIVE'
+            participant.current_subtask_id = descriptor['current_subtask_id']
+        participant.save()
+    return participant, created
@@ -6,3 +6,6 @@ class SessionsConfig(AppConfig):
     name = 'apps.sessions'
     label = 'lecture_sessions'  # Avoid conflict with django.contrib.sessions
     verbose_name = 'Lecture Sessions'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -1,17 +1,26 @@
 """
 WebSocket Consumers for Real-time Session Communication
 """
+import asyncio
 import json
+from urllib.parse import parse_qs
+
+from asgiref.sync import sync_to_async
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
 from django.contrib.auth import get_user_model
 from django.utils import timezone
+
+from core.websocket import BoundedSendMixin, MessageCodecMixin
+
 from .models import LectureSession, SessionParticipant, SessionStepControl
+from . import admission, directory, event_log, help_screenshots, live_counters, live_state, versions
+from .progress_frames import ProgressFrameBuilder, frame_interval_seconds
 
 User = get_user_model()
 
 
-class SessionConsumer(AsyncWebsocketConsumer):
+class SessionConsumer(MessageCodecMixin, BoundedSendMixin, AsyncWebsocketConsumer):
     """
     WebSocket Consumer for real-time session synchronization
 
@@ -31,10 +40,73 @@ class SessionConsumer(AsyncWebsocketConsumer):
     - Broadcast to all:
       - step_changed: Notify step change
       - session_status_changed: Notify status change
-      - participant_joined: New participant joined
-      - participant_left: Participant left
+      - participant_joined: New participant joined (Redis를 사용할 수 없을 때만)
+      - participant_left: Participant left (Redis를 사용할 수 없을 때만)
+
+    - To instructors:
+      - help_requested: First help request on a subtask (sent immediately; later ones too if the cluster flush is late)
+      - help_cluster: Coalesced help requests on the same subtask within a short window
+      - help_screenshot_ready: Help request screenshot stored (help_requested arrives first with
+        screenshot_pending and screenshot_id; the image is stored off the event loop - apps.sessions.help_screenshots)
+      - roster_diff: Coalesced participant joins/leaves within a short window
+
+    Event log (apps.sessions.event_log):
+      - Every group broadcast carries a per-session sequence number (seq)
+      - Reconnect with ?last_seq=N or send {"type": "resume", "last_seq": N} to receive only missed events,
+        followed by resume_complete (or resync_required if too many were missed - refetch over REST)
+
+    Progress frames (opt-in, instructors - apps.sessions.progress_frames):
+      - Connect with ?progress_frames=<ms> or send {"type": "subscribe_progress_frames", "interval_ms": 500}
+        to receive one progress_frame per tick (changed participants + per-step counts)
+        instead of each progress_updated / student_completion; unsubscribe_progress_frames to stop
+
+    Subprotocol (core.websocket.MessageCodecMixin):
+      - JSON text frames by default; clients requesting mobilegpt.msgpack.v1 get deduplicated
+        MessagePack binary frames ({"t": type, "s": seq, "d": payload})
+
+    Backpressure (core.websocket.BoundedSendMixin):
+      - Sends go through a bounded per-connection queue; only the latest pending step_changed
+        (and screenshot_updated per device) is kept, listing the replaced seqs in skipped_seqs
+      - A client that falls behind gets backpressure {"mode": "essential"} and only ESSENTIAL_TYPES
+        until it catches up ({"mode": "full", "dropped_seq": N} - resume from N - 1 to get the dropped events),
+        and is closed (4008) if it still can't
     """
 
+    # 재전송할 수 있는 이벤트 (같은 이름의 핸들러로 다시 보냄)
+    REPLAY_EVENT_TYPES = {
+        'step_changed', 'session_status_changed', 'participant_joined', 'participant_left', 'roster_diff',
+        'progress_updated', 'help_requested', 'help_cluster', 'help_cluster_answer', 'help_response',
+        'instructor_message', 'screenshot_updated', 'student_completion', 'help_screenshot_ready',
+    }
+
+    # 느린 연결(강등 상태)에도 보내는 메시지 - 수업 진행과 강사 조치에 필요한 것만
+    ESSENTIAL_TYPES = frozenset({
+        'step_changed', 'session_status_changed', 'instructor_message', 'help_response',
+        'help_cluster_answer', 'help_requested', 'help_cluster', 'help_screenshot_ready', 'resume_complete',
+        'resync_required', 'progress_frame',
+    })
+
+    # 대기 중인 같은 키의 메시지는 최신 것만 전송
+    COALESCE_KEYS = {
+        'step_changed': lambda message: 'current',
+        'screenshot_updated': lambda message: (
+            message['data'].get('device_id') or message['data'].get('participant_id')
+        ),
+    }
+
+    # 진도 묶음 전송 (subscribe_progress_frames)
+    progress_frames = None
+    progress_frame_task = None
+
+    # 저장 중인 도움 요청 스크린샷 (연결이 끊겨도 저장/알림은 마침)
+    help_screenshot_tasks = None
+
+    # 묶음 flush가 늦어지는지 지켜보는 도움 요청 (늦어지면 help_requested를 직접 전송)
+    help_cluster_watch_tasks = None
+
+    # 참가자 디렉터리 조회용 세션 ID (인증 연결은 connect에서, 그 밖에는 처음 조회할 때 채움)
+    session_id = None
+
     async def connect(self):
         """Handle WebSocket connection"""
         import logging
@@ -77,6 +149,7 @@ class SessionConsumer(AsyncWebsocketConsumer):
                     logger.warning(f"User {self.user.id} does not have access to session {self.session_code}")
                     await self.close()
                     return
+                self.session_id = session.id
             else:
                 # 익명 사용자: DEBUG 모드에서만 허용
                 if getattr(settings, 'DEBUG', False):
@@ -100,16 +173,21 @@ class SessionConsumer(AsyncWebsocketConsumer):
 
             await self.accept()
 
-            # Notify others that user joined
-            await self.channel_layer.group_send(
-                self.session_group_name,
-                {
-                    'type': 'participant_joined',
-                    'user_id': getattr(self.user, 'id', 0),
-                    'user_name': getattr(self.user, 'name', 'Anonymous'),
-                    'role': getattr(self.user, 'role', 'student')
-                }
-            )
+            # Notify others that user joined (강사에게 roster_diff로 묶어 전송)
+            await self.notify_roster('joined', {
+                'type': 'participant_joined',
+                'user_id': getattr(self.user, 'id', 0),
+                'user_name': getattr(self.user, 'name', 'Anonymous'),
+                'role': getattr(self.user, 'role', 'student')
+            })
+
+            # 재연결: 마지막으로 받은 순번 이후 놓친 이벤트 재전송
+            query = parse_qs(self.scope.get('query_string', b'').decode())
+            if 'progress_frames' in query:
+                await self.start_progress_frames(query['progress_frames'][0])
+            last_seq = query.get('last_seq')
+            if last_seq:
+                await self.replay_events(last_seq[0])
 
             logger.info(f"WebSocket connected successfully - Session: {self.session_code}, User: {getattr(self.user, 'id', 'anon')}")
 
@@ -119,6 +197,8 @@ class SessionConsumer(AsyncWebsocketConsumer):
 
     async def disconnect(self, close_code):
         """Handle WebSocket disconnection"""
+        await self.stop_progress_frames()
+
         # Update participant status to DISCONNECTED (device_id 우선)
         if hasattr(self, 'device_id') and self.device_id:
             await self.update_participant_on_disconnect_by_device()
@@ -135,17 +215,14 @@ class SessionConsumer(AsyncWebsocketConsumer):
             participant_name = getattr(self.user, 'name', 'Anonymous')
             participant_id = getattr(self.user, 'id', 0)
 
-        # Notify others that user left
+        # Notify others that user left (강사에게 roster_diff로 묶어 전송)
         if hasattr(self, 'session_group_name'):
-            await self.channel_layer.group_send(
-                self.session_group_name,
-                {
-                    'type': 'participant_left',
-                    'user_id': participant_id,
-                    'user_name': participant_name,
-                    'device_id': getattr(self, 'device_id', None)
-                }
-            )
+            await self.notify_roster('left', {
+                'type': 'participant_left',
+                'user_id': participant_id,
+                'user_name': participant_name,
+                'device_id': getattr(self, 'device_id', None)
+            })
 
         # Leave session group
         if hasattr(self, 'session_group_name'):
@@ -178,6 +255,12 @@ class SessionConsumer(AsyncWebsocketConsumer):
                 await self.handle_join(data)
             elif message_type == 'heartbeat':
                 await self.handle_heartbeat(data)
+            elif message_type == 'resume':
+                await self.replay_events(data.get('last_seq', data.get('data', {}).get('last_seq')))
+            elif message_type == 'subscribe_progress_frames':
+                await self.start_progress_frames(data.get('interval_ms', data.get('data', {}).get('interval_ms')))
+            elif message_type == 'unsubscribe_progress_frames':
+                await self.stop_progress_frames()
             elif message_type == 'step_complete':
                 await self.handle_step_complete(data)
             elif message_type == 'request_help':
@@ -238,13 +321,10 @@ class SessionConsumer(AsyncWebsocketConsumer):
         subtask = await self.get_subtask_details(subtask_id)
 
         # Broadcast to all participants
-        await self.channel_layer.group_send(
-            self.session_group_name,
-            {
-                'type': 'step_changed',
-                'subtask': subtask
-            }
-        )
+        await self.broadcast({
+            'type': 'step_changed',
+            'subtask': subtask
+        })
 
     async def handle_pause_session(self):
         """Handle instructor pausing session"""
@@ -262,14 +342,11 @@ class SessionConsumer(AsyncWebsocketConsumer):
             message='세션이 일시정지되었습니다'
         )
 
-        await self.channel_layer.group_send(
-            self.session_group_name,
-            {
-                'type': 'session_status_changed',
-                'status': 'PAUSED',
-                'message': '세션이 일시정지되었습니다'
-            }
-        )
+        await self.broadcast({
+            'type': 'session_status_changed',
+            'status': 'PAUSED',
+            'message': '세션이 일시정지되었습니다'
+        })
 
     async def handle_resume_session(self):
         """Handle instructor resuming session"""
@@ -287,14 +364,11 @@ class SessionConsumer(AsyncWebsocketConsumer):
             message='세션이 재개되었습니다'
         )
 
-        await self.channel_layer.group_send(
-            self.session_group_name,
-            {
-                'type': 'session_status_changed',
-                'status': 'IN_PROGRESS',
-                'message': '세션이 재개되었습니다'
-            }
-        )
+        await self.broadcast({
+            'type': 'session_status_changed',
+            'status': 'IN_PROGRESS',
+            'message': '세션이 재개되었습니다'
+        })
 
     async def handle_end_session(self):
         """Handle instructor ending session"""
@@ -312,14 +386,11 @@ class SessionConsumer(AsyncWebsocketConsumer):
             message='세션이 종료되었습니다'
         )
 
-        await self.channel_layer.group_send(
-            self.session_group_name,
-            {
-                'type': 'session_status_changed',
-                'status': 'ENDED',
-                'message': '세션이 종료되었습니다'
-            }
-        )
+        await self.broadcast({
+            'type': 'session_status_changed',
+            'status': 'ENDED',
+            'message': '세션이 종료되었습니다'
+        })
 
     # Student message handlers
     async def handle_join(self, data):
@@ -406,23 +477,19 @@ class SessionConsumer(AsyncWebsocketConsumer):
         else:
             await self.update_participant_subtask(subtask_id)
 
-        # 참가자 이름 결정 - DB에서 직접 조회
-        participant_name = await self.get_participant_name()
-        participant_id = self.participant.id if self.participant else getattr(self.user, 'id', 0)
+        # 참가자 이름 결정 - 세션 참가자 디렉터리에서 조회
+        participant_id, participant_name = await self.get_participant_identity()
 
         # Send progress update to instructor(s) only
-        await self.channel_layer.group_send(
-            self.session_group_name,
-            {
-                'type': 'progress_updated',
-                'user_id': participant_id,
-                'user_name': participant_name,
-                'device_id': self.device_id,
-                'subtask_id': subtask_id,
-                'status': 'completed',
-                'role_filter': 'INSTRUCTOR'  # Only send to instructors
-            }
-        )
+        await self.broadcast({
+            'type': 'progress_updated',
+            'user_id': participant_id,
+            'user_name': participant_name,
+            'device_id': self.device_id,
+            'subtask_id': subtask_id,
+            'status': 'completed',
+            'role_filter': 'INSTRUCTOR'  # Only send to instructors
+        })
 
         # Send confirmation to student
         await self.send(text_data=json.dumps({
@@ -452,23 +519,19 @@ class SessionConsumer(AsyncWebsocketConsumer):
             else:
                 await self.update_participant_subtask(subtask_id)
 
-        # 참가자 이름 결정 - DB에서 직접 조회
-        participant_name = await self.get_participant_name()
-        participant_id = self.participant.id if self.participant else getattr(self.user, 'id', 0)
+        # 참가자 이름 결정 - 세션 참가자 디렉터리에서 조회
+        participant_id, participant_name = await self.get_participant_identity()
 
         # Send progress update to instructor(s) only
-        await self.channel_layer.group_send(
-            self.session_group_name,
-            {
-                'type': 'progress_updated',
-                'user_id': participant_id,
-                'user_name': participant_name,
-                'device_id': self.device_id,
-                'subtask_id': subtask_id,
-                'status': status,
-                'role_filter': 'INSTRUCTOR'  # Only send to instructors
-            }
-        )
+        await self.broadcast({
+            'type': 'progress_updated',
+            'user_id': participant_id,
+            'user_name': participant_name,
+            'device_id': self.device_id,
+            'subtask_id': subtask_id,
+            'status': status,
+            'role_filter': 'INSTRUCTOR'  # Only send to instructors
+        })
 
     async def handle_help_request(self, data):
         """Handle student help request"""
@@ -485,39 +548,251 @@ class SessionConsumer(AsyncWebsocketConsumer):
             self.device_id = msg_device_id
             logger.info(f"[handle_help_request] device_id from message: {msg_device_id}")
 
-        # 참가자 이름 결정 - DB에서 직접 조회하여 정확한 이름 가져오기
-        participant_name = await self.get_participant_name()
-        participant_id = self.participant.id if self.participant else getattr(self.user, 'id', 0)
+        # 참가자 이름 결정 - 세션 참가자 디렉터리에서 조회
+        participant_id, participant_name = await self.get_participant_identity()
 
-        logger.info(f"[handle_help_request] participant_name={participant_name}, participant_id={participant_id}, device_id={self.device_id}, has_screenshot={screenshot_base64 is not None}")
-
-        # 스크린샷이 있으면 저장
-        screenshot_url = None
+        # 스크린샷은 전용 I/O 풀에서 저장하고 알림은 바로 보냄 (저장되면 help_screenshot_ready)
+        screenshot_id = None
         if screenshot_base64:
-            screenshot_url = await self.save_help_request_screenshot(screenshot_base64)
-            logger.info(f"[handle_help_request] Screenshot saved: {screenshot_url}")
-
-        # Send help request to instructor(s)
-        await self.channel_layer.group_send(
-            self.session_group_name,
-            {
-                'type': 'help_requested',
+            if help_screenshots.try_reserve():
+                screenshot_id = help_screenshots.new_screenshot_id()
+            else:
+                logger.warning(f"[handle_help_request] Screenshot storage busy, dropping screenshot from {self.device_id}")
+
+        logger.info(f"[handle_help_request] participant_name={participant_name}, participant_id={participant_id}, device_id={self.device_id}, screenshot_id={screenshot_id}")
+
+        # 같은 단계의 요청은 묶어서 창 종료 시 help_cluster로 한 번에 알림
+        cluster = await self.join_help_cluster(subtask_id, {
+            'user_id': participant_id,
+            'user_name': participant_name,
+            'device_id': self.device_id,
+            'account_id': getattr(self.user, 'id', None) or None,
+            'message': message,
+            'screenshot_url': None,
+            'screenshot_id': screenshot_id,
+        })
+        help_event = {
+            'type': 'help_requested',
+            'user_id': participant_id,
+            'user_name': participant_name,
+            'device_id': self.device_id,
+            'subtask_id': subtask_id,
+            'message': message,
+            'screenshot_url': None,
+            'screenshot_id': screenshot_id,
+            'screenshot_pending': screenshot_id is not None,
+            'cluster_id': cluster['cluster_id'] if cluster else None,
+            'role_filter': 'INSTRUCTOR'
+        }
+        if cluster and not cluster['is_first']:
+            logger.info(f"[handle_help_request] Added to help cluster {cluster['cluster_id']}")
+            self.start_help_cluster_watch(cluster['cluster_id'], help_event)
+        else:
+            # Send help request to instructor(s)
+            await self.broadcast(help_event)
+
+        if screenshot_id:
+            self.start_help_screenshot(screenshot_id, screenshot_base64, {
                 'user_id': participant_id,
                 'user_name': participant_name,
                 'device_id': self.device_id,
                 'subtask_id': subtask_id,
-                'message': message,
+                'cluster_id': cluster['cluster_id'] if cluster else None,
+            })
+
+    def start_help_screenshot(self, screenshot_id, screenshot_base64, request):
+        """스크린샷 저장 태스크 시작 (handle_help_request가 기다리지 않음)"""
+        if self.help_screenshot_tasks is None:
+            self.help_screenshot_tasks = set()
+        task = asyncio.ensure_future(self.store_help_screenshot(screenshot_id, screenshot_base64, request))
+        self.help_screenshot_tasks.add(task)
+        task.add_done_callback(self.help_screenshot_tasks.discard)
+
+    async def store_help_screenshot(self, screenshot_id, screenshot_base64, request):
+        """전용 I/O 풀에서 스크린샷 저장 후 강사에게 help_screenshot_ready (실패하면 screenshot_url 없음)"""
+        import logging
+
+        screenshot_url = await help_screenshots.store_async(screenshot_id, screenshot_base64)
+        try:
+            await self.broadcast({
+                'type': 'help_screenshot_ready',
+                **request,
+                'screenshot_id': screenshot_id,
                 'screenshot_url': screenshot_url,
+                'status': 'stored' if screenshot_url else 'failed',
                 'role_filter': 'INSTRUCTOR'
-            }
-        )
+            })
+        except Exception as e:
+            logging.getLogger(__name__).error(f"[store_help_screenshot] Broadcast failed: {e}")
+
+    def start_help_cluster_watch(self, cluster_id, help_event):
+        """묶음 flush 감시 시작 (handle_help_request가 기다리지 않음)"""
+        if self.help_cluster_watch_tasks is None:
+            self.help_cluster_watch_tasks = set()
+        task = asyncio.ensure_future(self.watch_help_cluster(cluster_id, help_event))
+        self.help_cluster_watch_tasks.add(task)
+        task.add_done_callback(self.help_cluster_watch_tasks.discard)
+
+    async def watch_help_cluster(self, cluster_id, help_event):
+        """창 길이 + 유예 시간 안에 flush가 시작되지 않으면 묶음에서 빠지고 help_requested 직접 전송"""
+        import logging
+        from apps.help.services import HelpClusterService
+
+        service = HelpClusterService()
+        await asyncio.sleep(service.window + service.flush_grace)
+        try:
+            if not await service.withdraw_unflushed(cluster_id, {
+                'device_id': help_event['device_id'],
+                'account_id': getattr(self.user, 'id', None) or None,
+                'user_id': help_event['user_id'],
+            }):
+                return
+            logging.getLogger(__name__).warning(
+                f"[watch_help_cluster] Cluster {cluster_id} was not flushed in time, sending request individually"
+            )
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"[watch_help_cluster] Cluster state unavailable: {e}")
+        await self.broadcast(help_event)
+
+    async def join_help_cluster(self, subtask_id, member):
+        """도움 요청 묶음에 참여 (단계가 없거나 Redis를 사용할 수 없으면 None → 개별 알림)"""
+        import logging
+        from apps.help.services import HelpClusterService
+        from apps.help.tasks import flush_help_cluster_task
+        logger = logging.getLogger(__name__)
+
+        if not subtask_id:
+            return None
+
+        service = HelpClusterService()
+        try:
+            cluster = await service.add_request(self.session_code, subtask_id, member)
+        except Exception as e:
+            logger.warning(f"[join_help_cluster] Help clustering unavailable: {e}")
+            return None
+
+        if cluster['is_first']:
+            try:
+                await sync_to_async(flush_help_cluster_task.apply_async)(
+                    args=[cluster['cluster_id']], countdown=service.window
+                )
+            except Exception as e:
+                # 예약되지 않은 묶음에는 더 이상 요청을 모으지 않음 (이 요청은 개별 알림)
+                logger.warning(f"[join_help_cluster] Failed to schedule cluster flush: {e}")
+                try:
+                    await service.abandon(self.session_code, subtask_id, cluster['cluster_id'])
+                except Exception:
+                    pass
+                return None
+        return cluster
+
+    async def broadcast(self, event):
+        """세션 그룹에 이벤트 전송 (이벤트 로그에 순번과 함께 기록)"""
+        await event_log.arecord(self.session_code, event)
+        await self.channel_layer.group_send(self.session_group_name, event)
+
+    async def send_event(self, event, message):
+        """브로드캐스트 이벤트를 클라이언트로 전송 (순번이 있으면 seq 포함)"""
+        if event.get('seq') is not None:
+            message['seq'] = event['seq']
+        await self.send_message(message)
+
+    def send_metrics_scope(self):
+        return getattr(self, 'session_code', None)
+
+    async def replay_events(self, last_seq):
+        """last_seq 이후 이벤트를 핸들러로 다시 보내고 resume_complete 전송 (클라이언트는 seq로 중복 제거)"""
+        try:
+            last_seq = int(last_seq)
+        except (TypeError, ValueError):
+            await self.send(text_data=json.dumps({'error': 'last_seq is required'}))
+            return
+
+        events = await database_sync_to_async(event_log.since)(self.session_code, last_seq)
+        if events is None:
+            latest = await database_sync_to_async(event_log.latest_seq)(self.session_code)
+            await self.send(text_data=json.dumps({
+                'type': 'resync_required',
+                'last_seq': latest,
+                'message': '놓친 이벤트가 너무 많습니다. 세션 상태를 다시 불러오세요.'
+            }))
+            return
+
+        for event in events:
+            if event.get('type') in self.REPLAY_EVENT_TYPES:
+                # 재전송 묶음이 송신 큐를 넘겨 강등되지 않도록 전송 속도에 맞춤
+                await self.wait_for_send_capacity()
+                await getattr(self, event['type'])(event)
+
+        await self.send_message({
+            'type': 'resume_complete',
+            'replayed': len(events),
+            'last_seq': events[-1]['seq'] if events else last_seq,
+        })
+
+    async def start_progress_frames(self, interval_ms=None):
+        """진도 묶음 전송 시작 (강사 전용) - 현재 상태로 전체 프레임을 보낸 뒤 주기마다 바뀐 부분만"""
+        if getattr(self.user, 'role', None) != 'INSTRUCTOR':
+            await self.send(text_data=json.dumps({
+                'error': 'Only instructors can subscribe to progress frames'
+            }))
+            return
+
+        await self.stop_progress_frames()
+        builder = ProgressFrameBuilder()
+        builder.seed(await self.get_progress_participants())
+        interval = frame_interval_seconds(interval_ms)
+        self.progress_frames = builder
+        self.progress_frame_task = asyncio.ensure_future(self.send_progress_frames(builder, interval))
+
+        await self.send(text_data=json.dumps({
+            'type': 'progress_frames_subscribed',
+            'interval_ms': int(interval * 1000),
+        }))
+
+    async def stop_progress_frames(self):
+        """진도 묶음 전송 중지 (이후 개별 메시지로 돌아감)"""
+        task, self.progress_frame_task = self.progress_frame_task, None
+        self.progress_frames = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def send_progress_frames(self, builder, interval):
+        while True:
+            frame = builder.frame()
+            if frame is not None:
+                await self.send_message(frame)
+            await asyncio.sleep(interval)
+
+    async def notify_roster(self, action, event):
+        """입장/퇴장을 roster_diff 창에 추가 (Redis를 사용할 수 없으면 기존처럼 개별 알림)"""
+        import logging
+        from . import roster
+        from .tasks import flush_roster_diff_task
+        logger = logging.getLogger(__name__)
+
+        member = {key: value for key, value in event.items() if key != 'type'}
+        try:
+            if await roster.add_change(self.session_code, action, self.channel_name, member):
+                await sync_to_async(flush_roster_diff_task.apply_async)(
+                    args=[self.session_code], countdown=roster.window_seconds()
+                )
+            return
+        except Exception as e:
+            logger.warning(f"[notify_roster] Roster diffs unavailable: {e}")
+
+        await self.broadcast(event)
 
     # Broadcast message handlers
     async def step_changed(self, event):
         """Send step changed notification to client"""
         subtask = event['subtask']
         # Android 앱 호환성: data 필드에 subtask 정보 포함
-        await self.send(text_data=json.dumps({
+        await self.send_event(event, {
             'type': 'step_changed',
             'subtask': subtask,
             'data': {
@@ -529,7 +804,7 @@ class SessionConsumer(AsyncWebsocketConsumer):
                 'guide_text': subtask.get('guide_text'),
                 'voice_guide_text': subtask.get('voice_guide_text')
             }
-        }))
+        })
 
     async def session_status_changed(self, event):
         """Send session status changed notification to client"""
@@ -538,7 +813,7 @@ class SessionConsumer(AsyncWebsocketConsumer):
         logger.info(f"[Consumer] Sending session_status_changed to client: {event['status']}")
 
         # Android 앱 호환성: data 필드 안에 status와 message 포함
-        await self.send(text_data=json.dumps({
+        await self.send_event(event, {
             'type': 'session_status_changed',
             'status': event['status'],
             'message': event['message'],
@@ -546,7 +821,7 @@ class SessionConsumer(AsyncWebsocketConsumer):
                 'status': event['status'],
                 'message': event['message']
             }
-        }))
+        })
         logger.info(f"[Consumer] Message sent successfully")
 
     async def participant_joined(self, event):
@@ -555,7 +830,7 @@ class SessionConsumer(AsyncWebsocketConsumer):
         if event['user_id'] == getattr(self.user, 'id', 0):
             return
 
-        await self.send(text_data=json.dumps({
+        await self.send_event(event, {
             'type': 'participant_joined',
             'user_id': event['user_id'],
             'user_name': event['user_name'],
@@ -566,7 +841,7 @@ class SessionConsumer(AsyncWebsocketConsumer):
                 'username': event['user_name'],
                 'role': event['role']
             }
-        }))
+        })
 
     async def participant_left(self, event):
         """Send participant left notification to client"""
@@ -574,7 +849,7 @@ class SessionConsumer(AsyncWebsocketConsumer):
         if event['user_id'] == getattr(self.user, 'id', 0):
             return
 
-        await self.send(text_data=json.dumps({
+        await self.send_event(event, {
             'type': 'participant_left',
             'user_id': event['user_id'],
             'user_name': event['user_name'],
@@ -583,7 +858,31 @@ class SessionConsumer(AsyncWebsocketConsumer):
                 'user_id': event['user_id'],
                 'username': event['user_name']
             }
-        }))
+        })
+
+    async def roster_diff(self, event):
+        """Send coalesced participant joins/leaves to instructors only"""
+        if event.get('role_filter') == 'INSTRUCTOR' and self.user.role != 'INSTRUCTOR':
+            return
+
+        # Don't send own join/leave to self
+        user_id = getattr(self.user, 'id', 0)
+        joined = [member for member in event['joined'] if member['user_id'] != user_id]
+        left = [member for member in event['left'] if member['user_id'] != user_id]
+        if not joined and not left:
+            return
+
+        data = {
+            'joined': joined,
+            'left': left,
+            'joined_count': len(joined),
+            'left_count': len(left),
+        }
+        await self.send_event(event, {
+            'type': 'roster_diff',
+            **data,
+            'data': data
+        })
 
     async def progress_updated(self, event):
         """Send progress update to instructors only"""
@@ -591,13 +890,17 @@ class SessionConsumer(AsyncWebsocketConsumer):
         if event.get('role_filter') == 'INSTRUCTOR' and self.user.role != 'INSTRUCTOR':
             return
 
-        await self.send(text_data=json.dumps({
+        if self.progress_frames is not None:
+            self.progress_frames.apply(event)
+            return
+
+        await self.send_event(event, {
             'type': 'progress_updated',
             'user_id': event['user_id'],
             'user_name': event['user_name'],
             'subtask_id': event['subtask_id'],
             'status': event['status']
-        }))
+        })
 
     async def help_requested(self, event):
         """Send help request to instructors only"""
@@ -606,13 +909,15 @@ class SessionConsumer(AsyncWebsocketConsumer):
             return
 
         # Frontend compatibility: data wrapper with consistent field names
-        await self.send(text_data=json.dumps({
+        await self.send_event(event, {
             'type': 'help_requested',
             'user_id': event['user_id'],
             'user_name': event['user_name'],
             'subtask_id': event['subtask_id'],
             'message': event.get('message', ''),
             'screenshot_url': event.get('screenshot_url'),
+            'screenshot_id': event.get('screenshot_id'),
+            'screenshot_pending': event.get('screenshot_pending', False),
             # Frontend expects data wrapper with 'username' (not 'user_name')
             'data': {
                 'user_id': event['user_id'],
@@ -620,13 +925,103 @@ class SessionConsumer(AsyncWebsocketConsumer):
                 'subtask_id': event['subtask_id'],
                 'message': event.get('message', ''),
                 'screenshot_url': event.get('screenshot_url'),
+                'screenshot_id': event.get('screenshot_id'),
+                'screenshot_pending': event.get('screenshot_pending', False),
+                'cluster_id': event.get('cluster_id'),
                 'timestamp': timezone.now().isoformat(),
             }
-        }))
+        })
+
+    async def help_screenshot_ready(self, event):
+        """Send stored help request screenshot to instructors only"""
+        if event.get('role_filter') == 'INSTRUCTOR' and self.user.role != 'INSTRUCTOR':
+            return
+
+        data = {
+            'screenshot_id': event['screenshot_id'],
+            'screenshot_url': event.get('screenshot_url'),
+            'status': event['status'],
+            'user_id': event['user_id'],
+            'username': event['user_name'],
+            'device_id': event.get('device_id'),
+            'subtask_id': event.get('subtask_id'),
+            'cluster_id': event.get('cluster_id'),
+        }
+        await self.send_event(event, {
+            'type': 'help_screenshot_ready',
+            **data,
+            'data': data
+        })
+
+    async def help_cluster(self, event):
+        """Send coalesced help requests on the same subtask to instructors only"""
+        if event.get('role_filter') == 'INSTRUCTOR' and self.user.role != 'INSTRUCTOR':
+            return
+
+        data = {
+            'cluster_id': event['cluster_id'],
+            'subtask_id': event['subtask_id'],
+            'count': event['count'],
+            'participants': event['participants'],
+            'opened_at': event.get('opened_at'),
+        }
+        await self.send_event(event, {
+            'type': 'help_cluster',
+            **data,
+            'data': data
+        })
+
+    async def help_cluster_answer(self, event):
+        """Forward the shared M-GPT answer to the clustered students (help_response) and instructors"""
+        is_instructor = getattr(self.user, 'role', None) == 'INSTRUCTOR'
+        is_member = (
+            (self.device_id and self.device_id in event.get('device_ids', [])) or
+            getattr(self.user, 'id', None) in event.get('account_ids', [])
+        )
+        if not is_instructor and not is_member:
+            return
+
+        data = {
+            'help_request_id': None,
+            'cluster_id': event['cluster_id'],
+            'subtask_id': event['subtask_id'],
+            'problem_diagnosis': event.get('problem_diagnosis', ''),
+            'help_content': event.get('help_content', ''),
+            'step_by_step_solution': event.get('step_by_step_solution', []),
+            'confidence_score': event.get('confidence_score'),
+        }
+        await self.send_event(event, {
+            'type': 'help_cluster_answer' if is_instructor else 'help_response',
+            **data,
+            'data': data
+        })
+
+    async def help_response(self, event):
+        """Send M-GPT help response to the requesting student and instructors"""
+        is_instructor = getattr(self.user, 'role', None) == 'INSTRUCTOR'
+        if not is_instructor and getattr(self.user, 'id', None) != event.get('user_id'):
+            return
+
+        data = {
+            'help_request_id': event['help_request_id'],
+            'help_response_id': event.get('help_response_id'),
+            'user_id': event.get('user_id'),
+            'username': event.get('user_name'),
+            'subtask_id': event.get('subtask_id'),
+            'problem_diagnosis': event.get('problem_diagnosis', ''),
+            'help_content': event.get('help_content', ''),
+            'step_by_step_solution': event.get('step_by_step_solution', []),
+            'confidence_score': event.get('confidence_score'),
+        }
+        await self.send_event(event, {
+            'type': 'help_response',
+            **data,
+            'data': data
+        })
 
     async def instructor_message(self, event):
         """Send instructor broadcast message to all participants"""
-        await self.send(text_data=json.dumps({
+        await self.send_event(event, {
             'type': 'instructor_message',
             'message': event['message'],
             'from': event['from'],
@@ -636,7 +1031,7 @@ class SessionConsumer(AsyncWebsocketConsumer):
                 'from': event['from'],
                 'timestamp': event['timestamp']
             }
-        }))
+        })
 
     async def screenshot_updated(self, event):
         """Send screenshot update notification to instructors only"""
@@ -644,7 +1039,7 @@ class SessionConsumer(AsyncWebsocketConsumer):
         if not hasattr(self.user, 'role') or self.user.role != 'INSTRUCTOR':
             return
 
-        await self.send(text_data=json.dumps({
+        await self.send_event(event, {
             'type': 'screenshot_updated',
             'data': {
                 'participant_id': event.get('participant_id'),
@@ -653,7 +1048,7 @@ class SessionConsumer(AsyncWebsocketConsumer):
                 'image_url': event.get('image_url'),
                 'captured_at': event.get('captured_at'),
             }
-        }))
+        })
 
     async def student_completion(self, event):
         """Send student step completion notification to instructors only"""
@@ -661,7 +1056,11 @@ class SessionConsumer(AsyncWebsocketConsumer):
         if not hasattr(self.user, 'role') or self.user.role != 'INSTRUCTOR':
             return
 
-        await self.send(text_data=json.dumps({
+        if self.progress_frames is not None:
+            self.progress_frames.apply(event)
+            return
+
+        await self.send_event(event, {
             'type': 'student_completion',
             'data': {
                 'device_id': event.get('device_id'),
@@ -670,56 +1069,52 @@ class SessionConsumer(AsyncWebsocketConsumer):
                 'subtask_id': event.get('subtask_id'),
                 'completed_subtasks': event.get('completed_subtasks', []),
                 'total_completed': event.get('total_completed', 0),
+                'changed_subtasks': event.get('changed_subtasks', [event.get('subtask_id')]),
                 'timestamp': event.get('timestamp'),
             }
-        }))
+        })
 
     # Helper methods
-    async def get_participant_name(self):
-        """참가자 이름을 가져오는 헬퍼 메서드 - 인증된 사용자 우선"""
-        import logging
-        logger = logging.getLogger(__name__)
-
-        # 1. 인증된 사용자의 이름 사용 (최우선 - JWT 토큰으로 인증된 경우)
-        # self.user.id가 0이 아니고 (익명이 아니고), name이 있으면 사용
-        if hasattr(self.user, 'id') and self.user.id and self.user.id != 0:
-            if hasattr(self.user, 'name') and self.user.name:
-                user_name = self.user.name
-                if not user_name.startswith('Anonymous_'):
-                    logger.info(f"[get_participant_name] Using authenticated user name: {user_name}")
-                    return user_name
+    async def get_participant_identity(self):
+        """
+        (참가자 ID, 이름) - 세션 참가자 디렉터리 사용 (디렉터리에 없을 때만 DB에서 한 번 채움)
 
-        # 2. self.participant가 있으면 사용
+        이름은 인증된 사용자 이름 우선, ID는 참가자가 없으면 사용자 ID
+        """
+        entry = await self.get_directory_entry()
         if self.participant:
-            # 2-1. participant에 연결된 user의 이름 확인
-            if hasattr(self.participant, 'user') and self.participant.user:
-                user = self.participant.user
-                if hasattr(user, 'name') and user.name and not user.name.startswith('Anonymous_'):
-                    logger.info(f"[get_participant_name] Using participant.user name: {user.name}")
-                    return user.name
-            # 2-2. display_name 확인
-            if self.participant.display_name:
-                logger.info(f"[get_participant_name] Using participant display_name: {self.participant.display_name}")
-                return self.participant.display_name
-
-        # 3. device_id로 DB에서 조회
-        if self.device_id:
-            participant = await self.get_participant_by_device(self.device_id)
-            if participant:
-                self.participant = participant  # 캐시
-                # 3-1. participant에 연결된 user의 이름 확인
-                if hasattr(participant, 'user') and participant.user:
-                    user = participant.user
-                    if hasattr(user, 'name') and user.name and not user.name.startswith('Anonymous_'):
-                        logger.info(f"[get_participant_name] Using DB participant.user name: {user.name}")
-                        return user.name
-                # 3-2. display_name 확인
-                if participant.display_name:
-                    logger.info(f"[get_participant_name] Using DB participant display_name: {participant.display_name}")
-                    return participant.display_name
-
-        logger.warning(f"[get_participant_name] Falling back to '익명' - user.id={getattr(self.user, 'id', None)}, device_id={self.device_id}")
-        return '익명'
+            participant_id = self.participant.id
+        elif entry:
+            participant_id = entry['id']
+        else:
+            participant_id = getattr(self.user, 'id', 0)
+        return participant_id, self.authenticated_user_name() or (entry['name'] if entry else directory.ANONYMOUS_NAME)
+
+    def authenticated_user_name(self):
+        """JWT로 인증된 사용자 이름 (익명 사용자면 None)"""
+        user_id = getattr(self.user, 'id', 0)
+        name = getattr(self.user, 'name', None)
+        if user_id and name and not name.startswith('Anonymous_'):
+            return name
+        return None
+
+    async def get_directory_entry(self):
+        """세션 참가자 디렉터리에서 이 연결의 참가자 항목 (device_id 우선, 없으면 user_id)"""
+        import logging
+
+        user_id = getattr(self.user, 'id', None) or None
+        if not self.device_id and not user_id:
+            return None
+        if self.session_id is None:
+            self.session_id = await self.get_session_id()
+        entry = await directory.alookup(self.session_id, device_id=self.device_id, user_id=user_id)
+        if entry is None and self.session_id:
+            entry = await database_sync_to_async(directory.load)(self.session_id, self.device_id, user_id)
+        if entry is None:
+            logging.getLogger(__name__).warning(
+                f"[get_directory_entry] Participant not found - user.id={user_id}, device_id={self.device_id}"
+            )
+        return entry
 
     # Database queries
     @database_sync_to_async
@@ -730,6 +1125,25 @@ class SessionConsumer(AsyncWebsocketConsumer):
         except LectureSession.DoesNotExist:
             return None
 
+    @database_sync_to_async
+    def get_session_id(self):
+        """세션 ID (세션 참가 정보 캐시 사용)"""
+        descriptor = admission.get_join_descriptor(self.session_code)
+        return descriptor['id'] if descriptor else None
+
+    @database_sync_to_async
+    def get_progress_participants(self):
+        """진도 묶음 전송 초기 상태 (실시간 상태 우선, 없으면 DB)"""
+        session_id = LectureSession.objects.filter(
+            session_code=self.session_code
+        ).values_list('id', flat=True).first()
+        if session_id is None:
+            return []
+        participants = live_state.list_participants(session_id)
+        if participants is None:
+            participants = list(SessionParticipant.objects.filter(session_id=session_id))
+        return participants
+
     @database_sync_to_async
     def get_anonymous_user(self):
         """Get or create anonymous test user for WebSocket testing"""
@@ -799,6 +1213,15 @@ class SessionConsumer(AsyncWebsocketConsumer):
             return None
 
     # SessionParticipant update methods
+    def get_live_participant(self, by_device=False):
+        """수업 중이면 Redis 실시간 상태의 참가자 (아니면 None - DB 경로 사용, 동기 메서드 안에서 호출)"""
+        session = admission.get_join_descriptor(self.session_code)
+        if session is None or session['status'] not in live_state.LIVE_STATUSES:
+            return None
+        if by_device:
+            return live_state.get_participant(session['id'], device_id=self.device_id)
+        return live_state.get_participant(session['id'], user_id=self.user.id)
+
     @database_sync_to_async
     def update_participant_status(self, status):
         """Update participant status"""
@@ -807,6 +1230,15 @@ class SessionConsumer(AsyncWebsocketConsumer):
             if hasattr(self.user, 'id') and self.user.id == 0:
                 return True
 
+            participant = self.get_live_participant()
+            if participant is not None:
+                participant.status = status
+                participant.save()
+                live_counters.set_status(
+                    participant.session_id, status, device_id=participant.device_id, user_id=self.user.id
+                )
+                return True
+
             session = LectureSession.objects.get(session_code=self.session_code)
             participant, created = SessionParticipant.objects.get_or_create(
                 session=session,
@@ -817,6 +1249,9 @@ class SessionConsumer(AsyncWebsocketConsumer):
                 participant.status = status
                 participant.last_active_at = timezone.now()
                 participant.save()
+            live_counters.set_status(
+                session.id, status, device_id=participant.device_id, user_id=self.user.id
+            )
             return True
         except Exception:
             return False
@@ -829,11 +1264,18 @@ class SessionConsumer(AsyncWebsocketConsumer):
             if hasattr(self.user, 'id') and self.user.id == 0:
                 return True
 
+            participant = self.get_live_participant()
+            if participant is not None:
+                participant.save()
+                live_counters.touch(participant.session_id, device_id=participant.device_id, user_id=self.user.id)
+                return True
+
             session = LectureSession.objects.get(session_code=self.session_code)
-            SessionParticipant.objects.filter(
-                session=session,
-                user=self.user
-            ).update(last_active_at=timezone.now())
+            participants = SessionParticipant.objects.filter(session=session, user=self.user)
+            # 카운터는 기기가 있는 참가자를 device 키로 셈 (rebuild와 같은 키)
+            device_id = participants.values_list('device_id', flat=True).first()
+            participants.update(last_active_at=timezone.now())
+            live_counters.touch(session.id, device_id=device_id, user_id=self.user.id)
             return True
         except Exception:
             return False
@@ -847,9 +1289,16 @@ class SessionConsumer(AsyncWebsocketConsumer):
                 return True
 
             from apps.tasks.models import Subtask
-            session = LectureSession.objects.get(session_code=self.session_code)
             subtask = Subtask.objects.get(id=subtask_id)
 
+            participant = self.get_live_participant()
+            if participant is not None:
+                participant.current_subtask_id = subtask.id
+                participant.save()
+                live_counters.touch(participant.session_id, device_id=participant.device_id, user_id=self.user.id)
+                return True
+
+            session = LectureSession.objects.get(session_code=self.session_code)
             participant = SessionParticipant.objects.get(
                 session=session,
                 user=self.user
@@ -857,6 +1306,7 @@ class SessionConsumer(AsyncWebsocketConsumer):
             participant.current_subtask = subtask
             participant.last_active_at = timezone.now()
             participant.save()
+            live_counters.touch(session.id, device_id=participant.device_id, user_id=self.user.id)
             return True
         except Exception:
             return False
@@ -869,14 +1319,24 @@ class SessionConsumer(AsyncWebsocketConsumer):
             if hasattr(self.user, 'id') and self.user.id == 0:
                 return True
 
+            participant = self.get_live_participant()
+            if participant is not None:
+                participant.status = 'DISCONNECTED'
+                participant.save()
+                live_counters.set_status(
+                    participant.session_id, 'DISCONNECTED', device_id=participant.device_id, user_id=self.user.id
+                )
+                return True
+
             session = LectureSession.objects.get(session_code=self.session_code)
-            SessionParticipant.objects.filter(
-                session=session,
-                user=self.user
-            ).update(
+            participants = SessionParticipant.objects.filter(session=session, user=self.user)
+            device_id = participants.values_list('device_id', flat=True).first()
+            participants.update(
                 status='DISCONNECTED',
                 last_active_at=timezone.now()
             )
+            live_counters.set_status(session.id, 'DISCONNECTED', device_id=device_id, user_id=self.user.id)
+            versions.bump(session.id, [self.user.id])
             return True
         except Exception:
             return False
@@ -890,10 +1350,12 @@ class SessionConsumer(AsyncWebsocketConsumer):
             session = LectureSession.objects.get(session_code=self.session_code)
             # select_related('user')로 user 관계를 미리 로드하여
             # participant.user.name 접근 시 정상적으로 이름을 가져올 수 있도록 함
-            return SessionParticipant.objects.select_related('user').get(
+            participant = SessionParticipant.objects.select_related('user').get(
                 session=session,
                 device_id=device_id
             )
+            directory.register(session.id, participant)
+            return participant
         except (LectureSession.DoesNotExist, SessionParticipant.DoesNotExist):
             return None
 
@@ -916,6 +1378,7 @@ class SessionConsumer(AsyncWebsocketConsumer):
                 participant.status = 'ACTIVE'
                 participant.last_active_at = timezone.now()
                 participant.save()
+            live_counters.set_status(session.id, 'ACTIVE', device_id=device_id)
             return participant
         except Exception as e:
             import logging
@@ -929,11 +1392,23 @@ class SessionConsumer(AsyncWebsocketConsumer):
             if not self.device_id:
                 return False
 
+            participant = self.get_live_participant(by_device=True)
+            if participant is not None:
+                participant.status = status
+                participant.save()
+                live_counters.set_status(participant.session_id, status, device_id=self.device_id)
+                return True
+
             session = LectureSession.objects.get(session_code=self.session_code)
             updated = SessionParticipant.objects.filter(
                 session=session,
                 device_id=self.device_id
             ).update(status=status, last_active_at=timezone.now())
+            if updated:
+                live_counters.set_status(session.id, status, device_id=self.device_id)
+                versions.bump_participants(
+                    session.id, SessionParticipant.objects.filter(session=session, device_id=self.device_id)
+                )
             return updated > 0
         except Exception:
             return False
@@ -945,11 +1420,19 @@ class SessionConsumer(AsyncWebsocketConsumer):
             if not self.device_id:
                 return False
 
+            participant = self.get_live_participant(by_device=True)
+            if participant is not None:
+                participant.save()
+                live_counters.touch(participant.session_id, device_id=self.device_id)
+                return True
+
             session = LectureSession.objects.get(session_code=self.session_code)
             updated = SessionParticipant.objects.filter(
                 session=session,
                 device_id=self.device_id
             ).update(last_active_at=timezone.now())
+            if updated:
+                live_counters.touch(session.id, device_id=self.device_id)
             return updated > 0
         except Exception:
             return False
@@ -962,12 +1445,11 @@ class SessionConsumer(AsyncWebsocketConsumer):
                 return False
 
             from apps.tasks.models import Subtask
-            session = LectureSession.objects.get(session_code=self.session_code)
             subtask = Subtask.objects.get(id=subtask_id)
 
-            # 완료된 단계 목록에 추가
-            participant = SessionParticipant.objects.get(
-                session=session,
+            # 완료된 단계 목록에 추가 (수업 중이면 Redis 실시간 상태)
+            participant = self.get_live_participant(by_device=True) or SessionParticipant.objects.get(
+                session__session_code=self.session_code,
                 device_id=self.device_id
             )
 
@@ -976,11 +1458,12 @@ class SessionConsumer(AsyncWebsocketConsumer):
             if subtask_id not in completed:
                 completed.append(subtask_id)
 
-            participant.current_subtask = subtask
+            participant.current_subtask_id = subtask.id
             participant.completed_subtasks = completed
             participant.last_completed_at = timezone.now()
             participant.last_active_at = timezone.now()
             participant.save()
+            live_counters.touch(participant.session_id, device_id=self.device_id)
             return True
         except Exception as e:
             import logging
@@ -994,6 +1477,13 @@ class SessionConsumer(AsyncWebsocketConsumer):
             if not self.device_id:
                 return False
 
+            participant = self.get_live_participant(by_device=True)
+            if participant is not None:
+                participant.status = 'DISCONNECTED'
+                participant.save()
+                live_counters.set_status(participant.session_id, 'DISCONNECTED', device_id=self.device_id)
+                return True
+
             session = LectureSession.objects.get(session_code=self.session_code)
             updated = SessionParticipant.objects.filter(
                 session=session,
@@ -1002,6 +1492,11 @@ class SessionConsumer(AsyncWebsocketConsumer):
                 status='DISCONNECTED',
                 last_active_at=timezone.now()
             )
+            if updated:
+                live_counters.set_status(session.id, 'DISCONNECTED', device_id=self.device_id)
+                versions.bump_participants(
+                    session.id, SessionParticipant.objects.filter(session=session, device_id=self.device_id)
+                )
             return updated > 0
         except Exception:
             return False
@@ -1034,59 +1529,3 @@ class SessionConsumer(AsyncWebsocketConsumer):
         except Exception as e:
             print(f"Error logging step control: {e}")
             return False
-
-    @database_sync_to_async
-    def save_help_request_screenshot(self, base64_image):
-        """
-        도움 요청 시 전송된 스크린샷을 저장하고 URL 반환
-
-        Args:
-            base64_image: Base64 인코딩된 이미지 데이터
-
-        Returns:
-            저장된 이미지의 URL 또는 None (실패 시)
-        """
-        import base64
-        import uuid
-        from django.core.files.base import ContentFile
-        from django.conf import settings
-        import os
-        import logging
-
-        logger = logging.getLogger(__name__)
-
-        try:
-            # Base64 디코딩
-            if ',' in base64_image:
-                # data:image/jpeg;base64,... 형식인 경우
-                base64_image = base64_image.split(',')[1]
-
-            image_data = base64.b64decode(base64_image)
-
-            # 파일명 생성
-            filename = f"help_request_{uuid.uuid4().hex}.jpg"
-
-            # 저장 경로 설정 (날짜별 디렉토리)
-            from datetime import date
-            today = date.today()
-            relative_path = f"help_screenshots/{today.year}/{today.month:02d}/{today.day:02d}"
-            full_dir = os.path.join(settings.MEDIA_ROOT, relative_path)
-
-            # 디렉토리 생성
-            os.makedirs(full_dir, exist_ok=True)
-
-            # 파일 저장
-            file_path = os.path.join(full_dir, filename)
-            with open(file_path, 'wb') as f:
-                f.write(image_data)
-
-            # URL 반환 (프론트엔드에서 접근 가능한 절대 경로)
-            # settings.MEDIA_URL이 이미 '/'로 시작하므로 중복 슬래시 방지
-            media_url = settings.MEDIA_URL.rstrip('/')
-            url = f"{media_url}/{relative_path}/{filename}"
-            logger.info(f"[save_help_request_screenshot] Saved: {url}, size={len(image_data)}bytes")
-            return url
-
-        except Exception as e:
-            logger.error(f"[save_help_request_screenshot] Error: {e}")
-            return None
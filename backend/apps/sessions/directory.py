@@ -0,0 +1,202 @@
+"""
+Session Directory - 세션 참가자 식별 정보 캐시 (device_id/user_id → 참가자 ID, 표시 이름, 역할)
+
+진도 보고/도움 요청/완료 브로드캐스트/스크린샷 알림마다 참가자 이름을 얻으려고
+SessionParticipant(+ user)를 다시 조회하지 않도록, 참가(join)와 이름 변경 시점에 세션별 디렉터리에
+기록해 두고 이후에는 DB 없이 읽는다.
+
+Redis 구조:
+  session_directory:{session_id}  hash - device:{device_id} / user:{user_id} → {"id", "name", "role"} JSON
+                                  (SESSION_DIRECTORY_TTL, 기록할 때마다 연장)
+프로세스 메모리:
+  (session_id, 필드) → 항목 (SESSION_DIRECTORY_LOCAL_TTL초, SESSION_DIRECTORY_LOCAL_CACHE_SIZE개까지)
+  다른 프로세스에서 이름이 바뀌면 최대 LOCAL_TTL 동안 이전 이름이 보일 수 있다.
+
+기록 시점:
+  SessionParticipant post_save (생성, 이름이 바뀐 저장) / post_delete → signals
+  수업 중 재참가 (LiveParticipant.save는 signal을 보내지 않음) → admission.upsert_participant
+
+디렉터리에 없으면(Redis 만료/장애, 기록 이전 참가자) load가 한 번 DB에서 읽어 채운다.
+"""
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from django.conf import settings
+
+from core.redis import get_async_redis, get_redis
+
+logger = logging.getLogger(__name__)
+
+ANONYMOUS_NAME = '익명'
+
+_local_entries = OrderedDict()
+_local_lock = threading.Lock()
+
+
+def _key(session_id: int) -> str:
+    return f'session_directory:{session_id}'
+
+
+def _fields(device_id: Optional[str] = None, user_id: Optional[int] = None):
+    fields = []
+    if device_id:
+        fields.append(f'device:{device_id}')
+    if user_id:
+        fields.append(f'user:{user_id}')
+    return fields
+
+
+def describe(participant) -> Dict:
+    """SessionParticipant 또는 LiveParticipant → 디렉터리 항목 (SessionParticipant는 user를 한 번 읽음)"""
+    if hasattr(participant, 'user_name'):
+        user, user_name = None, participant.user_name
+    else:
+        user = participant.user if participant.user_id else None
+        user_name = user.name if user else None
+    if user_name and user_name.startswith('Anonymous_'):
+        user_name = None
+    return {
+        'id': participant.id,
+        'name': participant.display_name or user_name or ANONYMOUS_NAME,
+        'role': getattr(user, 'role', None) or 'STUDENT',
+    }
+
+
+def _local_get(session_id: int, fields) -> Optional[Dict]:
+    now = time.monotonic()
+    with _local_lock:
+        for field in fields:
+            cached = _local_entries.get((session_id, field))
+            if cached is not None and cached[1] > now:
+                return cached[0]
+    return None
+
+
+def _local_set(session_id: int, fields, entry: Dict):
+    expires_at = time.monotonic() + getattr(settings, 'SESSION_DIRECTORY_LOCAL_TTL', 10)
+    with _local_lock:
+        for field in fields:
+            _local_entries[(session_id, field)] = (entry, expires_at)
+            _local_entries.move_to_end((session_id, field))
+        while len(_local_entries) > getattr(settings, 'SESSION_DIRECTORY_LOCAL_CACHE_SIZE', 10000):
+            _local_entries.popitem(last=False)
+
+
+def _local_discard(session_id: int, fields):
+    with _local_lock:
+        for field in fields:
+            _local_entries.pop((session_id, field), None)
+
+
+def register(session_id: int, participant) -> Optional[Dict]:
+    """참가자 항목 기록 (참가/이름 변경 시)"""
+    fields = _fields(participant.device_id, participant.user_id)
+    if not fields:
+        return None
+    entry = describe(participant)
+    _local_set(session_id, fields, entry)
+
+    value = json.dumps(entry, ensure_ascii=False)
+    try:
+        pipe = get_redis().pipeline()
+        pipe.hset(_key(session_id), mapping={field: value for field in fields})
+        pipe.expire(_key(session_id), getattr(settings, 'SESSION_DIRECTORY_TTL', 43200))
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to record participant {participant.id} in session directory: {e}")
+    return entry
+
+
+def refresh(session_id: int, participant):
+    """저장된 참가자 항목이 없거나 표시 이름이 바뀌었을 때만 다시 기록 (진도 저장마다 user를 읽지 않도록)"""
+    entry = lookup(session_id, device_id=participant.device_id, user_id=participant.user_id)
+    if entry is None or (participant.display_name and entry['name'] != participant.display_name):
+        register(session_id, participant)
+
+
+def forget(session_id: int, participant):
+    """삭제된 참가자 항목 제거"""
+    fields = _fields(participant.device_id, participant.user_id)
+    if not fields:
+        return
+    _local_discard(session_id, fields)
+    try:
+        get_redis().hdel(_key(session_id), *fields)
+    except Exception as e:
+        logger.warning(f"Failed to remove participant {participant.id} from session directory: {e}")
+
+
+def _first(session_id: int, fields, values) -> Optional[Dict]:
+    for value in values:
+        if value:
+            entry = json.loads(value)
+            _local_set(session_id, fields, entry)
+            return entry
+    return None
+
+
+def lookup(session_id: int, device_id: Optional[str] = None, user_id: Optional[int] = None) -> Optional[Dict]:
+    """
+    참가자 항목 조회 (프로세스 메모리 → Redis 순, DB는 읽지 않음)
+
+    device_id를 user_id보다 먼저 찾는다. 없으면 None.
+    """
+    fields = _fields(device_id, user_id)
+    if not session_id or not fields:
+        return None
+    entry = _local_get(session_id, fields)
+    if entry is not None:
+        return entry
+    try:
+        values = get_redis().hmget(_key(session_id), fields)
+    except Exception as e:
+        logger.warning(f"Session directory unavailable for session {session_id}: {e}")
+        return None
+    return _first(session_id, fields, values)
+
+
+async def alookup(session_id: int, device_id: Optional[str] = None, user_id: Optional[int] = None) -> Optional[Dict]:
+    """lookup의 비동기 버전 (WebSocket consumer용)"""
+    fields = _fields(device_id, user_id)
+    if not session_id or not fields:
+        return None
+    entry = _local_get(session_id, fields)
+    if entry is not None:
+        return entry
+    try:
+        values = await get_async_redis().hmget(_key(session_id), fields)
+    except Exception as e:
+        logger.warning(f"Session directory unavailable for session {session_id}: {e}")
+        return None
+    return _first(session_id, fields, values)
+
+
+def load(session_id: int, device_id: Optional[str] = None, user_id: Optional[int] = None) -> Optional[Dict]:
+    """디렉터리에 없을 때 DB에서 참가자를 읽어 기록 (동기 - consumer에서는 database_sync_to_async로 호출)"""
+    from .models import SessionParticipant
+
+    entry = lookup(session_id, device_id=device_id, user_id=user_id)
+    if entry is not None:
+        return entry
+
+    queryset = SessionParticipant.objects.select_related('user').filter(session_id=session_id)
+    participant = None
+    if device_id:
+        participant = queryset.filter(device_id=device_id).first()
+    if participant is None and user_id:
+        participant = queryset.filter(user_id=user_id).first()
+    if participant is None:
+        return None
+    return register(session_id, participant)
+
+
+def resolve_name(session_id: int, participant) -> str:
+    """이미 읽은 참가자의 표시 이름 (display_name이 없으면 user를 읽지 않고 디렉터리에서)"""
+    if participant.display_name:
+        return participant.display_name
+    entry = load(session_id, device_id=participant.device_id, user_id=participant.user_id)
+    return entry['name'] if entry else ANONYMOUS_NAME
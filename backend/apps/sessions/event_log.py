@@ -0,0 +1,312 @@
+"""
+Session Event Log - 세션 그룹 브로드캐스트를 순번과 함께 기록하는 추가 전용 이벤트 로그
+
+지금까지 진행 중 세션의 이력은 SessionStepControl, SessionParticipant 필드, 흘러가 버리는
+WebSocket 메시지에 흩어져 있어 재연결한 클라이언트는 REST로 전부 다시 불러와야 했다.
+세션 그룹(session_{code})에 보내는 모든 이벤트에 세션별 순번(seq)을 붙여 기록하고,
+재연결한 클라이언트는 마지막으로 받은 순번(last_seq) 이후 이벤트만 다시 받는다.
+
+Redis 구조 (session_events:*):
+  session_events:{session_code}:seq   마지막 순번 (INCR)
+  session_events:{session_code}:ring  최근 이벤트 zset (점수 = 순번, SESSION_EVENT_RING_SIZE개)
+  session_events:pending              DB에 아직 기록하지 않은 이벤트 목록 (persist_pending이 기록)
+
+DB (session_events):
+  SessionEvent - 전체 이벤트 (수업 후 분석/링 버퍼에서 밀려난 이벤트 재전송용)
+
+흐름:
+  브로드캐스트 직전 record / arecord → 순번 부여, 링 버퍼 + pending에 추가 (이벤트에 seq 추가)
+  persist_session_events_task (Celery beat) → persist_pending → SessionEvent bulk_create
+  SessionConsumer 재연결 (?last_seq= 또는 resume 메시지) → since → 놓친 이벤트 재전송
+
+순번은 기록 시점에 정해지고 브로드캐스트는 프로세스마다 따로 나가므로 순번이 뒤바뀌어 도착할 수 있다.
+클라이언트는 뒤 순번을 보관했다가 빈 순번이 오지 않으면 resume으로 다시 받는다 (websocket-client.ts).
+  수업 후 분석 → since(code, 0, limit=0) → rebuild_state
+
+Redis를 사용할 수 없으면 순번 없이 브로드캐스트하고 기록하지 않는다 (기존 동작).
+"""
+import json
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db.models import Max
+from django.utils import timezone
+
+from core.redis import get_async_redis, get_redis
+
+from .models import LectureSession, SessionEvent
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'session_events'
+PENDING_KEY = f'{KEY_PREFIX}:pending'
+
+
+def _keys(session_code: str) -> Dict[str, str]:
+    return {
+        'seq': f'{KEY_PREFIX}:{session_code}:seq',
+        'ring': f'{KEY_PREFIX}:{session_code}:ring',
+    }
+
+
+def _ring_size() -> int:
+    return getattr(settings, 'SESSION_EVENT_RING_SIZE', 1000)
+
+
+def _ttl() -> int:
+    return getattr(settings, 'SESSION_EVENT_LOG_TTL', 86400)
+
+
+def _persisted_max_seq(session_code: str) -> int:
+    return SessionEvent.objects.filter(session__session_code=session_code).aggregate(
+        max_seq=Max('seq')
+    )['max_seq'] or 0
+
+
+def _stamp(session_code: str, event: Dict, seq: int) -> tuple:
+    """이벤트에 순번을 붙이고 (링 버퍼 항목, pending 항목) 반환"""
+    event['seq'] = seq
+    payload = json.dumps(event, ensure_ascii=False, default=str)
+    pending = json.dumps({
+        'session_code': session_code,
+        'seq': seq,
+        'at': timezone.now().isoformat(),
+        'event': payload,
+    }, ensure_ascii=False)
+    return payload, pending
+
+
+def _append(pipe, session_code: str, seq: int, payload: str, pending: str):
+    keys = _keys(session_code)
+    pipe.zadd(keys['ring'], {payload: seq})
+    pipe.zremrangebyrank(keys['ring'], 0, -(_ring_size() + 1))
+    pipe.rpush(PENDING_KEY, pending)
+    pipe.expire(keys['ring'], _ttl())
+    pipe.expire(keys['seq'], _ttl())
+
+
+def record(session_code: str, event: Dict) -> Optional[int]:
+    """
+    세션 그룹에 보낼 이벤트 기록 (event에 seq를 추가)
+
+    Returns:
+        부여한 순번 (Redis를 사용할 수 없으면 None - 순번 없이 브로드캐스트)
+    """
+    keys = _keys(session_code)
+    try:
+        redis = get_redis()
+        seq = redis.incr(keys['seq'])
+        if seq == 1:
+            # 순번 키가 만료/유실된 세션이면 DB에 기록된 순번 다음부터 이어간다
+            persisted = _persisted_max_seq(session_code)
+            if persisted:
+                seq = redis.incrby(keys['seq'], persisted)
+        payload, pending = _stamp(session_code, event, seq)
+        pipe = redis.pipeline()
+        _append(pipe, session_code, seq, payload, pending)
+        pipe.execute()
+        return seq
+    except Exception as e:
+        logger.warning(f"Failed to record {event.get('type')} for session {session_code}: {e}")
+        # 기록하지 못한 순번은 재전송할 수 없으므로 붙이지 않음
+        event.pop('seq', None)
+        return None
+
+
+async def arecord(session_code: str, event: Dict) -> Optional[int]:
+    """record의 비동기 버전 (consumer에서 사용)"""
+    from asgiref.sync import sync_to_async
+
+    keys = _keys(session_code)
+    try:
+        redis = get_async_redis()
+        seq = await redis.incr(keys['seq'])
+        if seq == 1:
+            persisted = await sync_to_async(_persisted_max_seq)(session_code)
+            if persisted:
+                seq = await redis.incrby(keys['seq'], persisted)
+        payload, pending = _stamp(session_code, event, seq)
+        pipe = redis.pipeline()
+        _append(pipe, session_code, seq, payload, pending)
+        await pipe.execute()
+        return seq
+    except Exception as e:
+        logger.warning(f"Failed to record {event.get('type')} for session {session_code}: {e}")
+        # 기록하지 못한 순번은 재전송할 수 없으므로 붙이지 않음
+        event.pop('seq', None)
+        return None
+
+
+def latest_seq(session_code: str) -> int:
+    """세션의 마지막 순번 (기록된 이벤트가 없으면 0)"""
+    try:
+        seq = get_redis().get(_keys(session_code)['seq'])
+        if seq is not None:
+            return int(seq)
+    except Exception as e:
+        logger.warning(f"Event log unavailable for session {session_code}: {e}")
+    return _persisted_max_seq(session_code)
+
+
+def since(session_code: str, last_seq: int, limit: Optional[int] = None) -> Optional[List[Dict]]:
+    """
+    last_seq 이후 이벤트 (순번 순, 링 버퍼 → 밀려난 구간은 DB)
+
+    Args:
+        last_seq: 클라이언트가 마지막으로 받은 순번
+        limit: 최대 개수 (None이면 SESSION_EVENT_REPLAY_MAX, 0이면 제한 없음 - 분석용)
+
+    Returns:
+        이벤트 목록 또는 None (놓친 이벤트가 limit보다 많거나 일부를 찾을 수 없어 전체 재조회가 필요)
+    """
+    if limit is None:
+        limit = getattr(settings, 'SESSION_EVENT_REPLAY_MAX', 500)
+
+    events = []
+    latest = 0
+    try:
+        redis = get_redis()
+        pipe = redis.pipeline()
+        pipe.zrangebyscore(_keys(session_code)['ring'], f'({last_seq}', '+inf')
+        pipe.get(_keys(session_code)['seq'])
+        ring, latest = pipe.execute()
+        events = [json.loads(payload) for payload in ring]
+        latest = int(latest or 0)
+    except Exception as e:
+        logger.warning(f"Event log unavailable for session {session_code}: {e}")
+
+    # 링 버퍼에서 밀려났거나 Redis가 유실된 구간은 DB에서
+    first_in_ring = events[0]['seq'] if events else latest + 1
+    if first_in_ring > last_seq + 1 or not events:
+        missing = SessionEvent.objects.filter(
+            session__session_code=session_code, seq__gt=last_seq
+        ).order_by('seq')
+        if events:
+            missing = missing.filter(seq__lt=first_in_ring)
+        if limit:
+            missing = missing[:limit + 1]
+        persisted = [row.payload for row in missing]
+        if events and len(persisted) != first_in_ring - last_seq - 1:
+            return None
+        events = persisted + events
+
+    if limit and len(events) > limit:
+        return None
+    return events
+
+
+def persist_pending(batch: Optional[int] = None) -> int:
+    """
+    pending 이벤트를 DB에 기록 (Celery beat)
+
+    Returns:
+        기록한 이벤트 수
+    """
+    batch = batch or getattr(settings, 'SESSION_EVENT_PERSIST_BATCH', 1000)
+    redis = get_redis()
+    pipe = redis.pipeline()
+    pipe.lrange(PENDING_KEY, 0, batch - 1)
+    pipe.ltrim(PENDING_KEY, batch, -1)
+    raw, _ = pipe.execute()
+    if not raw:
+        return 0
+
+    try:
+        entries = [json.loads(item) for item in raw]
+        session_ids = dict(LectureSession.objects.filter(
+            session_code__in={entry['session_code'] for entry in entries}
+        ).values_list('session_code', 'id'))
+
+        rows = []
+        for entry in entries:
+            session_id = session_ids.get(entry['session_code'])
+            if session_id is None:
+                continue
+            payload = json.loads(entry['event'])
+            rows.append(SessionEvent(
+                session_id=session_id,
+                seq=entry['seq'],
+                event_type=payload.get('type', ''),
+                payload=payload,
+                created_at=entry['at'],
+            ))
+        # 같은 순번이 이미 있으면(재시도) 건너뜀
+        SessionEvent.objects.bulk_create(rows, batch_size=500, ignore_conflicts=True)
+    except Exception:
+        # 다음 주기에 다시 시도
+        redis.lpush(PENDING_KEY, *reversed(raw))
+        raise
+    return len(rows)
+
+
+def rebuild_state(events: Iterable[Dict]) -> Dict:
+    """
+    이벤트 로그 → 세션 상태 (수업 후 분석용, 추가 조회 없음)
+
+    Returns:
+        Dict containing:
+            - last_seq: 마지막 순번
+            - status: 마지막 세션 상태
+            - current_subtask: 마지막 단계 변경의 단계
+            - step_changes: 단계 변경 [{seq, subtask_id, title}]
+            - participants: device_id/참가자 → {name, completed_subtasks, last_subtask_id}
+            - help_requests: 단계 ID → 도움 요청 수
+            - roster: 입장/퇴장 수
+            - event_counts: 이벤트 종류별 수
+    """
+    state = {
+        'last_seq': 0,
+        'status': None,
+        'current_subtask': None,
+        'step_changes': [],
+        'participants': {},
+        'help_requests': {},
+        'roster': {'joined': 0, 'left': 0},
+        'event_counts': {},
+    }
+
+    def participant(key, name=None):
+        entry = state['participants'].setdefault(str(key), {
+            'name': None, 'completed_subtasks': [], 'last_subtask_id': None,
+        })
+        if name:
+            entry['name'] = name
+        return entry
+
+    for event in events:
+        event_type = event.get('type')
+        state['last_seq'] = max(state['last_seq'], event.get('seq') or 0)
+        state['event_counts'][event_type] = state['event_counts'].get(event_type, 0) + 1
+
+        if event_type == 'session_status_changed':
+            state['status'] = event.get('status')
+        elif event_type == 'step_changed':
+            subtask = event.get('subtask') or {}
+            state['current_subtask'] = subtask
+            state['step_changes'].append({
+                'seq': event.get('seq'), 'subtask_id': subtask.get('id'), 'title': subtask.get('title'),
+            })
+        elif event_type == 'student_completion':
+            entry = participant(event.get('device_id') or event.get('participant_id'), event.get('student_name'))
+            entry['completed_subtasks'] = event.get('completed_subtasks', [])
+            entry['last_subtask_id'] = event.get('subtask_id')
+        elif event_type == 'progress_updated':
+            entry = participant(event.get('device_id') or event.get('user_id'), event.get('user_name'))
+            entry['last_subtask_id'] = event.get('subtask_id')
+        elif event_type == 'help_requested':
+            subtask_id = str(event.get('subtask_id'))
+            state['help_requests'][subtask_id] = state['help_requests'].get(subtask_id, 0) + 1
+        elif event_type == 'help_cluster':
+            # 첫 요청은 help_requested로 이미 셌으므로 나머지만 더한다
+            subtask_id = str(event.get('subtask_id'))
+            state['help_requests'][subtask_id] = (
+                state['help_requests'].get(subtask_id, 0) + max(event.get('count', 1) - 1, 0)
+            )
+        elif event_type == 'roster_diff':
+            state['roster']['joined'] += len(event.get('joined', []))
+            state['roster']['left'] += len(event.get('left', []))
+        elif event_type in ('participant_joined', 'participant_left'):
+            state['roster']['joined' if event_type == 'participant_joined' else 'left'] += 1
+
+    return state
@@ -0,0 +1,148 @@
+"""
+Help Screenshots - 도움 요청 스크린샷을 전용 I/O 스레드 풀에서 저장
+
+도움 요청에 담긴 Base64 스크린샷(수백 KB~수 MB)을 consumer가 database_sync_to_async로 디코딩/저장하면
+그동안 강사 알림이 늦어지고, DB 호출이 써야 할 스레드 풀 자리를 파일 I/O가 차지한다.
+SessionConsumer는 스크린샷 ID만 정해 알림(help_requested, screenshot_pending)을 바로 보내고,
+디코딩/검증/저장은 이 모듈의 작은 스레드 풀(HELP_SCREENSHOT_WORKERS)에서 처리한 뒤
+help_screenshot_ready로 URL을 따로 알린다.
+
+  - 대기 한도: 저장 대기/진행 중인 스크린샷이 HELP_SCREENSHOT_MAX_PENDING개를 넘으면 새 스크린샷은 버림
+  - 검증: Base64 형식, 디코딩 크기(HELP_SCREENSHOT_MAX_BYTES), 이미지 형식(JPEG/PNG/WebP 시그니처)
+  - 저장 위치: MEDIA_ROOT/help_screenshots/YYYY/MM/DD/help_request_{스크린샷 ID}.{확장자}
+"""
+import asyncio
+import base64
+import binascii
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# 파일 시그니처 → 확장자
+_IMAGE_SIGNATURES = (
+    (b'\xff\xd8\xff', 'jpg'),
+    (b'\x89PNG\r\n\x1a\n', 'png'),
+)
+
+_executor = None
+_executor_lock = threading.Lock()
+_pending = 0
+_pending_lock = threading.Lock()
+
+
+def new_screenshot_id() -> str:
+    return uuid.uuid4().hex
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'HELP_SCREENSHOT_WORKERS', 2),
+                thread_name_prefix='help-screenshot',
+            )
+        return _executor
+
+
+def _image_extension(image_data: bytes) -> Optional[str]:
+    for signature, extension in _IMAGE_SIGNATURES:
+        if image_data.startswith(signature):
+            return extension
+    if image_data[:4] == b'RIFF' and image_data[8:12] == b'WEBP':
+        return 'webp'
+    return None
+
+
+def decode(base64_image: str) -> bytes:
+    """
+    Base64 스크린샷 디코딩 및 검증
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 너무 크거나 이미지가 아닌 경우
+    """
+    if ',' in base64_image:
+        # data:image/jpeg;base64,... 형식인 경우
+        base64_image = base64_image.split(',', 1)[1]
+
+    max_bytes = getattr(settings, 'HELP_SCREENSHOT_MAX_BYTES', 5 * 1024 * 1024)
+    # 디코딩 전에 길이로 먼저 거름 (Base64는 3바이트 → 4문자)
+    if len(base64_image) > (max_bytes + 2) // 3 * 4 + 4:
+        raise ValueError('screenshot too large')
+    try:
+        image_data = base64.b64decode(base64_image, validate=True)
+    except (binascii.Error, ValueError):
+        raise ValueError('invalid base64')
+    if len(image_data) > max_bytes:
+        raise ValueError('screenshot too large')
+    if _image_extension(image_data) is None:
+        raise ValueError('unsupported image format')
+    return image_data
+
+
+def store(screenshot_id: str, base64_image: str) -> str:
+    """
+    스크린샷 디코딩/검증 후 MEDIA_ROOT에 저장하고 URL 반환 (동기 - 전용 스레드 풀에서 실행)
+
+    Raises:
+        ValueError: 검증 실패
+        OSError: 저장 실패
+    """
+    image_data = decode(base64_image)
+    filename = f"help_request_{screenshot_id}.{_image_extension(image_data)}"
+
+    # 저장 경로 설정 (날짜별 디렉토리)
+    today = date.today()
+    relative_path = f"help_screenshots/{today.year}/{today.month:02d}/{today.day:02d}"
+    full_dir = os.path.join(settings.MEDIA_ROOT, relative_path)
+    os.makedirs(full_dir, exist_ok=True)
+
+    with open(os.path.join(full_dir, filename), 'wb') as f:
+        f.write(image_data)
+
+    # settings.MEDIA_URL이 이미 '/'로 시작하므로 중복 슬래시 방지
+    media_url = settings.MEDIA_URL.rstrip('/')
+    url = f"{media_url}/{relative_path}/{filename}"
+    logger.info(f"[help_screenshots] Saved: {url}, size={len(image_data)}bytes")
+    return url
+
+
+def try_reserve() -> bool:
+    """저장 자리 확보 (대기 한도를 넘으면 False - 호출 측은 스크린샷 없이 진행)"""
+    global _pending
+    with _pending_lock:
+        if _pending >= getattr(settings, 'HELP_SCREENSHOT_MAX_PENDING', 32):
+            return False
+        _pending += 1
+        return True
+
+
+def _release():
+    global _pending
+    with _pending_lock:
+        _pending -= 1
+
+
+async def store_async(screenshot_id: str, base64_image: str) -> Optional[str]:
+    """
+    전용 스레드 풀에서 store 실행 (try_reserve로 자리를 확보한 뒤 호출)
+
+    Returns:
+        저장된 이미지 URL 또는 None (검증/저장 실패 시)
+    """
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), store, screenshot_id, base64_image)
+    except (ValueError, OSError) as e:
+        logger.warning(f"[help_screenshots] Rejected screenshot {screenshot_id}: {e}")
+        return None
+    finally:
+        _release()
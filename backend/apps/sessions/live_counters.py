@@ -0,0 +1,179 @@
+"""
+Session Live Counters - 세션 참가자 상태 그룹을 Redis에서 O(1)로 집계
+
+강사 대시보드가 진도 통계를 자주 폴링하므로, 참가자를 매번 조회하지 않고
+입장/하트비트/완료/연결 해제 시점에 Redis 카운터를 갱신한다.
+
+Redis 구조 (session_live:{session_id}:*):
+  ready      카운터가 DB 기준으로 초기화되었는지 표시 (없으면 다음 조회 때 rebuild)
+  members    참가자 키 → 현재 상태
+  counts     상태 → 참가자 수
+  active_at  진행 중 참가자(ACTIVE/DISCONNECTED) → 마지막 활동 시각 (지연 판정은 ZCOUNT)
+
+참가자 키는 device_id가 있으면 device:{device_id}, 없으면 user:{user_id}.
+호출 측은 참가자의 device_id를 항상 함께 넘겨야 한다 (user_id만 넘기면 같은 참가자가 두 번 세어짐).
+Redis를 사용할 수 없으면 모든 함수가 조용히 실패하고, 조회 측은 DB 집계로 대체한다.
+"""
+import logging
+import time
+from typing import Dict, Optional
+
+from django.conf import settings
+
+from core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# 지연 판정 대상 상태 (대기/완료가 아닌 참가자)
+TRACKED_STATUSES = ('ACTIVE', 'DISCONNECTED')
+
+# 이전 상태를 읽어 카운터를 옮기는 작업을 원자적으로 처리
+_SET_STATUS_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+local old = redis.call('HGET', KEYS[2], ARGV[1])
+if old ~= ARGV[2] then
+    redis.call('HSET', KEYS[2], ARGV[1], ARGV[2])
+    if old then
+        redis.call('HINCRBY', KEYS[3], old, -1)
+    end
+    redis.call('HINCRBY', KEYS[3], ARGV[2], 1)
+end
+if ARGV[4] == '1' then
+    redis.call('ZADD', KEYS[4], ARGV[3], ARGV[1])
+else
+    redis.call('ZREM', KEYS[4], ARGV[1])
+end
+return 1
+"""
+
+
+def _keys(session_id: int) -> Dict[str, str]:
+    prefix = f'session_live:{session_id}'
+    return {
+        'ready': f'{prefix}:ready',
+        'members': f'{prefix}:members',
+        'counts': f'{prefix}:counts',
+        'active_at': f'{prefix}:active_at',
+    }
+
+
+def participant_key(device_id: Optional[str] = None, user_id: Optional[int] = None) -> str:
+    if device_id:
+        return f'device:{device_id}'
+    return f'user:{user_id}'
+
+
+def set_status(session_id: int, status: str, device_id: Optional[str] = None, user_id: Optional[int] = None):
+    """참가자 상태 변경 반영 (입장, 완료, 연결 해제)"""
+    keys = _keys(session_id)
+    try:
+        get_redis().eval(
+            _SET_STATUS_SCRIPT, 4,
+            keys['ready'], keys['members'], keys['counts'], keys['active_at'],
+            participant_key(device_id, user_id), status, time.time(),
+            '1' if status in TRACKED_STATUSES else '0',
+        )
+    except Exception as e:
+        logger.warning(f"Failed to update live counters for session {session_id}: {e}")
+
+
+def touch(session_id: int, device_id: Optional[str] = None, user_id: Optional[int] = None):
+    """진행 중 참가자의 마지막 활동 시각 갱신 (하트비트, 단계 완료)"""
+    try:
+        get_redis().zadd(
+            _keys(session_id)['active_at'],
+            {participant_key(device_id, user_id): time.time()},
+            xx=True,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to update live counters for session {session_id}: {e}")
+
+
+def invalidate(session_id: int):
+    """대량 상태 변경(queryset.update) 후 호출 - 다음 조회 때 DB 기준으로 다시 만든다"""
+    try:
+        get_redis().delete(*_keys(session_id).values())
+    except Exception as e:
+        logger.warning(f"Failed to invalidate live counters for session {session_id}: {e}")
+
+
+def rebuild(session_id: int) -> bool:
+    """참가자 상태로 카운터 초기화 (수업 중이면 Redis 실시간 상태, 아니면 DB)"""
+    from apps.sessions import live_state
+    from apps.sessions.models import SessionParticipant
+
+    participants = live_state.list_participants(session_id, load=False)
+    if participants is not None:
+        rows = [
+            {'device_id': p.device_id, 'user_id': p.user_id, 'status': p.status, 'last_active_at': p.last_active_at}
+            for p in participants
+        ]
+    else:
+        rows = SessionParticipant.objects.filter(session_id=session_id).values(
+            'device_id', 'user_id', 'status', 'last_active_at'
+        )
+
+    keys = _keys(session_id)
+    members, counts, active_at = {}, {}, {}
+    for row in rows:
+        key = participant_key(row['device_id'], row['user_id'])
+        members[key] = row['status']
+        counts[row['status']] = counts.get(row['status'], 0) + 1
+        if row['status'] in TRACKED_STATUSES:
+            active_at[key] = row['last_active_at'].timestamp() if row['last_active_at'] else time.time()
+
+    ttl = getattr(settings, 'SESSION_LIVE_COUNTERS_TTL', 21600)
+    try:
+        pipe = get_redis().pipeline()
+        pipe.delete(*keys.values())
+        if members:
+            pipe.hset(keys['members'], mapping=members)
+            pipe.hset(keys['counts'], mapping=counts)
+        if active_at:
+            pipe.zadd(keys['active_at'], active_at)
+        pipe.set(keys['ready'], 1)
+        for key in keys.values():
+            pipe.expire(key, ttl)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to rebuild live counters for session {session_id}: {e}")
+        return False
+    return True
+
+
+def get_counts(session_id: int, delay_seconds: int) -> Optional[Dict[str, int]]:
+    """
+    상태 그룹별 참가자 수 조회
+
+    Args:
+        session_id: LectureSession ID
+        delay_seconds: 마지막 활동 후 이 시간이 지나면 지연으로 분류
+
+    Returns:
+        total / completed / in_progress / delayed / not_started 또는 None (초기화 전, Redis 장애)
+    """
+    keys = _keys(session_id)
+    try:
+        pipe = get_redis().pipeline()
+        pipe.exists(keys['ready'])
+        pipe.hgetall(keys['counts'])
+        pipe.zcount(keys['active_at'], '-inf', f'({time.time() - delay_seconds}')
+        ready, counts, delayed = pipe.execute()
+    except Exception as e:
+        logger.warning(f"Live counters unavailable for session {session_id}: {e}")
+        return None
+
+    if not ready:
+        return None
+
+    counts = {status: int(count) for status, count in counts.items()}
+    tracked = sum(counts.get(status, 0) for status in TRACKED_STATUSES)
+    return {
+        'total': sum(counts.values()),
+        'completed': counts.get('COMPLETED', 0),
+        'in_progress': tracked - delayed,
+        'delayed': delayed,
+        'not_started': counts.get('WAITING', 0),
+    }
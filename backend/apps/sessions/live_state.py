@@ -0,0 +1,674 @@
+"""
+Session Live State - 진행 중 세션의 실시간 상태를 Redis에 두고 DB에는 나중에 기록 (write-behind)
+
+수업 중에는 세션 현재 단계와 참가자 상태/현재 단계/완료 목록/마지막 활동 시각이 계속 바뀌는데,
+비동기 consumer에서 변경마다 동기 ORM 쓰기를 하면 DB 연결과 행 잠금이 병목이 된다.
+세션이 진행 중(IN_PROGRESS/PAUSED)인 동안은 참가자 상태를 Redis를 기준 데이터로 삼고, 변경은 세션별
+스트림에 순서대로 남겨 flush_live_session_state_task가 주기적으로 session_participants에 반영한다.
+세션 필드(상태/현재 단계/강의)는 강사 조작으로만 바뀌므로 지금처럼 DB에 바로 저장하고 Redis에는 복사만 한다.
+
+Redis 구조 (session_state:{session_id}:*):
+  meta          세션 hash (status, current_subtask_id, lecture_id, session_code) - 있으면 실시간 상태 사용 중
+  participants  참가자 ID set
+  p:{id}        참가자 hash (SessionParticipant 필드)
+  done:{id}     완료한 단계 zset (점수 = 완료 순서)
+  devices       device_id → 참가자 ID
+  users         user_id → 참가자 ID
+  changes       참가자 변경 스트림 (id=참가자 ID, k=t 활동 시각만 / k=c 그 밖의 변경)
+  off           실시간 상태를 쓰지 않는 세션 표시 (짧은 TTL, 호출마다 DB를 확인하지 않도록)
+  flush_lock    flush 중복 실행 방지
+session_state:live  실시간 상태를 쓰는 세션 ID set (주기 flush 대상)
+
+흐름:
+  SessionStartView → activate (DB → Redis 적재, 이후에는 필요할 때 ensure_live가 다시 적재)
+  쓰기: get_participant(...) → 속성 변경 → save(), update_participants
+  세션 저장 (post_save) → sync_session (Redis에 복사, 진행 중이 아니게 되면 reconcile)
+  flush (주기 태스크) → 스트림을 순서대로 읽어 바뀐 참가자를 DB에 일괄 기록 → 조회 버전(ETag) 증가
+  SessionEndView → reconcile (전체 참가자를 DB에 맞춘 뒤 Redis 상태 삭제)
+      - 다른 flush가 잠금을 계속 잡고 있으면 아무것도 지우지 않고 reconcile_live_state_task로 다시 시도
+
+조회 버전은 DB에 기록한 뒤에 올린다 (DB를 읽는 조회 API가 이전 데이터에 새 ETag를 붙이지 않도록).
+Redis를 사용할 수 없으면 조회 함수는 None을 반환하고 호출 측은 기존 ORM 경로를 사용한다.
+"""
+import json
+import logging
+import time
+import uuid
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from redis.exceptions import WatchError
+
+from core.redis import get_redis
+
+from . import versions
+from .models import LectureSession, SessionParticipant
+
+logger = logging.getLogger(__name__)
+
+# 실시간 상태를 쓰는 세션 상태
+LIVE_STATUSES = ('IN_PROGRESS', 'PAUSED')
+
+LIVE_SESSIONS_KEY = 'session_state:live'
+
+# 참가자 hash 필드 (완료 목록은 done zset)
+PARTICIPANT_FIELDS = (
+    'id', 'device_id', 'user_id', 'user_name', 'display_name', 'status', 'current_subtask_id',
+    'last_completed_at', 'last_active_at', 'joined_at', 'completed_at',
+)
+# 참가자가 바꿀 수 있는 필드 (save에서 비교, flush에서 DB에 기록)
+WRITABLE_FIELDS = (
+    'display_name', 'status', 'current_subtask_id', 'completed_subtasks',
+    'last_completed_at', 'last_active_at', 'completed_at',
+)
+SESSION_FIELDS = ('status', 'current_subtask_id', 'lecture_id', 'session_code')
+
+_INT_FIELDS = {'id', 'user_id', 'current_subtask_id', 'lecture_id'}
+_DATETIME_FIELDS = {'last_completed_at', 'last_active_at', 'joined_at', 'completed_at'}
+_NULLABLE_FIELDS = _INT_FIELDS | _DATETIME_FIELDS | {'device_id', 'user_name'}
+
+# 실시간 상태를 쓰지 않는 세션 표시 유지 시간 (초)
+OFF_TTL = 5
+# 변경 스트림 최대 길이 (근사)
+CHANGES_MAXLEN = 100000
+# flush 잠금 유지 시간 (초) / flush가 잠겨 있어 미룬 reconcile의 재시도 간격 (초)
+FLUSH_LOCK_TTL = 30
+RECONCILE_RETRY_DELAY = 5
+
+# 참가자 추가 (이미 DB에 있는 참가자이므로 변경 스트림에 남기지 않음)
+_ADD_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('DEL', KEYS[5], KEYS[6])
+redis.call('HSET', KEYS[5], unpack(cjson.decode(ARGV[2])))
+for i, id in ipairs(cjson.decode(ARGV[3])) do
+    redis.call('ZADD', KEYS[6], i, id)
+end
+redis.call('SADD', KEYS[2], ARGV[1])
+if ARGV[4] ~= '' then
+    redis.call('HSET', KEYS[3], ARGV[4], ARGV[1])
+end
+if ARGV[5] ~= '' then
+    redis.call('HSET', KEYS[4], ARGV[5], ARGV[1])
+end
+for i = 2, 6 do
+    redis.call('EXPIRE', KEYS[i], ARGV[6])
+end
+return 1
+"""
+
+# 참가자 변경 + 변경 스트림 기록 (실시간 상태가 아니거나 참가자가 없으면 -1)
+_UPDATE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 or redis.call('EXISTS', KEYS[2]) == 0 then
+    return -1
+end
+local fields = cjson.decode(ARGV[2])
+if #fields > 0 then
+    redis.call('HSET', KEYS[2], unpack(fields))
+end
+local changed = 0
+for _, op in ipairs(cjson.decode(ARGV[3])) do
+    if op[1] == '=' then
+        redis.call('DEL', KEYS[3])
+        for i, id in ipairs(op[2]) do
+            redis.call('ZADD', KEYS[3], i, id)
+        end
+        changed = changed + 1
+    elseif op[1] == '+' then
+        changed = changed + redis.call('ZADD', KEYS[3], 'NX', op[3], op[2])
+    else
+        changed = changed + redis.call('ZREM', KEYS[3], op[2])
+    end
+end
+redis.call('EXPIRE', KEYS[2], ARGV[4])
+redis.call('EXPIRE', KEYS[3], ARGV[4])
+redis.call('XADD', KEYS[4], 'MAXLEN', '~', ARGV[6], '*', 'id', ARGV[1], 'k', ARGV[5])
+return changed
+"""
+
+# 세션 필드 복사 (적재된 경우만)
+_SESSION_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[1], unpack(cjson.decode(ARGV[1])))
+return 1
+"""
+
+
+def _keys(session_id: int) -> Dict[str, str]:
+    prefix = f'session_state:{session_id}'
+    return {
+        'meta': f'{prefix}:meta',
+        'participants': f'{prefix}:participants',
+        'devices': f'{prefix}:devices',
+        'users': f'{prefix}:users',
+        'changes': f'{prefix}:changes',
+        'off': f'{prefix}:off',
+        'flush_lock': f'{prefix}:flush_lock',
+    }
+
+
+def _participant_keys(session_id: int, participant_id) -> Dict[str, str]:
+    prefix = f'session_state:{session_id}'
+    return {'hash': f'{prefix}:p:{participant_id}', 'done': f'{prefix}:done:{participant_id}'}
+
+
+def _ttl() -> int:
+    return getattr(settings, 'SESSION_LIVE_STATE_TTL', 43200)
+
+
+def _encode(value) -> str:
+    if value is None:
+        return ''
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+def _flatten(fields: Dict) -> str:
+    """Lua HSET 인자용 [필드, 값, ...] JSON"""
+    flat = []
+    for field, value in fields.items():
+        flat.extend([field, _encode(value)])
+    return json.dumps(flat)
+
+
+def _decode(field: str, raw: Optional[str]):
+    if raw is None or (raw == '' and field in _NULLABLE_FIELDS):
+        return None
+    if field in _INT_FIELDS:
+        return int(raw)
+    if field in _DATETIME_FIELDS:
+        return parse_datetime(raw)
+    return raw
+
+
+def _decode_subtask_id(raw: str):
+    try:
+        return int(raw)
+    except ValueError:
+        return raw
+
+
+class LiveParticipant:
+    """
+    Redis 실시간 상태의 참가자 (SessionParticipant와 같은 속성)
+
+    save()는 바뀐 필드만 Redis에 기록하고 변경 스트림에 남긴다 (DB 기록은 flush).
+    완료 목록은 읽은 시점과 비교해 추가/제거한 단계만 보내므로, 같은 참가자를 동시에 읽어
+    저장한 요청(consumer step_complete, REST report-completion)의 완료가 서로 덮어쓰이지 않는다.
+    그 사이 세션이 종료되어 실시간 상태가 없어졌으면 DB에 바로 기록한다.
+    """
+
+    def __init__(self, session_id: int, data: Dict[str, str], completed: List[str]):
+        self.session_id = session_id
+        for field in PARTICIPANT_FIELDS:
+            setattr(self, field, _decode(field, data.get(field)))
+        self.completed_subtasks = [_decode_subtask_id(raw) for raw in completed]
+        self._loaded = self._values()
+
+    def __repr__(self):
+        return f'<LiveParticipant {self.id} session={self.session_id} status={self.status}>'
+
+    @property
+    def pk(self):
+        return self.id
+
+    @property
+    def participant_name(self):
+        return self.display_name or self.user_name or '익명'
+
+    @property
+    def current_subtask(self):
+        from apps.tasks.models import Subtask
+
+        if not self.current_subtask_id:
+            return None
+        return Subtask.objects.filter(pk=self.current_subtask_id).first()
+
+    def _values(self) -> Dict:
+        values = {field: getattr(self, field) for field in WRITABLE_FIELDS}
+        values['completed_subtasks'] = list(values['completed_subtasks'] or [])
+        return values
+
+    def save(self):
+        """바뀐 필드 기록 (SessionParticipant.save()처럼 last_active_at도 현재 시각으로 갱신)"""
+        self.last_active_at = timezone.now()
+        current = self._values()
+        changed = {
+            field: value for field, value in current.items()
+            if field != 'completed_subtasks' and value != self._loaded[field]
+        }
+        loaded_completed = set(self._loaded['completed_subtasks'])
+        current_completed = set(current['completed_subtasks'])
+        ops = [['-', str(subtask_id)] for subtask_id in self._loaded['completed_subtasks']
+               if subtask_id not in current_completed]
+        # 점수 = 완료 시각 (적재 시의 순번보다 크므로 완료 순서 유지)
+        score = time.time()
+        ops.extend(['+', str(subtask_id), score] for subtask_id in current['completed_subtasks']
+                   if subtask_id not in loaded_completed)
+        kind = 'c' if ops or set(changed) - {'last_active_at'} else 't'
+
+        keys = _keys(self.session_id)
+        participant_keys = _participant_keys(self.session_id, self.id)
+        try:
+            result = get_redis().eval(
+                _UPDATE_SCRIPT, 4,
+                keys['meta'], participant_keys['hash'], participant_keys['done'], keys['changes'],
+                self.id, _flatten(changed), json.dumps(ops), _ttl(), kind, CHANGES_MAXLEN,
+            )
+        except Exception as e:
+            logger.warning(f"Live state write failed for participant {self.id}: {e}")
+            result = -1
+
+        if result == -1:
+            self._save_to_db(current)
+        self._loaded = current
+
+    def _save_to_db(self, values: Dict):
+        SessionParticipant.objects.filter(pk=self.id).update(**values)
+        versions.bump(self.session_id, [self.user_id])
+
+
+# ==================== 적재 / 상태 확인 ====================
+
+def activate(session_id: int) -> bool:
+    """
+    DB의 세션/참가자를 Redis에 적재 (이미 적재되어 있으면 그대로 사용)
+
+    Returns:
+        실시간 상태를 쓰게 되었으면 True (세션이 진행 중이 아니거나 Redis 장애면 False)
+    """
+    keys = _keys(session_id)
+    try:
+        redis = get_redis()
+        session = LectureSession.objects.filter(pk=session_id).values(*SESSION_FIELDS).first()
+        if session is None or session['status'] not in LIVE_STATUSES:
+            redis.set(keys['off'], 1, ex=OFF_TTL)
+            return False
+
+        rows = SessionParticipant.objects.filter(session_id=session_id).values(
+            *(field for field in PARTICIPANT_FIELDS if field != 'user_name'),
+            'user__name', 'completed_subtasks',
+        )
+
+        ttl = _ttl()
+        with redis.pipeline() as pipe:
+            pipe.watch(keys['meta'])
+            if pipe.exists(keys['meta']):
+                return True
+            pipe.multi()
+            pipe.delete(keys['participants'], keys['devices'], keys['users'], keys['off'])
+            pipe.hset(keys['meta'], mapping={field: _encode(session[field]) for field in SESSION_FIELDS})
+            for row in rows:
+                row['user_name'] = row.pop('user__name')
+                completed = row.pop('completed_subtasks') or []
+                participant_keys = _participant_keys(session_id, row['id'])
+                pipe.delete(participant_keys['hash'], participant_keys['done'])
+                pipe.hset(participant_keys['hash'], mapping={field: _encode(value) for field, value in row.items()})
+                if completed:
+                    pipe.zadd(participant_keys['done'], {
+                        str(subtask_id): index for index, subtask_id in enumerate(completed)
+                    })
+                pipe.expire(participant_keys['hash'], ttl)
+                pipe.expire(participant_keys['done'], ttl)
+                pipe.sadd(keys['participants'], row['id'])
+                if row['device_id']:
+                    pipe.hset(keys['devices'], row['device_id'], row['id'])
+                if row['user_id']:
+                    pipe.hset(keys['users'], row['user_id'], row['id'])
+            for name in ('meta', 'participants', 'devices', 'users', 'changes'):
+                pipe.expire(keys[name], ttl)
+            pipe.sadd(LIVE_SESSIONS_KEY, session_id)
+            pipe.execute()
+    except WatchError:
+        # 동시에 다른 요청이 적재함
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to activate live state for session {session_id}: {e}")
+        return False
+
+    logger.info(f"Live state activated for session {session_id}")
+    return True
+
+
+def ensure_live(session_id: int) -> bool:
+    """실시간 상태 사용 여부 (진행 중인데 적재되지 않았으면 적재)"""
+    keys = _keys(session_id)
+    try:
+        pipe = get_redis().pipeline()
+        pipe.exists(keys['meta'])
+        pipe.exists(keys['off'])
+        live, off = pipe.execute()
+    except Exception as e:
+        logger.warning(f"Live state unavailable for session {session_id}: {e}")
+        return False
+
+    if live:
+        return True
+    if off:
+        return False
+    return activate(session_id)
+
+
+# ==================== 조회 ====================
+
+def get_session(session_id: int) -> Optional[Dict]:
+    """실시간 세션 필드 (status, current_subtask_id, lecture_id, session_code) - 적재 전이면 None"""
+    try:
+        raw = get_redis().hgetall(_keys(session_id)['meta'])
+    except Exception as e:
+        logger.warning(f"Live state unavailable for session {session_id}: {e}")
+        return None
+    if not raw:
+        return None
+    return {field: _decode(field, raw.get(field)) for field in SESSION_FIELDS}
+
+
+def _load_participants(session_id: int, participant_ids: Iterable) -> List[LiveParticipant]:
+    participant_ids = list(participant_ids)
+    pipe = get_redis().pipeline()
+    for participant_id in participant_ids:
+        participant_keys = _participant_keys(session_id, participant_id)
+        pipe.hgetall(participant_keys['hash'])
+        pipe.zrange(participant_keys['done'], 0, -1)
+    results = pipe.execute()
+
+    participants = []
+    for index in range(len(participant_ids)):
+        data, completed = results[index * 2], results[index * 2 + 1]
+        if data:
+            participants.append(LiveParticipant(session_id, data, completed))
+    return participants
+
+
+def get_participant(
+    session_id: int,
+    device_id: Optional[str] = None,
+    user_id: Optional[int] = None,
+) -> Optional[LiveParticipant]:
+    """
+    실시간 상태의 참가자 조회 (device_id 우선)
+
+    Returns:
+        LiveParticipant 또는 None (실시간 상태가 아니거나 참가자가 없으면 - 호출 측은 DB 조회)
+    """
+    if not (device_id or user_id) or not ensure_live(session_id):
+        return None
+
+    keys = _keys(session_id)
+    try:
+        redis = get_redis()
+        participant_id = None
+        if device_id:
+            participant_id = redis.hget(keys['devices'], device_id)
+        if participant_id is None and user_id:
+            participant_id = redis.hget(keys['users'], user_id)
+        if participant_id is None:
+            return None
+        participants = _load_participants(session_id, [participant_id])
+    except Exception as e:
+        logger.warning(f"Live state unavailable for session {session_id}: {e}")
+        return None
+    return participants[0] if participants else None
+
+
+def list_participants(session_id: int, load: bool = True) -> Optional[List[LiveParticipant]]:
+    """
+    실시간 상태의 전체 참가자 (ID 순)
+
+    Args:
+        load: 적재되지 않은 진행 중 세션이면 적재 (False면 적재된 경우만)
+
+    Returns:
+        참가자 목록 또는 None (실시간 상태가 아니면 - 호출 측은 DB 조회)
+    """
+    keys = _keys(session_id)
+    try:
+        if load:
+            if not ensure_live(session_id):
+                return None
+        elif not get_redis().exists(keys['meta']):
+            return None
+        participant_ids = sorted(int(pid) for pid in get_redis().smembers(keys['participants']))
+        return _load_participants(session_id, participant_ids)
+    except Exception as e:
+        logger.warning(f"Live state unavailable for session {session_id}: {e}")
+        return None
+
+
+# ==================== 쓰기 ====================
+
+def add_participant(participant) -> bool:
+    """DB에 새로 만든 참가자를 실시간 상태에 추가 (실시간 상태가 아니면 무시)"""
+    keys = _keys(participant.session_id)
+    participant_keys = _participant_keys(participant.session_id, participant.id)
+    fields = {field: getattr(participant, field, None) for field in PARTICIPANT_FIELDS if field != 'user_name'}
+    fields['user_name'] = participant.user.name if participant.user_id else None
+    try:
+        return bool(get_redis().eval(
+            _ADD_SCRIPT, 6,
+            keys['meta'], keys['participants'], keys['devices'], keys['users'],
+            participant_keys['hash'], participant_keys['done'],
+            participant.id, _flatten(fields),
+            json.dumps([str(subtask_id) for subtask_id in participant.completed_subtasks or []]),
+            participant.device_id or '', participant.user_id or '', _ttl(),
+        ))
+    except Exception as e:
+        logger.warning(f"Failed to add participant {participant.id} to live state: {e}")
+        return False
+
+
+def remove_participant(participant):
+    """삭제된 참가자를 실시간 상태에서 제거"""
+    keys = _keys(participant.session_id)
+    try:
+        pipe = get_redis().pipeline()
+        pipe.srem(keys['participants'], participant.id)
+        if participant.device_id:
+            pipe.hdel(keys['devices'], participant.device_id)
+        if participant.user_id:
+            pipe.hdel(keys['users'], participant.user_id)
+        pipe.delete(*_participant_keys(participant.session_id, participant.id).values())
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to remove participant {participant.id} from live state: {e}")
+
+
+def sync_session(session):
+    """
+    DB에 저장된 세션 필드를 실시간 상태에 복사 (LectureSession post_save)
+
+    진행 중이 아닌 상태로 바뀌었으면 커밋 후 reconcile로 실시간 상태를 정리한다.
+    """
+    if session.status not in LIVE_STATUSES:
+        transaction.on_commit(lambda: reconcile(session.id))
+        return
+
+    try:
+        get_redis().eval(_SESSION_SCRIPT, 1, _keys(session.id)['meta'], _flatten({
+            'status': session.status,
+            'current_subtask_id': session.current_subtask_id,
+            'lecture_id': session.lecture_id,
+        }))
+    except Exception as e:
+        logger.warning(f"Live state write failed for session {session.id}: {e}")
+
+
+def update_participants(session_id: int, statuses: Iterable[str], **fields) -> Optional[int]:
+    """
+    지정한 상태의 참가자 일괄 변경 (queryset.update 대신)
+
+    Returns:
+        변경한 참가자 수 또는 None (실시간 상태가 아니면 - 호출 측이 DB에 기록)
+    """
+    participants = list_participants(session_id)
+    if participants is None:
+        return None
+
+    statuses = set(statuses)
+    targets = [participant for participant in participants if participant.status in statuses]
+    for participant in targets:
+        for field, value in fields.items():
+            setattr(participant, field, value)
+        participant.save()
+    return len(targets)
+
+
+# ==================== DB 기록 ====================
+
+def _write_participants(participants: List[LiveParticipant]):
+    rows = [
+        SessionParticipant(id=participant.id, session_id=participant.session_id, **participant._values())
+        for participant in participants
+    ]
+    fields = [field.replace('_id', '') if field == 'current_subtask_id' else field for field in WRITABLE_FIELDS]
+    try:
+        with transaction.atomic():
+            SessionParticipant.objects.bulk_update(rows, fields, batch_size=500)
+    except IntegrityError:
+        # 그 사이 삭제된 단계를 가리키는 참가자가 있으면 한 명씩 기록하고 실패한 참가자는 건너뜀
+        for row in rows:
+            try:
+                with transaction.atomic():
+                    SessionParticipant.objects.bulk_update([row], fields)
+            except IntegrityError as e:
+                logger.error(f"Failed to persist live state of participant {row.id}: {e}")
+
+
+def flush(session_id: int, full: bool = False) -> Optional[int]:
+    """
+    변경 스트림을 순서대로 읽어 바뀐 참가자를 DB에 기록
+
+    Args:
+        full: 스트림과 관계없이 전체 참가자를 기록 (종료 시 최종 정리)
+
+    Returns:
+        기록한 참가자 수 또는 None (다른 flush가 실행 중)
+    """
+    keys = _keys(session_id)
+    redis = get_redis()
+    token = uuid.uuid4().hex
+    if not redis.set(keys['flush_lock'], token, nx=True, ex=FLUSH_LOCK_TTL):
+        return None
+
+    try:
+        batch = getattr(settings, 'SESSION_LIVE_STATE_FLUSH_BATCH', 5000)
+        entries = redis.xrange(keys['changes'], count=None if full else batch)
+
+        # 참가자 ID → 활동 시각 외의 변경 여부 (스트림 순서대로 합침)
+        participant_ids = {}
+        for _, entry in entries:
+            participant_id = int(entry['id'])
+            participant_ids[participant_id] = participant_ids.get(participant_id, False) or entry.get('k') == 'c'
+        if full:
+            for participant_id in redis.smembers(keys['participants']):
+                participant_ids.setdefault(int(participant_id), True)
+        if not participant_ids:
+            return 0
+
+        participants = _load_participants(session_id, participant_ids)
+        if participants:
+            _write_participants(participants)
+        if entries:
+            redis.xdel(keys['changes'], *[entry_id for entry_id, _ in entries])
+
+        # 활동 시각만 바뀐 경우(하트비트)는 버전을 올리지 않는다
+        changed_users = [p.user_id for p in participants if participant_ids.get(p.id)]
+        if any(participant_ids.values()):
+            versions.bump(session_id, changed_users)
+        return len(participants)
+    finally:
+        if redis.get(keys['flush_lock']) == token:
+            redis.delete(keys['flush_lock'])
+
+
+def flush_all() -> Dict[int, Optional[int]]:
+    """실시간 상태를 쓰는 모든 세션 flush (주기 태스크)"""
+    redis = get_redis()
+    results = {}
+    for session_id in redis.smembers(LIVE_SESSIONS_KEY):
+        session_id = int(session_id)
+        if not redis.exists(_keys(session_id)['meta']) and not redis.exists(_keys(session_id)['changes']):
+            redis.srem(LIVE_SESSIONS_KEY, session_id)
+            continue
+        try:
+            results[session_id] = flush(session_id)
+        except Exception as e:
+            logger.error(f"Live state flush failed for session {session_id}: {e}")
+    return results
+
+
+def _flush_waiting(session_id: int, full: bool, timeout: float = 5.0) -> Optional[int]:
+    deadline = time.monotonic() + timeout
+    while True:
+        result = flush(session_id, full=full)
+        if result is not None or time.monotonic() > deadline:
+            return result
+        time.sleep(0.05)
+
+
+def _postpone_reconcile(session_id: int, retry: bool) -> None:
+    logger.warning(f"Live state flush for session {session_id} is still locked, postponing reconcile")
+    if retry:
+        from .tasks import reconcile_live_state_task
+
+        try:
+            reconcile_live_state_task.apply_async(args=[session_id], countdown=RECONCILE_RETRY_DELAY)
+        except Exception as e:
+            logger.error(f"Failed to schedule live state reconcile for session {session_id}: {e}")
+    return None
+
+
+def reconcile(session_id: int, retry: bool = True) -> Optional[bool]:
+    """
+    세션 종료 시 최종 정리 - 전체 참가자를 DB에 기록하고 Redis 상태 삭제
+
+    flush가 실제로 실행된 뒤에만 Redis 상태를 지운다. 다른 flush가 잠금을 놓지 않으면
+    아무것도 지우지 않고 미룬다 (다시 호출하면 남은 단계부터 이어서 정리).
+
+    Args:
+        retry: 미룬 경우 reconcile_live_state_task로 다시 시도 (태스크 안에서는 False)
+
+    Returns:
+        True 정리함 / False 실시간 상태가 아니었음 / None 미룸
+    """
+    keys = _keys(session_id)
+    try:
+        redis = get_redis()
+        live = redis.exists(keys['meta'])
+        if not live and not redis.exists(keys['participants']):
+            return False
+
+        if live:
+            if _flush_waiting(session_id, full=True) is None:
+                return _postpone_reconcile(session_id, retry)
+
+            # 이후 쓰기는 DB로 가도록 표시를 지우고, 그 사이 남은 변경을 기록
+            pipe = redis.pipeline()
+            pipe.delete(keys['meta'])
+            pipe.set(keys['off'], 1, ex=OFF_TTL)
+            pipe.execute()
+        if _flush_waiting(session_id, full=False) is None:
+            return _postpone_reconcile(session_id, retry)
+
+        participant_ids = redis.smembers(keys['participants'])
+        participant_keys = [
+            key for participant_id in participant_ids
+            for key in _participant_keys(session_id, participant_id).values()
+        ]
+        pipe = redis.pipeline()
+        pipe.delete(keys['participants'], keys['devices'], keys['users'], keys['changes'], *participant_keys)
+        pipe.srem(LIVE_SESSIONS_KEY, session_id)
+        pipe.execute()
+    except Exception as e:
+        logger.error(f"Live state reconcile failed for session {session_id}: {e}")
+        return False
+
+    logger.info(f"Live state reconciled for session {session_id}")
+    return True
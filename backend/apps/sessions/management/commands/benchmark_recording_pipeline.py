@@ -0,0 +1,247 @@
+"""
+Recording Pipeline Benchmark Management Command
+저장된 녹화를 분석(analyze_recording_task) → 과제 변환(TaskConversionService) 파이프라인에
+재생(replay)하여 동시성 단계별 지연시간/쿼리 수/처리량을 측정
+
+실제 OpenAI 대신 run_fake_llm_server를 띄우고 OPENAI_BASE_URL로 연결하면
+API 비용 없이 결정적으로 측정할 수 있습니다.
+
+사용 예:
+    python manage.py run_fake_llm_server --latency-ms 800 &
+    OPENAI_BASE_URL=http://localhost:8090/v1 OPENAI_API_KEY=fake \\
+        python manage.py benchmark_recording_pipeline --recording-ids 3 5 --concurrency 1 2 4 8
+"""
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+
+from apps.logs.models import ActivityLog
+from apps.sessions.models import RecordingSession
+from apps.sessions.services import TaskConversionService
+from apps.sessions.tasks import analyze_recording_task
+from apps.tasks.models import Task
+
+REPLAY_TITLE_PREFIX = '[benchmark]'
+
+# 재생용 복제 시 함께 복사할 ActivityLog 필드
+ACTIVITY_LOG_COPY_FIELDS = [
+    'user_id', 'device_id', 'event_type', 'event_data', 'screen_info', 'node_info',
+    'parent_node_info', 'view_id_resource_name', 'content_description', 'bounds',
+    'is_sensitive_data', 'is_clickable', 'is_editable', 'is_enabled', 'is_focused',
+]
+
+
+class QueryCounter:
+    """현재 스레드의 DB 연결에서 실행된 쿼리 수 집계"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def percentile(values, pct):
+    """정렬된 목록에서 선형 보간 백분위수 계산"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100.0
+    lower = int(k)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
+
+
+class Command(BaseCommand):
+    help = 'Replay stored recordings through analysis and task conversion, reporting latency/queries/throughput'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--recording-ids', type=int, nargs='+',
+            help='Source RecordingSession IDs (default: latest recordings with events)'
+        )
+        parser.add_argument(
+            '--limit', type=int, default=3,
+            help='Number of source recordings when --recording-ids is omitted'
+        )
+        parser.add_argument(
+            '--concurrency', type=int, nargs='+', default=[1, 2, 4, 8],
+            help='Worker concurrency levels to measure (emulates Celery --concurrency)'
+        )
+        parser.add_argument(
+            '--jobs-per-level', type=int, default=16,
+            help='Number of pipeline runs per concurrency level'
+        )
+        parser.add_argument(
+            '--skip-conversion', action='store_true',
+            help='Measure analysis only (skip TaskConversionService)'
+        )
+        parser.add_argument(
+            '--keep', action='store_true',
+            help='Keep replay recordings and generated tasks instead of deleting them'
+        )
+
+    def handle(self, *args, **options):
+        sources = self._get_source_recordings(options['recording_ids'], options['limit'])
+        if not sources:
+            raise CommandError('재생할 녹화가 없습니다. 이벤트가 저장된 RecordingSession이 필요합니다.')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Source recordings: {", ".join(str(r.id) for r in sources)}\n'
+            f'Concurrency levels: {options["concurrency"]}, jobs per level: {options["jobs_per_level"]}'
+        ))
+
+        reports = []
+        for level in options['concurrency']:
+            replays = self._create_replays(sources, options['jobs_per_level'])
+            try:
+                report = self._run_level(
+                    level, replays, skip_conversion=options['skip_conversion']
+                )
+            finally:
+                if not options['keep']:
+                    self._cleanup(replays)
+            reports.append(report)
+            self._print_report(report)
+
+        self._print_summary(reports)
+
+    def _get_source_recordings(self, recording_ids, limit):
+        queryset = RecordingSession.objects.exclude(title__startswith=REPLAY_TITLE_PREFIX)
+        if recording_ids:
+            recordings = list(queryset.filter(id__in=recording_ids))
+        else:
+            recordings = list(queryset.filter(event_count__gt=0).order_by('-created_at')[:limit])
+
+        return [
+            r for r in recordings
+            if ActivityLog.objects.filter(recording_session=r).exists()
+        ]
+
+    def _create_replays(self, sources, job_count):
+        """
+        작업마다 독립된 녹화 복제본 생성
+
+        같은 녹화를 동시에 분석/변환하면 상태 전이가 서로 충돌하므로,
+        원본의 이벤트를 복사한 재생용 RecordingSession을 작업 수만큼 만든다.
+        """
+        replays = []
+        for index in range(job_count):
+            source = sources[index % len(sources)]
+            replay = RecordingSession.objects.create(
+                instructor_id=source.instructor_id,
+                title=f'{REPLAY_TITLE_PREFIX} {source.title}',
+                description=f'Replay of recording {source.id}',
+                status='COMPLETED',
+                event_count=source.event_count,
+                duration_seconds=source.duration_seconds,
+                started_at=source.started_at,
+                ended_at=source.ended_at,
+            )
+            source_logs = ActivityLog.objects.filter(
+                recording_session=source
+            ).order_by('timestamp', 'id').values(*ACTIVITY_LOG_COPY_FIELDS)
+            ActivityLog.objects.bulk_create([
+                ActivityLog(recording_session=replay, **log) for log in source_logs
+            ])
+            replays.append(replay.id)
+        return replays
+
+    def _cleanup(self, replay_ids):
+        task_ids = list(
+            RecordingSession.objects.filter(id__in=replay_ids, task__isnull=False)
+            .values_list('task_id', flat=True)
+        )
+        ActivityLog.objects.filter(recording_session_id__in=replay_ids).delete()
+        RecordingSession.objects.filter(id__in=replay_ids).delete()
+        Task.objects.filter(id__in=task_ids).delete()
+
+    def _run_job(self, recording_id, skip_conversion):
+        """분석 → 변환 1회 실행 (워커 스레드)"""
+        counter = QueryCounter()
+        started = time.perf_counter()
+        analysis_seconds = 0.0
+        error = None
+
+        try:
+            with connection.execute_wrapper(counter):
+                result = analyze_recording_task.apply(args=[recording_id]).get()
+                analysis_seconds = time.perf_counter() - started
+
+                if not result.get('success'):
+                    error = result.get('error', 'analysis failed')
+                elif not skip_conversion:
+                    conversion = TaskConversionService().convert_to_task(
+                        recording_id, title=f'{REPLAY_TITLE_PREFIX} task {recording_id}'
+                    )
+                    if not conversion.get('success'):
+                        error = conversion.get('error', 'conversion failed')
+        except Exception as e:
+            error = str(e)
+        finally:
+            connections.close_all()
+
+        return {
+            'latency': time.perf_counter() - started,
+            'analysis_latency': analysis_seconds,
+            'queries': counter.count,
+            'error': error,
+            'thread': threading.get_ident(),
+        }
+
+    def _run_level(self, level, replay_ids, skip_conversion):
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=level) as executor:
+            results = list(executor.map(
+                lambda rid: self._run_job(rid, skip_conversion), replay_ids
+            ))
+        wall_seconds = time.perf_counter() - started
+
+        succeeded = [r for r in results if not r['error']]
+        latencies = [r['latency'] for r in succeeded]
+        analysis_latencies = [r['analysis_latency'] for r in succeeded]
+        queries = [r['queries'] for r in results]
+
+        return {
+            'concurrency': level,
+            'jobs': len(results),
+            'succeeded': len(succeeded),
+            'errors': sorted({r['error'] for r in results if r['error']}),
+            'wall_seconds': wall_seconds,
+            'throughput': len(succeeded) / wall_seconds if wall_seconds else 0.0,
+            'p50': percentile(latencies, 50),
+            'p90': percentile(latencies, 90),
+            'p99': percentile(latencies, 99),
+            'analysis_p50': percentile(analysis_latencies, 50),
+            'queries_mean': statistics.mean(queries) if queries else 0.0,
+            'queries_max': max(queries) if queries else 0,
+        }
+
+    def _print_report(self, report):
+        style = self.style.SUCCESS if not report['errors'] else self.style.WARNING
+        self.stdout.write(style(
+            f'\n[concurrency={report["concurrency"]}] '
+            f'{report["succeeded"]}/{report["jobs"]} succeeded in {report["wall_seconds"]:.2f}s'
+        ))
+        self.stdout.write(
+            f'  end-to-end latency  p50={report["p50"]:.3f}s  p90={report["p90"]:.3f}s  p99={report["p99"]:.3f}s\n'
+            f'  analysis latency    p50={report["analysis_p50"]:.3f}s\n'
+            f'  queries per job     mean={report["queries_mean"]:.1f}  max={report["queries_max"]}\n'
+            f'  throughput          {report["throughput"]:.2f} jobs/s'
+        )
+        for error in report['errors']:
+            self.stdout.write(self.style.ERROR(f'  error: {error}'))
+
+    def _print_summary(self, reports):
+        self.stdout.write(self.style.SUCCESS('\nSummary'))
+        self.stdout.write('  concurrency   p50(s)   p90(s)   p99(s)  queries/job  jobs/s')
+        for r in reports:
+            self.stdout.write(
+                f'  {r["concurrency"]:>11}  {r["p50"]:>7.3f}  {r["p90"]:>7.3f}  {r["p99"]:>7.3f}'
+                f'  {r["queries_mean"]:>11.1f}  {r["throughput"]:>6.2f}'
+            )
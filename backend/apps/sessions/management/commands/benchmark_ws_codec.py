@@ -0,0 +1,193 @@
+"""
+WebSocket Codec Benchmark Management Command
+Android 학생 앱이 받는 메시지 묶음을 JSON(기본)과 MessagePack v1 서브프로토콜로 인코딩하여
+메시지별 전송 바이트와 인코딩/파싱 시간을 비교
+
+메시지는 SessionConsumer 핸들러를 실제로 거쳐 만들며(학생 연결 기준), step_changed는
+DB에 있는 단계(--lecture-id)로 채운다. 파싱 시간은 클라이언트가 프레임을 맵으로 읽는 시간
+(json.loads / msgpack.unpackb)으로 측정한다.
+
+사용 예:
+    python manage.py benchmark_ws_codec
+    python manage.py benchmark_ws_codec --lecture-id 1 --iterations 20000
+"""
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.sessions.consumers import SessionConsumer
+from apps.tasks.models import Subtask
+from core.websocket.codec import CODECS, MSGPACK_SUBPROTOCOL
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class CapturingSessionConsumer(SessionConsumer):
+    """연결 없이 핸들러가 보내는 메시지만 모음"""
+
+    def __init__(self, user, device_id):
+        super().__init__()
+        self.user = user
+        self.device_id = device_id
+        self.session_code = 'BENCH1'
+        self.captured = []
+
+    async def send_message(self, message):
+        self.captured.append(message)
+
+    async def send(self, text_data=None, bytes_data=None, close=False):
+        self.captured.append(json.loads(text_data))
+
+
+class Command(BaseCommand):
+    help = 'Compare JSON and MessagePack v1 WebSocket frames for the Android student app message set'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--lecture-id', type=int, help='Lecture whose subtasks fill step_changed messages')
+        parser.add_argument('--steps', type=int, default=5, help='Number of step_changed messages')
+        parser.add_argument('--iterations', type=int, default=10000, help='Encode/parse repetitions per message')
+
+    def handle(self, *args, **options):
+        if msgpack is None or MSGPACK_SUBPROTOCOL not in CODECS:
+            raise CommandError('msgpack 라이브러리가 필요합니다. (pip install msgpack)')
+
+        messages = asyncio.run(self._student_messages(self._subtasks(options)))
+        codec = CODECS[MSGPACK_SUBPROTOCOL]
+        iterations = options['iterations']
+
+        rows = []
+        for message in messages:
+            json_frame = json.dumps(message).encode()
+            msgpack_frame = codec.encode(message)['bytes_data']
+            rows.append({
+                'type': message['type'],
+                'json_bytes': len(json_frame),
+                'msgpack_bytes': len(msgpack_frame),
+                'json_encode_us': self._time_us(lambda: json.dumps(message), iterations),
+                'msgpack_encode_us': self._time_us(lambda: codec.encode(message), iterations),
+                'json_parse_us': self._time_us(lambda: json.loads(json_frame), iterations),
+                'msgpack_parse_us': self._time_us(lambda: msgpack.unpackb(msgpack_frame, raw=False), iterations),
+            })
+
+        self._print_report(rows)
+
+    def _subtasks(self, options):
+        queryset = Subtask.objects.order_by('task_id', 'order_index')
+        if options['lecture_id']:
+            queryset = queryset.filter(task__lecture_id=options['lecture_id'])
+        subtasks = [
+            {
+                'id': subtask.id,
+                'title': subtask.title,
+                'order_index': subtask.order_index,
+                'target_action': subtask.target_action,
+                'guide_text': subtask.guide_text,
+                'voice_guide_text': subtask.voice_guide_text,
+                'view_id': subtask.view_id or '',
+                'text': subtask.text or '',
+                'content_description': subtask.content_description or '',
+                'target_package': subtask.target_package or '',
+            }
+            for subtask in queryset[:options['steps']]
+        ]
+        if not subtasks:
+            if options['lecture_id']:
+                raise CommandError(f'강의에 단계가 없습니다: {options["lecture_id"]}')
+            subtasks = [{
+                'id': index + 1,
+                'title': f'{index + 1}단계: 설정 앱 열기',
+                'order_index': index,
+                'target_action': 'CLICK',
+                'guide_text': '홈 화면에서 톱니바퀴 모양의 설정 아이콘을 찾아 눌러주세요.',
+                'voice_guide_text': '홈 화면에서 설정 아이콘을 눌러주세요.',
+                'view_id': 'com.android.settings:id/title',
+                'text': '설정',
+                'content_description': '설정',
+                'target_package': 'com.android.settings',
+            } for index in range(options['steps'])]
+        return subtasks
+
+    async def _student_messages(self, subtasks):
+        """학생 연결이 받는 메시지 (핸들러 출력 그대로, 순번 포함)"""
+        user = SimpleNamespace(id=7, role='STUDENT', name='김학생', is_authenticated=True)
+        consumer = CapturingSessionConsumer(user, device_id='8f14e45fceea167a5a36dedd4bea2543')
+        now = timezone.now().isoformat()
+        seq = iter(range(100, 10000))
+        solution = ['설정 앱을 엽니다.', '네트워크 및 인터넷을 누릅니다.', 'Wi-Fi를 켭니다.']
+
+        await consumer.send(text_data=json.dumps({
+            'type': 'join_confirmed', 'session_code': 'BENCH1', 'participant_id': 42,
+            'device_id': consumer.device_id, 'user_id': user.id, 'message': '세션에 참가했습니다'
+        }))
+        await consumer.session_status_changed({
+            'type': 'session_status_changed', 'status': 'IN_PROGRESS', 'message': '수업이 시작되었습니다',
+            'seq': next(seq),
+        })
+        for subtask in subtasks:
+            await consumer.step_changed({'type': 'step_changed', 'subtask': subtask, 'seq': next(seq)})
+        await consumer.send(text_data=json.dumps({
+            'type': 'step_complete_confirmed', 'subtask_id': subtasks[0]['id'], 'message': '단계를 완료했습니다'
+        }))
+        await consumer.send(text_data=json.dumps({'type': 'heartbeat_ack', 'timestamp': now}))
+        await consumer.instructor_message({
+            'type': 'instructor_message', 'message': '잠시 화면을 봐주세요', 'from': '강사', 'timestamp': now,
+            'seq': next(seq),
+        })
+        await consumer.help_response({
+            'type': 'help_response', 'help_request_id': 11, 'help_response_id': 12, 'user_id': user.id,
+            'user_name': user.name, 'subtask_id': subtasks[0]['id'],
+            'problem_diagnosis': 'Wi-Fi 설정 화면이 아닌 블루투스 화면에 있습니다.',
+            'help_content': '뒤로 가기를 누른 뒤 네트워크 메뉴로 이동하세요.',
+            'step_by_step_solution': solution, 'confidence_score': 0.82, 'seq': next(seq),
+        })
+        await consumer.help_cluster_answer({
+            'type': 'help_cluster_answer', 'cluster_id': 'c1', 'subtask_id': subtasks[0]['id'],
+            'device_ids': [consumer.device_id], 'account_ids': [],
+            'problem_diagnosis': '여러 학생이 같은 화면에서 멈췄습니다.',
+            'help_content': '화면 위쪽의 검색창에 Wi-Fi를 입력해 보세요.',
+            'step_by_step_solution': solution, 'confidence_score': 0.74, 'seq': next(seq),
+        })
+        await consumer.session_status_changed({
+            'type': 'session_status_changed', 'status': 'ENDED', 'message': '수업이 종료되었습니다',
+            'seq': next(seq),
+        })
+        return consumer.captured
+
+    @staticmethod
+    def _time_us(func, iterations):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return (time.perf_counter() - started) / iterations * 1e6
+
+    def _print_report(self, rows):
+        self.stdout.write(self.style.SUCCESS(
+            f'Android student message set: {len(rows)} messages, JSON vs {MSGPACK_SUBPROTOCOL}'
+        ))
+        self.stdout.write(
+            '  type                       json(B)  msgpack(B)  saved   '
+            'enc json/mp(us)   parse json/mp(us)'
+        )
+        for r in rows:
+            saved = 1 - r['msgpack_bytes'] / r['json_bytes']
+            self.stdout.write(
+                f'  {r["type"]:<25}  {r["json_bytes"]:>7}  {r["msgpack_bytes"]:>10}  {saved:>5.0%}  '
+                f'{r["json_encode_us"]:>7.2f}/{r["msgpack_encode_us"]:<7.2f}  '
+                f'{r["json_parse_us"]:>7.2f}/{r["msgpack_parse_us"]:<7.2f}'
+            )
+
+        total = {key: sum(r[key] for r in rows) for key in rows[0] if key != 'type'}
+        self.stdout.write(self.style.SUCCESS('\nTotal'))
+        self.stdout.write(
+            f'  bytes on the wire   json={total["json_bytes"]}  msgpack={total["msgpack_bytes"]}  '
+            f'saved={1 - total["msgpack_bytes"] / total["json_bytes"]:.0%}\n'
+            f'  encode (us)         json={total["json_encode_us"]:.2f}  msgpack={total["msgpack_encode_us"]:.2f}\n'
+            f'  client parse (us)   json={total["json_parse_us"]:.2f}  msgpack={total["msgpack_parse_us"]:.2f}'
+        )
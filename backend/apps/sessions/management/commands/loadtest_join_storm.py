@@ -0,0 +1,262 @@
+"""
+Join Storm Load Test Management Command
+강사가 QR 코드를 띄운 직후처럼 여러 기기가 동시에 익명 참가(AnonymousSessionJoinView)하는 상황을 재현하여
+지연시간/쿼리 수/처리량을 측정
+
+기본은 프로세스 안에서 뷰를 직접 호출하고(쿼리 수 측정 가능), --base-url을 주면 실행 중인 서버에 HTTP로 요청한다.
+--websocket을 함께 주면 참가 후 WebSocket에 연결해 join 메시지까지 보낸다 (websockets 라이브러리 필요,
+익명 연결은 DEBUG 서버에서만 허용되므로 --ws-token으로 토큰을 줄 수 있음).
+
+사용 예:
+    python manage.py loadtest_join_storm --session-code ABC234 --joins 300
+    python manage.py loadtest_join_storm --session-code ABC234 --joins 300 --waves join rejoin
+    python manage.py loadtest_join_storm --session-code ABC234 --joins 300 \\
+        --base-url http://localhost:8000 --websocket
+"""
+import asyncio
+import json
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from urllib import error as urlerror
+from urllib import request as urlrequest
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from rest_framework.test import APIRequestFactory
+
+from apps.sessions.models import LectureSession, SessionParticipant
+from apps.sessions.views import AnonymousSessionJoinView
+
+from .benchmark_recording_pipeline import QueryCounter, percentile
+
+DEVICE_PREFIX = 'loadtest-'
+
+
+class Command(BaseCommand):
+    help = 'Simulate many devices joining a session at once and report latency/queries/throughput'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--session-code', required=True, help='Session code to join')
+        parser.add_argument('--joins', type=int, default=300, help='Number of simultaneous devices')
+        parser.add_argument(
+            '--waves', nargs='+', choices=['join', 'rejoin'], default=['join', 'rejoin'],
+            help='join: new devices, rejoin: the same devices joining again (reconnect path)'
+        )
+        parser.add_argument(
+            '--concurrency', type=int,
+            help='Worker threads (default: --joins, all requests released together)'
+        )
+        parser.add_argument('--base-url', help='Send HTTP requests to a running server instead of in-process')
+        parser.add_argument(
+            '--websocket', action='store_true',
+            help='After joining, open a WebSocket and send join (requires --base-url)'
+        )
+        parser.add_argument('--ws-token', help='JWT access token for WebSocket connections')
+        parser.add_argument(
+            '--keep', action='store_true',
+            help='Keep load test participants instead of deleting them'
+        )
+
+    def handle(self, *args, **options):
+        session_code = options['session_code'].upper()
+        if options['websocket'] and not options['base_url']:
+            raise CommandError('--websocket은 --base-url과 함께 사용해야 합니다.')
+        if not options['base_url'] and not LectureSession.objects.filter(session_code=session_code).exists():
+            raise CommandError(f'세션을 찾을 수 없습니다: {session_code}')
+
+        run_id = uuid.uuid4().hex[:8]
+        device_ids = [f'{DEVICE_PREFIX}{run_id}-{index}' for index in range(options['joins'])]
+        concurrency = options['concurrency'] or options['joins']
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Session: {session_code}, devices: {len(device_ids)}, concurrency: {concurrency}, '
+            f'target: {options["base_url"] or "in-process"}'
+        ))
+
+        reports = []
+        try:
+            for wave in options['waves']:
+                report = self._run_wave(wave, session_code, device_ids, concurrency, options)
+                reports.append(report)
+                self._print_report(report)
+
+            if options['websocket']:
+                report = self._run_websocket_wave(session_code, device_ids, options)
+                reports.append(report)
+                self._print_report(report)
+        finally:
+            if not options['keep'] and not options['base_url']:
+                deleted, _ = SessionParticipant.objects.filter(
+                    device_id__startswith=f'{DEVICE_PREFIX}{run_id}-'
+                ).delete()
+                self.stdout.write(f'\nDeleted {deleted} load test participants')
+
+        self._print_summary(reports)
+
+    # ==================== HTTP 참가 ====================
+
+    def _join_in_process(self, session_code, device_id):
+        factory = APIRequestFactory()
+        view = AnonymousSessionJoinView.as_view()
+        request = factory.post(
+            '/api/sessions/join/',
+            {'session_code': session_code, 'device_id': device_id, 'name': device_id[-8:]},
+            format='json'
+        )
+        return view(request).status_code
+
+    def _join_http(self, base_url, session_code, device_id):
+        body = json.dumps({'session_code': session_code, 'device_id': device_id, 'name': device_id[-8:]})
+        req = urlrequest.Request(
+            f'{base_url.rstrip("/")}/api/sessions/join/',
+            data=body.encode(), headers={'Content-Type': 'application/json'}, method='POST'
+        )
+        try:
+            with urlrequest.urlopen(req, timeout=30) as response:
+                return response.status
+        except urlerror.HTTPError as e:
+            return e.code
+
+    def _run_join(self, session_code, device_id, barrier, options):
+        """참가 1회 (워커 스레드) - 모든 스레드가 준비되면 동시에 요청"""
+        counter = QueryCounter()
+        status_code = None
+        error = None
+
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            pass
+
+        started = time.perf_counter()
+        try:
+            if options['base_url']:
+                status_code = self._join_http(options['base_url'], session_code, device_id)
+            else:
+                with connection.execute_wrapper(counter):
+                    status_code = self._join_in_process(session_code, device_id)
+        except Exception as e:
+            error = str(e)
+        finally:
+            if not options['base_url']:
+                connections.close_all()
+
+        return {
+            'latency': time.perf_counter() - started,
+            'queries': counter.count,
+            'status': status_code,
+            'error': error,
+        }
+
+    def _run_wave(self, wave, session_code, device_ids, concurrency, options):
+        barrier = threading.Barrier(min(concurrency, len(device_ids)), timeout=30)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(
+                lambda device_id: self._run_join(session_code, device_id, barrier, options), device_ids
+            ))
+        wall_seconds = time.perf_counter() - started
+
+        expected = 201 if wave == 'join' else 200
+        return self._summarize(wave, results, wall_seconds, expected, with_queries=not options['base_url'])
+
+    # ==================== WebSocket 연결 ====================
+
+    def _run_websocket_wave(self, session_code, device_ids, options):
+        try:
+            import websockets
+        except ImportError:
+            raise CommandError('websockets 라이브러리가 필요합니다. (pip install websockets)')
+
+        ws_base = options['base_url'].rstrip('/').replace('https://', 'wss://').replace('http://', 'ws://')
+        uri = f'{ws_base}/ws/sessions/{session_code}/'
+        if options['ws_token']:
+            uri += f'?token={options["ws_token"]}'
+
+        async def connect_and_join(device_id, start_event):
+            await start_event.wait()
+            started = time.perf_counter()
+            try:
+                async with websockets.connect(uri, open_timeout=30) as websocket:
+                    await websocket.send(json.dumps({
+                        'type': 'join', 'data': {'device_id': device_id, 'name': device_id[-8:]}
+                    }))
+                    while True:
+                        message = json.loads(await asyncio.wait_for(websocket.recv(), timeout=30))
+                        if message.get('type') == 'join_confirmed':
+                            break
+                    latency = time.perf_counter() - started
+                    # 묶인 입장 알림이 나갈 때까지 연결 유지
+                    await asyncio.sleep(1)
+                return {'latency': latency, 'queries': 0, 'status': 200, 'error': None}
+            except Exception as e:
+                return {'latency': time.perf_counter() - started, 'queries': 0, 'status': None, 'error': str(e)}
+
+        async def storm():
+            start_event = asyncio.Event()
+            jobs = [asyncio.create_task(connect_and_join(device_id, start_event)) for device_id in device_ids]
+            await asyncio.sleep(0)
+            started = time.perf_counter()
+            start_event.set()
+            results = await asyncio.gather(*jobs)
+            return results, time.perf_counter() - started
+
+        results, wall_seconds = asyncio.run(storm())
+        return self._summarize('websocket', results, wall_seconds, 200, with_queries=False)
+
+    # ==================== 결과 ====================
+
+    def _summarize(self, wave, results, wall_seconds, expected_status, with_queries):
+        succeeded = [r for r in results if not r['error'] and r['status'] == expected_status]
+        latencies = [r['latency'] for r in succeeded]
+        queries = [r['queries'] for r in results]
+        return {
+            'wave': wave,
+            'requests': len(results),
+            'succeeded': len(succeeded),
+            'statuses': Counter(r['status'] for r in results),
+            'errors': sorted({r['error'] for r in results if r['error']}),
+            'wall_seconds': wall_seconds,
+            'throughput': len(succeeded) / wall_seconds if wall_seconds else 0.0,
+            'p50': percentile(latencies, 50),
+            'p95': percentile(latencies, 95),
+            'p99': percentile(latencies, 99),
+            'max': max(latencies) if latencies else 0.0,
+            'queries_mean': sum(queries) / len(queries) if with_queries and queries else None,
+            'queries_max': max(queries) if with_queries and queries else None,
+        }
+
+    def _print_report(self, report):
+        style = self.style.SUCCESS if report['succeeded'] == report['requests'] else self.style.WARNING
+        self.stdout.write(style(
+            f'\n[{report["wave"]}] {report["succeeded"]}/{report["requests"]} succeeded '
+            f'in {report["wall_seconds"]:.2f}s'
+        ))
+        statuses = ', '.join(f'{status}: {count}' for status, count in sorted(
+            report['statuses'].items(), key=lambda item: str(item[0])
+        ))
+        self.stdout.write(
+            f'  statuses            {statuses}\n'
+            f'  latency             p50={report["p50"]:.3f}s  p95={report["p95"]:.3f}s  '
+            f'p99={report["p99"]:.3f}s  max={report["max"]:.3f}s\n'
+            f'  throughput          {report["throughput"]:.2f} joins/s'
+        )
+        if report['queries_mean'] is not None:
+            self.stdout.write(
+                f'  queries per join    mean={report["queries_mean"]:.1f}  max={report["queries_max"]}'
+            )
+        for error in report['errors'][:5]:
+            self.stdout.write(self.style.ERROR(f'  error: {error}'))
+
+    def _print_summary(self, reports):
+        self.stdout.write(self.style.SUCCESS('\nSummary'))
+        self.stdout.write('  wave        ok/total    p50(s)   p95(s)   p99(s)  queries/join  joins/s')
+        for r in reports:
+            queries = f'{r["queries_mean"]:.1f}' if r['queries_mean'] is not None else '-'
+            self.stdout.write(
+                f'  {r["wave"]:<10}  {r["succeeded"]:>4}/{r["requests"]:<5}  {r["p50"]:>7.3f}  {r["p95"]:>7.3f}'
+                f'  {r["p99"]:>7.3f}  {queries:>12}  {r["throughput"]:>7.2f}'
+            )
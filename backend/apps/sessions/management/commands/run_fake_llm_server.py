@@ -0,0 +1,305 @@
+"""
+Fake LLM Server Management Command
+OpenAI 호환 /v1/chat/completions 엔드포인트를 흉내내는 오프라인 서버
+
+실제 API 키나 네트워크 없이 녹화 분석 파이프라인과 M-GPT 도움 요청을
+결정적(deterministic)으로 실행하기 위해 사용합니다.
+
+사용 예:
+    python manage.py run_fake_llm_server --port 8090 --latency-ms 800 --jitter-ms 200
+    OPENAI_BASE_URL=http://localhost:8090/v1 OPENAI_API_KEY=fake python manage.py ...
+"""
+import hashlib
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.core.management.base import BaseCommand
+
+# 단계로 인정할 이벤트 타입별 제목 (클릭/입력/화면 전환, Android 이름 포함)
+STEP_TITLES = {
+    'VIEW_CLICKED': '버튼 누르기',
+    'VIEW_LONG_CLICKED': '길게 누르기',
+    'VIEW_TEXT_CHANGED': '글자 입력하기',
+    'WINDOW_CHANGE': '화면 이동하기',
+    '1': '버튼 누르기',
+    'CLICK': '버튼 누르기',
+    '2': '길게 누르기',
+    'LONG_CLICK': '길게 누르기',
+    '16': '글자 입력하기',
+    'INPUT': '글자 입력하기',
+    'TEXT_INPUT': '글자 입력하기',
+    '32': '화면 이동하기',
+    'SCREEN_CHANGE': '화면 이동하기',
+    'NAVIGATE': '화면 이동하기',
+}
+
+
+def _extract_events(prompt):
+    """프롬프트에 포함된 이벤트 JSON 배열 추출 (없으면 빈 목록)"""
+    start = prompt.find('[')
+    end = prompt.rfind(']')
+    if start == -1 or end <= start:
+        return []
+    try:
+        events = json.loads(prompt[start:end + 1])
+    except json.JSONDecodeError:
+        return []
+    return [ev for ev in events if isinstance(ev, dict)]
+
+
+def build_steps_response(prompt):
+    """녹화 분석 프롬프트에 대한 결정적 단계 목록 생성"""
+    steps = []
+    for event in _extract_events(prompt):
+        event_type = str(event.get('eventType', ''))
+        if event_type not in STEP_TITLES:
+            continue
+
+        label = event.get('text') or event.get('contentDescription') or event.get('viewId') or ''
+        title = STEP_TITLES[event_type]
+        steps.append({
+            'step': len(steps) + 1,
+            'title': f"{label} {title}".strip() if label else title,
+            'description': f"{title} 단계입니다.",
+            'time': event.get('time', 0),
+            'eventType': event_type,
+            'package': event.get('package', ''),
+            'className': event.get('className', ''),
+            'text': event.get('text', ''),
+            'contentDescription': event.get('contentDescription', ''),
+            'viewId': event.get('viewId', ''),
+            'bounds': event.get('bounds', ''),
+        })
+    return steps
+
+
+def build_help_response(prompt):
+    """M-GPT 도움 요청 프롬프트에 대한 결정적 JSON 응답 생성"""
+    digest = int(hashlib.sha1(prompt.encode('utf-8')).hexdigest()[:8], 16)
+    return {
+        'problem_diagnosis': '현재 화면에서 다음에 눌러야 할 버튼을 찾지 못한 것으로 보입니다.',
+        'step_by_step_solution': [
+            '1단계: 화면을 천천히 위아래로 살펴보세요',
+            '2단계: 안내된 버튼 이름을 찾아 한 번 눌러보세요',
+            '3단계: 화면이 바뀌었는지 확인하세요',
+        ],
+        'alternative_approaches': [
+            '대안 1: 뒤로 가기 버튼을 누른 뒤 다시 시도하기',
+        ],
+        'confidence_score': 60 + digest % 30,
+        'estimated_difficulty': '중급',
+    }
+
+
+def build_completion_content(payload):
+    """요청 본문에 맞는 응답 텍스트 생성"""
+    messages = payload.get('messages') or []
+    prompt = '\n'.join(str(m.get('content', '')) for m in messages if isinstance(m, dict))
+
+    response_format = payload.get('response_format') or {}
+    if response_format.get('type') == 'json_object':
+        return json.dumps(build_help_response(prompt), ensure_ascii=False)
+    return json.dumps(build_steps_response(prompt), ensure_ascii=False)
+
+
+class FakeLLMRequestHandler(BaseHTTPRequestHandler):
+    """OpenAI Chat Completions 호환 요청 핸들러"""
+
+    server_version = 'FakeLLM/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status_code, body):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path.rstrip('/').endswith('/models'):
+            self._send_json(200, {
+                'object': 'list',
+                'data': [{'id': self.server.model_name, 'object': 'model', 'owned_by': 'fake'}],
+            })
+            return
+        self._send_json(404, {'error': {'message': 'Not found'}})
+
+    def do_POST(self):
+        if not self.path.rstrip('/').endswith('/chat/completions'):
+            self._send_json(404, {'error': {'message': 'Not found'}})
+            return
+
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b'{}')
+        except json.JSONDecodeError:
+            self._send_json(400, {'error': {'message': 'Invalid JSON body'}})
+            return
+
+        self.server.simulate_latency()
+
+        if self.server.should_fail():
+            self._send_json(500, {'error': {'message': 'Simulated upstream failure'}})
+            return
+
+        content = build_completion_content(payload)
+        model = payload.get('model') or self.server.model_name
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+
+        if payload.get('stream'):
+            self._send_stream(completion_id, model, content)
+        else:
+            self._send_json(200, {
+                'id': completion_id,
+                'object': 'chat.completion',
+                'created': int(time.time()),
+                'model': model,
+                'choices': [{
+                    'index': 0,
+                    'message': {'role': 'assistant', 'content': content},
+                    'finish_reason': 'stop',
+                }],
+                'usage': {
+                    'prompt_tokens': length // 4,
+                    'completion_tokens': len(content) // 4,
+                    'total_tokens': (length + len(content)) // 4,
+                },
+            })
+
+    def _send_stream(self, completion_id, model, content):
+        """SSE 형식으로 응답을 청크 단위 스트리밍"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+
+        chunk_size = self.server.stream_chunk_chars
+        pieces = [content[i:i + chunk_size] for i in range(0, len(content), chunk_size)] or ['']
+
+        for index, piece in enumerate(pieces):
+            delta = {'content': piece}
+            if index == 0:
+                delta['role'] = 'assistant'
+            self._write_event({
+                'id': completion_id,
+                'object': 'chat.completion.chunk',
+                'created': int(time.time()),
+                'model': model,
+                'choices': [{'index': 0, 'delta': delta, 'finish_reason': None}],
+            })
+            if self.server.stream_delay:
+                time.sleep(self.server.stream_delay)
+
+        self._write_event({
+            'id': completion_id,
+            'object': 'chat.completion.chunk',
+            'created': int(time.time()),
+            'model': model,
+            'choices': [{'index': 0, 'delta': {}, 'finish_reason': 'stop'}],
+        })
+        self.wfile.write(b'data: [DONE]\n\n')
+        self.wfile.flush()
+        self.close_connection = True
+
+    def _write_event(self, body):
+        self.wfile.write(f"data: {json.dumps(body, ensure_ascii=False)}\n\n".encode('utf-8'))
+        self.wfile.flush()
+
+
+class FakeLLMServer(ThreadingHTTPServer):
+    """지연/실패율 설정을 가진 멀티스레드 HTTP 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, address, latency_ms, jitter_ms, failure_rate, seed,
+                 stream_chunk_chars, stream_delay_ms, model_name, verbose):
+        super().__init__(address, FakeLLMRequestHandler)
+        self.latency = latency_ms / 1000.0
+        self.jitter = jitter_ms / 1000.0
+        self.failure_rate = failure_rate
+        self.stream_chunk_chars = max(1, stream_chunk_chars)
+        self.stream_delay = stream_delay_ms / 1000.0
+        self.model_name = model_name
+        self.verbose = verbose
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+
+    def simulate_latency(self):
+        with self._random_lock:
+            jitter = self._random.uniform(-self.jitter, self.jitter) if self.jitter else 0.0
+        delay = max(0.0, self.latency + jitter)
+        if delay:
+            time.sleep(delay)
+
+    def should_fail(self):
+        if not self.failure_rate:
+            return False
+        with self._random_lock:
+            return self._random.random() < self.failure_rate
+
+
+class Command(BaseCommand):
+    help = 'Run an offline OpenAI-compatible server for deterministic analysis benchmarks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', type=str, default='127.0.0.1', help='Bind address')
+        parser.add_argument('--port', type=int, default=8090, help='Bind port')
+        parser.add_argument(
+            '--latency-ms', type=int, default=0,
+            help='Base latency added to every completion'
+        )
+        parser.add_argument(
+            '--jitter-ms', type=int, default=0,
+            help='Uniform +/- jitter applied to the base latency'
+        )
+        parser.add_argument(
+            '--failure-rate', type=float, default=0.0,
+            help='Fraction of requests answered with HTTP 500 (0.0 ~ 1.0)'
+        )
+        parser.add_argument('--seed', type=int, default=42, help='Random seed for jitter/failures')
+        parser.add_argument(
+            '--stream-chunk-chars', type=int, default=32,
+            help='Characters per SSE chunk when stream=true'
+        )
+        parser.add_argument(
+            '--stream-delay-ms', type=int, default=0,
+            help='Delay between SSE chunks when stream=true'
+        )
+        parser.add_argument('--model', type=str, default='fake-gpt', help='Model name reported by /v1/models')
+        parser.add_argument('--verbose', action='store_true', help='Log every request')
+
+    def handle(self, *args, **options):
+        server = FakeLLMServer(
+            (options['host'], options['port']),
+            latency_ms=options['latency_ms'],
+            jitter_ms=options['jitter_ms'],
+            failure_rate=options['failure_rate'],
+            seed=options['seed'],
+            stream_chunk_chars=options['stream_chunk_chars'],
+            stream_delay_ms=options['stream_delay_ms'],
+            model_name=options['model'],
+            verbose=options['verbose'],
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Fake LLM server listening on http://{options["host"]}:{options["port"]}/v1\n'
+            f'Latency: {options["latency_ms"]}ms (+/- {options["jitter_ms"]}ms), '
+            f'failure rate: {options["failure_rate"]}'
+        ))
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING('\nShutting down fake LLM server...'))
+        finally:
+            server.server_close()
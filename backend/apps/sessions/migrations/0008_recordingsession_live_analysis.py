@@ -0,0 +1,41 @@
+# Generated by Django 5.0.1 on 2026-10-19 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("lecture_sessions", "0007_fix_analysis_error_default"),
+        ("lecture_sessions", "0007_recordingsession_task_alter_recordingsession_lecture_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="recordingsession",
+            name="live_analysis",
+            field=models.BooleanField(
+                default=False,
+                help_text="녹화 중 닫힌 구간을 백그라운드에서 미리 분석",
+                verbose_name="실시간 분석 사용",
+            ),
+        ),
+        migrations.AddField(
+            model_name="recordingsession",
+            name="draft_analysis",
+            field=models.JSONField(
+                blank=True,
+                help_text="녹화 중 분석된 구간의 단계 목록 (JSON Array)",
+                null=True,
+                verbose_name="분석 초안",
+            ),
+        ),
+        migrations.AddField(
+            model_name="recordingsession",
+            name="analyzed_event_count",
+            field=models.IntegerField(
+                default=0,
+                help_text="분석 초안에 반영된 이벤트 수 (다음 구간의 시작 위치)",
+                verbose_name="초안 반영 이벤트 수",
+            ),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.0.1 on 2026-10-19 01:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("lecture_sessions", "0008_recordingsession_live_analysis"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SessionSummarySnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "summary",
+                    models.JSONField(
+                        help_text="SessionSummaryView 응답 형식", verbose_name="세션 요약"
+                    ),
+                ),
+                (
+                    "participant_count",
+                    models.IntegerField(default=0, verbose_name="참가자 수"),
+                ),
+                (
+                    "completed_count",
+                    models.IntegerField(default=0, verbose_name="완료 참가자 수"),
+                ),
+                (
+                    "avg_completion_time",
+                    models.FloatField(default=0, verbose_name="평균 완료 시간(초)"),
+                ),
+                (
+                    "help_request_count",
+                    models.IntegerField(
+                        default=0,
+                        help_text="세션 진행 시간 동안 강의 단계에 접수된 도움 요청 수",
+                        verbose_name="세션 중 도움 요청 수",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성 시각"),
+                ),
+                (
+                    "session",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="summary_snapshot",
+                        to="lecture_sessions.lecturesession",
+                        verbose_name="세션",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "세션 요약 스냅샷",
+                "verbose_name_plural": "세션 요약 스냅샷",
+                "db_table": "session_summary_snapshots",
+            },
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.0.1 on 2026-10-19 02:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("lecture_sessions", "0009_sessionsummarysnapshot"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SessionEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "seq",
+                    models.PositiveIntegerField(
+                        help_text="세션 안에서 1부터 증가", verbose_name="순번"
+                    ),
+                ),
+                ("event_type", models.CharField(max_length=50, verbose_name="이벤트 종류")),
+                (
+                    "payload",
+                    models.JSONField(
+                        help_text="브로드캐스트한 이벤트 그대로 (seq 포함)", verbose_name="이벤트"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(verbose_name="발생 시각")),
+                (
+                    "session",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="events",
+                        to="lecture_sessions.lecturesession",
+                        verbose_name="세션",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "세션 이벤트",
+                "verbose_name_plural": "세션 이벤트",
+                "db_table": "session_events",
+                "ordering": ["session", "seq"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="sessionevent",
+            constraint=models.UniqueConstraint(
+                fields=("session", "seq"), name="unique_session_event_seq"
+            ),
+        ),
+    ]
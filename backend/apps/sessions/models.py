@@ -240,6 +240,65 @@ class SessionStepControl(models.Model):
         return f"{self.session.title} - {self.action} at {self.created_at}"
 
 
+class SessionSummarySnapshot(models.Model):
+    """세션 종료 시점에 한 번 계산해 고정한 세션 요약 (이후 수정하지 않음)"""
+
+    session = models.OneToOneField(
+        LectureSession,
+        on_delete=models.CASCADE,
+        related_name='summary_snapshot',
+        verbose_name='세션'
+    )
+    summary = models.JSONField(verbose_name='세션 요약', help_text='SessionSummaryView 응답 형식')
+
+    # 세션 간 추이 비교용 지표
+    participant_count = models.IntegerField(default=0, verbose_name='참가자 수')
+    completed_count = models.IntegerField(default=0, verbose_name='완료 참가자 수')
+    avg_completion_time = models.FloatField(default=0, verbose_name='평균 완료 시간(초)')
+    help_request_count = models.IntegerField(
+        default=0,
+        verbose_name='세션 중 도움 요청 수',
+        help_text='세션 진행 시간 동안 강의 단계에 접수된 도움 요청 수'
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성 시각')
+
+    class Meta:
+        db_table = 'session_summary_snapshots'
+        verbose_name = '세션 요약 스냅샷'
+        verbose_name_plural = '세션 요약 스냅샷'
+
+    def __str__(self):
+        return f"Summary of session {self.session_id}"
+
+
+class SessionEvent(models.Model):
+    """세션 이벤트 로그 (세션 그룹에 브로드캐스트된 이벤트를 순번과 함께 보관, 추가만 함)"""
+
+    session = models.ForeignKey(
+        LectureSession,
+        on_delete=models.CASCADE,
+        related_name='events',
+        verbose_name='세션'
+    )
+    seq = models.PositiveIntegerField(verbose_name='순번', help_text='세션 안에서 1부터 증가')
+    event_type = models.CharField(max_length=50, verbose_name='이벤트 종류')
+    payload = models.JSONField(verbose_name='이벤트', help_text='브로드캐스트한 이벤트 그대로 (seq 포함)')
+    created_at = models.DateTimeField(verbose_name='발생 시각')
+
+    class Meta:
+        db_table = 'session_events'
+        verbose_name = '세션 이벤트'
+        verbose_name_plural = '세션 이벤트'
+        ordering = ['session', 'seq']
+        constraints = [
+            models.UniqueConstraint(fields=['session', 'seq'], name='unique_session_event_seq'),
+        ]
+
+    def __str__(self):
+        return f"Session {self.session_id} #{self.seq} {self.event_type}"
+
+
 class StudentScreenshot(models.Model):
     """학생 화면 스크린샷 모델"""
 
@@ -366,6 +425,24 @@ class RecordingSession(models.Model):
         verbose_name='분석 완료 시각'
     )
 
+    # 실시간(증분) 분석 관련 필드
+    live_analysis = models.BooleanField(
+        default=False,
+        verbose_name='실시간 분석 사용',
+        help_text='녹화 중 닫힌 구간을 백그라운드에서 미리 분석'
+    )
+    draft_analysis = models.JSONField(
+        null=True,
+        blank=True,
+        verbose_name='분석 초안',
+        help_text='녹화 중 분석된 구간의 단계 목록 (JSON Array)'
+    )
+    analyzed_event_count = models.IntegerField(
+        default=0,
+        verbose_name='초안 반영 이벤트 수',
+        help_text='분석 초안에 반영된 이벤트 수 (다음 구간의 시작 위치)'
+    )
+
     class Meta:
         db_table = 'recording_sessions'
         verbose_name = '녹화 세션'
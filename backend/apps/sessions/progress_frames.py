@@ -0,0 +1,142 @@
+"""
+Progress Frames - 강사 소켓용 진도 묶음 전송 (progress_frame)
+
+학생 행동마다 progress_updated / student_completion을 한 건씩 보내면 100명 수업에서 분당 수백 건이 되고
+강사 화면은 메시지마다 다시 그려진다. 집계 모드를 켠 강사 연결은 개별 메시지 대신
+일정 주기(SESSION_PROGRESS_FRAME_INTERVAL_MS)마다 그 사이 바뀐 참가자만 담은 progress_frame을 받는다.
+
+progress_frame:
+  {
+    "type": "progress_frame",
+    "full": false,                 첫 프레임(구독 직후)만 true - 전체 참가자와 전체 단계 집계
+    "seq": 42,                     반영한 마지막 이벤트 순번 (event_log, 반영한 이벤트가 없으면 생략)
+    "participants": [              바뀐 참가자만
+      {"key": "device:abc", "participant_id": 3, "device_id": "abc", "name": "김",
+       "subtask_id": 5, "status": "completed", "completed_subtasks": [1, 2, 5]}
+    ],
+    "step_counts": {"5": 12},      바뀐 단계만 - 단계 ID → 완료한 참가자 수
+    "participant_count": 100,
+    "timestamp": "..."
+  }
+
+ProgressFrameBuilder는 I/O 없이 이벤트를 누적만 한다 (연결마다 하나, SessionConsumer가 주기적으로 frame 호출).
+"""
+from collections import Counter
+from typing import Dict, Iterable, Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+
+def frame_interval_seconds(requested_ms=None) -> float:
+    """요청한 주기(ms)를 허용 범위로 맞춰 초 단위로 반환 (없으면 기본값)"""
+    default_ms = getattr(settings, 'SESSION_PROGRESS_FRAME_INTERVAL_MS', 500)
+    try:
+        interval_ms = int(requested_ms) if requested_ms not in (None, '', True) else default_ms
+    except (TypeError, ValueError):
+        interval_ms = default_ms
+    return min(max(interval_ms, 100), 5000) / 1000
+
+
+def participant_key(device_id: Optional[str] = None, participant_id: Optional[int] = None) -> str:
+    return f'device:{device_id}' if device_id else f'participant:{participant_id}'
+
+
+class ProgressFrameBuilder:
+    """진도 이벤트를 참가자별 최신 상태로 누적하고, 바뀐 부분만 프레임으로 만든다"""
+
+    def __init__(self):
+        self.participants: Dict[str, Dict] = {}
+        self.step_counts = Counter()  # 단계 ID → 완료한 참가자 수
+        self.seq = None
+        self._dirty = set()
+        self._dirty_steps = set()
+        self._full = True
+
+    def seed(self, participants: Iterable):
+        """
+        현재 참가자 상태로 초기화 (SessionParticipant 또는 live_state.LiveParticipant)
+
+        다음 frame은 전체 프레임(full)이 된다.
+        """
+        self.participants.clear()
+        self.step_counts.clear()
+        for participant in participants:
+            completed = list(participant.completed_subtasks or [])
+            key = participant_key(participant.device_id, participant.id)
+            self.participants[key] = {
+                'key': key,
+                'participant_id': participant.id,
+                'device_id': participant.device_id,
+                'name': participant.display_name or getattr(participant, 'user_name', None),
+                'subtask_id': participant.current_subtask_id,
+                'status': participant.status,
+                'completed_subtasks': completed,
+            }
+            self.step_counts.update(completed)
+        self._full = True
+
+    def _entry(self, device_id, participant_id, name) -> Dict:
+        key = participant_key(device_id, participant_id)
+        entry = self.participants.get(key)
+        if entry is None:
+            entry = self.participants[key] = {
+                'key': key, 'participant_id': participant_id, 'device_id': device_id, 'name': name,
+                'subtask_id': None, 'status': None, 'completed_subtasks': [],
+            }
+        elif name:
+            entry['name'] = name
+        self._dirty.add(key)
+        return entry
+
+    def _set_completed(self, entry: Dict, completed: Iterable):
+        old, new = set(entry['completed_subtasks']), set(completed)
+        for subtask_id in old - new:
+            self.step_counts[subtask_id] -= 1
+        for subtask_id in new - old:
+            self.step_counts[subtask_id] += 1
+        self._dirty_steps.update(old ^ new)
+        entry['completed_subtasks'] = list(completed)
+
+    def apply(self, event: Dict):
+        """progress_updated / student_completion 이벤트 반영"""
+        if event.get('seq') is not None:
+            self.seq = max(self.seq or 0, event['seq'])
+
+        if event['type'] == 'student_completion':
+            entry = self._entry(event.get('device_id'), event.get('participant_id'), event.get('student_name'))
+            entry['subtask_id'] = event.get('subtask_id')
+            entry['status'] = 'completed'
+            self._set_completed(entry, event.get('completed_subtasks', []))
+        elif event['type'] == 'progress_updated':
+            entry = self._entry(event.get('device_id'), event.get('user_id'), event.get('user_name'))
+            entry['subtask_id'] = event.get('subtask_id')
+            entry['status'] = event.get('status')
+            if event.get('status') == 'completed' and event.get('subtask_id') not in entry['completed_subtasks']:
+                self._set_completed(entry, entry['completed_subtasks'] + [event.get('subtask_id')])
+
+    def frame(self) -> Optional[Dict]:
+        """지난 프레임 이후 바뀐 참가자/단계 집계 (바뀐 것이 없으면 None)"""
+        if self._full:
+            participants = list(self.participants.values())
+            step_ids = [subtask_id for subtask_id, count in self.step_counts.items() if count]
+        elif self._dirty or self._dirty_steps:
+            participants = [self.participants[key] for key in self._dirty]
+            step_ids = self._dirty_steps
+        else:
+            return None
+
+        frame = {
+            'type': 'progress_frame',
+            'full': self._full,
+            'participants': participants,
+            'step_counts': {str(subtask_id): self.step_counts[subtask_id] for subtask_id in step_ids},
+            'participant_count': len(self.participants),
+            'timestamp': timezone.now().isoformat(),
+        }
+        if self.seq is not None:
+            frame['seq'] = self.seq
+        self._full = False
+        self._dirty = set()
+        self._dirty_steps = set()
+        return frame
@@ -3,6 +3,7 @@ Recording Session Views (녹화 기능)
 Extended with GPT analysis, step editing, and lecture conversion
 """
 import logging
+from django.conf import settings
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -18,7 +19,7 @@ from .serializers import (
     RecordingSessionAnalysisSerializer,
     RecordingConvertSerializer
 )
-from .tasks import analyze_recording_task
+from .tasks import analyze_recording_task, analyze_recording_segments_task
 from apps.logs.models import ActivityLog
 from apps.logs.serializers import ActivityLogSerializer
 from apps.tasks.models import Subtask
@@ -57,7 +58,10 @@ class RecordingSessionViewSet(viewsets.ModelViewSet):
         recording = serializer.save(
             instructor=self.request.user,
             status='RECORDING',
-            started_at=timezone.now()
+            started_at=timezone.now(),
+            live_analysis=serializer.validated_data.get(
+                'live_analysis', settings.RECORDING_LIVE_ANALYSIS_DEFAULT
+            )
         )
         return recording
 
@@ -97,7 +101,19 @@ class RecordingSessionViewSet(viewsets.ModelViewSet):
             duration = (recording.ended_at - recording.started_at).total_seconds()
             recording.duration_seconds = int(duration)
 
-        recording.save()
+        # 실시간 분석 중이던 녹화는 남은 꼬리 구간만 분석하여 결과 확정
+        if recording.live_analysis and recording.event_count > 0:
+            recording.status = 'PROCESSING'
+            recording.analysis_error = ''
+
+        # 증분 분석 태스크가 갱신하는 초안 필드를 덮어쓰지 않도록 필요한 필드만 저장
+        recording.save(update_fields=[
+            'status', 'ended_at', 'event_count', 'duration_seconds',
+            'analysis_error', 'updated_at'
+        ])
+
+        if recording.status == 'PROCESSING':
+            analyze_recording_segments_task.delay(recording.id, final=True)
 
         serializer = RecordingSessionSerializer(recording)
         return Response(serializer.data)
@@ -182,6 +198,10 @@ class RecordingSessionViewSet(viewsets.ModelViewSet):
         ).count()
         recording.save(update_fields=['event_count'])
 
+        # 실시간 분석: 녹화 중 닫힌 구간을 백그라운드에서 분석
+        if recording.live_analysis and recording.status == 'RECORDING':
+            analyze_recording_segments_task.delay(recording.id)
+
         return Response({
             'message': f'{len(created_logs)}개의 이벤트가 저장되었습니다.',
             'saved_count': len(created_logs),
@@ -196,6 +216,14 @@ class RecordingSessionViewSet(viewsets.ModelViewSet):
         """
         recording = self.get_object()
 
+        # 실시간 분석 녹화는 종료 시점에 이미 마무리 분석이 시작됨
+        if recording.live_analysis and recording.status == 'PROCESSING':
+            return Response({
+                'message': '실시간 분석을 마무리하는 중입니다.',
+                'recording_id': recording.id,
+                'status': 'PROCESSING'
+            }, status=status.HTTP_202_ACCEPTED)
+
         # 상태 확인: COMPLETED 또는 FAILED만 분석 가능
         if recording.status not in ['COMPLETED', 'FAILED']:
             return Response(
@@ -0,0 +1,120 @@
+"""
+Session Roster Diffs - 참가자 입장/퇴장 알림을 짧은 창 단위로 묶어 전송
+
+수업 시작 시 수백 대의 기기가 몇 초 안에 WebSocket에 연결하면 연결마다 participant_joined가
+세션 그룹 전체로 퍼지고, 강사 화면은 알림마다 참가자 목록을 다시 불러온다.
+세션별로 짧은 창(SESSION_ROSTER_DIFF_WINDOW_SECONDS)을 열어 입장/퇴장을 모으고,
+창이 끝나면 강사에게 roster_diff 한 번으로 알린다. 창 안에서 연결했다가 끊긴 연결은 서로 상쇄한다.
+
+플로우:
+  SessionConsumer.connect / disconnect → add_change
+      - 창의 첫 변경: flush 태스크 예약 (countdown=창 길이)
+  flush_roster_diff_task → flush
+      - 모인 입장/퇴장을 roster_diff로 전송 (role_filter=INSTRUCTOR)
+
+Redis 구조 (session_roster:*):
+  session_roster:open:{session_code}    현재 열린 창 (창 길이 TTL)
+  session_roster:joined:{session_code}  연결 키 → 입장 정보 JSON
+  session_roster:left:{session_code}    연결 키 → 퇴장 정보 JSON
+
+연결 키는 WebSocket 채널 이름 (같은 사용자라도 연결마다 다름).
+"""
+import json
+import logging
+from typing import Dict
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.utils import timezone
+
+from core.redis import get_async_redis, get_redis
+
+from . import event_log
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'session_roster'
+
+# 창이 끝나기 전에 flush가 실행되지 않으면(워커 장애) 남은 변경을 버리는 시간
+PENDING_TTL = 300
+
+
+def _keys(session_code: str) -> Dict[str, str]:
+    return {
+        'open': f'{KEY_PREFIX}:open:{session_code}',
+        'joined': f'{KEY_PREFIX}:joined:{session_code}',
+        'left': f'{KEY_PREFIX}:left:{session_code}',
+    }
+
+
+def window_seconds() -> float:
+    return getattr(settings, 'SESSION_ROSTER_DIFF_WINDOW_SECONDS', 2)
+
+
+async def add_change(session_code: str, action: str, connection_key: str, member: Dict) -> bool:
+    """
+    입장(joined)/퇴장(left) 변경을 현재 창에 추가
+
+    Args:
+        session_code: 세션 코드
+        action: 'joined' 또는 'left'
+        connection_key: 연결 키 (채널 이름)
+        member: 알림에 포함할 참가자 정보 (user_id, user_name, role / device_id)
+
+    Returns:
+        이 변경으로 창이 새로 열렸으면 True (flush 예약 필요)
+    """
+    redis = get_async_redis()
+    keys = _keys(session_code)
+    member = {**member, 'at': timezone.now().isoformat()}
+
+    # 아직 알리지 않은 입장의 연결이 나가면 입장 알림만 지운다 (이미 예약된 flush가 처리)
+    if action == 'left' and await redis.hdel(keys['joined'], connection_key):
+        return False
+
+    pipe = redis.pipeline()
+    pipe.hset(keys[action], connection_key, json.dumps(member, ensure_ascii=False))
+    pipe.expire(keys[action], PENDING_TTL)
+    pipe.set(keys['open'], 1, nx=True, px=int(window_seconds() * 1000))
+    return bool((await pipe.execute())[-1])
+
+
+def flush(session_code: str) -> Dict:
+    """
+    창이 끝난 입장/퇴장 변경 전송 (Celery 태스크에서 호출)
+
+    Returns:
+        Dict containing:
+            - joined: 입장 수
+            - left: 퇴장 수
+    """
+    redis = get_redis()
+    keys = _keys(session_code)
+
+    pipe = redis.pipeline()
+    pipe.hvals(keys['joined'])
+    pipe.hvals(keys['left'])
+    pipe.delete(keys['joined'], keys['left'])
+    joined, left, _ = pipe.execute()
+
+    joined = sorted((json.loads(raw) for raw in joined), key=lambda member: member['at'])
+    left = sorted((json.loads(raw) for raw in left), key=lambda member: member['at'])
+    if not joined and not left:
+        return {'joined': 0, 'left': 0}
+
+    channel_layer = get_channel_layer()
+    if channel_layer is not None:
+        event = {
+            'type': 'roster_diff',
+            'joined': joined,
+            'left': left,
+            'role_filter': 'INSTRUCTOR',
+        }
+        event_log.record(session_code, event)
+        try:
+            async_to_sync(channel_layer.group_send)(f'session_{session_code}', event)
+        except Exception as e:
+            logger.error(f"Failed to send roster_diff for session {session_code}: {e}")
+
+    return {'joined': len(joined), 'left': len(left)}
@@ -11,6 +11,7 @@ from django.db.models import Max
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
 
+from . import directory, event_log, versions
 from .models import LectureSession, SessionParticipant, StudentScreenshot
 from .serializers import (
     StudentScreenshotSerializer,
@@ -90,22 +91,22 @@ class ScreenshotUploadView(APIView):
             participant_name = "Unknown"
             participant_id = None
             if screenshot.participant:
-                participant_name = screenshot.participant.participant_name
+                # 세션 참가자 디렉터리에서 이름 조회 (참가자 user를 다시 읽지 않음)
+                participant_name = directory.resolve_name(session.id, screenshot.participant)
                 participant_id = screenshot.participant.id
             elif screenshot.device_id:
                 participant_name = f"익명-{screenshot.device_id[:8]}"
 
-            async_to_sync(channel_layer.group_send)(
-                group_name,
-                {
-                    'type': 'screenshot_updated',
-                    'participant_id': participant_id,
-                    'device_id': screenshot.device_id,
-                    'participant_name': participant_name,
-                    'image_url': screenshot.image.url if screenshot.image else None,
-                    'captured_at': screenshot.captured_at.isoformat(),
-                }
-            )
+            event = {
+                'type': 'screenshot_updated',
+                'participant_id': participant_id,
+                'device_id': screenshot.device_id,
+                'participant_name': participant_name,
+                'image_url': screenshot.image.url if screenshot.image else None,
+                'captured_at': screenshot.captured_at.isoformat(),
+            }
+            event_log.record(session.session_code, event)
+            async_to_sync(channel_layer.group_send)(group_name, event)
         except Exception as e:
             # WebSocket 알림 실패해도 업로드는 성공으로 처리
             print(f"Failed to send WebSocket notification: {e}")
@@ -116,19 +117,26 @@ class StudentScreenshotListView(APIView):
     세션 내 모든 학생의 최신 스크린샷 목록 조회 (강사용)
 
     GET /api/sessions/{session_id}/screenshots/
+
+    ETag/If-None-Match 지원 (세션 버전), ?wait=초 로 long-poll
     """
     permission_classes = [IsAuthenticated]
 
     def get(self, request, session_id):
         session = get_object_or_404(LectureSession, id=session_id)
 
-        # 강사 권한 확인
-        if session.instructor != request.user:
+        # 강사 권한 확인 (304보다 먼저)
+        if session.instructor_id != request.user.id:
             return Response(
                 {'error': '권한이 없습니다.'},
                 status=status.HTTP_403_FORBIDDEN
             )
 
+        conditional = versions.ConditionalGet(request, versions.session_scope(session_id), request.user.id)
+        not_modified = conditional.not_modified()
+        if not_modified is not None:
+            return not_modified
+
         # 각 참가자/device_id별 최신 스크린샷만 조회
         # Subquery를 사용하여 최신 스크린샷 ID를 찾음
         latest_screenshot_ids = StudentScreenshot.objects.filter(
@@ -146,7 +154,7 @@ class StudentScreenshotListView(APIView):
             many=True,
             context={'request': request}
         )
-        return Response(serializer.data)
+        return conditional.apply(Response(serializer.data))
 
 
 class StudentScreenshotDetailView(APIView):
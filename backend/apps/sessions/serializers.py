@@ -169,7 +169,8 @@ class RecordingSessionCreateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = RecordingSession
-        fields = ['title', 'description']
+        fields = ['title', 'description', 'live_analysis']
+        extra_kwargs = {'live_analysis': {'required': False}}
 
     def create(self, validated_data):
         # instructor는 view에서 request.user로 자동 설정
@@ -203,13 +204,15 @@ class RecordingSessionListSerializer(serializers.ModelSerializer):
 class RecordingSessionAnalysisSerializer(serializers.ModelSerializer):
     """분석 결과를 포함한 녹화 세션 시리얼라이저"""
     step_count = serializers.SerializerMethodField()
+    draft_step_count = serializers.SerializerMethodField()
 
     class Meta:
         model = RecordingSession
         fields = [
             'id', 'title', 'status',
             'analysis_result', 'analyzed_at', 'analysis_error',
-            'step_count', 'event_count', 'created_at'
+            'step_count', 'event_count', 'created_at',
+            'live_analysis', 'draft_analysis', 'draft_step_count', 'analyzed_event_count'
         ]
         read_only_fields = fields
 
@@ -219,6 +222,12 @@ class RecordingSessionAnalysisSerializer(serializers.ModelSerializer):
             return len(obj.analysis_result)
         return 0
 
+    def get_draft_step_count(self, obj):
+        """녹화 중 분석된 초안 단계 수 반환"""
+        if obj.draft_analysis and isinstance(obj.draft_analysis, list):
+            return len(obj.draft_analysis)
+        return 0
+
 
 class RecordingConvertSerializer(serializers.Serializer):
     """녹화 → 과제 변환 요청 시리얼라이저"""
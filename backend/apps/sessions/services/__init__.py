@@ -1,7 +1,8 @@
 from .recording_analysis_service import RecordingAnalysisService
 from .lecture_conversion_service import TaskConversionService
+from .session_summary_service import SessionSummaryService
 
 # 기존 호환성 유지
 LectureConversionService = TaskConversionService
 
-__all__ = ['RecordingAnalysisService', 'TaskConversionService', 'LectureConversionService']
+__all__ = ['RecordingAnalysisService', 'TaskConversionService', 'LectureConversionService', 'SessionSummaryService']
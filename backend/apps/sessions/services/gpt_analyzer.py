@@ -34,7 +34,10 @@ class GPTAnalyzer:
         api_key = config('OPENAI_API_KEY', default=None)
         if not api_key:
             raise ValueError("OPENAI_API_KEY is not configured in environment variables")
-        self.client = OpenAI(api_key=api_key)
+        self.client = OpenAI(
+            api_key=api_key,
+            base_url=config('OPENAI_BASE_URL', default=None),
+        )
         self.model = config('OPENAI_MODEL', default='gpt-4o-mini')
 
     def _minimize_events(self, events: List[Dict]) -> List[Dict]:
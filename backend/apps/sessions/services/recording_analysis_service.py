@@ -23,6 +23,14 @@ ESSENTIAL_FIELDS = [
     "bounds"
 ]
 
+# 화면 전환 이벤트 - 실시간 분석 시 구간(segment)의 경계로 사용
+SEGMENT_BOUNDARY_EVENT_TYPES = {
+    "WINDOW_CHANGE",  # Android 강의자 앱
+    "TYPE_WINDOW_STATE_CHANGED",
+    "SCREEN_CHANGE",
+    "32",
+}
+
 
 class RecordingAnalysisService:
     """
@@ -41,6 +49,9 @@ class RecordingAnalysisService:
         else:
             # 환경변수로 설정 (httpx proxies 충돌 방지)
             os.environ['OPENAI_API_KEY'] = self.api_key
+            base_url = getattr(settings, 'OPENAI_BASE_URL', None)
+            if base_url:
+                os.environ['OPENAI_BASE_URL'] = base_url
             self.client = OpenAI()
 
     def analyze_recording(self, recording_session_id: int) -> Dict:
@@ -121,6 +132,133 @@ class RecordingAnalysisService:
 
             return {'success': False, 'error': error_msg}
 
+    def analyze_live_segments(self, recording_session_id: int, final: bool = False) -> Dict:
+        """
+        녹화 중 닫힌 구간(segment)을 증분 분석하여 분석 초안에 추가
+
+        화면 전환 이벤트를 경계로 이미 끝난 구간만 분석하고, 아직 진행 중인
+        마지막 구간은 다음 호출로 미룬다. final=True(녹화 종료 후)이면 남은
+        꼬리 구간까지 분석한 뒤 초안을 최종 분석 결과로 확정한다.
+
+        Args:
+            recording_session_id: RecordingSession ID
+            final: 꼬리 구간까지 분석하고 결과를 확정할지 여부
+
+        Returns:
+            Dict containing:
+                - success: bool
+                - analyzed_events: 이번에 분석한 이벤트 수
+                - draft_step_count: 누적 초안 단계 수
+                - error: Error message (if failed)
+        """
+        from apps.sessions.models import RecordingSession
+        from apps.logs.models import ActivityLog
+
+        try:
+            recording = RecordingSession.objects.get(id=recording_session_id)
+            offset = recording.analyzed_event_count
+            draft = list(recording.draft_analysis or [])
+
+            pending_events = list(
+                ActivityLog.objects.filter(
+                    recording_session=recording
+                ).order_by('timestamp', 'id')[offset:]
+            )
+
+            end = len(pending_events) if final else self._find_closed_segment_end(pending_events)
+
+            new_steps = []
+            if end > 0:
+                minimized_events = self._minimize_events(pending_events[:end])
+                if minimized_events:
+                    new_steps = self._call_gpt_analysis(minimized_events)
+
+            # 단계 번호를 기존 초안에 이어서 재부여
+            for index, step in enumerate(new_steps, start=len(draft) + 1):
+                if isinstance(step, dict):
+                    step['step'] = index
+            draft.extend(new_steps)
+
+            update_fields = {
+                'draft_analysis': draft,
+                'analyzed_event_count': offset + end,
+                'updated_at': timezone.now(),
+            }
+            if final:
+                if offset + end == 0:
+                    raise ValueError("녹화된 이벤트가 없습니다.")
+                update_fields.update({
+                    'analysis_result': draft,
+                    'analyzed_at': timezone.now(),
+                    'status': 'ANALYZED',
+                })
+
+            # 다른 워커가 같은 구간을 먼저 반영했다면 덮어쓰지 않음
+            updated = RecordingSession.objects.filter(
+                id=recording_session_id,
+                analyzed_event_count=offset,
+            ).update(**update_fields)
+
+            if not updated:
+                logger.info(f"Recording {recording_session_id} segment already analyzed by another worker")
+                return {'success': True, 'analyzed_events': 0, 'draft_step_count': len(draft)}
+
+            logger.info(
+                f"Recording {recording_session_id} live analysis: "
+                f"{end} events -> {len(new_steps)} steps (final={final})"
+            )
+
+            return {
+                'success': True,
+                'analyzed_events': end,
+                'draft_step_count': len(draft),
+            }
+
+        except RecordingSession.DoesNotExist:
+            error_msg = f"RecordingSession {recording_session_id} not found"
+            logger.error(error_msg)
+            return {'success': False, 'error': error_msg}
+
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(f"Error in live analysis of recording {recording_session_id}: {error_msg}")
+
+            # 녹화 중 구간 분석 실패는 다음 호출에서 더 큰 구간으로 재시도되므로
+            # 최종 확정 단계에서만 실패 상태로 저장
+            if final:
+                RecordingSession.objects.filter(id=recording_session_id).update(
+                    status='FAILED',
+                    analysis_error=error_msg,
+                    updated_at=timezone.now(),
+                )
+
+            return {'success': False, 'error': error_msg}
+
+    def _find_closed_segment_end(self, events) -> int:
+        """
+        분석 가능한(닫힌) 구간의 끝 위치 계산
+
+        마지막 화면 전환 이벤트 직전까지가 닫힌 구간이며, 화면 전환 없이
+        이벤트가 RECORDING_LIVE_SEGMENT_MAX_EVENTS개 이상 쌓이면 전체를 닫는다.
+
+        Args:
+            events: 아직 분석되지 않은 ActivityLog 목록 (시간순)
+
+        Returns:
+            닫힌 구간에 속한 이벤트 수 (0이면 분석할 구간 없음)
+        """
+        max_events = getattr(settings, 'RECORDING_LIVE_SEGMENT_MAX_EVENTS', 40)
+
+        end = 0
+        for index, event in enumerate(events):
+            if index > 0 and event.event_type in SEGMENT_BOUNDARY_EVENT_TYPES:
+                end = index
+
+        if len(events) - end >= max_events:
+            end = len(events)
+
+        return end
+
     def _minimize_events(self, events) -> List[Dict]:
         """
         이벤트 데이터를 GPT 분석에 필요한 필수 필드만 추출
@@ -253,6 +391,9 @@ title은 한글로 간결하게 작성하고, description은 해당 단계에서
             if recording.status == 'ANALYZED' and recording.analysis_result:
                 result['steps'] = recording.analysis_result
                 result['step_count'] = len(recording.analysis_result)
+            elif recording.live_analysis and recording.draft_analysis:
+                result['draft_steps'] = recording.draft_analysis
+                result['draft_step_count'] = len(recording.draft_analysis)
 
             return result
 
@@ -0,0 +1,233 @@
+"""
+Session Summary Service - 세션 요약 계산 및 종료 시점 스냅샷 고정
+
+종료(ENDED)된 세션의 요약은 더 이상 바뀌지 않으므로, 종료 상태로 바뀔 때 태스크로
+한 번 계산해 SessionSummarySnapshot에 저장하고 이후에는 저장된 값을 그대로 제공한다.
+진행 중인 세션과 복습 모드(REVIEW_MODE - 아직 참가/완료 보고를 받음) 세션은 조회할 때마다 실시간으로 계산한다.
+복습 모드 시절 구버전이 고정한 스냅샷은 종료로 바뀔 때 다시 계산해 교체한다.
+
+플로우:
+  LectureSession 종료 상태 저장 (SessionEndView, WebSocket end_session 등) → signals (커밋 후)
+    → freeze_session_summary_task → SessionSummaryService.freeze
+  SessionSummaryView / SessionTrendsView → 종료 세션은 스냅샷, 진행 중 세션은 build
+"""
+import logging
+from collections import Counter
+from typing import Dict
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷으로 고정하는 세션 상태 (REVIEW_MODE는 참가/완료 보고를 계속 받으므로 제외)
+SNAPSHOT_STATUSES = ('ENDED',)
+
+
+class SessionSummaryService:
+    """세션 요약 계산/스냅샷 서비스"""
+
+    def build(self, session) -> Dict:
+        """
+        세션 요약 실시간 계산 (SessionSummaryView 응답 형식)
+
+        Args:
+            session: LectureSession instance
+
+        Returns:
+            세션/참가자/단계/도움 요청 요약 Dict
+        """
+        from apps.help.models import HelpRequest
+        from apps.lectures.services import get_lecture_plan
+
+        # 참가자 정보
+        participants = list(session.participants.select_related('user'))
+        total_participants = len(participants)
+
+        # 완료율 계산
+        completed_participants = sum(1 for p in participants if p.status == 'COMPLETED')
+        completion_rate = (completed_participants / total_participants * 100) if total_participants > 0 else 0
+
+        # 전체 단계 수
+        total_subtasks = get_lecture_plan(session.lecture_id)['total_subtasks'] if session.lecture_id else 0
+
+        # 참가자별 진행률 계산
+        participant_progress = []
+        all_completed_subtasks = []
+
+        for p in participants:
+            completed_count = len(p.completed_subtasks or [])
+            all_completed_subtasks.extend(p.completed_subtasks or [])
+
+            progress_rate = (completed_count / total_subtasks * 100) if total_subtasks > 0 else 0
+
+            participant_progress.append({
+                'id': p.id,
+                'name': p.display_name or p.participant_name,
+                'status': p.status,
+                'completedCount': completed_count,
+                'totalSteps': total_subtasks,
+                'progressRate': round(progress_rate, 1),
+                'joinedAt': p.joined_at.isoformat() if p.joined_at else None,
+                'completedAt': p.completed_at.isoformat() if p.completed_at else None,
+            })
+
+        # 평균 진행률
+        avg_progress = sum(p['progressRate'] for p in participant_progress) / total_participants if total_participants > 0 else 0
+
+        # 도움 요청 통계
+        help_requests = HelpRequest.objects.filter(session=session)
+        help_totals = help_requests.order_by().aggregate(
+            total=Count('id'),
+            resolved=Count('id', filter=Q(status='RESOLVED')),
+        )
+        total_help_requests = help_totals['total']
+        resolved_help_requests = help_totals['resolved']
+
+        # 어려운 단계 분석 (도움 요청이 많은 단계)
+        help_by_subtask = help_requests.values('subtask_id', 'subtask__title').annotate(
+            count=Count('id')
+        ).order_by('-count')[:5]
+
+        difficult_steps = [
+            {
+                'subtaskId': item['subtask_id'],
+                'subtaskName': item['subtask__title'],
+                'helpRequestCount': item['count'],
+            }
+            for item in help_by_subtask if item['subtask_id']
+        ]
+
+        # 단계별 완료 통계
+        subtask_completion_stats = dict(Counter(all_completed_subtasks))
+
+        # 세션 시간 계산
+        duration_seconds = 0
+        if session.started_at and session.ended_at:
+            duration_seconds = int((session.ended_at - session.started_at).total_seconds())
+        elif session.started_at:
+            duration_seconds = int((timezone.now() - session.started_at).total_seconds())
+
+        return {
+            'sessionId': session.id,
+            'sessionTitle': session.title,
+            'sessionCode': session.session_code,
+            'lectureId': session.lecture.id if session.lecture else None,
+            'lectureName': session.lecture.title if session.lecture else None,
+            'status': session.status,
+
+            # 시간 정보
+            'startedAt': session.started_at.isoformat() if session.started_at else None,
+            'endedAt': session.ended_at.isoformat() if session.ended_at else None,
+            'durationSeconds': duration_seconds,
+
+            # 참가자 통계
+            'totalParticipants': total_participants,
+            'completedParticipants': completed_participants,
+            'completionRate': round(completion_rate, 1),
+            'avgProgress': round(avg_progress, 1),
+
+            # 단계 정보
+            'totalSteps': total_subtasks,
+            'subtaskCompletionStats': subtask_completion_stats,
+
+            # 도움 요청 통계
+            'totalHelpRequests': total_help_requests,
+            'resolvedHelpRequests': resolved_help_requests,
+            'helpResolutionRate': round(resolved_help_requests / total_help_requests * 100, 1) if total_help_requests > 0 else 100,
+
+            # 어려운 단계
+            'difficultSteps': difficult_steps,
+
+            # 참가자 상세
+            'participants': participant_progress,
+        }
+
+    def build_trend_metrics(self, session) -> Dict:
+        """
+        세션 간 추이 비교용 지표 (SessionTrendsView 기준과 동일)
+
+        Returns:
+            Dict containing participant_count, completed_count, avg_completion_time, help_request_count
+        """
+        from apps.help.models import HelpRequest
+
+        participant_count = 0
+        completed_count = 0
+        total_time = 0
+        timed_count = 0
+        for row in session.participants.values('status', 'joined_at', 'completed_at'):
+            participant_count += 1
+            if row['status'] == 'COMPLETED':
+                completed_count += 1
+            if row['joined_at'] and row['completed_at']:
+                total_time += (row['completed_at'] - row['joined_at']).total_seconds()
+                timed_count += 1
+
+        help_request_count = 0
+        if session.lecture_id:
+            help_request_count = HelpRequest.objects.filter(
+                subtask__task__lecture_id=session.lecture_id,
+                created_at__gte=session.started_at if session.started_at else timezone.now(),
+                created_at__lte=session.ended_at if session.ended_at else timezone.now()
+            ).count()
+
+        return {
+            'participant_count': participant_count,
+            'completed_count': completed_count,
+            'avg_completion_time': total_time / timed_count if timed_count > 0 else 0,
+            'help_request_count': help_request_count,
+        }
+
+    def freeze(self, session, replace: bool = False):
+        """
+        종료된 세션의 요약 스냅샷 생성 (이미 있으면 기존 스냅샷 반환)
+
+        Args:
+            session: LectureSession instance
+            replace: 이미 있는 스냅샷도 다시 계산해 교체 (종료 상태로 바뀔 때)
+
+        Returns:
+            SessionSummarySnapshot 또는 None (아직 종료되지 않은 세션)
+        """
+        from apps.sessions.models import SessionSummarySnapshot
+
+        if session.status not in SNAPSHOT_STATUSES:
+            return None
+
+        # 확인/계산/저장을 모두 primary에서 (ReplicaReadMixin 구간에서 호출되어도 트랜잭션 안의 읽기는
+        # primary로 가므로, 복제 지연된 데이터로 스냅샷을 고정하거나 방금 생긴 스냅샷을 놓치지 않음)
+        with transaction.atomic():
+            existing = SessionSummarySnapshot.objects.select_for_update().filter(session=session).first()
+            if existing is not None and not replace:
+                return existing
+
+            summary = self.build(session)
+            trend_metrics = self.build_trend_metrics(session)
+            if existing is not None:
+                existing.summary = summary
+                for field, value in trend_metrics.items():
+                    setattr(existing, field, value)
+                existing.save()
+                return existing
+            try:
+                with transaction.atomic():
+                    return SessionSummarySnapshot.objects.create(
+                        session=session,
+                        summary=summary,
+                        **trend_metrics,
+                    )
+            except IntegrityError:
+                # 태스크와 조회 요청이 동시에 생성한 경우
+                return SessionSummarySnapshot.objects.get(session=session)
+
+    def get_summary(self, session) -> Dict:
+        """
+        세션 요약 조회 - 종료된 세션은 스냅샷(없으면 생성), 진행 중/복습 모드 세션은 실시간 계산
+        """
+        snapshot = self.freeze(session)
+        if snapshot is None:
+            return self.build(session)
+
+        return {**snapshot.summary, 'status': session.status}
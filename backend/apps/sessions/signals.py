@@ -0,0 +1,98 @@
+"""
+Session Signals - 세션 조회 API 버전(ETag) 증가
+
+참가자/세션/스크린샷 저장·삭제 시 세션(및 참가자 사용자) 범위 버전을 올린다.
+queryset.update()는 signal을 보내지 않으므로 해당 위치에서 versions.bump를 직접 호출한다.
+세션 저장·삭제 시에는 참가(join) 경로의 세션 참가 정보 캐시도 비운다.
+수업 중인 세션이면 새 참가자와 세션 필드를 Redis 실시간 상태(live_state)에도 반영한다.
+참가자 생성/이름 변경/삭제는 세션 참가자 디렉터리(directory)에도 반영한다.
+세션이 종료(ENDED)로 바뀌면 (REST/WebSocket 어느 경로든) 커밋 후 요약 스냅샷 생성 태스크를 등록한다.
+"""
+import logging
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from . import admission, directory, live_state, versions
+from .models import LectureSession, SessionParticipant, StudentScreenshot
+from .services.session_summary_service import SNAPSHOT_STATUSES
+from .tasks import freeze_session_summary_task
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=SessionParticipant)
+@receiver(post_delete, sender=SessionParticipant)
+def bump_version_on_participant_change(sender, instance, **kwargs):
+    versions.bump(instance.session_id, [instance.user_id])
+
+
+@receiver(post_save, sender=SessionParticipant)
+def add_participant_to_live_state(sender, instance, created, **kwargs):
+    # 이미 있는 참가자의 변경은 실시간 상태를 거쳐 오므로 새 참가자만 추가한다
+    if created:
+        transaction.on_commit(lambda: live_state.add_participant(instance))
+
+
+@receiver(post_delete, sender=SessionParticipant)
+def remove_participant_from_live_state(sender, instance, **kwargs):
+    transaction.on_commit(lambda: live_state.remove_participant(instance))
+
+
+@receiver(post_save, sender=SessionParticipant)
+def record_participant_in_directory(sender, instance, created, **kwargs):
+    if created:
+        transaction.on_commit(lambda: directory.register(instance.session_id, instance))
+    else:
+        transaction.on_commit(lambda: directory.refresh(instance.session_id, instance))
+
+
+@receiver(post_delete, sender=SessionParticipant)
+def remove_participant_from_directory(sender, instance, **kwargs):
+    transaction.on_commit(lambda: directory.forget(instance.session_id, instance))
+
+
+@receiver(post_save, sender=LectureSession)
+def bump_version_on_session_save(sender, instance, **kwargs):
+    # 세션 상태/현재 단계는 참가자의 '내 활성 세션' 응답에도 포함된다
+    versions.bump_participants(instance.id, instance.participants.all())
+    admission.invalidate_join_descriptor(instance.session_code)
+    live_state.sync_session(instance)
+
+
+@receiver(post_init, sender=LectureSession)
+def remember_session_status(sender, instance, **kwargs):
+    # 지연 로딩된 필드는 읽지 않음 (조회 쿼리를 추가로 만들지 않도록)
+    instance._saved_status = instance.__dict__.get('status') if instance.pk else None
+
+
+def _queue_summary_freeze(session_id):
+    try:
+        # 복습 모드에서 받은 완료까지 반영하도록 이미 있는 스냅샷도 다시 계산
+        freeze_session_summary_task.delay(session_id, replace=True)
+    except Exception as e:
+        # 스냅샷은 요약 조회 시에도 생성됨
+        logger.warning(f"Failed to queue summary snapshot for session {session_id}: {e}")
+
+
+@receiver(post_save, sender=LectureSession)
+def freeze_summary_on_session_end(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_saved_status', None)
+    current = instance.__dict__.get('status')
+    instance._saved_status = current
+    if current in SNAPSHOT_STATUSES and (created or previous != current):
+        session_id = instance.id
+        transaction.on_commit(lambda: _queue_summary_freeze(session_id))
+
+
+@receiver(post_delete, sender=LectureSession)
+def bump_version_on_session_delete(sender, instance, **kwargs):
+    versions.bump(instance.id)
+    admission.invalidate_join_descriptor(instance.session_code)
+
+
+@receiver(post_save, sender=StudentScreenshot)
+@receiver(post_delete, sender=StudentScreenshot)
+def bump_version_on_screenshot_change(sender, instance, **kwargs):
+    versions.bump(instance.session_id)
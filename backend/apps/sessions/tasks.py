@@ -1,5 +1,5 @@
 """
-Celery Tasks for Recording Session Analysis
+Celery Tasks for Recording Session Analysis, Session Summary and Roster Diffs
 """
 import logging
 from celery import shared_task
@@ -60,6 +60,63 @@ def analyze_recording_task(self, recording_session_id: int):
         return {'success': False, 'error': str(exc)}
 
 
+@shared_task(bind=True)
+def analyze_recording_segments_task(self, recording_session_id: int, final: bool = False):
+    """
+    녹화 중 증분 분석 태스크
+
+    닫힌 구간만 분석하여 초안에 추가한다. 같은 녹화에 대해서는 한 번에 하나의
+    워커만 분석하도록 캐시 락을 사용하며, 종료(final) 태스크는 진행 중인 구간
+    분석이 끝날 때까지 재시도로 대기한다. 락 TTL(RECORDING_LIVE_ANALYSIS_LOCK_TTL)이
+    지나도록 락을 얻지 못하면 전체 분석(analyze_recording_task)으로 넘겨
+    녹화가 PROCESSING에 머물지 않도록 한다.
+
+    Args:
+        recording_session_id: RecordingSession ID
+        final: 꼬리 구간까지 분석하고 결과를 확정할지 여부
+
+    Returns:
+        Dict with live analysis result
+    """
+    from celery.exceptions import MaxRetriesExceededError
+    from django.conf import settings
+    from django.core.cache import cache
+    from apps.sessions.services import RecordingAnalysisService
+
+    lock_key = f'recording_live_analysis_lock:{recording_session_id}'
+    lock_ttl = getattr(settings, 'RECORDING_LIVE_ANALYSIS_LOCK_TTL', 300)
+    if not cache.add(lock_key, self.request.id or 'local', timeout=lock_ttl):
+        if not final:
+            # 진행 중인 구간 분석이 다음 구간까지 이어서 처리하므로 생략
+            return {'success': True, 'skipped': True}
+
+        # 락 TTL이 지날 때까지 대기 (락을 잡은 워커가 죽어도 TTL 후에는 락이 풀림)
+        retry_delay = getattr(settings, 'RECORDING_LIVE_FINAL_RETRY_DELAY', 5)
+        try:
+            raise self.retry(countdown=retry_delay, max_retries=lock_ttl // retry_delay + 1)
+        except MaxRetriesExceededError:
+            logger.warning(
+                f"Live analysis lock for recording {recording_session_id} not released "
+                f"within {lock_ttl}s, falling back to full analysis"
+            )
+            analyze_recording_task.delay(recording_session_id)
+            return {'success': False, 'error': 'live analysis lock timeout', 'fallback': True}
+
+    try:
+        service = RecordingAnalysisService()
+        result = service.analyze_live_segments(recording_session_id, final=final)
+    finally:
+        cache.delete(lock_key)
+
+    if not result.get('success'):
+        logger.warning(
+            f"Live analysis failed for recording {recording_session_id}: "
+            f"{result.get('error', 'Unknown error')}"
+        )
+
+    return result
+
+
 @shared_task
 def convert_recording_to_task_task(
     recording_session_id: int,
@@ -106,3 +163,95 @@ def convert_recording_to_lecture_task(
 ):
     """[Deprecated] convert_recording_to_task_task 사용 권장"""
     return convert_recording_to_task_task(recording_session_id, title, description)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=30)
+def freeze_session_summary_task(self, session_id: int, replace: bool = False):
+    """
+    세션 종료 시 요약 스냅샷 생성 태스크
+
+    Args:
+        session_id: LectureSession ID
+        replace: 이미 있는 스냅샷도 다시 계산해 교체
+
+    Returns:
+        Dict with snapshot result
+    """
+    from apps.sessions.models import LectureSession
+    from apps.sessions.services import SessionSummaryService
+
+    try:
+        session = LectureSession.objects.select_related('lecture').get(id=session_id)
+    except LectureSession.DoesNotExist:
+        return {'success': False, 'error': f"Session {session_id} not found"}
+
+    try:
+        snapshot = SessionSummaryService().freeze(session, replace=replace)
+    except Exception as exc:
+        logger.error(f"Summary snapshot failed for session {session_id}: {exc}")
+        raise self.retry(exc=exc)
+
+    if snapshot is None:
+        return {'success': False, 'error': f"Session {session_id} has not ended"}
+
+    logger.info(f"Summary snapshot stored for session {session_id}")
+    return {'success': True, 'snapshot_id': snapshot.id}
+
+
+@shared_task
+def flush_roster_diff_task(session_code: str):
+    """
+    참가자 입장/퇴장 묶음 창 종료 처리 (창의 첫 변경 시 창 길이만큼 지연 실행)
+
+    Args:
+        session_code: 세션 코드
+    """
+    from apps.sessions import roster
+
+    return roster.flush(session_code)
+
+
+@shared_task
+def flush_live_session_state_task():
+    """
+    진행 중 세션의 Redis 참가자 상태 변경을 DB에 기록 (Celery beat, SESSION_LIVE_STATE_FLUSH_INTERVAL_SECONDS 간격)
+
+    Returns:
+        Dict of session_id → 기록한 참가자 수
+    """
+    from apps.sessions import live_state
+
+    return live_state.flush_all()
+
+
+@shared_task(bind=True, max_retries=12)
+def reconcile_live_state_task(self, session_id: int):
+    """
+    flush 잠금 때문에 미룬 세션 종료 정리를 다시 시도 (live_state.reconcile)
+
+    Args:
+        session_id: LectureSession ID
+    """
+    from celery.exceptions import MaxRetriesExceededError
+    from apps.sessions import live_state
+
+    result = live_state.reconcile(session_id, retry=False)
+    if result is None:
+        try:
+            raise self.retry(countdown=live_state.RECONCILE_RETRY_DELAY)
+        except MaxRetriesExceededError:
+            logger.error(f"Gave up reconciling live state for session {session_id}; flush lock never released")
+    return result
+
+
+@shared_task
+def persist_session_events_task():
+    """
+    세션 이벤트 로그의 pending 이벤트를 DB(session_events)에 기록 (Celery beat)
+
+    Returns:
+        기록한 이벤트 수
+    """
+    from apps.sessions import event_log
+
+    return event_log.persist_pending()
@@ -0,0 +1,65 @@
+"""
+세션 조회 API 조건부 GET - long-poll 동시 대기 제한, 304보다 먼저 권한 확인
+"""
+import uuid
+from unittest import mock
+
+from django.http import HttpResponseNotModified
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.accounts.models import User
+from apps.lectures.models import Lecture
+from apps.sessions import versions
+from apps.sessions.models import LectureSession, SessionParticipant
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        self.instructor = User.objects.create_user(
+            email='poll-instructor@example.com', password='x', name='강사', role='INSTRUCTOR'
+        )
+        self.student = User.objects.create_user(
+            email='poll-student@example.com', password='x', name='학생', role='STUDENT'
+        )
+        lecture = Lecture.objects.create(instructor=self.instructor, title='강의')
+        self.session = LectureSession.objects.create(
+            lecture=lecture, instructor=self.instructor, title='세션',
+            session_code=uuid.uuid4().hex[:6].upper(), status='IN_PROGRESS',
+        )
+        SessionParticipant.objects.create(session=self.session, user=self.student, status='ACTIVE')
+        self.client = APIClient()
+
+    def test_long_poll_returns_304_immediately_when_waiters_are_full(self):
+        self.client.force_authenticate(self.student)
+        etag = self.client.get('/api/sessions/my-active/')['ETag']
+
+        with override_settings(SESSION_LONG_POLL_MAX_WAITERS=0), \
+                mock.patch('apps.sessions.versions.wait_for_change') as wait_for_change:
+            response = self.client.get('/api/sessions/my-active/?wait=25', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        wait_for_change.assert_not_called()
+
+    def test_long_poll_waits_when_a_slot_is_free(self):
+        self.client.force_authenticate(self.student)
+        etag = self.client.get('/api/sessions/my-active/')['ETag']
+
+        with mock.patch('apps.sessions.versions.wait_for_change', return_value=False) as wait_for_change:
+            response = self.client.get('/api/sessions/my-active/?wait=1', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        wait_for_change.assert_called_once()
+        self.assertEqual(versions._waiters, 0)
+
+    def test_permission_is_checked_before_not_modified(self):
+        self.client.force_authenticate(self.student)
+        with mock.patch.object(
+            versions.ConditionalGet, 'not_modified', return_value=HttpResponseNotModified()
+        ):
+            for url in (
+                f'/api/sessions/{self.session.id}/completion-status/',
+                f'/api/dashboard/sessions/{self.session.id}/progress-stats/',
+                f'/api/sessions/{self.session.id}/screenshots/',
+            ):
+                self.assertEqual(self.client.get(url).status_code, 403, url)
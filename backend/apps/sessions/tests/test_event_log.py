@@ -0,0 +1,38 @@
+"""
+세션 이벤트 로그 - 기록하지 못한 이벤트에는 순번을 붙이지 않음
+"""
+import uuid
+from unittest import mock
+
+from django.test import TestCase
+
+from apps.sessions import event_log
+from core.redis import get_redis
+
+
+class EventLogRecordTests(TestCase):
+    def setUp(self):
+        self.session_code = uuid.uuid4().hex[:6].upper()
+        self.addCleanup(self._clear_redis)
+
+    def _clear_redis(self):
+        redis = get_redis()
+        for key in redis.scan_iter(f'{event_log.KEY_PREFIX}:{self.session_code}:*'):
+            redis.delete(key)
+
+    def test_record_assigns_consecutive_seq(self):
+        first, second = {'type': 'step_changed'}, {'type': 'step_changed'}
+
+        self.assertEqual(event_log.record(self.session_code, first), 1)
+        self.assertEqual(event_log.record(self.session_code, second), 2)
+        self.assertEqual([first['seq'], second['seq']], [1, 2])
+        self.assertEqual([event['seq'] for event in event_log.since(self.session_code, 0)], [1, 2])
+
+    def test_failed_append_leaves_event_without_seq(self):
+        event = {'type': 'step_changed'}
+
+        with mock.patch.object(event_log, '_append', side_effect=ConnectionError('redis down')):
+            self.assertIsNone(event_log.record(self.session_code, event))
+
+        # 재전송할 수 없는 순번을 클라이언트에 보내지 않음
+        self.assertNotIn('seq', event)
@@ -0,0 +1,76 @@
+"""
+도움 요청 묶음 - flush가 늦거나 예약되지 않으면 개별 help_requested로 알림
+"""
+import uuid
+from types import SimpleNamespace
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase, override_settings
+
+from apps.help.services import HelpClusterService
+from apps.sessions.consumers import SessionConsumer
+
+
+def _member(device_id):
+    return {
+        'user_id': device_id, 'user_name': device_id, 'device_id': device_id,
+        'account_id': None, 'message': '', 'screenshot_url': None, 'screenshot_id': None,
+    }
+
+
+@override_settings(HELP_CLUSTER_WINDOW_SECONDS=0, HELP_CLUSTER_FLUSH_GRACE_SECONDS=0)
+class HelpClusterFallbackTests(SimpleTestCase):
+    def setUp(self):
+        self.session_code = uuid.uuid4().hex[:6]
+        self.service = HelpClusterService()
+        self.service.window = 5  # 테스트 중 창이 닫히지 않도록 (감시 대기 시간은 설정값 0 사용)
+        self.consumer = SessionConsumer()
+        self.consumer.session_code = self.session_code
+        self.consumer.user = SimpleNamespace(id=None, role='STUDENT')
+        self.consumer.broadcast = mock.AsyncMock()
+        for name, value in (('_send', None), ('_build_shared_answer', {})):
+            patcher = mock.patch.object(HelpClusterService, name, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _join(self, device_id):
+        return async_to_sync(self.service.add_request)(self.session_code, 3, _member(device_id))
+
+    def _help_event(self, device_id, cluster_id):
+        return {'type': 'help_requested', 'user_id': device_id, 'device_id': device_id, 'cluster_id': cluster_id}
+
+    def test_late_flush_falls_back_to_individual_request(self):
+        first = self._join('dev-a')
+        second = self._join('dev-b')
+        self.assertFalse(second['is_first'])
+
+        event = self._help_event('dev-b', second['cluster_id'])
+        async_to_sync(self.consumer.watch_help_cluster)(second['cluster_id'], event)
+
+        self.consumer.broadcast.assert_awaited_once_with(event)
+        # 늦게 실행된 flush는 빠진 요청을 다시 묶지 않음
+        result = self.service.flush(first['cluster_id'])
+        self.assertEqual(result['count'], 1)
+        self.assertFalse(result['clustered'])
+
+    def test_flushed_cluster_does_not_send_again(self):
+        first = self._join('dev-a')
+        second = self._join('dev-b')
+        self.assertTrue(self.service.flush(first['cluster_id'])['clustered'])
+
+        async_to_sync(self.consumer.watch_help_cluster)(
+            second['cluster_id'], self._help_event('dev-b', second['cluster_id'])
+        )
+
+        self.consumer.broadcast.assert_not_awaited()
+
+    @override_settings(HELP_CLUSTER_WINDOW_SECONDS=5)
+    def test_failed_flush_scheduling_closes_cluster(self):
+        with mock.patch(
+            'apps.help.tasks.flush_help_cluster_task.apply_async', side_effect=ConnectionError('broker down')
+        ):
+            cluster = async_to_sync(self.consumer.join_help_cluster)(3, _member('dev-a'))
+
+        self.assertIsNone(cluster)
+        self.assertTrue(self._join('dev-b')['is_first'])
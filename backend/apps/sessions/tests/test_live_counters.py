@@ -0,0 +1,75 @@
+"""
+세션 실시간 카운터 - 기기가 있는 로그인 참가자를 한 번만 셈
+"""
+import uuid
+
+from asgiref.sync import async_to_sync
+from django.test import TestCase
+
+from apps.accounts.models import User
+from apps.lectures.models import Lecture
+from apps.sessions import live_counters, live_state
+from apps.sessions.consumers import SessionConsumer
+from apps.sessions.models import LectureSession, SessionParticipant
+from core.redis import get_redis
+
+
+class LiveCountersParticipantKeyTests(TestCase):
+    DELAY_SECONDS = 300
+
+    def _create_session(self, status):
+        instructor = User.objects.create_user(
+            email=f'{uuid.uuid4().hex[:8]}@example.com', password='x', name='강사', role='INSTRUCTOR'
+        )
+        lecture = Lecture.objects.create(instructor=instructor, title='강의')
+        session = LectureSession.objects.create(
+            lecture=lecture, instructor=instructor, title='세션',
+            session_code=uuid.uuid4().hex[:6].upper(), status=status,
+        )
+        self.student = User.objects.create_user(
+            email=f'{uuid.uuid4().hex[:8]}@example.com', password='x', name='학생', role='STUDENT'
+        )
+        SessionParticipant.objects.create(session=session, user=self.student, device_id='dev-a', status='ACTIVE')
+        SessionParticipant.objects.create(session=session, device_id='dev-b', status='ACTIVE')
+        SessionParticipant.objects.create(session=session, device_id='dev-c', status='WAITING')
+        self._clear_redis(session.id)
+        self.addCleanup(self._clear_redis, session.id)
+        return session
+
+    def _clear_redis(self, session_id):
+        redis = get_redis()
+        keys = list(redis.scan_iter(f'session_state:{session_id}:*'))
+        if keys:
+            redis.delete(*keys)
+        live_counters.invalidate(session_id)
+
+    def _consumer(self, session):
+        consumer = SessionConsumer()
+        consumer.session_code = session.session_code
+        consumer.user = self.student
+        consumer.device_id = None
+        return consumer
+
+    def _disconnect_keeps_total(self, session):
+        self.assertTrue(live_counters.rebuild(session.id))
+        before = live_counters.get_counts(session.id, self.DELAY_SECONDS)
+        self.assertEqual(before['total'], 3)
+
+        consumer = self._consumer(session)
+        async_to_sync(consumer.update_participant_last_active)()
+        async_to_sync(consumer.update_participant_on_disconnect)()
+
+        after = live_counters.get_counts(session.id, self.DELAY_SECONDS)
+        self.assertEqual(after['total'], 3)
+        self.assertEqual(after['in_progress'], before['in_progress'])
+        self.assertEqual(
+            get_redis().hget(f'session_live:{session.id}:members', 'device:dev-a'), 'DISCONNECTED'
+        )
+
+    def test_user_only_disconnect_keeps_total(self):
+        self._disconnect_keeps_total(self._create_session('WAITING'))
+
+    def test_user_only_disconnect_keeps_total_in_live_session(self):
+        session = self._create_session('IN_PROGRESS')
+        self.assertTrue(live_state.activate(session.id))
+        self._disconnect_keeps_total(session)
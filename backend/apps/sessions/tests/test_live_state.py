@@ -0,0 +1,91 @@
+"""
+세션 실시간 상태 - 완료 목록 동시 저장, flush가 잠겨 있을 때의 종료 정리
+"""
+import uuid
+from unittest import mock
+
+from django.test import TestCase
+
+from apps.accounts.models import User
+from apps.lectures.models import Lecture
+from apps.sessions import live_state
+from apps.sessions.models import LectureSession, SessionParticipant
+from core.redis import get_redis
+
+
+class LiveStateTests(TestCase):
+    def setUp(self):
+        instructor = User.objects.create_user(
+            email='live-instructor@example.com', password='x', name='강사', role='INSTRUCTOR'
+        )
+        lecture = Lecture.objects.create(instructor=instructor, title='강의')
+        self.session = LectureSession.objects.create(
+            lecture=lecture, instructor=instructor, title='세션',
+            session_code=uuid.uuid4().hex[:6].upper(), status='IN_PROGRESS',
+        )
+        self.participant = SessionParticipant.objects.create(
+            session=self.session, device_id='dev-a', status='ACTIVE', completed_subtasks=[10]
+        )
+        self._clear_redis()
+        self.addCleanup(self._clear_redis)
+        self.assertTrue(live_state.activate(self.session.id))
+
+    def _clear_redis(self):
+        redis = get_redis()
+        keys = list(redis.scan_iter(f'session_state:{self.session.id}:*'))
+        if keys:
+            redis.delete(*keys)
+
+    def _load(self):
+        return live_state.get_participant(self.session.id, device_id='dev-a')
+
+    def test_concurrent_completions_are_both_kept(self):
+        first, second = self._load(), self._load()
+        first.completed_subtasks.append(11)
+        first.save()
+        second.completed_subtasks.append(12)
+        second.save()
+
+        self.assertEqual(self._load().completed_subtasks, [10, 11, 12])
+
+    def test_uncomplete_does_not_drop_concurrent_completion(self):
+        first, second = self._load(), self._load()
+        first.completed_subtasks.append(11)
+        first.save()
+        second.completed_subtasks.remove(10)
+        second.save()
+
+        self.assertEqual(self._load().completed_subtasks, [11])
+
+    def test_reconcile_keeps_state_while_flush_is_locked(self):
+        participant = self._load()
+        participant.completed_subtasks.append(11)
+        participant.save()
+
+        with mock.patch.object(live_state, '_flush_waiting', return_value=None), \
+                mock.patch('apps.sessions.tasks.reconcile_live_state_task.apply_async') as retry:
+            self.assertIsNone(live_state.reconcile(self.session.id))
+
+        retry.assert_called_once()
+        self.assertEqual(self._load().completed_subtasks, [10, 11])
+
+        self.assertTrue(live_state.reconcile(self.session.id))
+        self.participant.refresh_from_db()
+        self.assertEqual(self.participant.completed_subtasks, [10, 11])
+        self.assertFalse(get_redis().exists(f'session_state:{self.session.id}:participants'))
+
+    def test_reconcile_resumes_after_postponed_stream_flush(self):
+        participant = self._load()
+        participant.completed_subtasks.append(11)
+        participant.save()
+
+        # 전체 flush와 meta 삭제까지 한 뒤 남은 변경 flush에서 잠긴 경우
+        results = iter([1, None])
+        with mock.patch.object(live_state, '_flush_waiting', side_effect=lambda *args, **kwargs: next(results)), \
+                mock.patch('apps.sessions.tasks.reconcile_live_state_task.apply_async'):
+            self.assertIsNone(live_state.reconcile(self.session.id))
+        self.assertTrue(get_redis().exists(f'session_state:{self.session.id}:participants'))
+
+        self.assertTrue(live_state.reconcile(self.session.id))
+        self.participant.refresh_from_db()
+        self.assertEqual(self.participant.completed_subtasks, [10, 11])
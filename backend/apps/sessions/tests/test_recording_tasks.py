@@ -0,0 +1,47 @@
+"""
+녹화 실시간 분석 종료 태스크 - 구간 분석 락을 끝내 얻지 못한 경우
+"""
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from apps.accounts.models import User
+from apps.sessions.models import RecordingSession
+from apps.sessions.tasks import analyze_recording_segments_task
+
+
+@override_settings(
+    CELERY_TASK_ALWAYS_EAGER=True,
+    RECORDING_LIVE_ANALYSIS_LOCK_TTL=10,
+    RECORDING_LIVE_FINAL_RETRY_DELAY=5,
+)
+class LiveAnalysisFinalTaskTests(TestCase):
+    def setUp(self):
+        instructor = User.objects.create_user(email='rec@example.com', password='x', name='강사', role='INSTRUCTOR')
+        self.recording = RecordingSession.objects.create(
+            instructor=instructor, title='녹화', status='PROCESSING', live_analysis=True
+        )
+        self.lock_key = f'recording_live_analysis_lock:{self.recording.id}'
+        cache.delete(self.lock_key)
+
+    def tearDown(self):
+        cache.delete(self.lock_key)
+
+    def test_final_task_falls_back_to_full_analysis_when_lock_is_never_released(self):
+        cache.set(self.lock_key, 'other-worker', timeout=None)
+
+        with mock.patch('apps.sessions.tasks.analyze_recording_task.delay') as full_analysis:
+            result = analyze_recording_segments_task.apply(args=[self.recording.id], kwargs={'final': True}).get()
+
+        full_analysis.assert_called_once_with(self.recording.id)
+        self.assertTrue(result['fallback'])
+
+    def test_segment_task_skips_while_lock_is_held(self):
+        cache.set(self.lock_key, 'other-worker', timeout=None)
+
+        with mock.patch('apps.sessions.tasks.analyze_recording_task.delay') as full_analysis:
+            result = analyze_recording_segments_task.apply(args=[self.recording.id]).get()
+
+        full_analysis.assert_not_called()
+        self.assertTrue(result['skipped'])
@@ -0,0 +1,127 @@
+"""
+단계 완료 일괄 동기화 (report-completion/batch) - 재전송, 완료 후 취소, 거부 항목, 수업 중 동시 보고
+"""
+import uuid
+from unittest import mock
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.accounts.models import User
+from apps.lectures.models import Lecture
+from apps.sessions import live_state
+from apps.sessions.models import LectureSession, SessionParticipant
+from apps.tasks.models import Subtask, Task
+from core.redis import get_redis
+
+
+class ReportCompletionBatchTests(TestCase):
+    status = 'WAITING'
+
+    def setUp(self):
+        instructor = User.objects.create_user(
+            email='batch-instructor@example.com', password='x', name='강사', role='INSTRUCTOR'
+        )
+        lecture = Lecture.objects.create(instructor=instructor, title='강의')
+        task = Task.objects.create(lecture=lecture, title='과제', order_index=0)
+        self.s1, self.s2, self.s3 = [
+            Subtask.objects.create(task=task, title=f'단계 {index}', order_index=index).id
+            for index in range(3)
+        ]
+        self.session = LectureSession.objects.create(
+            lecture=lecture, instructor=instructor, title='세션',
+            session_code=uuid.uuid4().hex[:6].upper(), status=self.status,
+        )
+        self.participant = SessionParticipant.objects.create(
+            session=self.session, device_id='dev-a', status='ACTIVE'
+        )
+        self.url = f'/api/sessions/{self.session.id}/report-completion/batch/'
+        self.client = APIClient()
+
+        patcher = mock.patch('apps.sessions.views.broadcast_student_completion')
+        self.broadcast = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._clear_redis)
+
+    def _clear_redis(self):
+        redis = get_redis()
+        keys = list(redis.scan_iter(f'session_state:{self.session.id}:*'))
+        if keys:
+            redis.delete(*keys)
+
+    def _sync(self, completions):
+        response = self.client.post(self.url, {'device_id': 'dev-a', 'completions': completions}, format='json')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def _completed(self):
+        participant = live_state.get_participant(self.session.id, device_id='dev-a')
+        if participant is None:
+            participant = SessionParticipant.objects.get(pk=self.participant.pk)
+        return participant.completed_subtasks
+
+    def test_replaying_batch_is_idempotent(self):
+        batch = [{'subtask_id': self.s1}, {'subtask_id': self.s2}]
+        first = self._sync(batch)
+        second = self._sync(batch)
+
+        self.assertEqual(first['completed_subtasks'], [self.s1, self.s2])
+        self.assertEqual(second['completed_subtasks'], [self.s1, self.s2])
+        self.assertEqual(self._completed(), [self.s1, self.s2])
+        self.broadcast.assert_called_once()
+
+    def test_complete_then_uncomplete_within_one_batch(self):
+        result = self._sync([
+            {'subtask_id': self.s1, 'is_completed': True},
+            {'subtask_id': self.s2},
+            {'subtask_id': self.s1, 'is_completed': 'false'},
+            {'subtask_id': self.s3, 'is_completed': 1},
+            {'subtask_id': self.s3, 'is_completed': 0},
+        ])
+
+        self.assertEqual(result['applied'], 5)
+        self.assertEqual(result['completed_subtasks'], [self.s2])
+        self.assertEqual(self._completed(), [self.s2])
+        self.assertEqual(self.broadcast.call_args.kwargs['changed_subtasks'], [self.s2])
+
+    def test_invalid_entries_are_rejected_and_the_rest_applied(self):
+        result = self._sync([
+            {'subtask_id': 'abc'},
+            {'subtask_id': self.s1},
+            {'subtask_id': 999999},
+            {'subtask_id': self.s2, 'completed_at': 'yesterday'},
+            {'subtask_id': self.s3, 'is_completed': 'maybe'},
+            'not-an-object',
+        ])
+
+        self.assertEqual(result['applied'], 1)
+        self.assertEqual(
+            [(item['index'], item['reason']) for item in result['rejected']],
+            [
+                (0, 'invalid_subtask_id'),
+                (2, 'subtask_not_found'),
+                (3, 'invalid_completed_at'),
+                (4, 'invalid_is_completed'),
+                (5, 'invalid_subtask_id'),
+            ],
+        )
+        self.assertEqual(self._completed(), [self.s1])
+
+
+class LiveReportCompletionBatchTests(ReportCompletionBatchTests):
+    """수업 중 - Redis 실시간 상태 경로"""
+    status = 'IN_PROGRESS'
+
+    def setUp(self):
+        super().setUp()
+        self._clear_redis()
+        self.assertTrue(live_state.activate(self.session.id))
+
+    def test_batch_does_not_overwrite_concurrent_live_completion(self):
+        # WebSocket step_complete가 읽은 뒤 batch가 먼저 저장되는 경우
+        concurrent = live_state.get_participant(self.session.id, device_id='dev-a')
+        self._sync([{'subtask_id': self.s2}, {'subtask_id': self.s3}, {'subtask_id': self.s3, 'is_completed': False}])
+        concurrent.completed_subtasks.append(self.s1)
+        concurrent.save()
+
+        self.assertEqual(sorted(self._completed()), [self.s1, self.s2])
@@ -0,0 +1,114 @@
+"""
+세션 요약 스냅샷 - replica 구간에서 호출되어도 확인/계산/저장은 primary에서, 종료(ENDED)로 바뀔 때 생성 등록,
+복습 모드는 실시간 계산
+"""
+import uuid
+from unittest import mock
+
+from django.test import TestCase, TransactionTestCase
+
+from apps.accounts.models import User
+from apps.lectures.models import Lecture
+from apps.sessions.models import LectureSession, SessionParticipant, SessionSummarySnapshot
+from apps.sessions.services import SessionSummaryService
+from core.db import use_replica
+
+
+def _create_session(status):
+    instructor = User.objects.create_user(
+        email=f'{uuid.uuid4().hex[:8]}@example.com', password='x', name='강사', role='INSTRUCTOR'
+    )
+    lecture = Lecture.objects.create(instructor=instructor, title='강의')
+    session = LectureSession.objects.create(
+        lecture=lecture, instructor=instructor, title='세션',
+        session_code=uuid.uuid4().hex[:6].upper(), status='IN_PROGRESS',
+    )
+    SessionParticipant.objects.create(session=session, device_id='dev-a', status='COMPLETED')
+    # 상태 변경 signal(스냅샷 생성 등록) 없이 상태만 지정
+    LectureSession.objects.filter(pk=session.pk).update(status=status)
+    return LectureSession.objects.get(pk=session.pk)
+
+
+class SessionSummaryFreezeOnPrimaryTests(TransactionTestCase):
+    # 'replica' 별칭은 설정에 없으므로 replica로 간 조회는 실패한다
+    databases = {'default'}
+
+    def _freeze_under_replica(self, session):
+        with mock.patch('core.db.routers._replica_alias', return_value='replica'), use_replica():
+            return SessionSummaryService().freeze(session)
+
+    def test_freeze_reads_from_primary(self):
+        session = _create_session('ENDED')
+
+        snapshot = self._freeze_under_replica(session)
+
+        self.assertEqual(snapshot.participant_count, 1)
+        self.assertEqual(snapshot.completed_count, 1)
+
+    def test_freeze_returns_snapshot_created_concurrently(self):
+        session = _create_session('ENDED')
+        existing = SessionSummaryService().freeze(session)
+
+        # 존재 확인이 놓친 스냅샷 (태스크가 막 저장) - 생성 충돌 후 primary에서 다시 읽음
+        with mock.patch('django.db.models.query.QuerySet.first', return_value=None):
+            snapshot = self._freeze_under_replica(session)
+
+        self.assertEqual(snapshot.pk, existing.pk)
+        self.assertEqual(SessionSummarySnapshot.objects.count(), 1)
+
+
+class SessionSummaryFreezeOnEndTests(TestCase):
+    def setUp(self):
+        patcher = mock.patch('apps.sessions.signals.freeze_session_summary_task')
+        self.task = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_status_change_to_ended_queues_freeze_after_commit(self):
+        session = _create_session('IN_PROGRESS')
+
+        # WebSocket end_session 경로 (update_session_status)와 같은 저장
+        session = LectureSession.objects.get(pk=session.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            session.status = 'ENDED'
+            session.save()
+            self.task.delay.assert_not_called()
+
+        self.task.delay.assert_called_once_with(session.id, replace=True)
+
+    def test_save_without_status_change_does_not_queue(self):
+        session = _create_session('ENDED')
+        session = LectureSession.objects.get(pk=session.pk)
+        self.task.reset_mock()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            session.title = '제목 변경'
+            session.save()
+
+        self.task.delay.assert_not_called()
+
+
+class SessionSummaryReviewModeTests(TestCase):
+    def test_review_mode_summary_is_live(self):
+        session = _create_session('REVIEW_MODE')
+        service = SessionSummaryService()
+        self.assertEqual(service.get_summary(session)['completedParticipants'], 1)
+
+        # 복습 모드에서 받은 완료도 요약에 반영
+        SessionParticipant.objects.create(session=session, device_id='dev-b', status='COMPLETED')
+
+        self.assertEqual(service.get_summary(session)['completedParticipants'], 2)
+        self.assertFalse(SessionSummarySnapshot.objects.filter(session=session).exists())
+
+    def test_freeze_on_end_replaces_review_mode_snapshot(self):
+        session = _create_session('ENDED')
+        service = SessionSummaryService()
+        # 구버전이 복습 모드 시점에 고정한 스냅샷
+        stale = service.freeze(session)
+        SessionParticipant.objects.create(session=session, device_id='dev-b', status='COMPLETED')
+        self.assertEqual(service.freeze(session).completed_count, 1)
+
+        snapshot = service.freeze(session, replace=True)
+
+        self.assertEqual(snapshot.pk, stale.pk)
+        self.assertEqual(snapshot.completed_count, 2)
+        self.assertEqual(snapshot.summary['completedParticipants'], 2)
@@ -19,9 +19,12 @@ from .views import (
     SessionBroadcastView,
     SessionSwitchLectureView,
     ReportCompletionView,
+    ReportCompletionBatchView,
     SessionCompletionStatusView,
     SessionSummaryView,
     SessionSubtasksView,
+    SessionEventsView,
+    SessionConnectionMetricsView,
 )
 from .screenshot_views import (
     ScreenshotUploadView,
@@ -56,11 +59,18 @@ urlpatterns = [
 
     # Step completion endpoints (단계 완료 보고)
     path('<int:session_id>/report-completion/', ReportCompletionView.as_view(), name='session-report-completion'),
+    path('<int:session_id>/report-completion/batch/', ReportCompletionBatchView.as_view(), name='session-report-completion-batch'),
     path('<int:session_id>/completion-status/', SessionCompletionStatusView.as_view(), name='session-completion-status'),
 
     # Session summary (세션 요약)
     path('<int:session_id>/summary/', SessionSummaryView.as_view(), name='session-summary'),
 
+    # Session event log (세션 이벤트 로그)
+    path('<int:session_id>/events/', SessionEventsView.as_view(), name='session-events'),
+
+    # WebSocket send queue metrics (연결 송신 큐 지표)
+    path('<int:session_id>/connection-metrics/', SessionConnectionMetricsView.as_view(), name='session-connection-metrics'),
+
     # Session subtasks (세션 단계 목록)
     path('<int:session_id>/subtasks/', SessionSubtasksView.as_view(), name='session-subtasks'),
 
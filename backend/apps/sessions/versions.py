@@ -0,0 +1,258 @@
+"""
+Session Versions - 세션 조회 API 조건부 GET(ETag/Last-Modified)용 버전 카운터
+
+대시보드/학생 앱이 같은 조회 API를 반복 폴링하므로, 세션(또는 사용자)별 버전을 Redis에 두고
+관련 쓰기가 있을 때만 올린다. 조회 API는 버전으로 ETag를 만들어, 클라이언트가 보낸
+If-None-Match와 같으면 무거운 조회 없이 304를 반환한다.
+
+Redis 구조 (session_version:*):
+  session_version:session:{session_id}  세션 범위 버전 (hash: v=버전, t=마지막 변경 시각)
+  session_version:user:{user_id}        사용자 범위 버전 (내 활성 세션 조회용)
+  채널 같은 이름                          버전 변경 알림 (long-poll 대기 해제)
+
+버전 키가 만료/유실되면 현재 시각(ms)으로 다시 시작하므로, 이전에 발급한 ETag와 겹치지 않는다.
+하트비트(last_active_at만 갱신)는 버전을 올리지 않는다. 시간이 지나면 바뀌는 응답(지연 판정)은
+조회 측에서 time_bucket으로 ETag에 시간 구간을 포함한다.
+
+long-poll(?wait=)은 동기 뷰의 실행 스레드를 대기 시간 동안 점유한다. ASGI(daphne)에서는
+WebSocket consumer의 database_sync_to_async와 같은 스레드 풀을 쓰므로, 프로세스당 동시 대기를
+SESSION_LONG_POLL_MAX_WAITERS개로 제한하고 넘으면 기다리지 않고 바로 304를 반환한다.
+
+Redis를 사용할 수 없으면 버전 없이 매번 전체 응답을 반환한다.
+"""
+import hashlib
+import logging
+import threading
+import time
+from typing import Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.http import HttpResponseNotModified
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+_waiters = 0
+_waiters_lock = threading.Lock()
+
+# 키가 없으면 현재 시각(ms)에서 시작, 있으면 1 증가 후 변경 알림
+_BUMP_SCRIPT = """
+local now_ms = tonumber(ARGV[1])
+local version
+if redis.call('HEXISTS', KEYS[1], 'v') == 0 then
+    version = now_ms
+    redis.call('HSET', KEYS[1], 'v', version)
+else
+    version = redis.call('HINCRBY', KEYS[1], 'v', 1)
+end
+redis.call('HSET', KEYS[1], 't', ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+redis.call('PUBLISH', KEYS[1], version)
+return version
+"""
+
+
+def session_scope(session_id: int) -> str:
+    return f'session:{session_id}'
+
+
+def user_scope(user_id: int) -> str:
+    return f'user:{user_id}'
+
+
+def _key(scope: str) -> str:
+    return f'session_version:{scope}'
+
+
+def _ttl() -> int:
+    return getattr(settings, 'SESSION_VERSION_TTL', 21600)
+
+
+def _bump_now(scopes: Iterable[str]):
+    now = time.time()
+    try:
+        redis = get_redis()
+        for scope in scopes:
+            redis.eval(_BUMP_SCRIPT, 1, _key(scope), int(now * 1000), now, _ttl())
+    except Exception as e:
+        logger.warning(f"Failed to bump session versions {list(scopes)}: {e}")
+
+
+def bump(session_id: Optional[int] = None, user_ids: Iterable[Optional[int]] = ()):
+    """
+    세션/사용자 범위 버전 증가 (트랜잭션 안이면 커밋 후)
+
+    커밋 전에 올리면 다른 요청이 새 ETag로 이전 데이터를 받아 갈 수 있으므로 on_commit을 사용한다.
+    """
+    scopes = [session_scope(session_id)] if session_id else []
+    scopes.extend(user_scope(user_id) for user_id in set(user_ids) if user_id)
+    if scopes:
+        transaction.on_commit(lambda: _bump_now(scopes))
+
+
+def bump_participants(session_id: int, participants):
+    """세션과 참가자(queryset)의 사용자 범위 버전 증가 - 참가자 일괄 변경(queryset.update) 후 호출"""
+    bump(session_id, participants.exclude(user_id=None).values_list('user_id', flat=True))
+
+
+def get_version(scope: str) -> Optional[Tuple[int, float]]:
+    """
+    현재 버전 조회
+
+    Returns:
+        (버전, 마지막 변경 시각) 또는 None (Redis 장애)
+    """
+    key = _key(scope)
+    try:
+        redis = get_redis()
+        version, changed_at = redis.hmget(key, 'v', 't')
+        if version is None:
+            now = time.time()
+            pipe = redis.pipeline()
+            pipe.hsetnx(key, 'v', int(now * 1000))
+            pipe.hsetnx(key, 't', now)
+            pipe.expire(key, _ttl())
+            pipe.hmget(key, 'v', 't')
+            version, changed_at = pipe.execute()[-1]
+    except Exception as e:
+        logger.warning(f"Session version unavailable for {scope}: {e}")
+        return None
+    return int(version), float(changed_at or 0)
+
+
+def _try_reserve_waiter() -> bool:
+    """long-poll 대기 자리 확보 (한도를 넘으면 False - 호출 측은 기다리지 않음)"""
+    global _waiters
+    with _waiters_lock:
+        if _waiters >= getattr(settings, 'SESSION_LONG_POLL_MAX_WAITERS', 8):
+            return False
+        _waiters += 1
+        return True
+
+
+def _release_waiter():
+    global _waiters
+    with _waiters_lock:
+        _waiters -= 1
+
+
+def wait_for_change(scope: str, version: int, timeout: float) -> bool:
+    """버전이 version에서 바뀔 때까지 최대 timeout초 대기 (long-poll)"""
+    key = _key(scope)
+    deadline = time.monotonic() + timeout
+    pubsub = None
+    try:
+        pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(key)
+        # 구독 전에 바뀐 경우
+        current = get_redis().hget(key, 'v')
+        if current is not None and int(current) != version:
+            return True
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            message = pubsub.get_message(timeout=remaining)
+            if message and int(message['data']) != version:
+                return True
+    except Exception as e:
+        logger.warning(f"Session version long-poll failed for {scope}: {e}")
+        return False
+    finally:
+        if pubsub is not None:
+            pubsub.close()
+
+
+class ConditionalGet:
+    """
+    버전 기반 조건부 GET 처리
+
+    사용법:
+        conditional = ConditionalGet(request, session_scope(session_id), request.user.id)
+        not_modified = conditional.not_modified()
+        if not_modified is not None:
+            return not_modified
+        ...
+        return conditional.apply(Response(data))
+
+    Query Parameters:
+    - wait: If-None-Match가 현재 ETag와 같으면 버전이 바뀔 때까지 최대 wait초 대기 (long-poll)
+            동시 대기가 SESSION_LONG_POLL_MAX_WAITERS개를 넘으면 기다리지 않고 304
+
+    권한 확인은 not_modified보다 먼저 한다 (304도 응답이므로).
+    """
+
+    def __init__(self, request, scope: str, *parts, time_bucket: Optional[int] = None):
+        """
+        Args:
+            request: DRF Request
+            scope: session_scope / user_scope
+            parts: 응답에 영향을 주는 그 밖의 값 (사용자 ID, 쿼리 파라미터 등)
+            time_bucket: 시간이 지나면 바뀌는 응답이면 구간 길이(초) - ETag에 현재 구간 포함
+        """
+        self.request = request
+        self.scope = scope
+        self.parts = parts
+        self.time_bucket = time_bucket
+        self._load()
+
+    def _load(self):
+        self.etag = None
+        self.last_modified = None
+        current = get_version(self.scope)
+        if current is None:
+            return
+        self.version, changed_at = current
+
+        parts = [self.scope, self.version, *self.parts]
+        if self.time_bucket:
+            bucket = int(time.time() // self.time_bucket)
+            parts.append(bucket)
+            changed_at = max(changed_at, bucket * self.time_bucket)
+        digest = hashlib.md5('|'.join(map(str, parts)).encode()).hexdigest()[:16]
+        self.etag = f'W/"{self.version}-{digest}"'
+        self.last_modified = int(changed_at)
+
+    def _wait_seconds(self) -> float:
+        try:
+            wait = float(self.request.query_params.get('wait', 0))
+        except (TypeError, ValueError):
+            return 0
+        wait = min(max(wait, 0), getattr(settings, 'SESSION_LONG_POLL_MAX_SECONDS', 25))
+        if self.time_bucket:
+            # 시간 구간이 바뀌면 ETag도 바뀌므로 그 전까지만 대기
+            wait = min(wait, self.time_bucket - time.time() % self.time_bucket)
+        return wait
+
+    def not_modified(self) -> Optional[HttpResponseNotModified]:
+        """변경이 없으면 304 응답, 변경되었으면 None (전체 응답 생성)"""
+        if self.etag is None:
+            return None
+        if get_conditional_response(
+            self.request, etag=self.etag, last_modified=self.last_modified
+        ) is None:
+            return None
+
+        wait = self._wait_seconds()
+        if wait > 0 and _try_reserve_waiter():
+            try:
+                changed = wait_for_change(self.scope, self.version, wait)
+            finally:
+                _release_waiter()
+            if changed:
+                self._load()
+                return None
+
+        return self.apply(HttpResponseNotModified())
+
+    def apply(self, response):
+        """응답에 ETag/Last-Modified 헤더 추가 (성공 응답만)"""
+        if self.etag is not None and response.status_code in (200, 304):
+            response['ETag'] = self.etag
+            response['Last-Modified'] = http_date(self.last_modified)
+            response['Cache-Control'] = 'private, no-cache'
+        return response
@@ -7,13 +7,26 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.db import transaction
 from django.db.models import Q
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
 
 from apps.lectures.models import Lecture
-from apps.tasks.models import Task, Subtask
+from apps.lectures.services import (
+    get_lecture_plan,
+    describe_subtask,
+    get_plan_subtask,
+    get_next_subtask,
+    get_first_subtask,
+)
+from core.db import ReplicaReadMixin
+from core.websocket import get_send_metrics
+from apps.tasks.models import Subtask
 from .models import LectureSession, SessionParticipant, SessionStepControl
+from . import admission, directory, event_log, live_counters, live_state, versions
+from .services import SessionSummaryService
 from .serializers import (
     LectureSessionSerializer,
     LectureSessionCreateSerializer,
@@ -37,14 +50,13 @@ def broadcast_session_status(session_code: str, session_status: str, message: st
         group_name = f'session_{session_code}'
         logger.info(f"Broadcasting session_status_changed to {group_name}: {session_status}")
 
-        async_to_sync(channel_layer.group_send)(
-            group_name,
-            {
-                'type': 'session_status_changed',
-                'status': session_status,
-                'message': message
-            }
-        )
+        event = {
+            'type': 'session_status_changed',
+            'status': session_status,
+            'message': message
+        }
+        event_log.record(session_code, event)
+        async_to_sync(channel_layer.group_send)(group_name, event)
         logger.info(f"Broadcast successful to {group_name}")
     except Exception as e:
         logger.error(f"Broadcast failed: {e}", exc_info=True)
@@ -66,13 +78,12 @@ def broadcast_step_changed(session_code: str, subtask: dict):
         group_name = f'session_{session_code}'
         logger.info(f"Broadcasting step_changed to {group_name}: {subtask.get('title', 'unknown')}")
 
-        async_to_sync(channel_layer.group_send)(
-            group_name,
-            {
-                'type': 'step_changed',
-                'subtask': subtask
-            }
-        )
+        event = {
+            'type': 'step_changed',
+            'subtask': subtask
+        }
+        event_log.record(session_code, event)
+        async_to_sync(channel_layer.group_send)(group_name, event)
         logger.info(f"Step broadcast successful to {group_name}")
     except Exception as e:
         logger.error(f"Step broadcast failed: {e}", exc_info=True)
@@ -94,15 +105,14 @@ def broadcast_instructor_message(session_code: str, message: str, instructor_nam
         group_name = f'session_{session_code}'
         logger.info(f"Broadcasting instructor_message to {group_name}: {message[:50]}...")
 
-        async_to_sync(channel_layer.group_send)(
-            group_name,
-            {
-                'type': 'instructor_message',
-                'message': message,
-                'from': instructor_name,
-                'timestamp': timezone.now().isoformat()
-            }
-        )
+        event = {
+            'type': 'instructor_message',
+            'message': message,
+            'from': instructor_name,
+            'timestamp': timezone.now().isoformat()
+        }
+        event_log.record(session_code, event)
+        async_to_sync(channel_layer.group_send)(group_name, event)
         logger.info(f"Instructor message broadcast successful to {group_name}")
     except Exception as e:
         logger.error(f"Instructor message broadcast failed: {e}", exc_info=True)
@@ -115,9 +125,12 @@ def broadcast_student_completion(
     student_name: str = '',
     participant_id: int = None,
     completed_subtasks: list = None,
+    changed_subtasks: list = None,
 ):
     """
     WebSocket을 통해 학생의 단계 완료를 강사에게 브로드캐스트
+
+    changed_subtasks: 일괄 동기화로 여러 단계가 한 번에 바뀐 경우 바뀐 단계 ID 목록
     """
     import logging
     logger = logging.getLogger(__name__)
@@ -132,24 +145,41 @@ def broadcast_student_completion(
         logger.info(f"Broadcasting student_completion to {group_name}: device={device_id}, subtask={subtask_id}")
 
         completed_list = completed_subtasks or []
-        async_to_sync(channel_layer.group_send)(
-            group_name,
-            {
-                'type': 'student_completion',
-                'device_id': device_id,
-                'participant_id': participant_id,
-                'student_name': student_name,
-                'subtask_id': subtask_id,
-                'completed_subtasks': completed_list,
-                'total_completed': len(completed_list),
-                'timestamp': timezone.now().isoformat()
-            }
-        )
+        event = {
+            'type': 'student_completion',
+            'device_id': device_id,
+            'participant_id': participant_id,
+            'student_name': student_name,
+            'subtask_id': subtask_id,
+            'completed_subtasks': completed_list,
+            'total_completed': len(completed_list),
+            'changed_subtasks': changed_subtasks or [subtask_id],
+            'timestamp': timezone.now().isoformat()
+        }
+        event_log.record(session_code, event)
+        async_to_sync(channel_layer.group_send)(group_name, event)
         logger.info(f"Student completion broadcast successful to {group_name}")
     except Exception as e:
         logger.error(f"Student completion broadcast failed: {e}", exc_info=True)
 
 
+def subtask_guide_data(subtask: dict) -> dict:
+    """강의 단계 구성의 단계 설명 → 학생 앱 단계 안내 응답 (UI 매칭 필드 포함)"""
+    return {
+        'id': subtask['id'],
+        'title': subtask['title'],
+        'description': subtask['description'],
+        'order_index': subtask['order_index'],
+        'target_action': subtask['target_action'],
+        'guide_text': subtask['guide_text'],
+        # UI 매칭용 필드
+        'view_id': subtask['view_id'] or '',
+        'text': subtask['text'] or '',
+        'content_description': subtask['content_description'] or '',
+        'target_package': subtask['target_package'] or '',
+    }
+
+
 class SessionCreateView(generics.CreateAPIView):
     """강의방 생성 (강사 전용)"""
     serializer_class = LectureSessionCreateSerializer
@@ -208,7 +238,11 @@ class SessionJoinView(APIView):
                 {'message': '이미 참가 중인 세션입니다.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
-        
+
+        live_counters.set_status(
+            session.id, participant.status, device_id=participant.device_id, user_id=request.user.id
+        )
+
         return Response(
             {
                 'participant_id': participant.id,
@@ -283,16 +317,15 @@ class SessionStartView(APIView):
         first_subtask_id = request.data.get('first_subtask_id')
         message = request.data.get('message', '')
 
-        # first_subtask_id가 없으면 강의의 첫 번째 subtask를 자동으로 찾기
+        # first_subtask_id가 없으면 강의의 첫 번째 subtask를 자동으로 찾기 (캐시된 강의 단계 구성)
+        plan = get_lecture_plan(session.lecture_id) if session.lecture_id else None
         first_subtask = None
         if first_subtask_id:
-            first_subtask = get_object_or_404(Subtask, pk=first_subtask_id)
-        else:
-            # 강의에 연결된 Task의 첫 번째 Subtask 찾기
-            from apps.tasks.models import Task
-            first_task = Task.objects.filter(lecture=session.lecture).order_by('order_index').first()
-            if first_task:
-                first_subtask = first_task.subtasks.order_by('order_index').first()
+            first_subtask = get_plan_subtask(plan, first_subtask_id) if plan else None
+            if first_subtask is None:
+                first_subtask = describe_subtask(get_object_or_404(Subtask, pk=first_subtask_id))
+        elif plan:
+            first_subtask = get_first_subtask(plan)
 
         # subtask가 없어도 세션은 시작 가능 (subtask 없이 진행)
         if not first_subtask:
@@ -303,6 +336,9 @@ class SessionStartView(APIView):
 
             # 모든 대기 중인 참가자를 활성화
             session.participants.filter(status='WAITING').update(status='ACTIVE')
+            live_counters.invalidate(session.id)
+            versions.bump_participants(session.id, session.participants.all())
+            live_state.activate(session.id)
 
             # WebSocket 브로드캐스트 - 세션 시작 알림
             broadcast_session_status(
@@ -323,19 +359,23 @@ class SessionStartView(APIView):
         # 세션 상태 업데이트
         session.status = 'IN_PROGRESS'
         session.started_at = timezone.now()
-        session.current_subtask = first_subtask
+        session.current_subtask_id = first_subtask['id']
         session.save()
         
         # 모든 대기 중인 참가자를 활성화
         session.participants.filter(status='WAITING').update(
             status='ACTIVE',
-            current_subtask=first_subtask
+            current_subtask_id=first_subtask['id']
         )
+        live_counters.invalidate(session.id)
+        versions.bump_participants(session.id, session.participants.all())
+        # 수업 중 참가자 상태는 Redis 실시간 상태에서 처리 (종료 시 DB에 최종 반영)
+        live_state.activate(session.id)
         
         # 제어 기록 생성
         SessionStepControl.objects.create(
             session=session,
-            subtask=first_subtask,
+            subtask_id=first_subtask['id'],
             instructor=request.user,
             action='START_STEP',
             message=message
@@ -350,17 +390,17 @@ class SessionStartView(APIView):
         broadcast_step_changed(
             session.session_code,
             {
-                'id': first_subtask.id,
-                'title': first_subtask.title,
-                'order_index': first_subtask.order_index,
-                'target_action': first_subtask.target_action,
-                'guide_text': first_subtask.guide_text,
-                'voice_guide_text': first_subtask.voice_guide_text,
+                'id': first_subtask['id'],
+                'title': first_subtask['title'],
+                'order_index': first_subtask['order_index'],
+                'target_action': first_subtask['target_action'],
+                'guide_text': first_subtask['guide_text'],
+                'voice_guide_text': first_subtask['voice_guide_text'],
                 # UI 매칭용 필드 추가
-                'view_id': first_subtask.view_id or '',
-                'text': first_subtask.text or '',
-                'content_description': first_subtask.content_description or '',
-                'target_package': first_subtask.target_package or '',
+                'view_id': first_subtask['view_id'] or '',
+                'text': first_subtask['text'] or '',
+                'content_description': first_subtask['content_description'] or '',
+                'target_package': first_subtask['target_package'] or '',
             }
         )
 
@@ -369,8 +409,8 @@ class SessionStartView(APIView):
             'status': session.status,
             'started_at': session.started_at,
             'current_subtask': {
-                'id': first_subtask.id,
-                'title': first_subtask.title
+                'id': first_subtask['id'],
+                'title': first_subtask['title']
             },
             'active_participants': session.participants.filter(status='ACTIVE').count(),
             'message': '수업이 시작되었습니다'
@@ -413,10 +453,12 @@ class SessionNextStepView(APIView):
         session.current_subtask = next_subtask
         session.save()
         
-        # 모든 활성 참가자 동기화
-        session.participants.filter(status='ACTIVE').update(
-            current_subtask=next_subtask
-        )
+        # 모든 활성 참가자 동기화 (실시간 상태가 없으면 DB에 바로 반영)
+        if live_state.update_participants(session.id, ['ACTIVE'], current_subtask_id=next_subtask.id) is None:
+            session.participants.filter(status='ACTIVE').update(
+                current_subtask=next_subtask
+            )
+        versions.bump_participants(session.id, session.participants.all())
         
         # 제어 기록 생성
         SessionStepControl.objects.create(
@@ -579,9 +621,13 @@ class SessionEndView(APIView):
         
         message = request.data.get('message', '')
         
+        # 실시간 참가자 상태를 DB에 최종 반영 (이후 통계/요약은 DB 기준)
+        live_state.reconcile(session.id)
+
         # 세션 종료
         session.status = 'REVIEW_MODE'
         session.ended_at = timezone.now()
+        # 복습 모드 동안 요약은 실시간 계산 (스냅샷은 종료(ENDED)로 바뀔 때 signal이 등록)
         session.save()
 
         # 통계 계산
@@ -617,10 +663,19 @@ class SessionCurrentView(APIView):
 
 
 class MyActiveSessionView(APIView):
-    """내가 참가 중인 활성 세션 조회 (학생용)"""
+    """
+    내가 참가 중인 활성 세션 조회 (학생용)
+
+    ETag/If-None-Match 지원 (사용자 범위 버전), ?wait=초 로 long-poll
+    """
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
+        conditional = versions.ConditionalGet(request, versions.user_scope(request.user.id))
+        not_modified = conditional.not_modified()
+        if not_modified is not None:
+            return not_modified
+
         participation = SessionParticipant.objects.filter(
             user=request.user,
             status__in=['WAITING', 'ACTIVE'],
@@ -634,7 +689,7 @@ class MyActiveSessionView(APIView):
             }, status=status.HTTP_404_NOT_FOUND)
         
         session = participation.session
-        return Response({
+        return conditional.apply(Response({
             'active_session': {
                 'session_id': session.id,
                 'session_code': session.session_code,
@@ -650,7 +705,7 @@ class MyActiveSessionView(APIView):
                 'my_status': participation.status,
                 'joined_at': participation.joined_at
             }
-        })
+        }))
 
 
 class InstructorActiveSessionView(APIView):
@@ -700,6 +755,9 @@ class AnonymousSessionJoinView(APIView):
     """
     익명 세션 참가 (학생 앱용)
     인증 없이 device_id와 name으로 세션에 참가합니다.
+
+    수업 시작 시 참가가 몰리므로 세션 정보는 캐시에서 읽고 참가자는 한 문장으로 생성/갱신합니다
+    (apps.sessions.admission).
     """
     permission_classes = [AllowAny]
 
@@ -720,85 +778,54 @@ class AnonymousSessionJoinView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # 세션 조회
-        try:
-            session = LectureSession.objects.select_related(
-                'lecture', 'instructor', 'current_subtask'
-            ).get(
-                session_code=session_code.upper(),
-                status__in=['WAITING', 'IN_PROGRESS', 'REVIEW_MODE']
-            )
-        except LectureSession.DoesNotExist:
+        # 세션 조회 (캐시된 세션 참가 정보)
+        session = admission.get_join_descriptor(session_code)
+        if session is None or session['status'] not in admission.JOINABLE_STATUSES:
             return Response(
                 {'error': '세션을 찾을 수 없거나 이미 종료되었습니다.'},
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        # 이미 참가 중인지 확인 (device_id로)
-        participant, created = SessionParticipant.objects.get_or_create(
-            session=session,
-            device_id=device_id,
-            defaults={
-                'display_name': name,
-                'status': 'WAITING' if session.status == 'WAITING' else 'ACTIVE',
-                'current_subtask': session.current_subtask
-            }
-        )
+        # 참가자 생성 또는 재참가 갱신 (device_id, INSERT ... ON CONFLICT 한 번)
+        participant, created = admission.upsert_participant(session, device_id, name)
 
-        if not created:
-            # 이미 참가 중이면 정보 업데이트
-            participant.display_name = name
-            if session.status == 'IN_PROGRESS' and participant.status == 'WAITING':
-                participant.status = 'ACTIVE'
-                participant.current_subtask = session.current_subtask
-            participant.save()
-
-        # 현재 단계 정보 (UI 매칭 필드 포함)
+        live_counters.set_status(session['id'], participant.status, device_id=device_id)
+
+        # 현재 단계 정보 / 전체 서브태스크 목록 (진행도 표시용, 캐시된 강의 단계 구성)
+        plan = get_lecture_plan(session['lecture_id']) if session['lecture_id'] else None
         current_subtask_data = None
-        if session.current_subtask:
-            subtask = session.current_subtask
-            current_subtask_data = {
-                'id': subtask.id,
-                'title': subtask.title,
-                'description': subtask.description,
-                'order_index': subtask.order_index,
-                'target_action': subtask.target_action,
-                'guide_text': subtask.guide_text,
-                # UI 매칭용 필드 (android-student 앱에서 진행도 추적에 사용)
-                'view_id': subtask.view_id or '',
-                'text': subtask.text or '',
-                'content_description': subtask.content_description or '',
-                'target_package': subtask.target_package or '',
-            }
+        if session['current_subtask_id']:
+            current = get_plan_subtask(plan, session['current_subtask_id']) if plan else None
+            if current is None:
+                current = describe_subtask(Subtask.objects.get(pk=session['current_subtask_id']))
+            current_subtask_data = subtask_guide_data(current)
 
-        # 전체 서브태스크 목록 (진행도 표시용)
         subtasks = []
-        if session.lecture:
-            from apps.tasks.models import Task
-            tasks = Task.objects.filter(lecture=session.lecture).prefetch_related('subtasks')
-            for task in tasks:
-                for subtask in task.subtasks.all().order_by('order_index'):
-                    subtasks.append({
-                        'id': subtask.id,
-                        'title': subtask.title,
-                        'order_index': subtask.order_index
-                    })
+        if plan:
+            subtasks = [
+                {
+                    'id': subtask['id'],
+                    'title': subtask['title'],
+                    'order_index': subtask['order_index']
+                }
+                for subtask in plan['subtasks']
+            ]
 
         return Response({
             'participant_id': participant.id,
             'session': {
-                'id': session.id,
-                'session_code': session.session_code,
-                'title': session.title,
-                'status': session.status,
+                'id': session['id'],
+                'session_code': session['session_code'],
+                'title': session['title'],
+                'status': session['status'],
                 'lecture': {
-                    'id': session.lecture.id,
-                    'title': session.lecture.title
-                } if session.lecture else None,
+                    'id': session['lecture_id'],
+                    'title': session['lecture_title']
+                } if session['lecture_id'] else None,
                 'instructor': {
-                    'id': session.instructor.id,
-                    'name': session.instructor.name
-                } if session.instructor else None,
+                    'id': session['instructor_id'],
+                    'name': session['instructor_name']
+                } if session['instructor_id'] else None,
                 'current_subtask': current_subtask_data,
                 'currentSubtaskDetail': current_subtask_data,  # Android 앱 호환성
                 'subtasks': subtasks,
@@ -903,10 +930,12 @@ class SessionSwitchLectureView(APIView):
         session.current_subtask = None  # 새 강의로 전환 시 현재 단계 초기화
         session.save()
 
-        # 참가자들의 현재 단계도 초기화
-        session.participants.filter(status__in=['WAITING', 'ACTIVE']).update(
-            current_subtask=None
-        )
+        # 참가자들의 현재 단계도 초기화 (실시간 상태가 없으면 DB에 바로 반영)
+        if live_state.update_participants(session.id, ['WAITING', 'ACTIVE'], current_subtask_id=None) is None:
+            session.participants.filter(status__in=['WAITING', 'ACTIVE']).update(
+                current_subtask=None
+            )
+        versions.bump_participants(session.id, session.participants.all())
 
         # WebSocket으로 강의 전환 알림 브로드캐스트
         broadcast_session_status(
@@ -968,9 +997,9 @@ class ReportCompletionView(APIView):
         # 세션 조회
         session = get_object_or_404(LectureSession, pk=session_id)
 
-        # 참가자 조회
+        # 참가자 조회 (수업 중이면 Redis 실시간 상태)
         try:
-            participant = SessionParticipant.objects.get(
+            participant = live_state.get_participant(session.id, device_id=device_id) or SessionParticipant.objects.get(
                 session=session,
                 device_id=device_id
             )
@@ -980,10 +1009,10 @@ class ReportCompletionView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        # Subtask 존재 확인
-        try:
-            subtask = Subtask.objects.get(pk=subtask_id)
-        except Subtask.DoesNotExist:
+        # Subtask 존재 확인 (세션 강의의 단계면 캐시된 강의 단계 구성에서 조회)
+        plan = get_lecture_plan(session.lecture_id) if session.lecture_id else None
+        subtask = get_plan_subtask(plan, subtask_id) if plan else None
+        if subtask is None and not Subtask.objects.filter(pk=subtask_id).exists():
             return Response(
                 {'success': False, 'message': '단계를 찾을 수 없습니다.'},
                 status=status.HTTP_404_NOT_FOUND
@@ -999,6 +1028,7 @@ class ReportCompletionView(APIView):
                 participant.completed_subtasks = completed_list
                 participant.last_completed_at = timezone.now()
                 participant.save()
+                live_counters.touch(session.id, device_id=device_id)
 
                 logger.info(f"Step completion recorded: device={device_id}, subtask={subtask_id}")
 
@@ -1007,7 +1037,7 @@ class ReportCompletionView(APIView):
                     session_code=session.session_code,
                     device_id=device_id,
                     subtask_id=subtask_id,
-                    student_name=participant.display_name or participant.participant_name,
+                    student_name=directory.resolve_name(session.id, participant),
                     participant_id=participant.id,
                     completed_subtasks=completed_list,
                 )
@@ -1021,48 +1051,17 @@ class ReportCompletionView(APIView):
                 participant.save()
                 logger.info(f"Step completion removed: device={device_id}, subtask={subtask_id}")
 
-        # 다음 단계 찾기 (학생 앱에서 자동 진행용)
+        # 다음 단계 찾기 (학생 앱에서 자동 진행용, 강의 단계 구성의 위치 인덱스로 O(1))
         next_subtask_data = None
-        if is_completed and session.lecture:
-            # 현재 단계의 task와 order_index 확인
-            current_task = subtask.task
-            current_order = subtask.order_index
-
-            # 같은 Task 내에서 다음 단계 찾기
-            next_subtask = Subtask.objects.filter(
-                task=current_task,
-                order_index__gt=current_order
-            ).order_by('order_index').first()
-
-            # 같은 Task에 없으면, 다음 Task의 첫 번째 단계 찾기
-            if not next_subtask:
-                from apps.tasks.models import Task
-                next_task = Task.objects.filter(
-                    lecture=session.lecture,
-                    order_index__gt=current_task.order_index
-                ).order_by('order_index').first()
-
-                if next_task:
-                    next_subtask = next_task.subtasks.order_by('order_index').first()
+        if is_completed and subtask is not None:
+            next_subtask = get_next_subtask(plan, subtask['id'])
 
             if next_subtask:
-                next_subtask_data = {
-                    'id': next_subtask.id,
-                    'title': next_subtask.title,
-                    'description': next_subtask.description,
-                    'order_index': next_subtask.order_index,
-                    'target_action': next_subtask.target_action,
-                    'guide_text': next_subtask.guide_text,
-                    # UI 매칭용 필드
-                    'view_id': next_subtask.view_id or '',
-                    'text': next_subtask.text or '',
-                    'content_description': next_subtask.content_description or '',
-                    'target_package': next_subtask.target_package or '',
-                }
+                next_subtask_data = subtask_guide_data(next_subtask)
                 # 참가자의 현재 단계 업데이트
-                participant.current_subtask = next_subtask
+                participant.current_subtask_id = next_subtask['id']
                 participant.save()
-                logger.info(f"Auto-advanced to next step: device={device_id}, next_subtask={next_subtask.id}")
+                logger.info(f"Auto-advanced to next step: device={device_id}, next_subtask={next_subtask['id']}")
 
         return Response({
             'success': True,
@@ -1073,25 +1072,220 @@ class ReportCompletionView(APIView):
         })
 
 
+def _parse_completed_flag(value):
+    """완료 여부 값 해석 (JSON bool, 0/1, "true"/"false" 문자열) - 알 수 없는 값이면 None"""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        return {'true': True, '1': True, 'false': False, '0': False}.get(value.strip().lower())
+    return None
+
+
+class ReportCompletionBatchView(APIView):
+    """
+    학생 단계 완료 일괄 동기화 (오프라인 복구용, 익명 사용자용)
+    POST /api/sessions/{session_id}/report-completion/batch/
+
+    연결이 끊긴 동안 쌓인 완료 보고를 한 번에 반영합니다. 순서대로 적용하되 완료 목록은
+    집합으로 다루므로 같은 보고를 다시 보내도 결과가 같습니다. 현재 단계는 report-completion을
+    순서대로 호출한 것과 같은 결과로 한 번만 계산하고, 강사에게는 완료 알림을 한 번만 보냅니다.
+    수업 중(실시간 상태)에는 바뀐 단계만 추가/제거로 기록하므로 동시에 들어온 WebSocket 완료 보고를
+    덮어쓰지 않습니다 (수업 중이 아니면 참가자 행을 잠가 처리).
+
+    Request Body:
+    - device_id: 기기 ID (필수)
+    - completions: [{subtask_id, is_completed (기본 true, bool/0/1/"true"/"false"), completed_at (ISO 8601, 선택)}, ...]
+      (보고 순서대로)
+
+    Response:
+    - applied: 반영한 항목 수
+    - rejected: 반영하지 못한 항목 [{index, subtask_id, reason}]
+    - completed_subtasks / last_completed_at / current_subtask
+    """
+    permission_classes = [AllowAny]
+
+    MAX_COMPLETIONS = 500
+
+    def post(self, request, session_id):
+        import logging
+        logger = logging.getLogger(__name__)
+
+        device_id = request.data.get('device_id')
+        completions = request.data.get('completions')
+
+        if not device_id:
+            return Response(
+                {'success': False, 'message': 'device_id가 필요합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if not isinstance(completions, list) or not completions:
+            return Response(
+                {'success': False, 'message': 'completions 목록이 필요합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if len(completions) > self.MAX_COMPLETIONS:
+            return Response(
+                {'success': False, 'message': f'한 번에 최대 {self.MAX_COMPLETIONS}개까지 동기화할 수 있습니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        session = get_object_or_404(LectureSession, pk=session_id)
+        plan = get_lecture_plan(session.lecture_id) if session.lecture_id else None
+
+        # 항목 검증 (강의 구성에 없는 단계는 한 번에 존재 여부 확인)
+        entries, rejected = [], []
+        for index, item in enumerate(completions):
+            subtask_id = item.get('subtask_id') if isinstance(item, dict) else None
+            try:
+                subtask_id = int(subtask_id)
+            except (TypeError, ValueError):
+                rejected.append({'index': index, 'subtask_id': subtask_id, 'reason': 'invalid_subtask_id'})
+                continue
+
+            completed_at = None
+            if item.get('completed_at'):
+                completed_at = parse_datetime(str(item['completed_at']))
+                if completed_at is None:
+                    rejected.append({'index': index, 'subtask_id': subtask_id, 'reason': 'invalid_completed_at'})
+                    continue
+                if timezone.is_naive(completed_at):
+                    completed_at = timezone.make_aware(completed_at)
+
+            is_completed = _parse_completed_flag(item.get('is_completed', item.get('completed', True)))
+            if is_completed is None:
+                rejected.append({'index': index, 'subtask_id': subtask_id, 'reason': 'invalid_is_completed'})
+                continue
+            entries.append((index, subtask_id, is_completed, completed_at))
+
+        unknown_ids = {
+            subtask_id for _, subtask_id, _, _ in entries
+            if not plan or get_plan_subtask(plan, subtask_id) is None
+        }
+        if unknown_ids:
+            unknown_ids -= set(Subtask.objects.filter(pk__in=unknown_ids).values_list('id', flat=True))
+        for index, subtask_id, _, _ in entries:
+            if subtask_id in unknown_ids:
+                rejected.append({'index': index, 'subtask_id': subtask_id, 'reason': 'subtask_not_found'})
+        entries = [entry for entry in entries if entry[1] not in unknown_ids]
+        rejected.sort(key=lambda item: item['index'])
+
+        # 수업 중이면 Redis 실시간 상태의 참가자 (아니면 DB 행 잠금)
+        # - 실시간 상태의 save()는 읽은 시점과의 차이(추가/제거한 단계)만 원자적으로 기록
+        participant = live_state.get_participant(session.id, device_id=device_id)
+        with transaction.atomic():
+            if participant is None:
+                try:
+                    participant = SessionParticipant.objects.select_for_update().get(
+                        session=session,
+                        device_id=device_id
+                    )
+                except SessionParticipant.DoesNotExist:
+                    return Response(
+                        {'success': False, 'message': '세션 참가자를 찾을 수 없습니다.'},
+                        status=status.HTTP_404_NOT_FOUND
+                    )
+
+            original = list(participant.completed_subtasks or [])
+            completed_list = list(original)
+            completed_set = set(completed_list)
+            completed_times = {}
+            current_subtask_id = participant.current_subtask_id
+
+            # report-completion을 순서대로 호출한 것과 같은 결과
+            for _, subtask_id, is_completed, completed_at in entries:
+                if is_completed:
+                    if subtask_id not in completed_set:
+                        completed_list.append(subtask_id)
+                        completed_set.add(subtask_id)
+                        completed_times[subtask_id] = completed_at or timezone.now()
+                    next_subtask = get_next_subtask(plan, subtask_id) if plan else None
+                    if next_subtask:
+                        current_subtask_id = next_subtask['id']
+                elif subtask_id in completed_set:
+                    completed_list.remove(subtask_id)
+                    completed_set.discard(subtask_id)
+
+            # 최종 상태 기준으로 바뀐 단계 (중간에 완료 후 취소된 단계는 제외)
+            original_set = set(original)
+            changed = [subtask_id for subtask_id in original if subtask_id not in completed_set]
+            changed += [subtask_id for subtask_id in completed_list if subtask_id not in original_set]
+
+            if changed:
+                participant.completed_subtasks = completed_list
+                added_times = [completed_times[subtask_id] for subtask_id in changed if subtask_id in completed_times]
+                if participant.last_completed_at:
+                    added_times.append(participant.last_completed_at)
+                if added_times:
+                    participant.last_completed_at = max(added_times)
+            if changed or current_subtask_id != participant.current_subtask_id:
+                participant.current_subtask_id = current_subtask_id
+                participant.save()
+
+        if changed:
+            live_counters.touch(session.id, device_id=device_id)
+            broadcast_student_completion(
+                session_code=session.session_code,
+                device_id=device_id,
+                subtask_id=changed[-1],
+                student_name=directory.resolve_name(session.id, participant),
+                participant_id=participant.id,
+                completed_subtasks=completed_list,
+                changed_subtasks=changed,
+            )
+        logger.info(
+            f"Step completions synced: device={device_id}, applied={len(entries)}, "
+            f"changed={len(changed)}, rejected={len(rejected)}"
+        )
+
+        current = None
+        if participant.current_subtask_id:
+            current = get_plan_subtask(plan, participant.current_subtask_id) if plan else None
+            if current is None:
+                current = describe_subtask(participant.current_subtask)
+
+        return Response({
+            'success': True,
+            'message': '단계 완료 상태가 동기화되었습니다.',
+            'applied': len(entries),
+            'rejected': rejected,
+            'completed_subtasks': participant.completed_subtasks,
+            'last_completed_at': participant.last_completed_at.isoformat() if participant.last_completed_at else None,
+            'current_subtask': subtask_guide_data(current) if current else None,
+        })
+
+
 class SessionCompletionStatusView(APIView):
     """
     세션 참가자들의 완료 상태 조회 (강사용)
     GET /api/sessions/{session_id}/completion-status/
+
+    ETag/If-None-Match 지원 (세션 버전), ?wait=초 로 long-poll
     """
     permission_classes = [IsAuthenticated]
 
     def get(self, request, session_id):
         session = get_object_or_404(LectureSession, pk=session_id)
 
-        # 강사 권한 확인
-        if session.instructor != request.user:
+        # 강사 권한 확인 (304보다 먼저)
+        if session.instructor_id != request.user.id:
             return Response(
                 {'error': '강사만 완료 상태를 조회할 수 있습니다.'},
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        # 참가자 목록과 완료 상태
-        participants = session.participants.all()
+        conditional = versions.ConditionalGet(request, versions.session_scope(session_id), request.user.id)
+        not_modified = conditional.not_modified()
+        if not_modified is not None:
+            return not_modified
+
+        # 참가자 목록과 완료 상태 (수업 중이면 Redis 실시간 상태)
+        participants = live_state.list_participants(session.id)
+        if participants is None:
+            participants = list(session.participants.all())
 
         completion_data = []
         for p in participants:
@@ -1102,7 +1296,7 @@ class SessionCompletionStatusView(APIView):
                 'completed_subtasks': p.completed_subtasks or [],
                 'completed_count': len(p.completed_subtasks or []),
                 'last_completed_at': p.last_completed_at.isoformat() if p.last_completed_at else None,
-                'current_subtask_id': p.current_subtask.id if p.current_subtask else None
+                'current_subtask_id': p.current_subtask_id
             })
 
         # 단계별 완료 통계
@@ -1113,143 +1307,111 @@ class SessionCompletionStatusView(APIView):
 
         subtask_stats = dict(Counter(all_completed))
 
-        return Response({
+        return conditional.apply(Response({
             'session_id': session.id,
-            'total_participants': participants.count(),
+            'total_participants': len(participants),
             'participants': completion_data,
             'subtask_completion_stats': subtask_stats
-        })
+        }))
 
 
-class SessionSummaryView(APIView):
+class SessionEventsView(APIView):
     """
-    세션 종료 후 요약 정보 조회 (강사용)
-    GET /api/sessions/{session_id}/summary/
+    세션 이벤트 로그 조회 (강사용)
+    GET /api/sessions/{session_id}/events/
 
-    수업 종료 후 강사가 빠르게 확인할 수 있는 요약 정보를 제공합니다.
+    Query Parameters:
+    - after_seq: 이 순번 이후 이벤트만 (기본 0, WebSocket 재연결 대신 REST로 따라잡을 때)
+    - limit: 최대 개수 (기본 SESSION_EVENT_REPLAY_MAX) - 넘으면 resync_required
+    - state: true이면 전체 로그로 재구성한 세션 상태 반환 (수업 후 분석용)
     """
     permission_classes = [IsAuthenticated]
 
     def get(self, request, session_id):
-        from apps.help.models import HelpRequest
-        from apps.tasks.models import Subtask
-        from collections import Counter
-        from django.db.models import Count
-
-        session = get_object_or_404(
-            LectureSession.objects.select_related('lecture', 'instructor'),
-            pk=session_id
-        )
+        session = get_object_or_404(LectureSession, pk=session_id)
 
         # 강사 권한 확인
-        if session.instructor != request.user:
+        if session.instructor_id != request.user.id:
             return Response(
-                {'error': '강사만 세션 요약을 조회할 수 있습니다.'},
+                {'error': '강사만 세션 이벤트를 조회할 수 있습니다.'},
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        # 참가자 정보
-        participants = session.participants.all()
-        total_participants = participants.count()
-
-        # 완료율 계산
-        completed_participants = participants.filter(status='COMPLETED').count()
-        completion_rate = (completed_participants / total_participants * 100) if total_participants > 0 else 0
-
-        # 전체 단계 수
-        total_subtasks = 0
-        if session.lecture:
-            total_subtasks = Subtask.objects.filter(
-                task__lecture=session.lecture
-            ).count()
-
-        # 참가자별 진행률 계산
-        participant_progress = []
-        all_completed_subtasks = []
-
-        for p in participants:
-            completed_count = len(p.completed_subtasks or [])
-            all_completed_subtasks.extend(p.completed_subtasks or [])
-
-            progress_rate = (completed_count / total_subtasks * 100) if total_subtasks > 0 else 0
-
-            participant_progress.append({
-                'id': p.id,
-                'name': p.display_name or p.participant_name,
-                'status': p.status,
-                'completedCount': completed_count,
-                'totalSteps': total_subtasks,
-                'progressRate': round(progress_rate, 1),
-                'joinedAt': p.joined_at.isoformat() if p.joined_at else None,
-                'completedAt': p.completed_at.isoformat() if p.completed_at else None,
+        if request.query_params.get('state', '').lower() == 'true':
+            return Response({
+                'session_id': session.id,
+                'state': event_log.rebuild_state(event_log.since(session.session_code, 0, limit=0)),
             })
 
-        # 평균 진행률
-        avg_progress = sum(p['progressRate'] for p in participant_progress) / total_participants if total_participants > 0 else 0
+        try:
+            after_seq = int(request.query_params.get('after_seq', 0))
+            limit = int(request.query_params['limit']) if 'limit' in request.query_params else None
+        except ValueError:
+            return Response(
+                {'error': 'after_seq와 limit는 정수여야 합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-        # 도움 요청 통계
-        help_requests = HelpRequest.objects.filter(session=session)
-        total_help_requests = help_requests.count()
-        resolved_help_requests = help_requests.filter(status='RESOLVED').count()
+        events = event_log.since(session.session_code, after_seq, limit=limit)
+        return Response({
+            'session_id': session.id,
+            'after_seq': after_seq,
+            'last_seq': event_log.latest_seq(session.session_code),
+            'resync_required': events is None,
+            'events': events or [],
+        })
 
-        # 어려운 단계 분석 (도움 요청이 많은 단계)
-        help_by_subtask = help_requests.values('subtask_id', 'subtask__title').annotate(
-            count=Count('id')
-        ).order_by('-count')[:5]
 
-        difficult_steps = [
-            {
-                'subtaskId': item['subtask_id'],
-                'subtaskName': item['subtask__title'],
-                'helpRequestCount': item['count'],
-            }
-            for item in help_by_subtask if item['subtask_id']
-        ]
+class SessionConnectionMetricsView(APIView):
+    """
+    세션 WebSocket 송신 큐 지표 조회 (강사용)
+    GET /api/sessions/{session_id}/connection-metrics/
 
-        # 단계별 완료 통계
-        subtask_completion_stats = dict(Counter(all_completed_subtasks))
+    느린 연결 때문에 병합/버려진 메시지 수, 강등/종료된 연결 수 (core.websocket.backpressure)
+    """
+    permission_classes = [IsAuthenticated]
 
-        # 세션 시간 계산
-        duration_seconds = 0
-        if session.started_at and session.ended_at:
-            duration_seconds = int((session.ended_at - session.started_at).total_seconds())
-        elif session.started_at:
-            duration_seconds = int((timezone.now() - session.started_at).total_seconds())
+    def get(self, request, session_id):
+        session = get_object_or_404(LectureSession, pk=session_id)
+
+        # 강사 권한 확인
+        if session.instructor_id != request.user.id:
+            return Response(
+                {'error': '강사만 연결 지표를 조회할 수 있습니다.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
 
         return Response({
-            'sessionId': session.id,
-            'sessionTitle': session.title,
-            'sessionCode': session.session_code,
-            'lectureId': session.lecture.id if session.lecture else None,
-            'lectureName': session.lecture.title if session.lecture else None,
-            'status': session.status,
+            'session_id': session.id,
+            'session': get_send_metrics(session.session_code),
+            'total': get_send_metrics(),
+        })
 
-            # 시간 정보
-            'startedAt': session.started_at.isoformat() if session.started_at else None,
-            'endedAt': session.ended_at.isoformat() if session.ended_at else None,
-            'durationSeconds': duration_seconds,
 
-            # 참가자 통계
-            'totalParticipants': total_participants,
-            'completedParticipants': completed_participants,
-            'completionRate': round(completion_rate, 1),
-            'avgProgress': round(avg_progress, 1),
+class SessionSummaryView(ReplicaReadMixin, APIView):
+    """
+    세션 종료 후 요약 정보 조회 (강사용)
+    GET /api/sessions/{session_id}/summary/
 
-            # 단계 정보
-            'totalSteps': total_subtasks,
-            'subtaskCompletionStats': subtask_completion_stats,
+    수업 종료 후 강사가 빠르게 확인할 수 있는 요약 정보를 제공합니다.
+    """
+    permission_classes = [IsAuthenticated]
 
-            # 도움 요청 통계
-            'totalHelpRequests': total_help_requests,
-            'resolvedHelpRequests': resolved_help_requests,
-            'helpResolutionRate': round(resolved_help_requests / total_help_requests * 100, 1) if total_help_requests > 0 else 100,
+    def get(self, request, session_id):
+        session = get_object_or_404(
+            LectureSession.objects.select_related('lecture', 'instructor'),
+            pk=session_id
+        )
 
-            # 어려운 단계
-            'difficultSteps': difficult_steps,
+        # 강사 권한 확인
+        if session.instructor != request.user:
+            return Response(
+                {'error': '강사만 세션 요약을 조회할 수 있습니다.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
 
-            # 참가자 상세
-            'participants': participant_progress,
-        })
+        # 종료된 세션은 종료 시점 스냅샷, 진행 중/복습 모드 세션은 실시간 계산
+        return Response(SessionSummaryService().get_summary(session))
 
 
 class SessionSubtasksView(APIView):
@@ -1263,54 +1425,66 @@ class SessionSubtasksView(APIView):
         - current_subtask_index: 현재 단계 인덱스 (0-based)
         - total_subtasks: 전체 단계 수
         - subtasks: 단계 목록
+
+    ETag/If-None-Match 지원 (세션 버전 + 강의 단계 구성 버전), ?wait=초 로 long-poll
     """
     permission_classes = [IsAuthenticated]
 
     def get(self, request, session_id):
+        lecture_id = LectureSession.objects.filter(pk=session_id).values_list('lecture_id', flat=True).first()
+        conditional = versions.ConditionalGet(
+            request, versions.session_scope(session_id),
+            lecture_id, get_lecture_plan(lecture_id)['version'] if lecture_id else None,
+        )
+        not_modified = conditional.not_modified()
+        if not_modified is not None:
+            return not_modified
+
         session = get_object_or_404(LectureSession, pk=session_id)
 
         subtasks = []
         current_subtask_index = 0
+        current_subtask_data = None
 
-        if session.lecture:
-            # 강의에 연결된 모든 Task와 Subtask 조회
-            tasks = Task.objects.filter(lecture=session.lecture).prefetch_related('subtasks').order_by('id')
-
-            global_index = 0
-            for task in tasks:
-                for subtask in task.subtasks.all().order_by('order_index'):
-                    subtask_data = {
-                        'id': subtask.id,
-                        'title': subtask.title,
-                        'description': subtask.description,
-                        'orderIndex': global_index,  # camelCase for frontend
-                        'order_index': global_index,  # snake_case for consistency
-                        'targetAction': subtask.target_action,
-                        'guideText': subtask.guide_text,
-                        'taskId': task.id,
-                        'taskTitle': task.title,
-                    }
-                    subtasks.append(subtask_data)
-
-                    # 현재 단계 인덱스 찾기
-                    if session.current_subtask and subtask.id == session.current_subtask.id:
-                        current_subtask_index = global_index
-
-                    global_index += 1
+        if session.lecture_id:
+            # 캐시된 강의 단계 구성 (과제 순서 → 단계 순서)
+            plan = get_lecture_plan(session.lecture_id)
+            subtasks = [
+                {
+                    'id': subtask['id'],
+                    'title': subtask['title'],
+                    'description': subtask['description'],
+                    'orderIndex': subtask['position'],  # camelCase for frontend
+                    'order_index': subtask['position'],  # snake_case for consistency
+                    'targetAction': subtask['target_action'],
+                    'guideText': subtask['guide_text'],
+                    'taskId': subtask['task_id'],
+                    'taskTitle': subtask['task_title'],
+                }
+                for subtask in plan['subtasks']
+            ]
+
+            current = get_plan_subtask(plan, session.current_subtask_id) if session.current_subtask_id else None
+            if current:
+                current_subtask_index = current['position']
+                current_subtask_data = {
+                    'id': current['id'],
+                    'title': current['title'],
+                    'orderIndex': current_subtask_index,
+                }
 
-        current_subtask_data = None
-        if session.current_subtask:
+        if current_subtask_data is None and session.current_subtask:
             current_subtask_data = {
                 'id': session.current_subtask.id,
                 'title': session.current_subtask.title,
                 'orderIndex': current_subtask_index,
             }
 
-        return Response({
+        return conditional.apply(Response({
             'session_id': session_id,
             'current_subtask': current_subtask_data,
-            'current_subtask_id': session.current_subtask.id if session.current_subtask else None,
+            'current_subtask_id': session.current_subtask_id,
             'current_subtask_index': current_subtask_index,
             'total_subtasks': len(subtasks),
             'subtasks': subtasks,
-        })
+        }))
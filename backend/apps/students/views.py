@@ -11,6 +11,7 @@ from django.utils import timezone
 
 from apps.lectures.models import Lecture, UserLectureEnrollment
 from apps.sessions.models import LectureSession, SessionParticipant
+from apps.sessions import live_counters
 from .serializers import (
     LectureListSerializer,
     SessionJoinSerializer,
@@ -113,6 +114,10 @@ class StudentSessionViewSet(viewsets.GenericViewSet):
                 participant.status = 'ACTIVE'
                 participant.save()
 
+        live_counters.set_status(
+            session.id, participant.status, device_id=participant.device_id, user_id=request.user.id
+        )
+
         participant_serializer = SessionParticipantSerializer(participant)
 
         return Response({
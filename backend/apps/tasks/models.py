@@ -88,6 +88,10 @@ class Task(models.Model):
         if subtasks_to_create:
             Subtask.objects.bulk_create(subtasks_to_create)
 
+            # bulk_create는 post_save 시그널을 보내지 않으므로 강의 단계 구성 캐시를 직접 무효화
+            from apps.lectures.services import bump_lecture_plan_version
+            bump_lecture_plan_version(lecture.id)
+
         return task_copy
 
 
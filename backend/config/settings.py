@@ -88,6 +88,20 @@ DATABASES = {
     }
 }
 
+# Read replica (설정 시 대시보드 통계 등 읽기 전용 분석 조회를 replica로 분산, core.db.routers)
+DB_REPLICA_HOST = config('DB_REPLICA_HOST', default='')
+if DB_REPLICA_HOST:
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'HOST': DB_REPLICA_HOST,
+        'PORT': config('DB_REPLICA_PORT', default=DATABASES['default']['PORT']),
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['core.db.routers.ReplicaRouter']
+REPLICA_MAX_LAG_SECONDS = config('REPLICA_MAX_LAG_SECONDS', default=5, cast=float)
+REPLICA_LAG_CHECK_INTERVAL = config('REPLICA_LAG_CHECK_INTERVAL', default=5, cast=float)
+
 # For local development with SQLite (uncomment if needed):
 # DATABASES = {
 #     'default': {
@@ -243,6 +257,12 @@ CACHES = {
     }
 }
 
+# Redis 자료구조용 연결 (core.redis.get_redis) - 실시간 상태, 카운터, 캐시 인덱스 등
+REDIS_STATE_URL = config(
+    'REDIS_STATE_URL',
+    default=f"redis://{config('REDIS_HOST', default='localhost')}:{config('REDIS_PORT', default=6379, cast=int)}/2"
+)
+
 # Kafka Configuration
 KAFKA_BOOTSTRAP_SERVERS = config('KAFKA_BOOTSTRAP_SERVERS', default='localhost:9092')
 KAFKA_TOPICS = {
@@ -258,10 +278,108 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    'prewarm-help-suggestions': {
+        'task': 'apps.help.tasks.prewarm_help_suggestions_task',
+        'schedule': config('HELP_PREWARM_INTERVAL_SECONDS', default=600, cast=int),
+    },
+    'flush-live-session-state': {
+        'task': 'apps.sessions.tasks.flush_live_session_state_task',
+        'schedule': config('SESSION_LIVE_STATE_FLUSH_INTERVAL_SECONDS', default=2, cast=float),
+    },
+    'persist-session-events': {
+        'task': 'apps.sessions.tasks.persist_session_events_task',
+        'schedule': config('SESSION_EVENT_PERSIST_INTERVAL_SECONDS', default=2, cast=float),
+    },
+}
 
 # OpenAI Configuration (for Recording Analysis)
 OPENAI_API_KEY = config('OPENAI_API_KEY', default=None)
 OPENAI_MODEL = config('OPENAI_MODEL', default='gpt-4o-mini')
+# OpenAI 호환 서버 주소 (예: run_fake_llm_server 사용 시 http://localhost:8090/v1)
+OPENAI_BASE_URL = config('OPENAI_BASE_URL', default=None)
+
+# Recording Live Analysis (녹화 중 증분 분석)
+RECORDING_LIVE_ANALYSIS_DEFAULT = config('RECORDING_LIVE_ANALYSIS_DEFAULT', default=False, cast=bool)
+RECORDING_LIVE_SEGMENT_MAX_EVENTS = config('RECORDING_LIVE_SEGMENT_MAX_EVENTS', default=40, cast=int)
+# 구간 분석 락 TTL (GPT 호출보다 길게) / 종료 태스크가 락을 기다리는 재시도 간격
+RECORDING_LIVE_ANALYSIS_LOCK_TTL = config('RECORDING_LIVE_ANALYSIS_LOCK_TTL', default=300, cast=int)
+RECORDING_LIVE_FINAL_RETRY_DELAY = config('RECORDING_LIVE_FINAL_RETRY_DELAY', default=5, cast=int)
+
+# Help Analysis (M-GPT 도움 요청 비동기 분석)
+HELP_ANALYSIS_CONCURRENCY = config('HELP_ANALYSIS_CONCURRENCY', default=4, cast=int)
+# 도움 요청 Kafka 전송 확인 대기 (넘으면 Celery 분석으로 대체)
+HELP_KAFKA_ACK_TIMEOUT_SECONDS = config('HELP_KAFKA_ACK_TIMEOUT_SECONDS', default=5, cast=float)
+HELP_CONTEXT_WINDOW_SECONDS = config('HELP_CONTEXT_WINDOW_SECONDS', default=300, cast=int)
+HELP_CONTEXT_MAX_EVENTS = config('HELP_CONTEXT_MAX_EVENTS', default=20, cast=int)
+
+# Help Screenshots (도움 요청 스크린샷 전용 저장 스레드 풀)
+HELP_SCREENSHOT_WORKERS = config('HELP_SCREENSHOT_WORKERS', default=2, cast=int)
+HELP_SCREENSHOT_MAX_PENDING = config('HELP_SCREENSHOT_MAX_PENDING', default=32, cast=int)
+HELP_SCREENSHOT_MAX_BYTES = config('HELP_SCREENSHOT_MAX_BYTES', default=5 * 1024 * 1024, cast=int)
+
+# Help Answer Cache (유사 상황 M-GPT 답변 재사용)
+HELP_ANSWER_CACHE_TTL = config('HELP_ANSWER_CACHE_TTL', default=3600, cast=int)
+HELP_ANSWER_CACHE_MAX_ENTRIES = config('HELP_ANSWER_CACHE_MAX_ENTRIES', default=5000, cast=int)
+HELP_ANSWER_SIGNATURE_EVENTS = config('HELP_ANSWER_SIGNATURE_EVENTS', default=5, cast=int)
+
+# Help Suggestion Pre-warming (예정 세션 도움말 사전 생성)
+HELP_PREWARM_LEAD_MINUTES = config('HELP_PREWARM_LEAD_MINUTES', default=120, cast=int)
+HELP_PREWARM_RATE_LIMIT = config('HELP_PREWARM_RATE_LIMIT', default='20/m')
+HELP_PREWARM_INFLIGHT_TTL = config('HELP_PREWARM_INFLIGHT_TTL', default=900, cast=int)
+
+# Help Request Clustering (같은 단계 도움 요청 묶음 알림)
+HELP_CLUSTER_WINDOW_SECONDS = config('HELP_CLUSTER_WINDOW_SECONDS', default=5, cast=int)
+HELP_CLUSTER_DETAIL_TTL = config('HELP_CLUSTER_DETAIL_TTL', default=3600, cast=int)
+HELP_CLUSTER_FLUSH_GRACE_SECONDS = config('HELP_CLUSTER_FLUSH_GRACE_SECONDS', default=10, cast=int)
+
+# Lecture Plan Cache (강의 단계 구성 캐시)
+LECTURE_PLAN_CACHE_TTL = config('LECTURE_PLAN_CACHE_TTL', default=3600, cast=int)
+LECTURE_PLAN_LOCAL_CACHE_SIZE = config('LECTURE_PLAN_LOCAL_CACHE_SIZE', default=256, cast=int)
+
+# Session Live Counters (Redis 실시간 참가자 상태 카운터)
+SESSION_LIVE_COUNTERS_TTL = config('SESSION_LIVE_COUNTERS_TTL', default=21600, cast=int)
+
+# Dashboard Ticker (강의별 대시보드 통계 공유 갱신)
+DASHBOARD_TICKER_INTERVAL_SECONDS = config('DASHBOARD_TICKER_INTERVAL_SECONDS', default=5, cast=float)
+DASHBOARD_SNAPSHOT_TTL = config('DASHBOARD_SNAPSHOT_TTL', default=300, cast=int)
+
+# 단계 소요 시간 분위수 스케치 상대 정확도 (DDSketch, 바꾸면 rebuild_dashboard_rollups 실행)
+DASHBOARD_SKETCH_RELATIVE_ACCURACY = config('DASHBOARD_SKETCH_RELATIVE_ACCURACY', default=0.02, cast=float)
+
+# Session Versions (조회 API 조건부 GET / long-poll)
+SESSION_VERSION_TTL = config('SESSION_VERSION_TTL', default=21600, cast=int)
+SESSION_LONG_POLL_MAX_SECONDS = config('SESSION_LONG_POLL_MAX_SECONDS', default=25, cast=float)
+# 프로세스당 동시 long-poll 대기 수 (ASGI 스레드 풀 크기보다 작게 - 넘으면 바로 304)
+SESSION_LONG_POLL_MAX_WAITERS = config('SESSION_LONG_POLL_MAX_WAITERS', default=8, cast=int)
+
+# Session Join Storm (수업 시작 시 참가 몰림 처리)
+SESSION_JOIN_CACHE_TTL = config('SESSION_JOIN_CACHE_TTL', default=30, cast=int)
+SESSION_ROSTER_DIFF_WINDOW_SECONDS = config('SESSION_ROSTER_DIFF_WINDOW_SECONDS', default=2, cast=float)
+
+# Session Live State (진행 중 세션 참가자 상태 Redis 보관 + DB write-behind)
+SESSION_LIVE_STATE_TTL = config('SESSION_LIVE_STATE_TTL', default=43200, cast=int)
+SESSION_LIVE_STATE_FLUSH_BATCH = config('SESSION_LIVE_STATE_FLUSH_BATCH', default=5000, cast=int)
+
+# Session Event Log (세션 브로드캐스트 순번 + 재연결 재전송)
+SESSION_EVENT_RING_SIZE = config('SESSION_EVENT_RING_SIZE', default=1000, cast=int)
+SESSION_EVENT_REPLAY_MAX = config('SESSION_EVENT_REPLAY_MAX', default=500, cast=int)
+SESSION_EVENT_LOG_TTL = config('SESSION_EVENT_LOG_TTL', default=86400, cast=int)
+SESSION_EVENT_PERSIST_BATCH = config('SESSION_EVENT_PERSIST_BATCH', default=1000, cast=int)
+
+# Session Directory (세션 참가자 식별 정보 캐시 - 이름 조회 시 DB 대신 사용)
+SESSION_DIRECTORY_TTL = config('SESSION_DIRECTORY_TTL', default=43200, cast=int)
+SESSION_DIRECTORY_LOCAL_TTL = config('SESSION_DIRECTORY_LOCAL_TTL', default=10, cast=float)
+SESSION_DIRECTORY_LOCAL_CACHE_SIZE = config('SESSION_DIRECTORY_LOCAL_CACHE_SIZE', default=10000, cast=int)
+
+# Session Progress Frames (강사 소켓 진도 묶음 전송 기본 주기, 100~5000ms)
+SESSION_PROGRESS_FRAME_INTERVAL_MS = config('SESSION_PROGRESS_FRAME_INTERVAL_MS', default=500, cast=int)
+
+# WebSocket Backpressure (연결별 송신 큐 한도, 느린 클라이언트 강등/종료)
+WS_SEND_QUEUE_MAX = config('WS_SEND_QUEUE_MAX', default=256, cast=int)
+WS_SLOW_SEND_SECONDS = config('WS_SLOW_SEND_SECONDS', default=1.0, cast=float)
+WS_SEND_METRICS_FLUSH_SECONDS = config('WS_SEND_METRICS_FLUSH_SECONDS', default=10, cast=float)
+WS_SEND_METRICS_TTL = config('WS_SEND_METRICS_TTL', default=604800, cast=int)
 
 # Session Configuration
 SESSION_CODE_LENGTH = 6
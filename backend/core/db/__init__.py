@@ -0,0 +1,4 @@
+# Database routing utilities
+from .routers import ReplicaReadMixin, ReplicaRouter, replica_lag_seconds, use_replica
+
+__all__ = ['ReplicaReadMixin', 'ReplicaRouter', 'replica_lag_seconds', 'use_replica']
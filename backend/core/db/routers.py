@@ -0,0 +1,144 @@
+"""
+Read replica routing
+
+대시보드 통계/세션 리포트처럼 무거운 읽기 전용 조회를 읽기 복제본(replica)으로 보내
+실시간 쓰기(세션 consumer, 로그 수집)를 처리하는 primary의 부하를 줄인다.
+
+- DB_REPLICA_HOST가 설정된 경우에만 DATABASES['replica']가 생기고, 없으면 모든 조회가 primary로 간다.
+- 기본은 primary. use_replica() / ReplicaReadMixin으로 표시한 구간의 읽기만 replica로 보낸다.
+- 복제 지연(REPLICA_MAX_LAG_SECONDS 초과)이나 replica 장애 시 primary로 대체한다 (bounded staleness).
+- primary 트랜잭션 안의 읽기는 방금 쓴 값을 봐야 하므로 항상 primary로 보낸다.
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from rest_framework.permissions import SAFE_METHODS
+
+logger = logging.getLogger(__name__)
+
+REPLICA_DB_ALIAS = 'replica'
+
+# 현재 요청(스레드/코루틴)의 읽기 DB
+_read_alias: ContextVar[Optional[str]] = ContextVar('read_db_alias', default=None)
+
+# 프로세스별 복제 지연 측정 캐시: (측정 시각, 지연 초 또는 None)
+_lag_cache = {'checked_at': 0.0, 'lag': None}
+_lag_lock = threading.Lock()
+
+# 수신한 WAL을 모두 적용했으면 0, 아니면 마지막 적용 트랜잭션 이후 경과 시간
+_LAG_QUERY = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+"""
+
+
+def replica_configured() -> bool:
+    return REPLICA_DB_ALIAS in settings.DATABASES
+
+
+def _measure_lag() -> Optional[float]:
+    connection = connections[REPLICA_DB_ALIAS]
+    if connection.vendor != 'postgresql':
+        return 0.0
+    with connection.cursor() as cursor:
+        cursor.execute(_LAG_QUERY)
+        return float(cursor.fetchone()[0])
+
+
+def replica_lag_seconds() -> Optional[float]:
+    """
+    replica 복제 지연(초) - REPLICA_LAG_CHECK_INTERVAL 동안 캐시
+
+    Returns:
+        지연 초 또는 None (replica 미설정/장애)
+    """
+    if not replica_configured():
+        return None
+
+    interval = getattr(settings, 'REPLICA_LAG_CHECK_INTERVAL', 5)
+    now = time.monotonic()
+    with _lag_lock:
+        if now - _lag_cache['checked_at'] < interval:
+            return _lag_cache['lag']
+        # 측정 중 다른 스레드는 이전 값을 사용
+        _lag_cache['checked_at'] = now
+
+    try:
+        lag = _measure_lag()
+    except Exception as e:
+        logger.warning(f"Replica lag check failed, reading from primary: {e}")
+        lag = None
+    _lag_cache['lag'] = lag
+    return lag
+
+
+def _replica_alias() -> Optional[str]:
+    lag = replica_lag_seconds()
+    if lag is None or lag > getattr(settings, 'REPLICA_MAX_LAG_SECONDS', 5):
+        return None
+    return REPLICA_DB_ALIAS
+
+
+@contextmanager
+def use_replica():
+    """
+    구간 내 읽기를 replica로 보냄 (지연이 크거나 replica가 없으면 primary)
+
+    사용법:
+        with use_replica():
+            stats = heavy_aggregate_query()
+    """
+    token = _read_alias.set(_replica_alias())
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+class ReplicaRouter:
+    """
+    DATABASE_ROUTERS용 라우터
+
+    쓰기와 마이그레이션은 항상 primary, 읽기는 use_replica() 구간에서만 replica.
+    """
+
+    def db_for_read(self, model, **hints):
+        alias = _read_alias.get()
+        if alias is None or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return alias
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replica는 primary의 복제본이므로 같은 데이터베이스로 취급
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReplicaReadMixin:
+    """
+    읽기 전용 분석 API용 mixin - GET/HEAD/OPTIONS 요청의 조회를 replica로 보냄
+
+    사용법:
+        class LectureStatisticsView(ReplicaReadMixin, APIView):
+            ...
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in SAFE_METHODS:
+            return super().dispatch(request, *args, **kwargs)
+        with use_replica():
+            return super().dispatch(request, *args, **kwargs)
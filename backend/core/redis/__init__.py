@@ -1 +1,4 @@
 # Redis utilities
+from .client import get_redis, get_async_redis
+
+__all__ = ['get_redis', 'get_async_redis']
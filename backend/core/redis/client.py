@@ -0,0 +1,41 @@
+"""
+Shared Redis clients
+
+Django cache API로 표현하기 어려운 자료구조(정렬 집합, 해시, 원자적 카운터 등)를
+다루기 위한 공용 클라이언트. REDIS_STATE_URL(기본 db 2)을 사용하므로 캐시(db 1),
+Celery 브로커(db 0)와 키가 섞이지 않는다.
+"""
+import threading
+import weakref
+
+import redis
+import redis.asyncio as aioredis
+from django.conf import settings
+
+_client = None
+_client_lock = threading.Lock()
+
+# redis.asyncio 커넥션은 생성된 이벤트 루프에 묶이므로 루프별로 클라이언트를 둔다
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_redis() -> redis.Redis:
+    """프로세스 공용 동기 Redis 클라이언트 (문자열 응답)"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = redis.Redis.from_url(settings.REDIS_STATE_URL, decode_responses=True)
+    return _client
+
+
+def get_async_redis() -> aioredis.Redis:
+    """현재 이벤트 루프 전용 비동기 Redis 클라이언트 (문자열 응답)"""
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = aioredis.Redis.from_url(settings.REDIS_STATE_URL, decode_responses=True)
+        _async_clients[loop] = client
+    return client
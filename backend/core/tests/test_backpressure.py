@@ -0,0 +1,71 @@
+"""
+WebSocket 송신 큐 - 강등 중 버린 순번과 병합으로 건너뛴 순번을 클라이언트에 알림
+"""
+import asyncio
+import json
+
+from django.test import SimpleTestCase, override_settings
+
+from core.websocket.backpressure import BoundedSendMixin
+
+
+class _RecordingSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, text_data=None, bytes_data=None, close=False):
+        self.sent.append(json.loads(text_data))
+
+    async def close(self, code=None):
+        pass
+
+
+class _Consumer(BoundedSendMixin, _RecordingSocket):
+    ESSENTIAL_TYPES = frozenset({'step_changed'})
+    COALESCE_KEYS = {'step_changed': lambda message: 'current'}
+
+
+@override_settings(WS_SEND_QUEUE_MAX=3)
+class BoundedSendSeqTests(SimpleTestCase):
+    def _run(self, scenario):
+        async def main():
+            consumer = _Consumer()
+            try:
+                await scenario(consumer)
+                # writer가 큐를 모두 비울 때까지
+                for _ in range(20):
+                    await asyncio.sleep(0)
+            finally:
+                await consumer._stop_send_writer()
+            return consumer.sent
+
+        return asyncio.run(main())
+
+    def test_recovery_notice_reports_lowest_dropped_seq(self):
+        async def scenario(consumer):
+            for seq in (1, 2, 3):
+                await consumer.send_message({'type': 'progress_updated', 'seq': seq})
+            # 큐가 가득 참 → 강등 (1~3 버림), 필수 메시지는 전송
+            await consumer.send_message({'type': 'step_changed', 'seq': 4})
+            await consumer.send_message({'type': 'progress_updated', 'seq': 5})
+
+        sent = self._run(scenario)
+
+        self.assertEqual(
+            [(message['type'], message.get('mode'), message.get('seq')) for message in sent],
+            [('backpressure', 'essential', None), ('step_changed', None, 4), ('backpressure', 'full', None)],
+        )
+        self.assertEqual(sent[0]['dropped_seq'], 1)
+        # 클라이언트는 dropped_seq 앞(0)부터 resume해 1~3, 5를 다시 받음
+        self.assertEqual(sent[2]['dropped_seq'], 1)
+
+    def test_coalesced_message_lists_replaced_seqs(self):
+        async def scenario(consumer):
+            for seq in (1, 2, 3):
+                await consumer.send_message({'type': 'step_changed', 'seq': seq})
+
+        sent = self._run(scenario)
+
+        self.assertEqual(len(sent), 1)
+        self.assertEqual(sent[0]['seq'], 3)
+        self.assertEqual(sent[0]['skipped_seqs'], [1, 2])
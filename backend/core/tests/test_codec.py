@@ -0,0 +1,151 @@
+"""
+WebSocket 코덱 - v1 레이아웃 왕복, 서브프로토콜 협상(JSON 대체), 바이너리 프레임 수신
+"""
+import asyncio
+import json
+
+import msgpack
+from django.test import SimpleTestCase
+
+from core.websocket.codec import (
+    JSON_CODEC, MSGPACK_SUBPROTOCOL, MessageCodecMixin, MsgpackCodec, compact, expand, negotiate,
+)
+
+
+class CompactLayoutTests(SimpleTestCase):
+    def test_step_changed_keeps_subtask_once(self):
+        subtask = {'id': 3, 'title': '로그인', 'order_index': 2}
+        message = {
+            'type': 'step_changed', 'seq': 7, 'subtask': subtask,
+            'data': {**subtask, 'order': 2}, 'timestamp': '2024-01-01T00:00:00',
+        }
+
+        frame = compact(message)
+
+        self.assertEqual(frame, {
+            't': 'step_changed', 's': 7,
+            'd': {'id': 3, 'title': '로그인', 'order_index': 2, 'timestamp': '2024-01-01T00:00:00'},
+        })
+        self.assertIn('subtask', message, 'compact는 원본 메시지를 바꾸지 않음')
+
+    def test_user_name_alias_kept_in_data_only(self):
+        message = {
+            'type': 'help_requested', 'seq': 12, 'user_name': '김학생', 'subtask_id': 5,
+            'data': {'username': '김학생', 'subtask_id': 5},
+        }
+
+        frame = compact(message)
+
+        self.assertEqual(frame['d'], {'username': '김학생', 'subtask_id': 5})
+        self.assertEqual(frame['s'], 12)
+
+    def test_message_without_seq_has_no_s(self):
+        frame = compact({'type': 'progress_frame', 'seq': None, 'full': True})
+
+        self.assertEqual(frame, {'t': 'progress_frame', 'd': {'full': True}})
+
+    def test_msgpack_round_trip(self):
+        codec = MsgpackCodec()
+        message = {
+            'type': 'help_requested', 'seq': 12, 'user_name': '김학생', 'subtask_id': 5,
+            'data': {'username': '김학생', 'subtask_id': 5},
+        }
+
+        decoded = codec.decode(codec.encode(message)['bytes_data'])
+
+        self.assertEqual(decoded['type'], 'help_requested')
+        self.assertEqual(decoded['seq'], 12)
+        # receive가 최상위/data 어느 쪽을 읽어도 같은 값
+        self.assertEqual(decoded['data'], {'username': '김학생', 'subtask_id': 5})
+        self.assertEqual(decoded['username'], '김학생')
+        self.assertEqual(expand(compact(message)), decoded)
+
+
+class NegotiateTests(SimpleTestCase):
+    def test_json_without_subprotocol(self):
+        self.assertIs(negotiate(None), JSON_CODEC)
+        self.assertIs(negotiate([]), JSON_CODEC)
+
+    def test_json_for_unknown_subprotocol(self):
+        self.assertIs(negotiate(['mobilegpt.msgpack.v9']), JSON_CODEC)
+
+    def test_first_supported_subprotocol(self):
+        codec = negotiate(['mobilegpt.msgpack.v9', MSGPACK_SUBPROTOCOL])
+
+        self.assertEqual(codec.subprotocol, MSGPACK_SUBPROTOCOL)
+        self.assertTrue(codec.binary)
+
+
+class _RecordingSocket:
+    """AsyncWebsocketConsumer 대신 accept/send/receive만 기록"""
+
+    def __init__(self, subprotocols=None):
+        self.scope = {'subprotocols': subprotocols or []}
+        self.accepted = []
+        self.sent = []
+        self.received = []
+
+    async def accept(self, subprotocol=None):
+        self.accepted.append(subprotocol)
+
+    async def send(self, text_data=None, bytes_data=None, close=False):
+        self.sent.append({'text_data': text_data, 'bytes_data': bytes_data})
+
+    async def websocket_receive(self, message):
+        await self.receive(text_data=message.get('text'))
+
+    async def receive(self, text_data=None, bytes_data=None):
+        self.received.append(json.loads(text_data))
+
+
+class _Consumer(MessageCodecMixin, _RecordingSocket):
+    pass
+
+
+class MessageCodecMixinTests(SimpleTestCase):
+    def test_binary_frame_expanded_into_receive(self):
+        consumer = _Consumer([MSGPACK_SUBPROTOCOL])
+
+        async def scenario():
+            await consumer.accept()
+            frame = msgpack.packb({'t': 'step_complete', 'd': {'subtask_id': 4}}, use_bin_type=True)
+            await consumer.websocket_receive({'type': 'websocket.receive', 'bytes': frame})
+
+        asyncio.run(scenario())
+
+        self.assertEqual(consumer.accepted, [MSGPACK_SUBPROTOCOL])
+        self.assertEqual(consumer.received, [
+            {'subtask_id': 4, 'type': 'step_complete', 'data': {'subtask_id': 4}},
+        ])
+
+    def test_text_response_reencoded_for_binary_client(self):
+        consumer = _Consumer([MSGPACK_SUBPROTOCOL])
+
+        async def scenario():
+            await consumer.accept()
+            await consumer.send(text_data=json.dumps({'type': 'resume_complete', 'replayed': 0, 'last_seq': 3}))
+
+        asyncio.run(scenario())
+
+        sent = consumer.sent[0]
+        self.assertIsNone(sent['text_data'])
+        self.assertEqual(
+            msgpack.unpackb(sent['bytes_data'], raw=False),
+            {'t': 'resume_complete', 'd': {'replayed': 0, 'last_seq': 3}},
+        )
+
+    def test_json_client_unchanged(self):
+        consumer = _Consumer()
+        text = json.dumps({'type': 'join', 'data': {}})
+
+        async def scenario():
+            await consumer.accept()
+            await consumer.send(text_data=text)
+            await consumer.websocket_receive({'type': 'websocket.receive', 'text': text})
+
+        asyncio.run(scenario())
+
+        self.assertEqual(consumer.accepted, [None])
+        self.assertEqual(consumer.sent, [{'text_data': text, 'bytes_data': None}])
+        self.assertEqual(consumer.received, [{'type': 'join', 'data': {}}])
+        self.assertEqual(consumer.encode_message({'type': 'join'}), {'text_data': json.dumps({'type': 'join'})})
@@ -0,0 +1,95 @@
+"""
+읽기 복제본 라우팅 - 복제 지연/장애/트랜잭션 안에서는 primary, 쓰기 요청은 replica로 보내지 않음
+"""
+from unittest import mock
+
+from django.db import transaction
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from core.db import ReplicaReadMixin, ReplicaRouter, use_replica
+from core.db import routers
+
+
+class _ReplicaTestMixin:
+    """replica가 설정된 것처럼 두고, 지연 측정 캐시를 테스트마다 비움"""
+
+    lag = 0.0
+
+    def setUp(self):
+        super().setUp()
+        routers._lag_cache.update(checked_at=0.0, lag=None)
+        self.addCleanup(routers._lag_cache.update, checked_at=0.0, lag=None)
+        for patcher in (
+            mock.patch.object(routers, 'replica_configured', return_value=True),
+            mock.patch.object(routers, '_measure_lag', side_effect=lambda: self.lag),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.router = ReplicaRouter()
+
+    def read_alias(self):
+        with use_replica():
+            return self.router.db_for_read(None)
+
+
+@override_settings(REPLICA_MAX_LAG_SECONDS=5)
+class ReplicaRouterLagTests(_ReplicaTestMixin, SimpleTestCase):
+    def test_reads_from_replica_within_lag_bound(self):
+        self.lag = 2.0
+
+        self.assertEqual(self.read_alias(), routers.REPLICA_DB_ALIAS)
+
+    def test_reads_from_primary_when_lag_exceeds_bound(self):
+        self.lag = 30.0
+
+        self.assertEqual(self.read_alias(), 'default')
+
+    def test_reads_from_primary_when_lag_check_fails(self):
+        routers._measure_lag.side_effect = ConnectionError('replica down')
+
+        self.assertEqual(self.read_alias(), 'default')
+
+    def test_reads_from_primary_outside_use_replica(self):
+        self.assertEqual(self.router.db_for_read(None), 'default')
+
+    def test_writes_always_go_to_primary(self):
+        with use_replica():
+            self.assertEqual(self.router.db_for_write(None), 'default')
+
+
+class ReplicaRouterAtomicTests(_ReplicaTestMixin, TransactionTestCase):
+    databases = {'default'}
+
+    def test_reads_inside_atomic_go_to_primary(self):
+        with use_replica():
+            self.assertEqual(self.router.db_for_read(None), routers.REPLICA_DB_ALIAS)
+            with transaction.atomic():
+                self.assertEqual(self.router.db_for_read(None), 'default')
+
+
+class _AliasView(ReplicaReadMixin, APIView):
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def _alias(self, request):
+        return Response({'alias': ReplicaRouter().db_for_read(None)})
+
+    get = post = put = delete = _alias
+
+
+class ReplicaReadMixinTests(_ReplicaTestMixin, SimpleTestCase):
+    def _alias_for(self, method):
+        request = getattr(APIRequestFactory(), method)('/alias/')
+        return _AliasView.as_view()(request).data['alias']
+
+    def test_get_reads_from_replica(self):
+        self.assertEqual(self._alias_for('get'), routers.REPLICA_DB_ALIAS)
+
+    def test_unsafe_methods_keep_primary(self):
+        for method in ('post', 'put', 'delete'):
+            with self.subTest(method=method):
+                self.assertEqual(self._alias_for(method), 'default')
@@ -0,0 +1,5 @@
+# WebSocket utilities
+from .backpressure import BoundedSendMixin, get_send_metrics
+from .codec import MSGPACK_SUBPROTOCOL, MessageCodecMixin
+
+__all__ = ['BoundedSendMixin', 'get_send_metrics', 'MessageCodecMixin', 'MSGPACK_SUBPROTOCOL']
@@ -0,0 +1,323 @@
+"""
+WebSocket Backpressure - 연결별 유한 송신 큐와 느린 클라이언트 격리
+
+그룹 핸들러에서 self.send를 바로 기다리면 약한 모바일 망의 연결 하나가 송신 버퍼를 끝없이 키우고,
+핸들러가 밀리는 동안 채널 레이어의 연결별 수신함(capacity)이 차서 그룹 전송이 메시지를 버리게 된다.
+BoundedSendMixin은 send를 연결별 큐에 넣고 바로 돌아오며, 연결마다 하나인 writer 태스크가 큐를 비운다.
+
+  - 병합: COALESCE_KEYS에 있는 타입은 같은 키로 대기 중인 메시지를 최신 것으로 교체
+          (예: step_changed는 마지막 단계만, screenshot_updated는 기기별 마지막 화면만)
+          교체된 메시지의 순번은 새 메시지의 skipped_seqs로 알림 (클라이언트가 빈 순번으로 기다리지 않도록)
+  - 강등: 대기 메시지가 WS_SEND_QUEUE_MAX에 닿으면 ESSENTIAL_TYPES가 아닌 대기 메시지를 버리고
+          이후 필수 메시지만 보냄 (backpressure 알림). 큐를 모두 비우면 다시 전체 전송으로 복구
+          복구 알림의 dropped_seq는 강등 중 버린 가장 작은 순번 - 그 앞부터 resume하면 놓친 이벤트를 다시 받음
+  - 차단: 강등 상태에서도 큐가 다시 차면 느린 클라이언트로 보고 연결 종료 (close code 4008)
+  - 지표: 연결별 카운터를 Redis 해시에 누적 (get_send_metrics)
+
+Redis 구조 (ws_send:*):
+  ws_send:metrics          전체 카운터 (enqueued, sent, coalesced, dropped, downgraded, ...)
+  ws_send:metrics:{scope}  범위별 카운터 (SessionConsumer는 세션 코드)
+
+타입 없이 send(text_data=...)로 보내는 메시지(요청에 대한 응답)는 필수 메시지로 취급한다.
+Redis를 사용할 수 없으면 지표만 기록하지 않는다.
+"""
+import asyncio
+import json
+import logging
+import time
+from collections import Counter, deque
+from typing import Callable, Dict, Optional
+
+from django.conf import settings
+
+from core.redis import get_async_redis, get_redis
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'ws_send'
+METRICS_KEY = f'{KEY_PREFIX}:metrics'
+METRIC_FIELDS = (
+    'enqueued', 'sent', 'coalesced', 'dropped', 'downgraded', 'recovered', 'disconnected', 'slow_sends',
+)
+
+# 느린 클라이언트 연결 종료 코드 (4000번대는 애플리케이션 정의)
+SLOW_CONSUMER_CLOSE_CODE = 4008
+
+
+def _metrics_key(scope: Optional[str] = None) -> str:
+    return f'{METRICS_KEY}:{scope}' if scope else METRICS_KEY
+
+
+def get_send_metrics(scope: Optional[str] = None) -> Dict:
+    """송신 큐 지표 조회 (scope가 없으면 전체)"""
+    try:
+        raw = get_redis().hgetall(_metrics_key(scope))
+    except Exception as e:
+        logger.warning(f"WebSocket send metrics unavailable: {e}")
+        raw = {}
+
+    metrics = {field: int(raw.get(field, 0)) for field in METRIC_FIELDS}
+    metrics['scope'] = scope
+    return metrics
+
+
+class _Outgoing:
+    """대기 중인 송신 (병합되면 kwargs가 None이 되고 writer가 건너뜀)"""
+    __slots__ = ('kwargs', 'message_type', 'key', 'seqs')
+
+    def __init__(self, kwargs, message_type, key, seqs=()):
+        self.kwargs = kwargs
+        self.message_type = message_type
+        self.key = key
+        self.seqs = seqs  # 이 송신이 전달하는 이벤트 순번 (병합으로 건너뛴 순번 포함)
+
+
+class BoundedSendMixin:
+    """
+    AsyncWebsocketConsumer용 연결별 유한 송신 큐
+
+    사용:
+        class SessionConsumer(BoundedSendMixin, AsyncWebsocketConsumer):
+            ESSENTIAL_TYPES = frozenset({'step_changed', ...})
+            COALESCE_KEYS = {'step_changed': lambda message: 'current'}
+
+            async def some_handler(self, event):
+                await self.send_message({'type': 'step_changed', ...})
+
+    - send_message(message): 타입으로 병합/강등을 판단해 큐에 추가 (encode_message로 직렬화)
+    - send(text_data=...): 필수 메시지로 큐에 추가 (기존 호출 그대로 동작)
+    - wait_for_send_capacity(): 재전송처럼 한꺼번에 많이 보낼 때 큐에 여유가 생길 때까지 대기
+    - send_metrics_scope(): 지표를 따로 모을 범위 (기본 없음)
+    """
+
+    # 강등 상태에서도 보내는 메시지 타입
+    ESSENTIAL_TYPES = frozenset()
+    # 메시지 타입 → 병합 키 함수 (같은 키로 대기 중인 메시지는 최신 것만 남김)
+    COALESCE_KEYS: Dict[str, Callable[[dict], object]] = {}
+
+    _send_queue = None
+
+    def send_metrics_scope(self) -> Optional[str]:
+        return None
+
+    def _init_send_queue(self):
+        self._send_queue = deque()
+        self._send_index = {}  # 병합 키 → 대기 중인 항목
+        self._send_pending = 0
+        self._send_ready = asyncio.Event()
+        self._send_downgraded = False
+        self._send_dropped_seq = None  # 강등 중 버린 가장 작은 이벤트 순번
+        self._send_closed = False
+        self._send_metrics = Counter()
+        self._send_metrics_flushed_at = time.monotonic()
+        self._send_writer = asyncio.ensure_future(self._send_writer_loop())
+
+    @staticmethod
+    def _send_queue_max() -> int:
+        return getattr(settings, 'WS_SEND_QUEUE_MAX', 256)
+
+    async def send(self, text_data=None, bytes_data=None, close=False):
+        """응답 전송 (필수 메시지로 큐에 추가)"""
+        await self._enqueue_send({'text_data': text_data, 'bytes_data': bytes_data, 'close': close})
+
+    def encode_message(self, message: Dict) -> Dict:
+        """메시지 → send 인자 (기본 JSON, MessageCodecMixin이 협상한 코덱으로 바꿈)"""
+        return {'text_data': json.dumps(message)}
+
+    async def send_message(self, message: Dict):
+        """타입이 있는 메시지 전송 (message['type']으로 병합/강등 판단, 병합 후 인코딩)"""
+        await self._enqueue_send(None, message.get('type'), message)
+
+    async def wait_for_send_capacity(self, timeout: float = 5.0):
+        """대기 메시지가 큐 한도의 절반 아래로 내려갈 때까지 대기 (timeout 후에는 그대로 진행)"""
+        if self._send_queue is None:
+            return
+        deadline = time.monotonic() + timeout
+        while (
+            not self._send_closed and self._send_pending >= self._send_queue_max() // 2
+            and time.monotonic() < deadline
+        ):
+            await asyncio.sleep(0.05)
+
+    def _push(self, kwargs, message_type=None, key=None, seqs=()):
+        entry = _Outgoing(kwargs, message_type, key, seqs)
+        self._send_queue.append(entry)
+        if key is not None:
+            self._send_index[key] = entry
+        self._send_pending += 1
+        self._send_metrics['enqueued'] += 1
+        self._send_ready.set()
+
+    def _push_notice(self, mode: str, dropped: int = 0):
+        """강등/복구 알림 (dropped_seq: 지금까지 버린 가장 작은 순번 - 복구되면 그 앞부터 resume)"""
+        self._push(self.encode_message({
+            'type': 'backpressure', 'mode': mode, 'dropped': dropped, 'dropped_seq': self._send_dropped_seq,
+        }))
+
+    def _record_dropped(self, seqs):
+        if seqs:
+            lowest = min(seqs)
+            if self._send_dropped_seq is None or lowest < self._send_dropped_seq:
+                self._send_dropped_seq = lowest
+
+    async def _enqueue_send(self, kwargs, message_type=None, message=None):
+        if self._send_queue is None:
+            self._init_send_queue()
+        if self._send_closed:
+            return
+
+        metrics = self._send_metrics
+        seq = message.get('seq') if message else None
+        seqs = (seq,) if seq is not None else ()
+        essential = message_type is None or message_type in self.ESSENTIAL_TYPES
+        if self._send_downgraded and not essential:
+            metrics['dropped'] += 1
+            self._record_dropped(seqs)
+            return
+
+        key = None
+        key_func = self.COALESCE_KEYS.get(message_type)
+        if key_func is not None:
+            key = (message_type, key_func(message))
+            previous = self._send_index.pop(key, None)
+            if previous is not None:
+                previous.kwargs = None
+                self._send_pending -= 1
+                metrics['coalesced'] += 1
+                if previous.seqs and seqs:
+                    seqs = previous.seqs + seqs
+                    message = {**message, 'skipped_seqs': list(seqs[:-1])}
+
+        if self._send_pending >= self._send_queue_max():
+            if not await self._on_send_overflow() or not essential:
+                metrics['dropped'] += 1
+                self._record_dropped(seqs)
+                return
+
+        if kwargs is None:
+            kwargs = self.encode_message(message)
+        self._push(kwargs, message_type, key, seqs)
+
+    async def _on_send_overflow(self) -> bool:
+        """
+        큐가 가득 찼을 때: 처음이면 필수 메시지만 남기고 강등, 강등 상태면 연결 종료
+
+        Returns:
+            계속 보낼 수 있으면 True (강등), 연결을 닫았으면 False
+        """
+        metrics = self._send_metrics
+        if self._send_downgraded:
+            logger.warning(
+                f"Closing slow WebSocket consumer {getattr(self, 'channel_name', '')} "
+                f"({self._send_pending} messages pending)"
+            )
+            metrics['disconnected'] += 1
+            await self._stop_send_writer()
+            self._send_closed = True
+            await self.close(code=SLOW_CONSUMER_CLOSE_CODE)
+            await self._flush_send_metrics()
+            return False
+
+        dropped = 0
+        for entry in self._send_queue:
+            if entry.kwargs is not None and entry.message_type is not None \
+                    and entry.message_type not in self.ESSENTIAL_TYPES:
+                entry.kwargs = None
+                if entry.key is not None and self._send_index.get(entry.key) is entry:
+                    del self._send_index[entry.key]
+                self._record_dropped(entry.seqs)
+                dropped += 1
+        self._send_pending -= dropped
+        metrics['dropped'] += dropped
+        metrics['downgraded'] += 1
+        self._send_downgraded = True
+        logger.info(
+            f"Downgraded WebSocket consumer {getattr(self, 'channel_name', '')} to essential messages "
+            f"(dropped {dropped})"
+        )
+        self._push_notice('essential', dropped)
+        return True
+
+    async def _send_writer_loop(self):
+        metrics = self._send_metrics
+        slow_seconds = getattr(settings, 'WS_SLOW_SEND_SECONDS', 1.0)
+        flush_seconds = getattr(settings, 'WS_SEND_METRICS_FLUSH_SECONDS', 10)
+        try:
+            while True:
+                if not self._send_queue:
+                    if self._send_downgraded:
+                        # 밀린 메시지를 모두 보냄 → 전체 전송으로 복구
+                        self._send_downgraded = False
+                        metrics['recovered'] += 1
+                        self._push_notice('full')
+                        self._send_dropped_seq = None
+                        continue
+                    if time.monotonic() - self._send_metrics_flushed_at >= flush_seconds:
+                        await self._flush_send_metrics()
+                    self._send_ready.clear()
+                    await self._send_ready.wait()
+                    continue
+
+                entry = self._send_queue.popleft()
+                if entry.kwargs is None:
+                    continue
+                self._send_pending -= 1
+                if entry.key is not None and self._send_index.get(entry.key) is entry:
+                    del self._send_index[entry.key]
+
+                started = time.monotonic()
+                await super().send(**entry.kwargs)
+                if time.monotonic() - started >= slow_seconds:
+                    metrics['slow_sends'] += 1
+                metrics['sent'] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 연결이 이미 끊김 - 남은 메시지는 보낼 수 없음
+            logger.warning(f"WebSocket send failed: {e}")
+            self._send_closed = True
+
+    async def _stop_send_writer(self):
+        if self._send_queue is None:
+            return
+        writer = self._send_writer
+        if not writer.done():
+            writer.cancel()
+            try:
+                await writer
+            except asyncio.CancelledError:
+                pass
+        self._send_metrics['dropped'] += self._send_pending
+        self._send_queue.clear()
+        self._send_index.clear()
+        self._send_pending = 0
+
+    async def _flush_send_metrics(self):
+        """누적 카운터를 Redis에 더하고 초기화"""
+        if self._send_queue is None:
+            return
+        counts = {field: count for field, count in self._send_metrics.items() if count}
+        self._send_metrics.clear()
+        self._send_metrics_flushed_at = time.monotonic()
+        if not counts:
+            return
+
+        scope = self.send_metrics_scope()
+        try:
+            pipe = get_async_redis().pipeline()
+            for key in filter(None, (METRICS_KEY, scope and _metrics_key(scope))):
+                for field, count in counts.items():
+                    pipe.hincrby(key, field, count)
+            if scope:
+                pipe.expire(_metrics_key(scope), getattr(settings, 'WS_SEND_METRICS_TTL', 86400 * 7))
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to record WebSocket send metrics: {e}")
+
+    async def websocket_disconnect(self, message):
+        """연결 종료: writer 정리 후 지표 기록"""
+        await self._stop_send_writer()
+        try:
+            await super().websocket_disconnect(message)
+        finally:
+            await self._flush_send_metrics()
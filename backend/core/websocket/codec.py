@@ -0,0 +1,150 @@
+"""
+WebSocket Codec - 협상한 서브프로토콜에 따라 메시지를 JSON 또는 MessagePack으로 인코딩
+
+기존 메시지는 웹/Android 호환을 위해 같은 값을 최상위와 data에 두 번 담는다
+(step_changed는 subtask와 data, help_requested는 모든 필드를 data에 다시).
+모바일 클라이언트가 서브프로토콜 mobilegpt.msgpack.v1을 요청하면 중복을 없앤 v1 레이아웃을
+MessagePack 바이너리 프레임으로 보낸다. 서브프로토콜을 요청하지 않은 기존 클라이언트는 그대로 JSON.
+
+v1 레이아웃 (버전은 서브프로토콜 이름으로 구분, 레이아웃이 바뀌면 v2 추가):
+  {"t": 메시지 타입, "s": 이벤트 순번 (있을 때만), "d": 내용}
+  - d는 data(Android 앱이 읽는 필드)를 기준으로, data에 없는 최상위 필드만 더한다
+    (같은 이름이나 user_name/username 같은 별칭이 data에 있으면 data 쪽만 남김)
+  - step_changed의 d는 subtask 필드 그대로 (data의 order는 order_index와 같으므로 제외)
+  - 클라이언트 → 서버도 같은 레이아웃 ({"t": "join", "d": {...}})
+
+msgpack이 설치되어 있지 않으면 서브프로토콜을 제안하지 않고 JSON만 사용한다.
+"""
+import json
+from typing import Dict, Iterable, Optional
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+MSGPACK_SUBPROTOCOL = 'mobilegpt.msgpack.v1'
+
+# 최상위 필드 → 같은 값을 담는 data 필드
+_DATA_ALIASES = {'user_name': 'username'}
+
+
+def _merge_payload(message: Dict) -> Dict:
+    """data를 기준으로 중복되지 않은 최상위 필드만 더함"""
+    data = message.pop('data', None)
+    if not isinstance(data, dict):
+        if data is not None:
+            message['data'] = data
+        return message
+
+    payload = dict(data)
+    for key, value in message.items():
+        alias = _DATA_ALIASES.get(key, key)
+        if alias in payload:
+            continue
+        payload[key] = value
+    return payload
+
+
+def _step_changed_payload(message: Dict) -> Dict:
+    message.pop('data', None)
+    payload = dict(message.pop('subtask', None) or {})
+    payload.update(message)
+    return payload
+
+
+_LAYOUTS = {
+    'step_changed': _step_changed_payload,
+}
+
+
+def compact(message: Dict) -> Dict:
+    """메시지 → v1 레이아웃"""
+    message = dict(message)
+    message_type = message.pop('type', None)
+    frame = {'t': message_type}
+    if message.get('seq') is not None:
+        frame['s'] = message.pop('seq')
+    message.pop('seq', None)
+    frame['d'] = _LAYOUTS.get(message_type, _merge_payload)(message)
+    return frame
+
+
+def expand(frame: Dict) -> Dict:
+    """v1 레이아웃 → 메시지 (receive가 최상위/data 어느 쪽을 읽어도 되도록 둘 다 채움)"""
+    payload = frame.get('d') or {}
+    message = {**payload, 'type': frame.get('t'), 'data': payload}
+    if frame.get('s') is not None:
+        message['seq'] = frame['s']
+    return message
+
+
+class JsonCodec:
+    """기본 코덱 (서브프로토콜 없음)"""
+    subprotocol = None
+    binary = False
+
+    def encode(self, message: Dict) -> Dict:
+        return {'text_data': json.dumps(message)}
+
+    def decode(self, data) -> Dict:
+        return json.loads(data)
+
+
+class MsgpackCodec:
+    """MessagePack v1 코덱 (바이너리 프레임)"""
+    subprotocol = MSGPACK_SUBPROTOCOL
+    binary = True
+
+    def encode(self, message: Dict) -> Dict:
+        return {'bytes_data': msgpack.packb(compact(message), use_bin_type=True)}
+
+    def decode(self, data) -> Dict:
+        return expand(msgpack.unpackb(data, raw=False))
+
+
+JSON_CODEC = JsonCodec()
+CODECS = {MSGPACK_SUBPROTOCOL: MsgpackCodec()} if msgpack is not None else {}
+
+
+def negotiate(subprotocols: Iterable[str]) -> JsonCodec:
+    """클라이언트가 요청한 서브프로토콜 중 지원하는 첫 번째 코덱 (없으면 JSON)"""
+    for subprotocol in subprotocols or ():
+        codec = CODECS.get(subprotocol)
+        if codec is not None:
+            return codec
+    return JSON_CODEC
+
+
+class MessageCodecMixin:
+    """
+    AsyncWebsocketConsumer용 서브프로토콜 협상 (BoundedSendMixin보다 앞에 둔다)
+
+        class SessionConsumer(MessageCodecMixin, BoundedSendMixin, AsyncWebsocketConsumer): ...
+
+    - accept(): scope['subprotocols']로 코덱을 정하고 응답에 서브프로토콜을 담음
+    - encode_message(message): 협상한 코덱으로 send 인자 생성 (BoundedSendMixin.send_message가 사용)
+    - send(text_data=...): 바이너리 코덱이면 JSON 문자열을 v1 레이아웃으로 다시 인코딩
+    - 받은 바이너리 프레임은 JSON 문자열로 바꿔 기존 receive(text_data)에 넘김
+    """
+
+    codec = JSON_CODEC
+
+    async def accept(self, subprotocol: Optional[str] = None):
+        self.codec = negotiate(self.scope.get('subprotocols'))
+        await super().accept(subprotocol or self.codec.subprotocol)
+
+    def encode_message(self, message: Dict) -> Dict:
+        return self.codec.encode(message)
+
+    async def send(self, text_data=None, bytes_data=None, close=False):
+        if text_data is not None and self.codec.binary:
+            await super().send(**self.codec.encode(json.loads(text_data)), close=close)
+            return
+        await super().send(text_data=text_data, bytes_data=bytes_data, close=close)
+
+    async def websocket_receive(self, message):
+        if message.get('bytes') is not None and self.codec.binary:
+            await self.receive(text_data=json.dumps(self.codec.decode(message['bytes'])))
+            return
+        await super().websocket_receive(message)
@@ -0,0 +1,9 @@
+#!/bin/sh
+# primary 최초 초기화 시 복제 계정 생성 및 복제 접속 허용 (docker-compose.replica.yml)
+set -e
+
+psql -v ON_ERROR_STOP=1 --username "$POSTGRES_USER" --dbname "$POSTGRES_DB" <<-SQL
+    CREATE ROLE replicator WITH REPLICATION LOGIN PASSWORD 'replicator';
+SQL
+
+echo "host replication replicator all scram-sha-256" >> "$PGDATA/pg_hba.conf"
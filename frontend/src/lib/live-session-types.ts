@@ -81,6 +81,7 @@ export interface LiveNotification {
   studentName?: string;
   isResolved: boolean;
   screenshotUrl?: string; // 도움 요청 시 캡처한 스크린샷 URL
+  screenshotId?: string; // 저장 중인 스크린샷 ID (help_screenshot_ready로 URL 도착)
 }
 
 export interface StudentScreen {
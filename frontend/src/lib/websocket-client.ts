@@ -1,6 +1,7 @@
 // WebSocket Client for real-time updates
 
 import type {
+  BackpressureMessage,
   IncomingMessage,
   OutgoingMessage,
   WebSocketCallback,
@@ -20,6 +21,13 @@ class WebSocketClient {
   private reconnectAttempts = 0;
   private callbacks: Set<WebSocketCallback> = new Set();
   private sessionCode: string | null = null;
+  private lastSeq = 0; // 빠짐없이 전달한 마지막 세션 이벤트 순번
+  private pendingEvents: Map<number, IncomingMessage> = new Map(); // 앞 순번이 오기 전에 도착한 이벤트
+  private handledSeqs: Set<number> = new Set(); // lastSeq 이후 이미 전달했거나 서버가 병합해 건너뛴 순번
+  private sendDowngraded = false; // 서버가 필수 메시지만 보내는 중 (backpressure essential)
+  private gapTimeout: NodeJS.Timeout | null = null;
+  private gapWaitDelay = 1000; // 순번이 빈 채로 이만큼 지나면 resume 요청
+  private progressFrames: { intervalMs?: number } | null = null; // 재연결 시 다시 구독
   private isIntentionallyClosed = false;
   private connectionStatus: WebSocketConnectionStatus = 'disconnected';
   private statusCallbacks: Set<(info: WebSocketConnectionInfo) => void> = new Set();
@@ -40,6 +48,10 @@ class WebSocketClient {
       this.stopHeartbeat();
     }
 
+    // 다른 세션이면 순번을 처음부터
+    if (this.sessionCode !== sessionCode) {
+      this.resetSeq(0);
+    }
     this.sessionCode = sessionCode;
     this.isIntentionallyClosed = false;
 
@@ -62,12 +74,21 @@ class WebSocketClient {
     // Connect to WebSocket with session code and JWT token
     // Note: Backend expects /ws/sessions/{session_code}/?token={jwt_token}
     let wsUrl = `${WS_BASE_URL}/sessions/${sessionCode}/`;
+    const params = new URLSearchParams();
     if (token) {
-      wsUrl += `?token=${encodeURIComponent(token)}`;
-      console.log(`[WebSocket] Connecting with authentication to: ${WS_BASE_URL}/sessions/${sessionCode}/`);
-    } else {
-      console.log(`[WebSocket] Connecting without authentication to: ${wsUrl}`);
+      params.set('token', token);
+    }
+    // 재연결이면 놓친 이벤트만 다시 받음
+    if (this.lastSeq > 0) {
+      params.set('last_seq', String(this.lastSeq));
+    }
+    if (params.toString()) {
+      wsUrl += `?${params.toString()}`;
     }
+    console.log(
+      `[WebSocket] Connecting ${token ? 'with' : 'without'} authentication to: ${WS_BASE_URL}/sessions/${sessionCode}/` +
+      (this.lastSeq > 0 ? ` (resume after seq ${this.lastSeq})` : '')
+    );
 
     this.ws = new WebSocket(wsUrl);
 
@@ -79,6 +100,10 @@ class WebSocketClient {
       // Send join message to authenticate and register
       this.send({ type: 'join', data: {} });
 
+      if (this.progressFrames) {
+        this.send({ type: 'subscribe_progress_frames', interval_ms: this.progressFrames.intervalMs });
+      }
+
       // Start heartbeat to keep connection alive
       this.startHeartbeat();
     };
@@ -86,8 +111,20 @@ class WebSocketClient {
     this.ws.onmessage = (event) => {
       try {
         const message: IncomingMessage = JSON.parse(event.data);
-        console.log('[WebSocket] Received:', message.type, message);
-        this.callbacks.forEach(callback => callback(message));
+        if (message.seq !== undefined && message.seq !== null) {
+          this.receiveEvent(message);
+        } else if (message.type === 'resync_required') {
+          // 놓친 이벤트를 다시 받을 수 없음 - 서버 순번부터 새로 시작하고 화면은 REST로 다시 불러옴
+          this.resetSeq(message.last_seq);
+          this.dispatch(message);
+        } else {
+          if (message.type === 'resume_complete') {
+            this.completeResume(message.last_seq);
+          } else if (message.type === 'backpressure') {
+            this.handleBackpressure(message);
+          }
+          this.dispatch(message);
+        }
       } catch (error) {
         console.error('[WebSocket] Failed to parse message:', error);
       }
@@ -102,6 +139,8 @@ class WebSocketClient {
       console.log(`[WebSocket] Disconnected (code: ${event.code}, reason: ${event.reason})`);
       this.ws = null;
       this.stopHeartbeat();
+      // 재연결하면 ?last_seq=로 빈 순번부터 다시 받음
+      this.clearGapTimeout();
 
       // Auto-reconnect if not intentionally closed and within retry limit
       if (!this.isIntentionallyClosed && this.sessionCode) {
@@ -125,6 +164,138 @@ class WebSocketClient {
     };
   }
 
+  private dispatch(message: IncomingMessage) {
+    console.log('[WebSocket] Received:', message.type, message);
+    this.callbacks.forEach(callback => callback(message));
+  }
+
+  // 세션 이벤트는 순번대로 한 번씩만 전달
+  // 여러 서버 프로세스가 보내므로 순번이 뒤바뀌어 도착할 수 있음 - 뒤 순번은 잠시 보관하고,
+  // 빈 순번이 gapWaitDelay 안에 오지 않으면 resume으로 다시 받음
+  private receiveEvent(message: IncomingMessage) {
+    const seq = message.seq as number;
+    if (this.lastSeq === 0) {
+      // 처음 받은 이벤트부터 순번을 셈
+      this.lastSeq = seq - 1;
+    }
+    // 송신 큐에서 이 메시지로 병합되어 오지 않을 순번
+    for (const skipped of message.skipped_seqs ?? []) {
+      if (skipped > this.lastSeq) {
+        this.handledSeqs.add(skipped);
+      }
+    }
+    if (seq <= this.lastSeq || this.pendingEvents.has(seq) || this.handledSeqs.has(seq)) {
+      // 재전송과 실시간 전송이 겹친 이벤트
+      return;
+    }
+    if (this.sendDowngraded) {
+      // 강등 중에는 버려진 순번을 기다리지 않고 바로 전달 (복구되면 resume으로 채움)
+      this.handledSeqs.add(seq);
+      this.dispatch(message);
+    } else {
+      this.pendingEvents.set(seq, message);
+    }
+    this.drainPendingEvents();
+  }
+
+  private drainPendingEvents() {
+    for (;;) {
+      const next = this.lastSeq + 1;
+      const message = this.pendingEvents.get(next);
+      if (message) {
+        this.pendingEvents.delete(next);
+        this.lastSeq = next;
+        this.dispatch(message);
+      } else if (this.handledSeqs.delete(next)) {
+        this.lastSeq = next;
+      } else {
+        break;
+      }
+    }
+
+    if (this.sendDowngraded || (this.pendingEvents.size === 0 && this.handledSeqs.size === 0)) {
+      this.clearGapTimeout();
+    } else if (!this.gapTimeout) {
+      this.gapTimeout = setTimeout(() => {
+        this.gapTimeout = null;
+        if ((this.pendingEvents.size > 0 || this.handledSeqs.size > 0) && this.isConnected()) {
+          console.warn(`[WebSocket] Missing event after seq ${this.lastSeq}, requesting resume`);
+          this.send({ type: 'resume', last_seq: this.lastSeq });
+        }
+      }, this.gapWaitDelay);
+    }
+  }
+
+  // 재전송이 끝났는데도 lastReplayedSeq 이하에 빈 순번이 남았으면 이벤트 로그에 없는 것
+  // - 보관한 이벤트를 전달하고 건너뛴 만큼은 resync_required로 전체 상태를 다시 불러오게 함
+  private completeResume(lastReplayedSeq: number) {
+    let skipped = false;
+    const seqs = [...this.pendingEvents.keys(), ...this.handledSeqs].sort((a, b) => a - b);
+    for (const seq of seqs) {
+      if (seq > lastReplayedSeq) {
+        break;
+      }
+      skipped = skipped || seq > this.lastSeq + 1;
+      const message = this.pendingEvents.get(seq);
+      this.pendingEvents.delete(seq);
+      this.handledSeqs.delete(seq);
+      this.lastSeq = seq;
+      if (message) {
+        this.dispatch(message);
+      }
+    }
+    this.drainPendingEvents();
+
+    if (skipped) {
+      console.warn('[WebSocket] Some events could not be replayed, resync required');
+      this.dispatch({ type: 'resync_required', last_seq: this.lastSeq });
+    }
+  }
+
+  // 느린 연결: essential이면 필수 메시지만 오므로 빈 순번을 기다리지 않고,
+  // full로 복구되면 버려진 가장 작은 순번(dropped_seq) 앞부터 resume으로 다시 받음
+  private handleBackpressure(message: BackpressureMessage) {
+    if (message.mode === 'essential') {
+      this.sendDowngraded = true;
+      for (const seq of [...this.pendingEvents.keys()].sort((a, b) => a - b)) {
+        this.dispatch(this.pendingEvents.get(seq) as IncomingMessage);
+        this.handledSeqs.add(seq);
+      }
+      this.pendingEvents.clear();
+      this.clearGapTimeout();
+      return;
+    }
+
+    this.sendDowngraded = false;
+    if (message.dropped_seq === null || message.dropped_seq === undefined) {
+      this.drainPendingEvents();
+      return;
+    }
+    if (message.dropped_seq <= this.lastSeq) {
+      // 버려진 이벤트 뒤부터 순번을 세기 시작함 - 다시 받을 수 없으므로 전체 상태를 다시 불러옴
+      const latest = Math.max(this.lastSeq, ...this.handledSeqs);
+      this.resetSeq(latest);
+      this.dispatch({ type: 'resync_required', last_seq: latest });
+      return;
+    }
+    console.log(`[WebSocket] Send queue recovered, resuming after seq ${this.lastSeq} (dropped from ${message.dropped_seq})`);
+    this.send({ type: 'resume', last_seq: this.lastSeq });
+  }
+
+  private clearGapTimeout() {
+    if (this.gapTimeout) {
+      clearTimeout(this.gapTimeout);
+      this.gapTimeout = null;
+    }
+  }
+
+  private resetSeq(seq: number) {
+    this.lastSeq = seq;
+    this.pendingEvents.clear();
+    this.handledSeqs.clear();
+    this.clearGapTimeout();
+  }
+
   private startHeartbeat() {
     this.stopHeartbeat();
     this.heartbeatInterval = setInterval(() => {
@@ -169,6 +340,8 @@ class WebSocketClient {
     }
 
     this.sessionCode = null;
+    this.resetSeq(0);
+    this.progressFrames = null;
     this.updateStatus('disconnected');
   }
 
@@ -236,6 +409,17 @@ class WebSocketClient {
     this.send({ type: 'end_session', data: {} });
   }
 
+  // 진도 메시지를 개별 대신 주기별 progress_frame으로 받음 (강사 전용)
+  subscribeProgressFrames(intervalMs?: number) {
+    this.progressFrames = { intervalMs };
+    this.send({ type: 'subscribe_progress_frames', interval_ms: intervalMs });
+  }
+
+  unsubscribeProgressFrames() {
+    this.progressFrames = null;
+    this.send({ type: 'unsubscribe_progress_frames' });
+  }
+
   sendStepComplete(subtaskId: number) {
     this.send({
       type: 'step_complete',
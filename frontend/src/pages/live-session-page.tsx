@@ -122,6 +122,23 @@ export function LiveSessionPage() {
     }
   }, [sessionId]);
 
+  // 놓친 실시간 이벤트를 다시 받을 수 없을 때 세션 상태를 REST로 다시 불러옴 (선택한 학생은 유지)
+  const reloadSessionState = useCallback(async () => {
+    if (!sessionId) return;
+    try {
+      const [session, studentList, notifs] = await Promise.all([
+        liveSessionService.getSessionData(parseInt(sessionId)),
+        liveSessionService.getStudentList(parseInt(sessionId)),
+        liveSessionService.getNotifications(parseInt(sessionId)),
+      ]);
+      setSessionData(session);
+      setStudents(studentList);
+      setNotifications(notifs);
+    } catch (error) {
+      console.error('Failed to reload session state:', error);
+    }
+  }, [sessionId]);
+
   // Handle incoming WebSocket messages
   const handleWebSocketMessage = useCallback((message: IncomingMessage) => {
     console.log('[LiveSession] Received WebSocket message:', message);
@@ -183,6 +200,23 @@ export function LiveSessionPage() {
         loadStudents();
         break;
 
+      case 'roster_diff': {
+        // 묶인 입장/퇴장 알림 - 목록은 한 번만 다시 불러옴
+        const { joined, left } = message.data;
+        if (joined.length === 1) {
+          toast.success(`${joined[0].user_name}님이 입장했습니다`);
+        } else if (joined.length > 1) {
+          toast.success(`${joined.length}명이 입장했습니다`);
+        }
+        if (left.length === 1) {
+          toast.info(`${left[0].user_name}님이 퇴장했습니다`);
+        } else if (left.length > 1) {
+          toast.info(`${left.length}명이 퇴장했습니다`);
+        }
+        loadStudents();
+        break;
+      }
+
       case 'help_requested':
         // Update student status to help_needed
         const helpData = message.data;
@@ -219,13 +253,25 @@ export function LiveSessionPage() {
           message: helpData.message || '',
           timestamp: helpData.timestamp || new Date().toISOString(),
           isResolved: false,
-          screenshotUrl: helpData.screenshot_url, // 스크린샷 URL 추가
+          screenshotUrl: helpData.screenshot_url || undefined, // 스크린샷 URL 추가
+          screenshotId: helpData.screenshot_id || undefined,
         };
 
         setNotifications(prev => [newNotification, ...prev]);
-        toast.warning(`🆘 도움 요청: ${helpData.username}${helpData.screenshot_url ? ' (스크린샷 포함)' : ''}`);
+        toast.warning(`🆘 도움 요청: ${helpData.username}${helpData.screenshot_url || helpData.screenshot_pending ? ' (스크린샷 포함)' : ''}`);
         break;
 
+      case 'help_screenshot_ready': {
+        // 도움 요청 알림보다 늦게 저장된 스크린샷 URL 반영
+        const { screenshot_id, screenshot_url } = message.data;
+        setNotifications(prev => prev.map(notification =>
+          notification.screenshotId === screenshot_id
+            ? { ...notification, screenshotUrl: screenshot_url || undefined }
+            : notification
+        ));
+        break;
+      }
+
       case 'screenshot_updated':
         // Update student screen if viewing this student
         const screenshotData = message.data;
@@ -283,6 +329,15 @@ export function LiveSessionPage() {
         });
         break;
 
+      case 'resync_required':
+        // 놓친 이벤트가 너무 많음 - 전체 상태를 다시 불러옴
+        reloadSessionState();
+        break;
+
+      case 'backpressure':
+        // wsClient가 처리 (복구되면 버려진 이벤트를 resume으로 다시 받음)
+        break;
+
       case 'error':
         // Handle error messages
         toast.error(`오류: ${message.data.message}`);
@@ -291,7 +346,7 @@ export function LiveSessionPage() {
       default:
         console.warn('[LiveSession] Unknown message type:', message.type);
     }
-  }, [loadStudents, selectedStudentId, navigate, sessionId]);
+  }, [loadStudents, reloadSessionState, selectedStudentId, navigate, sessionId]);
 
   // Setup WebSocket connection after initial data is loaded
   useEffect(() => {
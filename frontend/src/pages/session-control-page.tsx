@@ -151,6 +151,23 @@ export function SessionControlPage() {
         loadParticipants();
         break;
 
+      case 'roster_diff': {
+        // 묶인 입장/퇴장 알림 - 목록은 한 번만 다시 불러옴
+        const { joined, left } = message.data;
+        if (joined.length === 1) {
+          toast.success(`${joined[0].user_name}님이 입장했습니다`);
+        } else if (joined.length > 1) {
+          toast.success(`${joined.length}명이 입장했습니다`);
+        }
+        if (left.length === 1) {
+          toast.info(`${left[0].user_name}님이 퇴장했습니다`);
+        } else if (left.length > 1) {
+          toast.info(`${left.length}명이 퇴장했습니다`);
+        }
+        loadParticipants();
+        break;
+      }
+
       case 'session_status_changed':
         // Update session status
         if (currentSession) {
@@ -161,6 +178,23 @@ export function SessionControlPage() {
         }
         break;
 
+      case 'resync_required':
+        // 놓친 이벤트가 너무 많음 - 참가자 목록과 세션 상태를 다시 불러옴
+        loadParticipants();
+        if (currentSession) {
+          apiService.getInstructorActiveSessions().then((sessions) => {
+            setActiveSessions(sessions);
+            const latest = sessions.find((session) => session.id === currentSession.id);
+            // 상태가 바뀐 경우에만 갱신 (같은 객체를 유지해야 WebSocket을 다시 연결하지 않음)
+            setCurrentSession((prev) =>
+              prev && latest && prev.status !== latest.status ? { ...prev, status: latest.status } : prev
+            );
+          }).catch((error) => {
+            console.error("Failed to reload session state:", error);
+          });
+        }
+        break;
+
       default:
         // Ignore other message types for Session Control Page
         break;
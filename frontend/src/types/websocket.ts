@@ -12,15 +12,26 @@ export type IncomingMessageType =
   | 'session_status_changed'
   | 'participant_joined'
   | 'participant_left'
+  | 'roster_diff'
   | 'progress_updated'
   | 'student_completion'
   | 'help_requested'
+  | 'help_screenshot_ready'
   | 'screenshot_updated'
+  | 'resume_complete'
+  | 'resync_required'
+  | 'backpressure'
+  | 'progress_frames_subscribed'
+  | 'progress_frame'
   | 'error';
 
 export interface BaseIncomingMessage {
   type: IncomingMessageType;
   timestamp?: string;
+  // 세션 이벤트 순번 (클라이언트는 순번대로 전달하고, 빈 순번은 resume이나 재연결 시 ?last_seq=로 다시 받음)
+  seq?: number;
+  // 송신 큐에서 이 메시지로 병합되어 보내지 않은 이전 순번
+  skipped_seqs?: number[];
 }
 
 export interface StepChangedMessage extends BaseIncomingMessage {
@@ -60,6 +71,25 @@ export interface ParticipantLeftMessage extends BaseIncomingMessage {
   };
 }
 
+export interface RosterMember {
+  user_id: number;
+  user_name: string;
+  role?: string;
+  device_id?: string | null;
+  at: string;
+}
+
+// 짧은 시간 동안의 입장/퇴장을 묶은 알림 (강사 전용)
+export interface RosterDiffMessage extends BaseIncomingMessage {
+  type: 'roster_diff';
+  data: {
+    joined: RosterMember[];
+    left: RosterMember[];
+    joined_count: number;
+    left_count: number;
+  };
+}
+
 export interface ProgressUpdatedMessage extends BaseIncomingMessage {
   type: 'progress_updated';
   data: {
@@ -91,10 +121,28 @@ export interface HelpRequestedMessage extends BaseIncomingMessage {
     username: string;
     subtask_id: number | null;
     message: string;
+    screenshot_url?: string | null;
+    // 스크린샷은 저장 전이면 ID만 옴 (저장되면 help_screenshot_ready)
+    screenshot_id?: string | null;
+    screenshot_pending?: boolean;
     timestamp: string;
   };
 }
 
+export interface HelpScreenshotReadyMessage extends BaseIncomingMessage {
+  type: 'help_screenshot_ready';
+  data: {
+    screenshot_id: string;
+    screenshot_url: string | null;
+    status: 'stored' | 'failed';
+    user_id: number;
+    username: string;
+    device_id: string | null;
+    subtask_id: number | null;
+    cluster_id: string | null;
+  };
+}
+
 export interface ErrorMessage extends BaseIncomingMessage {
   type: 'error';
   data: {
@@ -114,15 +162,67 @@ export interface ScreenshotUpdatedMessage extends BaseIncomingMessage {
   };
 }
 
+export interface ResumeCompleteMessage extends BaseIncomingMessage {
+  type: 'resume_complete';
+  replayed: number;
+  last_seq: number;
+}
+
+// 놓친 이벤트가 너무 많거나 찾을 수 없음 - REST로 전체 상태를 다시 불러와야 함
+// (재전송 후에도 빈 순번이 남으면 wsClient가 직접 보냄)
+export interface ResyncRequiredMessage extends BaseIncomingMessage {
+  type: 'resync_required';
+  last_seq: number;
+}
+
+// 느린 연결: essential이면 필수 메시지만 받는 중, full이면 복구 (dropped_seq: 강등 중 버려진 가장 작은 순번)
+export interface BackpressureMessage extends BaseIncomingMessage {
+  type: 'backpressure';
+  mode: 'essential' | 'full';
+  dropped: number;
+  dropped_seq: number | null;
+}
+
+export interface ProgressFramesSubscribedMessage extends BaseIncomingMessage {
+  type: 'progress_frames_subscribed';
+  interval_ms: number;
+}
+
+export interface ProgressFrameParticipant {
+  key: string;
+  participant_id: number | null;
+  device_id: string | null;
+  name: string | null;
+  subtask_id: number | null;
+  status: string | null;
+  completed_subtasks: number[];
+}
+
+// 집계 모드 강사 소켓: 주기마다 바뀐 참가자와 바뀐 단계의 완료 수만 (full이면 전체)
+export interface ProgressFrameMessage extends BaseIncomingMessage {
+  type: 'progress_frame';
+  full: boolean;
+  participants: ProgressFrameParticipant[];
+  step_counts: Record<string, number>;
+  participant_count: number;
+}
+
 export type IncomingMessage =
   | StepChangedMessage
   | SessionStatusChangedMessage
   | ParticipantJoinedMessage
   | ParticipantLeftMessage
+  | RosterDiffMessage
   | ProgressUpdatedMessage
   | StudentCompletionMessage
   | HelpRequestedMessage
+  | HelpScreenshotReadyMessage
   | ScreenshotUpdatedMessage
+  | ResumeCompleteMessage
+  | ResyncRequiredMessage
+  | BackpressureMessage
+  | ProgressFramesSubscribedMessage
+  | ProgressFrameMessage
   | ErrorMessage;
 
 // ============================================================================
@@ -135,11 +235,14 @@ export type OutgoingMessageType =
   | 'pause_session'
   | 'resume_session'
   | 'end_session'
+  | 'subscribe_progress_frames'
+  | 'unsubscribe_progress_frames'
   // Student messages
   | 'join'
   | 'heartbeat'
   | 'step_complete'
   | 'request_help'
+  | 'resume'
   // Legacy (for backward compatibility)
   | 'progress_update'
   | 'help_request';
@@ -169,6 +272,15 @@ export interface EndSessionMessage extends BaseOutgoingMessage {
   data?: Record<string, never>;
 }
 
+export interface SubscribeProgressFramesMessage extends BaseOutgoingMessage {
+  type: 'subscribe_progress_frames';
+  interval_ms?: number;
+}
+
+export interface UnsubscribeProgressFramesMessage extends BaseOutgoingMessage {
+  type: 'unsubscribe_progress_frames';
+}
+
 // Student Messages
 export interface JoinMessage extends BaseOutgoingMessage {
   type: 'join';
@@ -195,6 +307,11 @@ export interface RequestHelpMessage extends BaseOutgoingMessage {
   };
 }
 
+export interface ResumeMessage extends BaseOutgoingMessage {
+  type: 'resume';
+  last_seq: number;
+}
+
 // Legacy Messages
 export interface ProgressUpdateMessage extends BaseOutgoingMessage {
   type: 'progress_update';
@@ -217,10 +334,13 @@ export type OutgoingMessage =
   | PauseSessionMessage
   | ResumeSessionMessage
   | EndSessionMessage
+  | SubscribeProgressFramesMessage
+  | UnsubscribeProgressFramesMessage
   | JoinMessage
   | HeartbeatMessage
   | StepCompleteMessage
   | RequestHelpMessage
+  | ResumeMessage
   | ProgressUpdateMessage
   | HelpRequestMessage;
 